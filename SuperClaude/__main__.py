@@ -53,6 +53,7 @@ except ImportError:
     def setup_logging(*args, **kwargs): pass
     class LogLevel:
         ERROR = 40
+        WARNING = 30
         INFO = 20
         DEBUG = 10
 
@@ -77,6 +78,8 @@ def create_global_parser() -> argparse.ArgumentParser:
                                help="Skip checking for updates")
     global_parser.add_argument("--auto-update", action="store_true",
                                help="Automatically install updates without prompting")
+    global_parser.add_argument("--lock-timeout", type=float, default=300,
+                               help="Seconds to wait for another operation on the same install directory (default: 300)")
 
     return global_parser
 
@@ -120,9 +123,16 @@ def setup_global_environment(args: argparse.Namespace):
     else:
         level = LogLevel.INFO
 
+    # Machine-readable output (--json) owns stdout; log warnings and errors to stderr
+    console_stream = None
+    if getattr(args, "json", False):
+        console_stream = sys.stderr
+        if level == LogLevel.INFO:
+            level = LogLevel.WARNING
+
     # Define log directory unless it's a dry run
     log_dir = args.install_dir / "logs" if not args.dry_run else None
-    setup_logging("superclaude_hub", log_dir=log_dir, console_level=level)
+    setup_logging("superclaude_hub", log_dir=log_dir, console_level=level, console_stream=console_stream)
 
     # Log startup context
     logger = get_logger()
@@ -137,14 +147,24 @@ def get_operation_modules() -> Dict[str, str]:
         "install": "Install SuperClaude framework components",
         "update": "Update existing SuperClaude installation",
         "uninstall": "Remove SuperClaude installation",
-        "backup": "Backup and restore operations"
+        "backup": "Backup and restore operations",
+        "compile": "Compile framework imports into one context bundle",
+        "dev": "Sync source edits into an installation",
+        "profile-context": "Estimate the session token footprint of installed content",
+        "duplicates": "Report duplicated sections across framework files",
+        "list": "List commands, agents or modes by their metadata",
+        "route": "Suggest agents for a task description",
+        "search": "Search framework content and documentation",
+        "lint": "Validate framework Markdown content",
+        "translate": "Translation memory and tooling for the Japanese docs"
     }
 
 
 def load_operation_module(name: str):
     """Try to dynamically import an operation module"""
     try:
-        return __import__(f"setup.cli.commands.{name}", fromlist=[name])
+        module_name = name.replace("-", "_")
+        return __import__(f"setup.cli.commands.{module_name}", fromlist=[module_name])
     except ImportError as e:
         logger = get_logger()
         if logger:
@@ -204,8 +224,8 @@ def main() -> int:
         operations = register_operation_parsers(subparsers, global_parser)
         args = parser.parse_args()
         
-        # Check for updates unless disabled
-        if not args.quiet and not getattr(args, 'no_update_check', False):
+        # Check for updates unless disabled (or the output is machine-readable)
+        if not args.quiet and not getattr(args, 'no_update_check', False) and not getattr(args, 'json', False):
             try:
                 from setup.utils.updater import check_for_updates
                 # Check for updates in the background
@@ -232,7 +252,7 @@ def main() -> int:
                 display_header(f"SuperClaude Framework v{__version__}", "Unified CLI for all operations")
                 print(f"{Colors.CYAN}Available operations:{Colors.RESET}")
                 for op, desc in get_operation_modules().items():
-                    print(f"  {op:<12} {desc}")
+                    print(f"  {op:<16} {desc}")
             return 0
 
         # Handle unknown operations and suggest corrections
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Glossary Engine Benchmark
+Scans the whole Docs/ tree with glossaries of growing size and verifies that
+checking time tracks document size rather than the number of glossary terms
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+from typing import List
+
+# Project root
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from setup.services.glossary import GlossaryEngine, GlossaryTerm  # noqa: E402
+from setup.utils.text import TOKEN  # noqa: E402
+
+
+def build_terms(count: int, words: List[str], seed: int) -> List[GlossaryTerm]:
+    """The real glossary padded with one- and two-word terms drawn from the corpus vocabulary"""
+    terms = list(GlossaryEngine.for_locale().terms)
+    seen = {term.source for term in terms}
+    rng = random.Random(seed)
+    while len(terms) < count:
+        source = " ".join(rng.sample(words, rng.choice((1, 1, 2))))
+        if source not in seen:
+            seen.add(source)
+            terms.append(GlossaryTerm(source, f"用語{len(terms)}"))
+    return terms[:count]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the glossary engine over Docs/")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000],
+                        help="Glossary sizes to test (default: 10 100 1000 5000)")
+    parser.add_argument("--rounds", type=int, default=3, help="Scans per size; the fastest counts (default: 3)")
+    parser.add_argument("--max-ratio", type=float, default=4.0,
+                        help="Allowed slowdown of the largest glossary over the smallest (default: 4.0)")
+    args = parser.parse_args()
+
+    files = sorted((PROJECT_ROOT / "Docs").rglob("*.md"))
+    texts = [path.read_text(encoding="utf-8") for path in files]
+    characters = sum(len(text) for text in texts)
+    words = sorted({word for text in texts for word in TOKEN.findall(text.lower())
+                    if word.isascii() and word.isalpha() and len(word) > 3})
+    print(f"📚 {len(files)} files, {characters / 1e6:.2f}M characters, {len(words)} distinct words")
+
+    timings = []
+    for size in args.sizes:
+        terms = build_terms(size, words, seed=size)
+        start = time.perf_counter()
+        engine = GlossaryEngine(terms)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        best = float("inf")
+        findings = 0
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            findings = sum(len(engine.scan(text)) for text in texts)
+            best = min(best, time.perf_counter() - start)
+        timings.append(best)
+        print(f"⏱️  {len(terms):>5} terms: compile {compile_ms:7.1f} ms, scan {best * 1000:7.1f} ms "
+              f"({characters / best / 1e6:.2f}M chars/s), {findings} findings")
+
+    ratio = timings[-1] / timings[0]
+    within = ratio <= args.max_ratio
+    print(f"{'✅' if within else '❌'} {args.sizes[-1]} terms scan {ratio:.2f}x slower than {args.sizes[0]} "
+          f"(limit {args.max_ratio}x)")
+    return 0 if within else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Install Lock Stress Benchmark
+Launches several concurrent installs into one directory and verifies that the
+installation lock kept metadata and CLAUDE.md consistent
+"""
+
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+from typing import List, Tuple
+
+# Project root
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def run_concurrent_installs(install_dir: Path, workers: int, components: List[str],
+                            lock_timeout: float) -> Tuple[List[int], float]:
+    """Start all installers at once and wait for them"""
+    command = [
+        sys.executable, "-m", "SuperClaude", "install",
+        "--install-dir", str(install_dir),
+        "--components", *components,
+        "--yes", "--no-update-check", "--force", "--quiet",
+        "--lock-timeout", str(lock_timeout)
+    ]
+
+    start = time.perf_counter()
+    processes = [
+        subprocess.Popen(command, cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        for _ in range(workers)
+    ]
+    return_codes = []
+    for process in processes:
+        _, stderr = process.communicate()
+        return_codes.append(process.returncode)
+        if process.returncode != 0:
+            print(f"❌ Installer pid {process.pid} exited with {process.returncode}")
+            print(stderr.decode("utf-8", errors="replace")[-2000:])
+    return return_codes, time.perf_counter() - start
+
+
+def check_consistency(install_dir: Path, components: List[str]) -> bool:
+    """Verify the installation left behind by the concurrent runs"""
+    ok = True
+
+    try:
+        metadata = json.loads((install_dir / ".superclaude-metadata.json").read_text(encoding="utf-8"))
+        installed = set(metadata.get("components", {}))
+        missing = [c for c in components if c not in installed]
+        if missing:
+            print(f"❌ Components missing from metadata: {', '.join(missing)}")
+            ok = False
+        else:
+            print("✅ Metadata parses and lists all components")
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ Metadata unreadable: {e}")
+        ok = False
+
+    claude_md = install_dir / "CLAUDE.md"
+    try:
+        imports = [line.strip() for line in claude_md.read_text(encoding="utf-8").splitlines()
+                   if line.strip().startswith("@")]
+        duplicates = sorted({line for line in imports if imports.count(line) > 1})
+        if duplicates:
+            print(f"❌ Duplicate CLAUDE.md imports: {', '.join(duplicates)}")
+            ok = False
+        else:
+            print(f"✅ CLAUDE.md has {len(imports)} unique imports")
+    except OSError as e:
+        print(f"❌ CLAUDE.md unreadable: {e}")
+        ok = False
+
+    lock_dir = install_dir / ".superclaude-lock"
+    if (lock_dir / "owner.json").exists():
+        print("❌ Lock owner file left behind")
+        ok = False
+    leftover = list((lock_dir / "queue").iterdir()) if (lock_dir / "queue").exists() else []
+    if leftover:
+        print(f"❌ {len(leftover)} queue tickets left behind")
+        ok = False
+    if ok:
+        print("✅ Lock released cleanly")
+
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stress test the SuperClaude installation lock")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent installers (default: 8)")
+    parser.add_argument("--components", nargs="+", default=["core", "commands"],
+                        help="Components to install (default: core commands)")
+    parser.add_argument("--lock-timeout", type=float, default=600.0,
+                        help="Lock timeout passed to each installer (default: 600)")
+    parser.add_argument("--keep", action="store_true", help="Keep the temporary install directory")
+    args = parser.parse_args()
+
+    # Installs must target a directory under the home directory
+    install_dir = Path(tempfile.mkdtemp(prefix=".superclaude-lock-bench-", dir=Path.home()))
+    print(f"🔒 {args.workers} concurrent installs into {install_dir}")
+
+    try:
+        return_codes, elapsed = run_concurrent_installs(
+            install_dir, args.workers, args.components, args.lock_timeout
+        )
+        failures = sum(1 for code in return_codes if code != 0)
+        print(f"⏱️  {elapsed:.2f}s total, {elapsed / args.workers:.2f}s per install (serialized)")
+        print(f"{'✅' if not failures else '❌'} {args.workers - failures}/{args.workers} installers succeeded")
+
+        consistent = check_consistency(install_dir, args.components)
+        return 0 if consistent and not failures else 1
+    finally:
+        if args.keep:
+            print(f"📁 Kept {install_dir}")
+        else:
+            shutil.rmtree(install_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Agent Routing Benchmark
+Measures how long the agent router takes to load its index and to rank agents
+for a set of task descriptions, and fails if routing is not sub-millisecond
+"""
+
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+from typing import List
+
+# Project root
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from setup.services.router import AgentRouter  # noqa: E402
+
+QUERIES = [
+    "optimize slow API response times",
+    "design a microservice architecture that scales horizontally",
+    "set up a CI/CD pipeline with kubernetes deployments",
+    "review python code for SOLID violations and type hints",
+    "threat model the login flow and check for OWASP issues",
+    "write API documentation for the REST endpoints",
+    "investigate why the nightly job crashes intermittently",
+    "make the React UI accessible and responsive",
+    "refactor this legacy module to reduce technical debt",
+    "explain how recursion works to a beginner",
+    "turn vague product ideas into a requirements document",
+    "improve test coverage with edge case tests",
+    "パフォーマンスを最適化する",
+]
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SuperClaude agent routing")
+    parser.add_argument("--iterations", type=int, default=200, help="Rounds over the query set (default: 200)")
+    parser.add_argument("--install-dir", type=Path, help="Route installed agents instead of the package's")
+    parser.add_argument("--limit-ms", type=float, default=1.0, help="Maximum p95 per query (default: 1.0)")
+    args = parser.parse_args()
+
+    router = AgentRouter.for_install_dir(args.install_dir) if args.install_dir else AgentRouter.for_package()
+
+    start = time.perf_counter()
+    router.build()
+    build_ms = (time.perf_counter() - start) * 1000
+    router.save()
+
+    start = time.perf_counter()
+    router = type(router)(router.agents_dir, router.index_file).load()
+    load_ms = (time.perf_counter() - start) * 1000
+    print(f"📚 {len(router.agents)} agents, {len(router.postings)} terms and phrases")
+    print(f"⏱️  build {build_ms:.1f} ms, load {load_ms:.2f} ms")
+
+    samples = []
+    for _ in range(args.iterations):
+        for query in QUERIES:
+            start = time.perf_counter()
+            router.route(query)
+            samples.append((time.perf_counter() - start) * 1_000_000)
+
+    p95 = percentile(samples, 0.95)
+    print(f"⏱️  route: p50 {statistics.median(samples):.1f} µs, p95 {p95:.1f} µs, "
+          f"max {max(samples):.1f} µs over {len(samples)} queries")
+
+    for query in QUERIES[:5]:
+        ranking = router.route(query, 1)
+        print(f"   {query!r} -> {ranking[0]['agent'] if ranking else '(none)'}")
+
+    within = p95 < args.limit_ms * 1000
+    print(f"{'✅' if within else '❌'} p95 {'within' if within else 'exceeds'} {args.limit_ms} ms")
+    return 0 if within else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
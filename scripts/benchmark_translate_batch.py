@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Translation Batch Benchmark
+Translates the batch targets with the stub backend at growing concurrency and
+verifies that throughput scales with the number of backend calls in flight
+"""
+
+import sys
+import argparse
+import tempfile
+from pathlib import Path
+
+# Project root
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from setup.services.translation_memory import TranslationMemory  # noqa: E402
+from setup.services.translation_jobs import TranslationScheduler, StubBackend, discover_batch_files  # noqa: E402
+from setup.services.translation_status import load_translation_pairs  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the translation job scheduler")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16],
+                        help="Concurrency levels to test (default: 1 4 16)")
+    parser.add_argument("--latency", type=float, default=0.002,
+                        help="Simulated seconds per backend call (default: 0.002)")
+    parser.add_argument("--min-speedup", type=float, default=0.5,
+                        help="Required speedup of the highest level, as a share of the ideal (default: 0.5)")
+    args = parser.parse_args()
+
+    config = load_translation_pairs()["ja"]["batch"]
+    files = discover_batch_files(PROJECT_ROOT, config["include"], config["exclude"])
+    print(f"📚 {len(files)} files, {args.latency * 1000:.0f} ms per backend call")
+
+    throughput = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for level in args.concurrency:
+            memory = TranslationMemory(Path(temp_dir) / f"memory_{level}.json")
+            scheduler = TranslationScheduler(memory, StubBackend(latency=args.latency),
+                                             Path(temp_dir) / f"checkpoint_{level}.jsonl", concurrency=level)
+            stats = scheduler.run(scheduler.plan(files))
+            throughput.append(stats["translated"] / stats["seconds"])
+            print(f"⏱️  concurrency {level:>3}: {stats['translated']} segments in {stats['seconds']:.2f} s "
+                  f"({throughput[-1]:.0f} segments/s)")
+
+    speedup = throughput[-1] / throughput[0]
+    ideal = args.concurrency[-1] / args.concurrency[0]
+    scales = speedup >= ideal * args.min_speedup
+    print(f"{'✅' if scales else '❌'} concurrency {args.concurrency[-1]} is {speedup:.1f}x faster than "
+          f"{args.concurrency[0]} (ideal {ideal:.0f}x, required {ideal * args.min_speedup:.1f}x)")
+    return 0 if scales else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
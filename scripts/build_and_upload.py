@@ -42,6 +42,9 @@ def run_command(cmd: List[str], description: str) -> Tuple[bool, str]:
 def clean_build_artifacts():
     """Clean previous build artifacts"""
     artifacts = [DIST_DIR, BUILD_DIR, PROJECT_ROOT / "SuperClaude.egg-info"]
+    # Runtime caches older versions wrote into setup/data
+    artifacts += [PROJECT_ROOT / "setup" / "data" / name
+                  for name in ("search_index.json", "lint_cache.json", "translation_hashes.json")]
     
     for artifact in artifacts:
         if artifact.exists():
@@ -95,8 +98,62 @@ def validate_project_structure() -> bool:
     print("✅ Project structure validation passed")
     return True
 
+def generate_frontmatter_index() -> bool:
+    """Generate the command, agent and mode frontmatter index shipped in setup/data"""
+    print("🔄 Generating frontmatter index...")
+    try:
+        sys.path.insert(0, str(PROJECT_ROOT))
+        from setup.services.frontmatter import FrontmatterIndex
+        index = FrontmatterIndex.for_package(build=True)
+        index.refresh(save=False)
+        if not index.save():
+            print("❌ Could not write the frontmatter index")
+            return False
+        print(f"✅ Indexed {len(index.data['files'])} command and agent files")
+        return True
+    except Exception as e:
+        print(f"❌ Frontmatter index generation failed: {e}")
+        return False
+
+def generate_agent_routes() -> bool:
+    """Generate the agent routing index shipped in setup/data"""
+    print("🔄 Generating agent routing index...")
+    try:
+        sys.path.insert(0, str(PROJECT_ROOT))
+        from setup.services.router import AgentRouter
+        router = AgentRouter.for_package(build=True)
+        router.build()
+        if not router.save():
+            print("❌ Could not write the agent routing index")
+            return False
+        print(f"✅ Indexed {len(router.agents)} agents, {len(router.postings)} terms")
+        return True
+    except Exception as e:
+        print(f"❌ Agent routing index generation failed: {e}")
+        return False
+
+def generate_locale_map() -> bool:
+    """Generate the map of localized agent and command variants shipped in setup/data"""
+    print("🔄 Generating locale map...")
+    try:
+        sys.path.insert(0, str(PROJECT_ROOT))
+        from setup.services.locales import build_locale_map, save_locale_map
+        data = build_locale_map(PROJECT_ROOT)
+        if not save_locale_map(data):
+            print("❌ Could not write the locale map")
+            return False
+        variants = sum(len(entry["variants"]) + len(entry["extras"])
+                       for components in data["locales"].values() for entry in components.values())
+        print(f"✅ Mapped {variants} localized files in {len(data['locales'])} locales")
+        return True
+    except Exception as e:
+        print(f"❌ Locale map generation failed: {e}")
+        return False
+
 def build_package() -> bool:
     """Build the package"""
+    if not generate_frontmatter_index() or not generate_agent_routes() or not generate_locale_map():
+        return False
     return run_command(
         [sys.executable, "-m", "build"],
         "Building package distributions"
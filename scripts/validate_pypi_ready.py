@@ -4,14 +4,22 @@ PyPI Readiness Validation Script
 Checks if SuperClaude project is ready for PyPI publication
 """
 
+import os
 import sys
+import json
 import toml
+import tempfile
 from pathlib import Path
 from typing import List, Tuple
 
 # Project root
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# Session token budget for the framework content a full install imports.
+# Override with SUPERCLAUDE_CONTEXT_BUDGET; set SUPERCLAUDE_CONTEXT_REPORT to a
+# path to export the full JSON profile for CI artifacts.
+CONTEXT_TOKEN_BUDGET = int(os.environ.get("SUPERCLAUDE_CONTEXT_BUDGET", "15000"))
+
 def check_file_exists(file_path: Path, description: str) -> bool:
     """Check if a required file exists"""
     if file_path.exists():
@@ -165,6 +173,38 @@ def check_import_test() -> bool:
         print(f"❌ Import failed: {e}")
         return False
 
+def check_context_budget() -> bool:
+    """Check the session token footprint of framework content against the budget"""
+    print("\n📏 Checking context token budget...")
+    
+    try:
+        sys.path.insert(0, str(PROJECT_ROOT))
+        from setup.services.profiler import ContextProfiler
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report = ContextProfiler(Path(temp_dir)).profile_sources()
+        report["budget"] = {"limit": CONTEXT_TOKEN_BUDGET, "exceeded": report["total_tokens"] > CONTEXT_TOKEN_BUDGET}
+        
+        report_path = os.environ.get("SUPERCLAUDE_CONTEXT_REPORT")
+        if report_path:
+            Path(report_path).write_text(json.dumps(report, indent=2), encoding="utf-8")
+            print(f"📝 Context profile written to {report_path}")
+        
+        for name, tokens in report["components"].items():
+            print(f"📦 {name}: ~{tokens:,} tokens")
+        
+        if report["budget"]["exceeded"]:
+            print(f"❌ Full install adds ~{report['total_tokens']:,} tokens per session, budget is {CONTEXT_TOKEN_BUDGET:,}")
+            for entry in report["files"][:5]:
+                print(f"   {entry['path']}: ~{entry['tokens']:,} tokens")
+            return False
+        
+        print(f"✅ Full install adds ~{report['total_tokens']:,} tokens per session (budget {CONTEXT_TOKEN_BUDGET:,})")
+        return True
+    except Exception as e:
+        print(f"❌ Context profiling failed: {e}")
+        return False
+
 def main():
     """Main validation function"""
     print("🔍 SuperClaude PyPI Readiness Validation")
@@ -177,6 +217,7 @@ def main():
         ("Version Consistency", check_version_consistency),
         ("PyProject Configuration", check_pyproject_config),
         ("Import Test", check_import_test),
+        ("Context Budget", check_context_budget),
     ]
     
     results = []
@@ -4,6 +4,7 @@ Pure Python installation system for SuperClaude framework
 """
 
 from pathlib import Path
+from typing import Optional
 
 try:
     __version__ = (Path(__file__).parent.parent / "VERSION").read_text().strip()
@@ -18,4 +19,23 @@ PROJECT_ROOT = SETUP_DIR.parent
 DATA_DIR = SETUP_DIR / "data"
 
 # Installation target
-DEFAULT_INSTALL_DIR = Path.home() / ".claude"
\ No newline at end of file
+DEFAULT_INSTALL_DIR = Path.home() / ".claude"
+
+# Derived data kept inside the installation directory (safe to delete)
+CACHE_DIR_NAME = ".superclaude-cache"
+
+
+def package_cache_dir(install_dir: Optional[Path] = None) -> Path:
+    """
+    Where caches derived from the package sources are kept
+
+    setup/data ships with the package (and may be read-only), so runtime caches
+    of the sources live in the user's cache directory instead.
+
+    Args:
+        install_dir: Installation directory (defaults to ~/.claude)
+
+    Returns:
+        <install_dir>/.superclaude-cache/package
+    """
+    return (install_dir or DEFAULT_INSTALL_DIR) / CACHE_DIR_NAME / "package"
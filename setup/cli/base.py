@@ -35,6 +35,51 @@ def get_command_info():
             "name": "backup",
             "description": "Backup and restore SuperClaude installations",
             "module": "setup.cli.commands.backup"
+        },
+        "compile": {
+            "name": "compile",
+            "description": "Compile framework imports into one context bundle",
+            "module": "setup.cli.commands.compile"
+        },
+        "dev": {
+            "name": "dev",
+            "description": "Sync source edits into an installation",
+            "module": "setup.cli.commands.dev"
+        },
+        "profile-context": {
+            "name": "profile-context",
+            "description": "Estimate the session token footprint of installed content",
+            "module": "setup.cli.commands.profile_context"
+        },
+        "duplicates": {
+            "name": "duplicates",
+            "description": "Report duplicated sections across framework files",
+            "module": "setup.cli.commands.duplicates"
+        },
+        "list": {
+            "name": "list",
+            "description": "List commands, agents or modes by their metadata",
+            "module": "setup.cli.commands.list"
+        },
+        "route": {
+            "name": "route",
+            "description": "Suggest agents for a task description",
+            "module": "setup.cli.commands.route"
+        },
+        "search": {
+            "name": "search",
+            "description": "Search framework content and documentation",
+            "module": "setup.cli.commands.search"
+        },
+        "lint": {
+            "name": "lint",
+            "description": "Validate framework Markdown content",
+            "module": "setup.cli.commands.lint"
+        },
+        "translate": {
+            "name": "translate",
+            "description": "Translation memory and tooling for the Japanese docs",
+            "module": "setup.cli.commands.translate"
         }
     }
 
@@ -8,11 +8,29 @@ from .install import InstallOperation
 from .uninstall import UninstallOperation
 from .update import UpdateOperation
 from .backup import BackupOperation
+from .compile import CompileOperation
+from .dev import DevOperation
+from .profile_context import ProfileContextOperation
+from .duplicates import DuplicatesOperation
+from .list import ListOperation
+from .route import RouteOperation
+from .search import SearchOperation
+from .lint import LintOperation
+from .translate import TranslateOperation
 
 __all__ = [
     'OperationBase',
     'InstallOperation',
     'UninstallOperation', 
     'UpdateOperation',
-    'BackupOperation'
+    'BackupOperation',
+    'CompileOperation',
+    'DevOperation',
+    'ProfileContextOperation',
+    'DuplicatesOperation',
+    'ListOperation',
+    'RouteOperation',
+    'SearchOperation',
+    'LintOperation',
+    'TranslateOperation'
 ]
\ No newline at end of file
@@ -13,12 +13,14 @@ from typing import List, Optional, Dict, Any, Tuple
 import argparse
 
 from ...services.settings import SettingsService
+from ...services.state import StateStore
 from ...utils.ui import (
     display_header, display_info, display_success, display_error, 
     display_warning, Menu, confirm, ProgressBar, Colors, format_size
 )
 from ...utils.logger import get_logger
-from ... import DEFAULT_INSTALL_DIR
+from ...utils.lock import InstallLock, LockTimeout, LOCK_DIR_NAME
+from ... import DEFAULT_INSTALL_DIR, CACHE_DIR_NAME
 from . import OperationBase
 
 
@@ -189,18 +191,50 @@ def get_backup_info(backup_path: Path) -> Dict[str, Any]:
     return info
 
 
-def list_backups(backup_dir: Path) -> List[Dict[str, Any]]:
-    """List all available backups"""
+def backup_info_from_record(backup_path: Path, record: Dict[str, Any]) -> Dict[str, Any]:
+    """Get information about a backup file from its state store record"""
+    info = {
+        "path": backup_path,
+        "exists": True,
+        "size": record["size"] or backup_path.stat().st_size,
+        "created": datetime.fromisoformat(record["created"]) if record["created"] else None,
+        "metadata": {},
+        "files": record["info"]["files"]
+    }
+    if "components" in record["info"]:
+        info["metadata"]["components"] = record["info"]["components"]
+    return info
+
+
+def list_backups(backup_dir: Path, install_dir: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """
+    List all available backups
+    
+    Backups recorded in the state store of install_dir, when it is enabled, are
+    listed from their records without opening the archives.
+    """
     backups = []
     
     if not backup_dir.exists():
         return backups
     
+    # Records that know their file count stand in for reading the archive
+    recorded = {}
+    state_store = StateStore.open_if_enabled(install_dir) if install_dir else None
+    if state_store:
+        for record in state_store.list_backups("installation"):
+            if record["path"] and "files" in record["info"]:
+                recorded[Path(record["path"]).resolve()] = record
+    
     # Find all backup files
     for backup_file in backup_dir.glob("*.tar*"):
-        if backup_file.is_file():
-            info = get_backup_info(backup_file)
-            backups.append(info)
+        if not backup_file.is_file():
+            continue
+        record = recorded.get(backup_file.resolve())
+        if record:
+            backups.append(backup_info_from_record(backup_file, record))
+        else:
+            backups.append(get_backup_info(backup_file))
     
     # Sort by creation date (newest first)
     backups.sort(key=lambda x: x.get("created", datetime.min), reverse=True)
@@ -318,7 +352,7 @@ def create_backup(args: argparse.Namespace) -> bool:
                         rel_path = item.relative_to(args.install_dir)
                         
                         # Skip files in excluded directories
-                        if rel_path.parts and rel_path.parts[0] in ["backups", "local"]:
+                        if rel_path.parts and rel_path.parts[0] in ["backups", "local", LOCK_DIR_NAME, CACHE_DIR_NAME]:
                             continue
                             
                         tar.add(item, arcname=str(rel_path))
@@ -333,6 +367,12 @@ def create_backup(args: argparse.Namespace) -> bool:
         duration = time.time() - start_time
         file_size = backup_file.stat().st_size
         
+        state_store = StateStore.open_if_enabled(args.install_dir)
+        if state_store:
+            state_store.record_backup(backup_file.name, "installation", backup_file,
+                                      metadata["created"], file_size,
+                                      {"files": files_added, "components": metadata["components"]})
+        
         logger.success(f"Backup created successfully in {duration:.1f} seconds")
         logger.info(f"Backup file: {backup_file}")
         logger.info(f"Files archived: {files_added}")
@@ -445,7 +485,7 @@ def cleanup_old_backups(backup_dir: Path, args: argparse.Namespace) -> bool:
     logger = get_logger()
     
     try:
-        backups = list_backups(backup_dir)
+        backups = list_backups(backup_dir, args.install_dir)
         if not backups:
             logger.info("No backups found to clean up")
             return True
@@ -521,19 +561,24 @@ def run(args: argparse.Namespace) -> int:
         
         backup_dir = get_backup_directory(args)
         
+        lock_timeout = getattr(args, 'lock_timeout', 300)
+        
         # Handle different backup operations
         if args.create:
-            success = create_backup(args)
+            with InstallLock(args.install_dir, "backup", timeout=lock_timeout):
+                success = create_backup(args)
             
         elif args.list:
-            backups = list_backups(backup_dir)
+            backups = InstallLock(args.install_dir).read_snapshot(
+                lambda: list_backups(backup_dir, args.install_dir)
+            )
             display_backup_list(backups)
             success = True
             
         elif args.restore:
             if args.restore == "interactive":
                 # Interactive restore
-                backups = list_backups(backup_dir)
+                backups = list_backups(backup_dir, args.install_dir)
                 backup_path = interactive_restore_selection(backups)
                 if not backup_path:
                     logger.info("Restore cancelled by user")
@@ -544,7 +589,11 @@ def run(args: argparse.Namespace) -> int:
                 if not backup_path.is_absolute():
                     backup_path = backup_dir / backup_path
             
-            success = restore_backup(backup_path, args)
+            if args.dry_run:
+                success = restore_backup(backup_path, args)
+            else:
+                with InstallLock(args.install_dir, "restore", timeout=lock_timeout):
+                    success = restore_backup(backup_path, args)
             
         elif args.info:
             backup_path = Path(args.info)
@@ -572,7 +621,8 @@ def run(args: argparse.Namespace) -> int:
             success = True
             
         elif args.cleanup:
-            success = cleanup_old_backups(backup_dir, args)
+            with InstallLock(args.install_dir, "backup cleanup", timeout=lock_timeout):
+                success = cleanup_old_backups(backup_dir, args)
         
         else:
             logger.error("No backup operation specified")
@@ -588,6 +638,9 @@ def run(args: argparse.Namespace) -> int:
             display_error("Backup operation failed. Check logs for details.")
             return 1
             
+    except LockTimeout as e:
+        display_error(str(e))
+        return 1
     except KeyboardInterrupt:
         print(f"\n{Colors.YELLOW}Backup operation cancelled by user{Colors.RESET}")
         return 130
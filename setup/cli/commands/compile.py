@@ -0,0 +1,139 @@
+"""
+SuperClaude Compile Operation Module
+Flattens the CLAUDE.md import closure into a single context bundle
+"""
+
+import json
+import argparse
+
+from ...services.context import ContextBundleService
+from ...utils.ui import display_header, display_info, display_success, display_error, display_warning, format_size
+from ...utils.logger import get_logger
+from ...utils.lock import InstallLock, LockTimeout
+from . import OperationBase
+
+
+class CompileOperation(OperationBase):
+    """Compile operation implementation"""
+
+    def __init__(self):
+        super().__init__("compile")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register compile CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "compile",
+        help="Compile framework imports into one context bundle",
+        description="Resolve the CLAUDE.md import closure and write a flattened, deduplicated bundle",
+        epilog="""
+Examples:
+  SuperClaude compile                       # Build or refresh the bundle
+  SuperClaude compile --link                # Build and make CLAUDE.md import only the bundle
+  SuperClaude compile --unlink              # Restore individual imports and remove the bundle
+  SuperClaude compile --force               # Rebuild even if no source file changed
+  SuperClaude compile --json --quiet        # Machine-readable result
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    mode_group = parser.add_mutually_exclusive_group()
+
+    mode_group.add_argument(
+        "--link",
+        action="store_true",
+        help="Point CLAUDE.md at the bundle instead of the individual files"
+    )
+
+    mode_group.add_argument(
+        "--unlink",
+        action="store_true",
+        help="Restore the individual imports in CLAUDE.md and remove the bundle"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the compile result as JSON"
+    )
+
+    return parser
+
+
+def display_compile_result(result: dict) -> None:
+    """Display a human-readable compile summary"""
+    if result["changed"]:
+        display_success(f"Compiled {len(result['files'])} files into {result['bundle']}")
+    else:
+        display_info(f"Bundle is up to date ({len(result['files'])} files)")
+
+    print(f"  Content hash:  {result['content_hash']}")
+    print(f"  Source size:   {format_size(result['source_bytes'])}")
+    print(f"  Bundle size:   {format_size(result['bundle_bytes'])}")
+    if result["changed"]:
+        print(f"  Deduplicated:  {result['duplicate_blocks']} blocks, {result['separator_lines']} separator lines")
+    print(f"  Linked:        {'yes' if result['linked'] else 'no'}")
+
+    for cycle in result["cycles"]:
+        display_warning("Import cycle: " + " -> ".join(cycle))
+    for missing in result["missing"]:
+        display_warning(f"Missing import: {missing}")
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute compile operation with parsed arguments"""
+    operation = CompileOperation()
+    operation.setup_operation_logging(args)
+    logger = get_logger()
+
+    try:
+        # Validate global arguments
+        success, errors = operation.validate_global_args(args)
+        if not success:
+            for error in errors:
+                logger.error(error)
+            return 1
+
+        if not (args.install_dir / "CLAUDE.md").exists():
+            logger.error(f"No CLAUDE.md found in {args.install_dir}")
+            logger.info("Use 'SuperClaude install' to install SuperClaude first")
+            return 1
+
+        if not args.quiet and not args.json:
+            display_header("SuperClaude Compile", "Flattening framework imports into one bundle")
+
+        bundle = ContextBundleService(args.install_dir)
+
+        if args.dry_run:
+            roots = bundle.get_roots()
+            display_info(f"Would compile {len(roots)} framework imports into {bundle.bundle_file}")
+            return 0
+
+        with InstallLock(args.install_dir, "compile", timeout=getattr(args, 'lock_timeout', 300)):
+            if args.unlink:
+                if not bundle.unlink():
+                    display_error("Could not restore CLAUDE.md imports")
+                    return 1
+                if not args.quiet:
+                    display_success("Restored individual framework imports in CLAUDE.md")
+                return 0
+
+            result = bundle.compile(link=args.link, force=args.force)
+
+        if args.json:
+            print(json.dumps(result, indent=2))
+        elif not args.quiet:
+            display_compile_result(result)
+        return 0
+
+    except LockTimeout as e:
+        display_error(str(e))
+        return 1
+    except KeyboardInterrupt:
+        print("\nCompile cancelled by user")
+        return 130
+    except Exception as e:
+        return operation.handle_operation_error("compile", e)
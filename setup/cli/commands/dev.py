@@ -0,0 +1,256 @@
+"""
+SuperClaude Dev Operation Module
+Keeps an installation in sync with the source checkout while editing framework content
+"""
+
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set
+
+from ...core.installer import Installer
+from ...core.registry import ComponentRegistry
+from ...services.settings import SettingsService
+from ...services.watch import create_watcher, WATCH_BACKENDS, DEFAULT_POLL_INTERVAL
+from ...utils.ui import display_header, display_info, display_success, display_error, display_warning
+from ...utils.logger import get_logger, LogLevel
+from ...utils.lock import InstallLock, LockTimeout
+from ... import PROJECT_ROOT
+from . import OperationBase
+
+
+DEFAULT_DEBOUNCE = 0.2
+
+
+class DevOperation(OperationBase):
+    """Dev operation implementation"""
+
+    def __init__(self):
+        super().__init__("dev")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register dev CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "dev",
+        help="Sync source edits into an installation",
+        description="Copy the framework files changed in the source checkout into the installation, "
+                    "updating CLAUDE.md imports and the metadata in place",
+        epilog="""
+Examples:
+  SuperClaude dev                           # Sync what changed since the last install, once
+  SuperClaude dev --watch                   # Sync every change until interrupted
+  SuperClaude dev --watch --components modes commands
+  SuperClaude dev --watch --backend poll    # Poll instead of using inotify
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep watching the sources and sync each change until interrupted"
+    )
+
+    parser.add_argument(
+        "--components",
+        type=str,
+        nargs="+",
+        help="Components to sync (default: all installed components)"
+    )
+
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        help=f"Seconds without further changes before syncing (default: {DEFAULT_DEBOUNCE})"
+    )
+
+    parser.add_argument(
+        "--backend",
+        choices=WATCH_BACKENDS,
+        default="auto",
+        help="How to detect changes: inotify (Linux), poll, or auto (inotify where available)"
+    )
+
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help=f"Seconds between two scans of the poll backend (default: {DEFAULT_POLL_INTERVAL})"
+    )
+
+    return parser
+
+
+def get_components_to_sync(args: argparse.Namespace, registry: ComponentRegistry) -> List[str]:
+    """
+    Components kept in sync
+
+    Returns:
+        Installed components, limited to --components if given
+
+    Raises:
+        ValueError: If a requested component is not installed
+    """
+    installed = InstallLock(args.install_dir).read_snapshot(
+        SettingsService(args.install_dir).get_installed_components)
+    names = [name for name in installed if name in registry.list_components()]
+    if args.components:
+        missing = [name for name in args.components if name not in names]
+        if missing:
+            raise ValueError(f"Not installed: {', '.join(missing)} (installed: {', '.join(names)})")
+        names = list(args.components)
+    return names
+
+
+def get_watch_roots(args: argparse.Namespace, registry: ComponentRegistry, components: List[str]) -> List[Path]:
+    """Source directories of the components, and the directories their installed files come from"""
+    roots: Set[Path] = set()
+    for component in registry.create_component_instances(components, args.install_dir).values():
+        source_dir = component._get_source_dir()
+        if source_dir:
+            roots.add(source_dir)
+        for source, _ in component.get_files_to_install():
+            roots.add(source.parent)
+    # Nested directories are watched through their parent
+    return sorted(root for root in roots if not any(other in root.parents for other in roots))
+
+
+def sync(args: argparse.Namespace, registry: ComponentRegistry, components: List[str]) -> Dict[str, Any]:
+    """
+    Install the changed files of the components
+
+    Args:
+        args: Parsed arguments
+        registry: Component registry
+        components: Components to sync
+
+    Returns:
+        Dict with success, updated (component -> changed file count, None for all files) and seconds
+    """
+    start = time.monotonic()
+    installer = Installer(args.install_dir, dry_run=args.dry_run)
+    instances = registry.create_component_instances(components, args.install_dir)
+    installer.register_components(list(instances.values()))
+
+    with InstallLock(args.install_dir, "dev", timeout=getattr(args, 'lock_timeout', 300)):
+        success = installer.install_components(components, {
+            "changed_only": True,
+            "backup": False,
+            "force": False
+        })
+
+    updated = {}
+    for name in sorted(installer.updated_components):
+        files = instances[name].changed_files if name in instances else None
+        updated[name] = None if files is None else len(files)
+    return {"success": success, "updated": updated, "seconds": time.monotonic() - start}
+
+
+def display_sync_result(result: Dict[str, Any], changes: Set[Path]) -> None:
+    """Display one line per sync"""
+    stamp = datetime.now().strftime("%H:%M:%S")
+    names = sorted(_display_path(path) for path in changes)
+    trigger = f" ({', '.join(names[:3])}{', ...' if len(names) > 3 else ''})" if names else ""
+    if not result["success"]:
+        display_error(f"[{stamp}] Sync failed{trigger}; see the log above")
+    elif not result["updated"]:
+        display_info(f"[{stamp}] Nothing to sync{trigger}")
+    else:
+        updated = ", ".join(f"{name} ({_describe_count(count)})" for name, count in result["updated"].items())
+        display_success(f"[{stamp}] Synced {updated} in {result['seconds']:.2f}s{trigger}")
+
+
+def _describe_count(count: Optional[int]) -> str:
+    if count is None:
+        return "all files"
+    if count == 0:
+        # Only files whose source was deleted
+        return "removed files"
+    return f"{count} file{'s' if count != 1 else ''}"
+
+
+def _display_path(path: Path) -> str:
+    try:
+        return path.relative_to(PROJECT_ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def watch(args: argparse.Namespace, registry: ComponentRegistry, components: List[str]) -> int:
+    """Sync every change until interrupted"""
+    roots = get_watch_roots(args, registry, components)
+    with create_watcher(roots, args.backend, args.poll_interval) as watcher:
+        if not args.quiet:
+            display_info(f"Watching {len(watcher.roots)} source directories ({watcher.name}); "
+                         f"press Ctrl+C to stop")
+            for root in watcher.roots:
+                print(f"  {_display_path(root)}")
+
+        # Catch up with edits made before watching
+        changes: Set[Path] = set()
+        while True:
+            result = sync(args, registry, components)
+            if not args.quiet or not result["success"]:
+                display_sync_result(result, changes)
+            changes = watcher.wait_for_changes(args.debounce)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute dev operation with parsed arguments"""
+    operation = DevOperation()
+    operation.setup_operation_logging(args)
+    logger = get_logger()
+
+    try:
+        # Validate global arguments
+        success, errors = operation.validate_global_args(args)
+        if not success:
+            for error in errors:
+                logger.error(error)
+            return 1
+
+        if args.debounce < 0 or args.poll_interval <= 0:
+            logger.error("--debounce must not be negative and --poll-interval must be positive")
+            return 1
+
+        if not SettingsService(args.install_dir).check_installation_exists():
+            logger.error(f"SuperClaude installation not found in {args.install_dir}")
+            logger.info("Use 'SuperClaude install' to install SuperClaude first")
+            return 1
+
+        if not args.quiet:
+            display_header("SuperClaude Dev", "Syncing source edits into the installation")
+
+        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+        registry.discover_components()
+        components = get_components_to_sync(args, registry)
+        if not components:
+            display_warning("No installed components to sync")
+            return 0
+
+        # One line per sync instead of the installer's progress log
+        if args.watch and not args.verbose and not args.quiet:
+            logger.set_console_level(LogLevel.WARNING)
+
+        if args.watch:
+            return watch(args, registry, components)
+
+        result = sync(args, registry, components)
+        if not args.quiet:
+            display_sync_result(result, set())
+        return 0 if result["success"] else 1
+
+    except (LockTimeout, ValueError) as e:
+        display_error(str(e))
+        return 1
+    except KeyboardInterrupt:
+        print("\nDev sync stopped by user")
+        return 130
+    except Exception as e:
+        return operation.handle_operation_error("dev", e)
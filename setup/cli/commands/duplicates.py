@@ -0,0 +1,189 @@
+"""
+SuperClaude Duplicates Operation Module
+Reports sections that are repeated near-verbatim across framework files
+"""
+
+import json
+import argparse
+from pathlib import Path
+
+from ...services.dedup import DuplicationAnalyzer, installed_framework_files
+from ...utils.ui import display_header, display_info, display_error, display_table, format_size, Colors
+from ...utils.logger import get_logger
+from ... import PROJECT_ROOT
+from . import OperationBase
+
+
+# Package directories analyzed by default (top level only: translations are separate corpora)
+SOURCE_DIRS = ["Core", "Modes", "MCP", "Commands", "Agents"]
+
+
+class DuplicatesOperation(OperationBase):
+    """Duplicates operation implementation"""
+
+    def __init__(self):
+        super().__init__("duplicates")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register duplicates CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "duplicates",
+        help="Report duplicated sections across framework files",
+        description="Fingerprint every heading section with shingled hashes and report near-duplicates across files",
+        epilog="""
+Examples:
+  SuperClaude duplicates                       # Analyze the package's framework sources
+  SuperClaude duplicates --installed           # Analyze the files installed in --install-dir
+  SuperClaude duplicates --threshold 0.6       # Report looser matches
+  SuperClaude duplicates --paths docs/*.md     # Analyze other Markdown files
+  SuperClaude duplicates --json --quiet        # Machine-readable report
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    source_group = parser.add_mutually_exclusive_group()
+
+    source_group.add_argument(
+        "--installed",
+        action="store_true",
+        help="Analyze installed framework files instead of the package sources"
+    )
+
+    source_group.add_argument(
+        "--paths",
+        type=Path,
+        nargs="+",
+        metavar="FILE",
+        help="Analyze these Markdown files"
+    )
+
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DuplicationAnalyzer.DEFAULT_THRESHOLD,
+        help=f"Minimum Jaccard similarity of two sections (default: {DuplicationAnalyzer.DEFAULT_THRESHOLD})"
+    )
+
+    parser.add_argument(
+        "--shingle-size",
+        type=int,
+        default=DuplicationAnalyzer.DEFAULT_SHINGLE_SIZE,
+        help=f"Words per shingle (default: {DuplicationAnalyzer.DEFAULT_SHINGLE_SIZE})"
+    )
+
+    parser.add_argument(
+        "--min-bytes",
+        type=int,
+        default=DuplicationAnalyzer.DEFAULT_MIN_BYTES,
+        help=f"Ignore sections smaller than this (default: {DuplicationAnalyzer.DEFAULT_MIN_BYTES})"
+    )
+
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of clusters, files and headings to show (default: 10)"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the report as JSON"
+    )
+
+    return parser
+
+
+def get_corpus(args: argparse.Namespace):
+    """Files to analyze and the directory they are displayed relative to"""
+    if args.paths:
+        return [path.resolve() for path in args.paths], Path.cwd().resolve()
+    if args.installed:
+        return installed_framework_files(args.install_dir), args.install_dir
+    source_root = PROJECT_ROOT / "SuperClaude"
+    files = [path for name in SOURCE_DIRS for path in (source_root / name).glob("*.md")]
+    return files, source_root
+
+
+def display_report(report: dict, top: int) -> None:
+    """Display a human-readable duplication report"""
+    print(f"\n{Colors.CYAN}{Colors.BRIGHT}{report['files']} files, {report['sections']} sections, "
+          f"{format_size(report['total_bytes'])}: {format_size(report['redundant_bytes'])} redundant "
+          f"({report['duplication_ratio']:.1%}){Colors.RESET}")
+
+    clusters = report["clusters"]
+    if clusters:
+        display_table(["Section", "Copies", "Similarity", "Redundant", "Files"],
+                      [[cluster["heading"], str(len(cluster["members"])),
+                        "exact" if cluster["exact"] else f"{cluster['similarity']:.0%}",
+                        format_size(cluster["redundant_bytes"]),
+                        ", ".join(member["file"] for member in cluster["members"][:3])
+                        + (" ..." if len(cluster["members"]) > 3 else "")]
+                       for cluster in clusters[:top]],
+                      f"Duplicate sections (top {min(top, len(clusters))} of {len(clusters)})")
+    else:
+        display_info(f"No sections are at least {report['threshold']:.0%} similar across files")
+
+    ratios = list(report["file_ratios"].items())
+    if ratios:
+        display_table(["File", "Redundant share"], [[file, f"{ratio:.1%}"] for file, ratio in ratios[:top]],
+                      "Files with the most redundant bytes")
+
+    headings = list(report["headings"].items())
+    if headings:
+        display_table(["Heading", "Files", "Size", "Mean similarity"],
+                      [[heading, str(stats["files"]), format_size(stats["bytes"]), f"{stats['mean_similarity']:.0%}"]
+                       for heading, stats in headings[:top]],
+                      "Headings repeated across files")
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute duplicates operation with parsed arguments"""
+    operation = DuplicatesOperation()
+    operation.setup_operation_logging(args)
+    logger = get_logger()
+
+    try:
+        # Validate global arguments
+        success, errors = operation.validate_global_args(args)
+        if not success:
+            for error in errors:
+                logger.error(error)
+            return 1
+
+        try:
+            analyzer = DuplicationAnalyzer(args.shingle_size, args.threshold, args.min_bytes)
+        except ValueError as e:
+            display_error(str(e))
+            return 1
+
+        files, base_dir = get_corpus(args)
+        missing = [path for path in files if not path.is_file()]
+        if missing:
+            display_error("Not a file: " + ", ".join(str(path) for path in missing))
+            return 1
+        if not files:
+            display_error("No Markdown files to analyze" + (f" in {args.install_dir}" if args.installed else ""))
+            return 1
+
+        if not args.quiet and not args.json:
+            display_header("SuperClaude Duplicates", "Near-identical sections across framework files")
+
+        analyzer.add_files(files, base_dir)
+        report = analyzer.report()
+
+        if args.json:
+            print(json.dumps(report, indent=2, ensure_ascii=False))
+        elif not args.quiet:
+            display_report(report, args.top)
+        return 0
+
+    except KeyboardInterrupt:
+        print("\nAnalysis cancelled by user")
+        return 130
+    except Exception as e:
+        return operation.handle_operation_error("duplicates", e)
@@ -13,12 +13,19 @@ from ...core.installer import Installer
 from ...core.registry import ComponentRegistry
 from ...services.config import ConfigService
 from ...core.validator import Validator
+from ...services.state import StateStore
+from ...services.import_profiles import ImportPolicy, get_profile_names
+from ...services.minify import MarkdownMinifier
+from ...services.locales import get_locales
+from ...services.selection import ItemSelection, parse_item_list
+from ...services.packs import ContentPack
 from ...utils.ui import (
     display_header, display_info, display_success, display_error, 
-    display_warning, Menu, confirm, ProgressBar, Colors, format_size, prompt_api_key
+    display_warning, display_table, Menu, confirm, ProgressBar, Colors, format_size, prompt_api_key
 )
 from ...utils.environment import setup_environment_variables
 from ...utils.logger import get_logger
+from ...utils.lock import InstallLock, LockTimeout
 from ... import DEFAULT_INSTALL_DIR, PROJECT_ROOT, DATA_DIR
 from . import OperationBase
 
@@ -44,6 +51,18 @@ Examples:
   SuperClaude install --dry-run                # Dry-run mode  
   SuperClaude install --components core mcp    # Specific components
   SuperClaude install --verbose --force        # Verbose with force mode
+  SuperClaude install --import-profile standard --context-budget 8000
+                                               # Import a lean set under ~8k tokens
+  SuperClaude install --minify --minify-drop-section Examples
+                                               # Compact installed Markdown, drop examples
+  SuperClaude install --components agents commands --locale ja
+                                               # Japanese agents and commands where translated
+  SuperClaude install --commands analyze,implement --agents python-expert
+                                               # Only these items and what their frontmatter requires
+  SuperClaude install --pack ~/acme-pack --pack ~/team-pack-1.2.tar.gz
+                                               # Layer organization commands and agents over the built-ins
+  SuperClaude install --components all --changed-only --yes
+                                               # Redeploy only what changed since the last install
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         parents=parents
@@ -65,6 +84,113 @@ Examples:
         help="Skip backup creation"
     )
     
+    parser.add_argument(
+        "--state-db",
+        action="store_true",
+        help="Keep installer state in a SQLite database (imports existing JSON state files)"
+    )
+    
+    parser.add_argument(
+        "--import-profile",
+        choices=get_profile_names(),
+        help="Which installed framework files CLAUDE.md imports (default: the last choice, or full)"
+    )
+    
+    parser.add_argument(
+        "--imports",
+        type=str,
+        nargs="+",
+        metavar="FILE",
+        help="Files to import with --import-profile custom"
+    )
+    
+    parser.add_argument(
+        "--context-budget",
+        type=int,
+        metavar="TOKENS",
+        help="Keep the always-loaded import closure under this many estimated tokens (0 removes the budget)"
+    )
+    
+    parser.add_argument(
+        "--locale",
+        choices=get_locales(),
+        help="Install agents and commands in this language, falling back to English per item "
+             "(default: the last choice, or en)"
+    )
+    
+    parser.add_argument(
+        "--commands",
+        type=str,
+        nargs="+",
+        metavar="NAME",
+        help="Install only these commands (comma-separated) plus the agents and MCP servers "
+             "their frontmatter requires; 'all' installs every command again"
+    )
+    
+    parser.add_argument(
+        "--agents",
+        type=str,
+        nargs="+",
+        metavar="NAME",
+        help="Install only these agents (comma-separated) plus what their frontmatter requires; "
+             "'all' installs every agent again"
+    )
+    
+    parser.add_argument(
+        "--pack",
+        action="append",
+        metavar="PATH",
+        help="Layer a content pack (directory or .zip/.tar.gz archive with a pack.json) over the built-in "
+             "commands and agents (repeatable; replaces the recorded packs, which later installs and updates keep)"
+    )
+    
+    parser.add_argument(
+        "--no-packs",
+        action="store_true",
+        help="Remove every content pack, restoring the built-in commands and agents"
+    )
+    
+    parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="Install only the components and files whose sources changed since the last install "
+             "(git diff against the recorded commit, or a hash scan without git)"
+    )
+    
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        help="Collapse whitespace and strip decorative separators in installed Markdown (kept for updates)"
+    )
+    
+    parser.add_argument(
+        "--minify-drop-section",
+        action="append",
+        metavar="TITLE",
+        help="With --minify, also drop sections whose heading matches TITLE (glob, repeatable)"
+    )
+    
+    parser.add_argument(
+        "--no-minify",
+        action="store_true",
+        help="Install Markdown files unchanged, turning off a recorded --minify"
+    )
+    
+    parser.add_argument(
+        "--shared-includes",
+        action="store_true",
+        default=None,
+        help="Move sections duplicated verbatim across the files CLAUDE.md imports into shared/ includes "
+             "(kept for updates; near-duplicates are only reported by the duplicates command)"
+    )
+    
+    parser.add_argument(
+        "--no-shared-includes",
+        action="store_false",
+        dest="shared_includes",
+        help="Keep duplicated sections inline, expanding earlier shared includes"
+    )
+    
     parser.add_argument(
         "--list-components",
         action="store_true",
@@ -114,10 +240,118 @@ def validate_system_requirements(validator: Validator, component_names: List[str
         return False
 
 
-def get_components_to_install(args: argparse.Namespace, registry: ComponentRegistry, config_manager: ConfigService) -> Optional[List[str]]:
+def get_item_selection(args: argparse.Namespace) -> Optional[Dict[str, Any]]:
+    """
+    Resolve --commands and --agents into their dependency closure
+
+    Args:
+        args: Parsed arguments
+
+    Returns:
+        Closure from ItemSelection.resolve plus "items" (component -> item file names,
+        None to clear a recorded selection), or None if no items were selected
+
+    Raises:
+        ValueError: If a selected command or agent does not exist
+    """
+    commands = parse_item_list(getattr(args, 'commands', None))
+    agents = parse_item_list(getattr(args, 'agents', None))
+    if commands is None and agents is None:
+        return None
+    selection = ItemSelection.for_package(args.install_dir).resolve(
+        commands if commands != ["all"] else [],
+        agents if agents != ["all"] else []
+    )
+    items: Dict[str, Optional[List[str]]] = {}
+    if commands is not None:
+        items["commands"] = None if commands == ["all"] else selection["commands"]
+    if agents is not None or selection["agents"]:
+        items["agents"] = None if agents == ["all"] else selection["agents"]
+    selection["items"] = items
+    return selection
+
+
+def get_content_packs(args: argparse.Namespace) -> Optional[List[ContentPack]]:
+    """
+    Read the packs given with --pack
+
+    Args:
+        args: Parsed arguments
+
+    Returns:
+        The packs (empty with --no-packs), or None to keep the recorded packs
+
+    Raises:
+        ValueError: If a pack can't be read, two packs share a name or --pack is combined with --no-packs
+    """
+    sources = getattr(args, 'pack', None)
+    if getattr(args, 'no_packs', False):
+        if sources:
+            raise ValueError("--no-packs can't be combined with --pack")
+        return []
+    if not sources:
+        return None
+    packs: List[ContentPack] = []
+    for source in sources:
+        pack = ContentPack.load(Path(source))
+        if any(other.name == pack.name for other in packs):
+            raise ValueError(f"Two packs are named {pack.name}")
+        packs.append(pack)
+    return packs
+
+
+def display_content_packs(packs: List[ContentPack]) -> None:
+    """Display the content packs, highest priority first"""
+    if not packs:
+        display_info("Removing every content pack")
+        return
+    rows = [[pack.name, pack.version, str(pack.priority), str(pack.source)]
+            for pack in sorted(packs, key=lambda pack: (-pack.priority, pack.name))]
+    display_table(["Pack", "Version", "Priority", "Source"], rows, "Content packs")
+
+
+def display_item_selection(selection: Dict[str, Any]) -> None:
+    """Display the items of a selection and why each dependency is included"""
+    rows = []
+    for component in ("commands", "agents"):
+        for item in selection[component]:
+            required_by = selection["required_by"].get(item)
+            rows.append([component[:-1], item, ", ".join(required_by) if required_by else "selected"])
+    for server in selection["mcp_servers"]:
+        rows.append(["mcp", server, ", ".join(selection["required_by"].get(f"mcp:{server}", []))])
+    if rows:
+        display_table(["Kind", "Item", "Required by"], rows, "Item selection")
+    for component, items in selection["items"].items():
+        if items is None:
+            display_info(f"Installing every item of {component} again")
+    if selection["unknown_personas"]:
+        display_warning(f"No agent found for personas: {', '.join(selection['unknown_personas'])}")
+
+
+def get_components_to_install(args: argparse.Namespace, registry: ComponentRegistry, config_manager: ConfigService,
+                              selection: Optional[Dict[str, Any]] = None,
+                              packs: Optional[List[ContentPack]] = None) -> Optional[List[str]]:
     """Determine which components to install"""
     logger = get_logger()
     
+    # Content packs extend commands and agents
+    if packs is not None and not args.components and not selection:
+        return ["core", "commands", "agents"]
+    
+    # Selected items: their components plus core, and the MCP servers they require
+    if selection:
+        components = list(args.components or [])
+        if "all" in components:
+            components = ["core", "commands", "agents", "modes", "mcp", "mcp_docs"]
+        components += [component for component in ["core"] + list(selection["items"]) if component not in components]
+        if selection["mcp_servers"]:
+            components += [component for component in ("mcp", "mcp_docs") if component not in components]
+        if not hasattr(config_manager, '_installation_context'):
+            config_manager._installation_context = {}
+        config_manager._installation_context["selected_mcp_servers"] = selection["mcp_servers"]
+        config_manager._installation_context["items"] = selection["items"]
+        return components
+    
     # Explicit components specified
     if args.components:
         if 'all' in args.components:
@@ -423,14 +657,108 @@ def run_system_diagnostics(validator: Validator) -> None:
         print("  3. Run 'SuperClaude install --diagnose' again to verify")
 
 
-def perform_installation(components: List[str], args: argparse.Namespace, config_manager: ConfigService = None) -> bool:
+def enable_state_store(install_dir: Path) -> None:
+    """Create the SQLite state store and import existing JSON state files"""
+    logger = get_logger()
+    
+    already_enabled = StateStore.is_enabled(install_dir)
+    state_store = StateStore.open(install_dir)
+    state_store.initialize()
+    
+    if already_enabled and state_store.get_info("migrated_from_files"):
+        return
+    
+    counts = state_store.migrate_from_files(
+        translation_log=PROJECT_ROOT / "SuperClaude" / "Translations" / "translation_log.jsonl"
+    )
+    imported = ", ".join(f"{count} {table}" for table, count in counts.items() if count)
+    logger.info(f"Enabled SQLite state store: {state_store.db_path}" + (f" (imported {imported})" if imported else ""))
+
+
+def get_import_policy(args: argparse.Namespace) -> Optional[ImportPolicy]:
+    """
+    Build the import policy requested on the command line
+    
+    Returns:
+        ImportPolicy, or None to keep the policy recorded by the last install
+        
+    Raises:
+        ValueError: If the profile options are inconsistent
+    """
+    profile = getattr(args, 'import_profile', None)
+    budget = getattr(args, 'context_budget', None)
+    imports = getattr(args, 'imports', None)
+    
+    if imports and profile not in (None, "custom"):
+        raise ValueError("--imports can only be used with --import-profile custom")
+    if imports and profile is None:
+        profile = "custom"
+    if profile is None and budget is None:
+        return None
+    
+    # Options not given keep their recorded value; a budget of 0 removes it
+    recorded = ImportPolicy.from_metadata(args.install_dir)
+    if profile is None and recorded:
+        profile, imports = recorded.profile, recorded.custom_imports
+    if budget is None and recorded:
+        budget = recorded.budget
+    return ImportPolicy(profile, budget or None, imports)
+
+
+def get_minifier(args: argparse.Namespace) -> Optional[MarkdownMinifier]:
+    """
+    Build the Markdown minifier requested on the command line
+    
+    Returns:
+        MarkdownMinifier, or None to keep the choice recorded by the last install
+        
+    Raises:
+        ValueError: If the minify options are inconsistent
+    """
+    drop_sections = getattr(args, 'minify_drop_section', None)
+    minify = getattr(args, 'minify', False)
+    if getattr(args, 'no_minify', False):
+        if minify or drop_sections:
+            raise ValueError("--no-minify can't be combined with --minify or --minify-drop-section")
+        return None
+    if drop_sections and not minify:
+        raise ValueError("--minify-drop-section requires --minify")
+    if not minify:
+        return None
+    return MarkdownMinifier(args.install_dir, drop_sections, dry_run=args.dry_run)
+
+
+def display_minify_report(minifier: MarkdownMinifier, top: int = 10) -> None:
+    """Display bytes and estimated tokens saved by --minify"""
+    rows = minifier.report()
+    if not rows:
+        return
+    bytes_saved = sum(row["bytes_saved"] for row in rows)
+    tokens_saved = sum(row["tokens_saved"] for row in rows)
+    source_tokens = sum(row["source_tokens"] for row in rows)
+    cached = sum(1 for row in rows if row["cached"])
+    
+    display_table(["File", "Bytes saved", "Tokens saved"],
+                  [[row["path"], f"{row['bytes_saved']:,}", f"{row['tokens_saved']:,}"] for row in rows[:top]],
+                  f"Minify savings (top {min(top, len(rows))} of {len(rows)} files)")
+    share = f" ({tokens_saved / source_tokens:.0%})" if source_tokens else ""
+    display_info(f"Minified {len(rows)} files: {format_size(bytes_saved)} and ~{tokens_saved:,} tokens saved{share}, "
+                 f"{cached} from cache")
+
+
+def perform_installation(components: List[str], args: argparse.Namespace, config_manager: ConfigService = None,
+                         packs: Optional[List[ContentPack]] = None) -> bool:
     """Perform the actual installation"""
     logger = get_logger()
     start_time = time.time()
     
     try:
         # Create installer
-        installer = Installer(args.install_dir, dry_run=args.dry_run)
+        if getattr(args, 'no_minify', False) and not args.dry_run:
+            MarkdownMinifier.disable(args.install_dir)
+        installer = Installer(args.install_dir, dry_run=args.dry_run, import_policy=get_import_policy(args),
+                              minifier=get_minifier(args),
+                              shared_includes=getattr(args, 'shared_includes', None))
         
         # Create component registry
         registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
@@ -446,6 +774,10 @@ def perform_installation(components: List[str], args: argparse.Namespace, config
         # Register components with installer
         installer.register_components(list(component_instances.values()))
         
+        # Enable the SQLite state store before anything records state
+        if getattr(args, 'state_db', False) and not args.dry_run:
+            enable_state_store(args.install_dir)
+        
         # Resolve dependencies
         ordered_components = registry.resolve_dependencies(components)
         
@@ -463,6 +795,10 @@ def perform_installation(components: List[str], args: argparse.Namespace, config
             "force": args.force,
             "backup": not args.no_backup,
             "dry_run": args.dry_run,
+            "locale": getattr(args, 'locale', None),
+            "changed_only": getattr(args, 'changed_only', False),
+            "items": getattr(config_manager, '_installation_context', {}).get("items", {}),
+            "packs": [str(pack.source) for pack in packs] if packs is not None else None,
             "selected_mcp_servers": getattr(config_manager, '_installation_context', {}).get("selected_mcp_servers", [])
         }
         
@@ -491,6 +827,9 @@ def perform_installation(components: List[str], args: argparse.Namespace, config
             
             if summary['backup_path']:
                 logger.info(f"Backup created: {summary['backup_path']}")
+            
+            if installer.minifier and not args.quiet:
+                display_minify_report(installer.minifier)
                 
         else:
             logger.error(f"Installation completed with errors in {duration:.1f} seconds")
@@ -557,6 +896,16 @@ def run(args: argparse.Namespace) -> int:
                 logger.error(error)
             return 1
         
+        # Validate import profile, minify options and item selection
+        try:
+            get_import_policy(args)
+            get_minifier(args)
+            selection = get_item_selection(args)
+            packs = get_content_packs(args)
+        except ValueError as e:
+            logger.error(str(e))
+            return 1
+        
         # Display header
         if not args.quiet:
             from setup.cli.base import __version__
@@ -609,7 +958,7 @@ def run(args: argparse.Namespace) -> int:
             return 1
         
         # Get components to install
-        components = get_components_to_install(args, registry, config_manager)
+        components = get_components_to_install(args, registry, config_manager, selection, packs)
         if not components:
             logger.error("No components selected for installation")
             return 1
@@ -632,6 +981,10 @@ def run(args: argparse.Namespace) -> int:
         
         # Display installation plan
         if not args.quiet:
+            if selection:
+                display_item_selection(selection)
+            if packs is not None:
+                display_content_packs(packs)
             display_installation_plan(components, registry, args.install_dir)
             
             if not args.dry_run:
@@ -640,7 +993,11 @@ def run(args: argparse.Namespace) -> int:
                     return 0
         
         # Perform installation
-        success = perform_installation(components, args, config_manager)
+        if args.dry_run:
+            success = perform_installation(components, args, config_manager, packs)
+        else:
+            with InstallLock(args.install_dir, "install", timeout=getattr(args, 'lock_timeout', 300)):
+                success = perform_installation(components, args, config_manager, packs)
         
         if success:
             if not args.quiet:
@@ -657,6 +1014,9 @@ def run(args: argparse.Namespace) -> int:
             display_error("Installation failed. Check logs for details.")
             return 1
             
+    except LockTimeout as e:
+        display_error(str(e))
+        return 1
     except KeyboardInterrupt:
         print(f"\n{Colors.YELLOW}Installation cancelled by user{Colors.RESET}")
         return 130
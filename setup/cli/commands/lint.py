@@ -0,0 +1,151 @@
+"""
+SuperClaude Lint Operation Module
+Validates framework Markdown: frontmatter, personas, MCP servers, imports and fences
+"""
+
+import json
+import time
+import argparse
+from pathlib import Path
+
+from ...services.lint import ContentLinter, RULES, ERROR, WARNING
+from ...utils.ui import display_header, display_success, display_error, display_warning, Colors
+from ...utils.logger import get_logger
+from ... import PROJECT_ROOT
+from . import OperationBase
+
+
+class LintOperation(OperationBase):
+    """Lint operation implementation"""
+
+    def __init__(self):
+        super().__init__("lint")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register lint CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "lint",
+        help="Validate framework Markdown content",
+        description="Check every Markdown file under SuperClaude/ against the content rules; "
+                    "results are cached per file hash",
+        epilog=f"""
+Examples:
+  SuperClaude lint                          # Lint the package sources
+  SuperClaude lint --strict                 # Warnings fail too
+  SuperClaude lint --json --quiet           # Machine-readable findings for CI
+  SuperClaude lint --root path/to/SuperClaude --no-cache
+
+Rules: {", ".join(RULES)}
+Exit status: 0 clean, 1 errors (or warnings with --strict)
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=PROJECT_ROOT / "SuperClaude",
+        help="Framework source directory to lint (default: the package's SuperClaude/)"
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Worker processes (default: CPU count)"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Check every file again, ignoring cached results"
+    )
+
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Exit with status 1 on warnings as well"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print findings and totals as JSON"
+    )
+
+    return parser
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute lint operation with parsed arguments"""
+    operation = LintOperation()
+    operation.setup_operation_logging(args)
+    logger = get_logger()
+
+    try:
+        # Validate global arguments
+        success, errors = operation.validate_global_args(args)
+        if not success:
+            for error in errors:
+                logger.error(error)
+            return 1
+
+        root = args.root.resolve()
+        if not root.is_dir():
+            display_error(f"Not a directory: {root}")
+            return 1
+        if args.jobs is not None and args.jobs < 1:
+            display_error("--jobs must be at least 1")
+            return 1
+
+        if root == (PROJECT_ROOT / "SuperClaude").resolve():
+            linter = ContentLinter.for_package(args.jobs, args.install_dir)
+        else:
+            linter = ContentLinter(root, root / ".superclaude-lint-cache.json", args.jobs)
+
+        start = time.perf_counter()
+        findings = linter.lint(use_cache=not args.no_cache)
+        elapsed = time.perf_counter() - start
+
+        counts = {ERROR: 0, WARNING: 0}
+        for finding in findings:
+            counts[finding["severity"]] += 1
+        failed = counts[ERROR] > 0 or (args.strict and counts[WARNING] > 0)
+
+        if args.json:
+            print(json.dumps({
+                "root": str(root),
+                **linter.stats,
+                "errors": counts[ERROR],
+                "warnings": counts[WARNING],
+                "seconds": round(elapsed, 4),
+                "findings": findings
+            }, indent=2, ensure_ascii=False))
+            return 1 if failed else 0
+
+        if not args.quiet:
+            display_header("SuperClaude Lint", str(root))
+            for finding in findings:
+                color = Colors.RED if finding["severity"] == ERROR else Colors.YELLOW
+                print(f"{finding['path']}:{finding['line']}: {color}{finding['severity']}{Colors.RESET} "
+                      f"[{finding['rule']}] {finding['message']}")
+            print(f"\n{linter.stats['files']} files ({linter.stats['checked']} checked, "
+                  f"{linter.stats['cached']} cached) in {elapsed * 1000:.0f} ms")
+
+        summary = f"{counts[ERROR]} errors, {counts[WARNING]} warnings"
+        if failed:
+            display_error(summary)
+        elif counts[WARNING]:
+            display_warning(summary)
+        else:
+            display_success("No problems found")
+        return 1 if failed else 0
+
+    except KeyboardInterrupt:
+        print("\nLint cancelled by user")
+        return 130
+    except Exception as e:
+        return operation.handle_operation_error("lint", e)
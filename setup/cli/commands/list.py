@@ -0,0 +1,157 @@
+"""
+SuperClaude List Operation Module
+Lists commands, agents and modes from the frontmatter index
+"""
+
+import json
+import argparse
+
+from ...services.frontmatter import FrontmatterIndex
+from ...utils.ui import display_header, display_info, display_error, display_table
+from ...utils.logger import get_logger
+from . import OperationBase
+
+
+# Columns shown per kind in the table view
+COLUMNS = {
+    "commands": ["name", "category", "complexity", "mcp-servers", "personas"],
+    "agents": ["name", "category", "tools"],
+    "modes": ["name", "title", "description"]
+}
+
+
+class ListOperation(OperationBase):
+    """List operation implementation"""
+
+    def __init__(self):
+        super().__init__("list")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register list CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "list",
+        help="List commands, agents or modes by their metadata",
+        description="Query command, agent and mode metadata through a JSON index (one file read)",
+        epilog="""
+Examples:
+  SuperClaude list commands                                  # Installed commands
+  SuperClaude list agents --filter category=quality          # Agents in one category
+  SuperClaude list commands --filter mcp-servers=sequential --filter complexity!=basic
+  SuperClaude list commands --filter description~test        # Substring match
+  SuperClaude list agents --locale ja --source package       # Japanese agents in the package
+  SuperClaude list modes                                     # Installed behavioral modes
+  SuperClaude list commands --json --quiet                   # Machine-readable output
+
+Filters: key=value (list fields match any item), key!=value, key~text; all filters must match
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    parser.add_argument(
+        "kind",
+        choices=FrontmatterIndex.KINDS,
+        help="What to list"
+    )
+
+    parser.add_argument(
+        "--filter",
+        action="append",
+        dest="filters",
+        metavar="EXPR",
+        help="Only entries matching EXPR (repeatable)"
+    )
+
+    parser.add_argument(
+        "--locale",
+        choices=["en", "ja"],
+        help="Only entries of this language"
+    )
+
+    parser.add_argument(
+        "--source",
+        choices=["installed", "package"],
+        help="Query the installation or the package sources (default: installed if present)"
+    )
+
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Discard the index and parse every file again"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print matching entries as JSON"
+    )
+
+    return parser
+
+
+def get_index(args: argparse.Namespace) -> FrontmatterIndex:
+    """Index for the requested source"""
+    source = args.source
+    if source is None:
+        installed = any((args.install_dir / subdir).is_dir() for subdir in ("commands", "agents"))
+        source = "installed" if installed else "package"
+    if source == "installed":
+        return FrontmatterIndex.for_install_dir(args.install_dir)
+    return FrontmatterIndex.for_package(args.install_dir)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute list operation with parsed arguments"""
+    operation = ListOperation()
+    operation.setup_operation_logging(args)
+    logger = get_logger()
+
+    try:
+        # Validate global arguments
+        success, errors = operation.validate_global_args(args)
+        if not success:
+            for error in errors:
+                logger.error(error)
+            return 1
+
+        index = get_index(args)
+        if not args.rebuild:
+            index.load()
+        index.refresh()
+
+        try:
+            entries = index.query(args.kind, args.filters, args.locale)
+        except ValueError as e:
+            display_error(str(e))
+            return 1
+
+        if args.json:
+            print(json.dumps(entries, indent=2, ensure_ascii=False))
+            return 0
+        if args.quiet:
+            return 0
+
+        display_header(f"SuperClaude {args.kind.capitalize()}", str(index.base_dir))
+        if not entries:
+            display_info(f"No {args.kind} match")
+            return 0
+
+        columns = COLUMNS[args.kind]
+        rows = []
+        for entry in entries:
+            row = []
+            for column in columns:
+                value = entry.get(column, "")
+                row.append(", ".join(value) if isinstance(value, list) else str(value))
+            rows.append(row)
+        display_table(columns, rows, f"{len(entries)} {args.kind}")
+        return 0
+
+    except KeyboardInterrupt:
+        print("\nListing cancelled by user")
+        return 130
+    except Exception as e:
+        return operation.handle_operation_error("list", e)
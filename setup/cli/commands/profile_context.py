@@ -0,0 +1,176 @@
+"""
+SuperClaude Profile-Context Operation Module
+Reports how many tokens installed framework content adds to every session
+"""
+
+import json
+import argparse
+from pathlib import Path
+
+from ...services.profiler import ContextProfiler
+from ...utils.ui import display_header, display_info, display_success, display_error, display_warning, display_table, Colors
+from ...utils.tokens import TOKENIZERS, DEFAULT_TOKENIZER
+from ...utils.logger import get_logger
+from . import OperationBase
+
+
+class ProfileContextOperation(OperationBase):
+    """Profile-context operation implementation"""
+
+    def __init__(self):
+        super().__init__("profile-context")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register profile-context CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "profile-context",
+        help="Estimate the session token footprint of installed content",
+        description="Walk the CLAUDE.md import closure and estimate tokens per file, component and category",
+        epilog=f"""
+Examples:
+  SuperClaude profile-context                        # Summary with top 10 files
+  SuperClaude profile-context --top 20               # Show more files
+  SuperClaude profile-context --tokenizer chars      # Use another estimator
+  SuperClaude profile-context --json --quiet         # Machine-readable report
+  SuperClaude profile-context --output report.json --budget 12000   # CI budget check
+
+Tokenizers: {', '.join(sorted(TOKENIZERS))} or a custom "package.module:ClassName"
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    parser.add_argument(
+        "--tokenizer",
+        default=DEFAULT_TOKENIZER,
+        help=f"Token estimator to use (default: {DEFAULT_TOKENIZER})"
+    )
+
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of largest files to show (default: 10)"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the report as JSON"
+    )
+
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Write the JSON report to a file"
+    )
+
+    parser.add_argument(
+        "--budget",
+        type=int,
+        help="Fail with exit code 2 if the total exceeds this many tokens"
+    )
+
+    parser.add_argument(
+        "--no-update-delta",
+        action="store_true",
+        help="Skip comparing installed files with the package sources"
+    )
+
+    return parser
+
+
+def display_profile(report: dict, top: int) -> None:
+    """Display a human-readable token profile"""
+    total = report["total_tokens"]
+    print(f"\n{Colors.CYAN}{Colors.BRIGHT}Session context: ~{total:,} tokens "
+          f"({report['total_bytes']:,} bytes, {report['tokenizer']} estimate){Colors.RESET}")
+
+    def share(tokens: int) -> str:
+        return f"{tokens / total:.0%}" if total else "-"
+
+    display_table(["Component", "Tokens", "Share"],
+                  [[name, f"{tokens:,}", share(tokens)] for name, tokens in report["components"].items()],
+                  "By component")
+    display_table(["Category", "Tokens", "Share"],
+                  [[name, f"{tokens:,}", share(tokens)] for name, tokens in report["categories"].items()],
+                  "By category")
+    display_table(["File", "Component", "Tokens", "Share"],
+                  [[entry["path"], entry["component"], f"{entry['tokens']:,}", share(entry["tokens"])]
+                   for entry in report["files"][:top]],
+                  f"Top {min(top, len(report['files']))} files")
+
+    delta = report.get("update_delta")
+    if delta is not None:
+        if delta["files"]:
+            sign = "+" if delta["total"] >= 0 else ""
+            display_info(f"Pending update would change session context by {sign}{delta['total']:,} tokens")
+            for change in delta["files"][:top]:
+                print(f"  {change['path']:<40} {change['delta']:+,}")
+        else:
+            display_info("Installed content matches the package; an update would not change the token count")
+
+    for cycle in report.get("cycles", []):
+        display_warning("Import cycle: " + " -> ".join(cycle))
+    for missing in report.get("missing", []):
+        display_warning(f"Missing import: {missing}")
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute profile-context operation with parsed arguments"""
+    operation = ProfileContextOperation()
+    operation.setup_operation_logging(args)
+    logger = get_logger()
+
+    try:
+        # Validate global arguments
+        success, errors = operation.validate_global_args(args)
+        if not success:
+            for error in errors:
+                logger.error(error)
+            return 1
+
+        if not (args.install_dir / "CLAUDE.md").exists():
+            logger.error(f"No CLAUDE.md found in {args.install_dir}")
+            logger.info("Use 'SuperClaude install' to install SuperClaude first")
+            return 1
+
+        if not args.quiet and not args.json:
+            display_header("SuperClaude Context Profile", "Token footprint of installed framework content")
+
+        try:
+            profiler = ContextProfiler(args.install_dir, tokenizer=args.tokenizer)
+        except ValueError as e:
+            display_error(str(e))
+            return 1
+
+        report = profiler.profile(include_update_delta=not args.no_update_delta)
+        if args.budget is not None:
+            report["budget"] = {"limit": args.budget, "exceeded": report["total_tokens"] > args.budget}
+
+        if args.output:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+            logger.info(f"Wrote context profile to {args.output}")
+
+        if args.json:
+            print(json.dumps(report, indent=2))
+        elif not args.quiet:
+            display_profile(report, args.top)
+
+        if args.budget is not None:
+            if report["budget"]["exceeded"]:
+                display_error(f"Session context of {report['total_tokens']:,} tokens exceeds the budget of {args.budget:,}")
+                return 2
+            if not args.quiet and not args.json:
+                display_success(f"Within the budget of {args.budget:,} tokens")
+        return 0
+
+    except KeyboardInterrupt:
+        print("\nProfiling cancelled by user")
+        return 130
+    except Exception as e:
+        return operation.handle_operation_error("profile-context", e)
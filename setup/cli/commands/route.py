@@ -0,0 +1,127 @@
+"""
+SuperClaude Route Operation Module
+Ranks the agents best suited to a task description
+"""
+
+import json
+import argparse
+
+from ...services.router import AgentRouter
+from ...utils.ui import display_header, display_info, display_error, display_table
+from ...utils.logger import get_logger
+from . import OperationBase
+
+
+class RouteOperation(OperationBase):
+    """Route operation implementation"""
+
+    def __init__(self):
+        super().__init__("route")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register route CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "route",
+        help="Suggest agents for a task description",
+        description="Score agents against their triggers and descriptions with a precomputed keyword index",
+        epilog="""
+Examples:
+  SuperClaude route "optimize slow API response times"
+  SuperClaude route "threat model the login flow" --top 1
+  SuperClaude route "design a REST API" --source package
+  SuperClaude route "write release notes" --json --quiet
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    parser.add_argument(
+        "task",
+        nargs="+",
+        help="Task description"
+    )
+
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=3,
+        help="Number of agents to show (default: 3)"
+    )
+
+    parser.add_argument(
+        "--source",
+        choices=["installed", "package"],
+        help="Route to installed agents or the package's agents (default: installed if present)"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the ranking as JSON"
+    )
+
+    return parser
+
+
+def get_router(args: argparse.Namespace) -> AgentRouter:
+    """Router for the requested source"""
+    source = args.source
+    if source is None:
+        source = "installed" if (args.install_dir / "agents").is_dir() else "package"
+    if source == "installed":
+        return AgentRouter.for_install_dir(args.install_dir)
+    return AgentRouter.for_package(args.install_dir)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute route operation with parsed arguments"""
+    operation = RouteOperation()
+    operation.setup_operation_logging(args)
+    logger = get_logger()
+
+    try:
+        # Validate global arguments
+        success, errors = operation.validate_global_args(args)
+        if not success:
+            for error in errors:
+                logger.error(error)
+            return 1
+
+        if args.top < 1:
+            display_error("--top must be at least 1")
+            return 1
+
+        router = get_router(args).load()
+        if not router.agents:
+            display_error(f"No agents found in {router.agents_dir}")
+            return 1
+
+        task = " ".join(args.task)
+        ranking = router.route(task, args.top)
+
+        if args.json:
+            print(json.dumps({"task": task, "agents": ranking}, indent=2, ensure_ascii=False))
+            return 0
+        if args.quiet:
+            return 0
+
+        display_header("SuperClaude Route", task)
+        if not ranking:
+            display_info("No agent matches this task; try describing the domain or the kind of work")
+            return 0
+
+        display_table(["Agent", "Score", "Confidence", "Matched"],
+                      [[entry["agent"], f"{entry['score']:.2f}", f"{entry['confidence']:.0%}",
+                        ", ".join(entry["matched"][:6]) + (" ..." if len(entry["matched"]) > 6 else "")]
+                       for entry in ranking],
+                      f"Top {len(ranking)} agents")
+        return 0
+
+    except KeyboardInterrupt:
+        print("\nRouting cancelled by user")
+        return 130
+    except Exception as e:
+        return operation.handle_operation_error("route", e)
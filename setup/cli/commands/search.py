@@ -0,0 +1,142 @@
+"""
+SuperClaude Search Operation Module
+Full-text search over framework content and documentation
+"""
+
+import json
+import time
+import argparse
+
+from ...services.search import SearchIndex
+from ...utils.ui import display_header, display_info, Colors
+from ...utils.logger import get_logger
+from . import OperationBase
+
+
+class SearchOperation(OperationBase):
+    """Search operation implementation"""
+
+    def __init__(self):
+        super().__init__("search")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register search CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "search",
+        help="Search framework content and documentation",
+        description="Rank Markdown sections with BM25 over a persistent, incrementally updated index",
+        epilog="""
+Examples:
+  SuperClaude search token efficiency               # Package sources and Docs/
+  SuperClaude search セッション管理                   # Japanese documents are searchable too
+  SuperClaude search permission denied --path Docs/Reference
+  SuperClaude search serena --source installed      # Files installed in --install-dir
+  SuperClaude search brainstorm --json --quiet      # Machine-readable hits
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    parser.add_argument(
+        "query",
+        nargs="+",
+        help="Search terms"
+    )
+
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of hits to show (default: 10)"
+    )
+
+    parser.add_argument(
+        "--locale",
+        choices=["en", "ja"],
+        help="Only documents of this language"
+    )
+
+    parser.add_argument(
+        "--path",
+        dest="path_prefix",
+        metavar="PREFIX",
+        help="Only files whose relative path starts with PREFIX"
+    )
+
+    parser.add_argument(
+        "--source",
+        choices=["installed", "package"],
+        default="package",
+        help="Search the package sources and docs or the installed files (default: package)"
+    )
+
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Discard the index and index every file again"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print hits as JSON"
+    )
+
+    return parser
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute search operation with parsed arguments"""
+    operation = SearchOperation()
+    operation.setup_operation_logging(args)
+    logger = get_logger()
+
+    try:
+        # Validate global arguments
+        success, errors = operation.validate_global_args(args)
+        if not success:
+            for error in errors:
+                logger.error(error)
+            return 1
+
+        index = SearchIndex.for_install_dir(args.install_dir) if args.source == "installed" \
+            else SearchIndex.for_package(args.install_dir)
+        if not args.rebuild:
+            index.load()
+        changed = index.refresh()
+        if changed:
+            logger.debug(f"Re-indexed {changed} changed files")
+
+        query = " ".join(args.query)
+        start = time.perf_counter()
+        hits = index.search(query, args.top, args.locale, args.path_prefix)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        if args.json:
+            print(json.dumps({"query": query, "hits": hits}, indent=2, ensure_ascii=False))
+            return 0
+        if args.quiet:
+            return 0
+
+        display_header("SuperClaude Search", query)
+        if not hits:
+            display_info(f"No matches in {len(index.data['files'])} files")
+            return 0
+
+        for hit in hits:
+            heading = f" › {hit['heading']}" if hit["heading"] else ""
+            print(f"{Colors.CYAN}{hit['path']}:{hit['line']}{Colors.RESET}{Colors.BRIGHT}{heading}{Colors.RESET}"
+                  f"  {Colors.WHITE}({hit['score']:.2f}){Colors.RESET}")
+            if hit["snippet"]:
+                print(f"    {hit['snippet']}")
+        print(f"\n{len(hits)} hits from {len(index.data['files'])} files in {elapsed_ms:.1f} ms")
+        return 0
+
+    except KeyboardInterrupt:
+        print("\nSearch cancelled by user")
+        return 130
+    except Exception as e:
+        return operation.handle_operation_error("search", e)
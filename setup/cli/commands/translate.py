@@ -0,0 +1,725 @@
+"""
+SuperClaude Translate Operation Module
+Tooling behind the Japanese translation commands: segment plans from the
+translation memory, reassembly of translated files, glossary checks and
+the sync status of translations against their English sources
+"""
+
+import json
+import argparse
+from pathlib import Path
+from typing import List, Dict
+
+from ...services.translation_memory import TranslationMemory, segment_markdown, diff_segments
+from ...services.glossary import GlossaryEngine
+from ...services.translation_status import SyncStatusIndex, STATUSES, load_translation_pairs
+from ...services.translation_log import TranslationLog
+from ...services.state import StateStore
+from ...services.translation_jobs import TranslationScheduler, get_backend, discover_batch_files, StubBackend
+from ...utils.ui import (display_header, display_info, display_success, display_error, display_warning,
+                         display_table, Colors, ProgressBar, format_duration)
+from ...utils.logger import get_logger
+from . import OperationBase
+
+
+class TranslateOperation(OperationBase):
+    """Translate operation implementation"""
+
+    def __init__(self):
+        super().__init__("translate")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register translate CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "translate",
+        help="Translation memory and tooling for the Japanese docs",
+        description="Plan, seed and assemble segment-level translations of Markdown files",
+        epilog="""
+Examples:
+  SuperClaude translate --learn Docs/User-Guide/flags.md Docs/User-Guide-jp/flags.md
+  SuperClaude translate --plan Docs/User-Guide/flags.md --json > pending.json
+  SuperClaude translate --plan Docs/User-Guide/flags.md --previous old-flags.md
+  SuperClaude translate --apply Docs/User-Guide/flags.md --translations done.json \\
+                        --output Docs/User-Guide-jp/flags.md
+  SuperClaude translate --check Docs/User-Guide-jp SuperClaude/Agents/JP
+  SuperClaude translate --check Docs/User-Guide-jp/flags.md --rewrite
+  SuperClaude translate --status --only stale --only missing
+  SuperClaude translate --mark Docs/User-Guide-jp/flags.md   # Translation is now up to date
+  SuperClaude translate --mark                               # Start tracking every untracked file
+  SuperClaude translate --history --file Docs/User-Guide/flags.md
+  SuperClaude translate --history --result failure --since 2025-01-01 --json
+  SuperClaude translate --compact-log --keep-days 90
+  SuperClaude translate --batch --dry-run
+  SuperClaude translate --batch --backend mypkg.backends:DeepLBackend --concurrency 8 --rate 5
+  SuperClaude translate --batch --backend stub --backend-option latency=0.05 \
+                        --memory /tmp/memory.json --output-dir /tmp/batch-jp
+
+--plan lists the segments the memory cannot translate; --translations takes a JSON
+object mapping their hashes to translated text. --batch translates the pending segments
+of every target file through a backend; an interrupted batch resumes from its checkpoint.
+Written translations are logged to SuperClaude/Translations/translation_log.jsonl.
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    # Translate operations (mutually exclusive)
+    operation_group = parser.add_mutually_exclusive_group(required=True)
+
+    operation_group.add_argument(
+        "--plan",
+        type=Path,
+        metavar="SOURCE",
+        help="Show which segments of SOURCE need translating"
+    )
+
+    operation_group.add_argument(
+        "--learn",
+        type=Path,
+        nargs=2,
+        metavar=("SOURCE", "TARGET"),
+        help="Seed the memory from an up-to-date source and translation pair"
+    )
+
+    operation_group.add_argument(
+        "--apply",
+        type=Path,
+        metavar="SOURCE",
+        help="Assemble the translation of SOURCE from the memory and --translations"
+    )
+
+    operation_group.add_argument(
+        "--check",
+        type=Path,
+        nargs="+",
+        metavar="PATH",
+        help="Check translated Markdown files or directories against the glossary"
+    )
+
+    operation_group.add_argument(
+        "--status",
+        action="store_true",
+        help="Show which translations are current, stale, missing, orphaned or untracked"
+    )
+
+    operation_group.add_argument(
+        "--mark",
+        type=Path,
+        nargs="*",
+        metavar="TARGET",
+        help="Record translations as in sync with their current sources (none: all untracked)"
+    )
+
+    operation_group.add_argument(
+        "--history",
+        action="store_true",
+        help="Show logged translation events, most recent first"
+    )
+
+    operation_group.add_argument(
+        "--compact-log",
+        action="store_true",
+        help="Rewrite the translation log without old events superseded by newer ones"
+    )
+
+    operation_group.add_argument(
+        "--batch",
+        action="store_true",
+        help="Translate the pending segments of every batch target (README, Docs, Commands) through --backend"
+    )
+
+    # Options
+    parser.add_argument(
+        "--locale",
+        default="ja",
+        help="Target language (default: ja)"
+    )
+
+    parser.add_argument(
+        "--previous",
+        type=Path,
+        metavar="FILE",
+        help="Previous version of the source, to report changed segments (for --plan)"
+    )
+
+    parser.add_argument(
+        "--translations",
+        type=Path,
+        metavar="JSON",
+        help="Translations of pending segments keyed by hash (for --apply)"
+    )
+
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Where to write the translated file (for --apply; default: print it)"
+    )
+
+    parser.add_argument(
+        "--glossary",
+        type=Path,
+        metavar="JSON",
+        help="Glossary to check against (for --check; default: SuperClaude/Translations/glossary_jp.json)"
+    )
+
+    parser.add_argument(
+        "--rewrite",
+        action="store_true",
+        help="Replace untranslated and inconsistent terms with the glossary translation (for --check)"
+    )
+
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=STATUSES,
+        help="Only show translations with this status (for --status; repeatable)"
+    )
+
+    parser.add_argument(
+        "--file",
+        metavar="PATH",
+        help="Only events for this source file, or files under it with a trailing / (for --history)"
+    )
+
+    parser.add_argument(
+        "--result",
+        metavar="STATUS",
+        help="Only events with this status, such as success or failure (for --history)"
+    )
+
+    parser.add_argument(
+        "--since",
+        metavar="DATE",
+        help="Only events on or after this date, YYYY-MM-DD (for --history)"
+    )
+
+    parser.add_argument(
+        "--until",
+        metavar="DATE",
+        help="Only events on or before this date, YYYY-MM-DD (for --history)"
+    )
+
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="Maximum events to show (for --history; default: 20, 0 for all)"
+    )
+
+    parser.add_argument(
+        "--keep-days",
+        type=int,
+        default=365,
+        help="Keep every event younger than this many days (for --compact-log; default: 365)"
+    )
+
+    parser.add_argument(
+        "--keep-per-file",
+        type=int,
+        default=1,
+        help="Latest events kept per file regardless of age (for --compact-log; default: 1)"
+    )
+
+    parser.add_argument(
+        "--backend",
+        metavar="NAME",
+        help="Translation backend: a registered name (stub) or module:ClassName (for --batch)"
+    )
+
+    parser.add_argument(
+        "--backend-option",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Keyword argument for the backend (for --batch; repeatable)"
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum backend calls in flight (for --batch; default: 4)"
+    )
+
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=0.0,
+        help="Maximum backend calls per second (for --batch; default: unlimited)"
+    )
+
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=3,
+        help="Retries per segment after a backend error (for --batch; default: 3)"
+    )
+
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        metavar="DIR",
+        help="Write every translated file under DIR, mirroring the source tree "
+             "(for --batch; default: configured translations only)"
+    )
+
+    parser.add_argument(
+        "--memory",
+        type=Path,
+        metavar="JSON",
+        help="Translation memory file to use instead of SuperClaude/Translations/memory_jp.json"
+    )
+
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Discard the checkpoint of an interrupted batch instead of resuming it (for --batch)"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print results as JSON"
+    )
+
+    return parser
+
+
+def read_text(path: Path) -> str:
+    """
+    Read a UTF-8 file
+
+    Raises:
+        ValueError: If the file does not exist
+    """
+    if not path.is_file():
+        raise ValueError(f"File not found: {path}")
+    return path.read_text(encoding="utf-8")
+
+
+def load_translations(path: Path) -> Dict[str, str]:
+    """
+    Read a hash -> translation JSON object
+
+    Raises:
+        ValueError: If the file is missing or not a JSON object of strings
+    """
+    try:
+        data = json.loads(read_text(path))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in {path}: {e}")
+    if not isinstance(data, dict) or not all(isinstance(value, str) for value in data.values()):
+        raise ValueError(f"{path} must map segment hashes to translated text")
+    return data
+
+
+def plan_file(args: argparse.Namespace, memory: TranslationMemory) -> int:
+    """Report the segments of a source file that need translating"""
+    plan = memory.plan(read_text(args.plan))
+    stats = plan.stats()
+    changes = None
+    if args.previous:
+        changes = diff_segments(segment_markdown(read_text(args.previous)), plan.segments)
+
+    if args.json:
+        result = {"source": str(args.plan), "locale": memory.locale, **stats,
+                  "pending_segments": [segment.to_dict() for segment in plan.pending]}
+        if changes is not None:
+            result["changes"] = changes
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return 0
+
+    if not args.quiet:
+        display_header("SuperClaude Translate", f"Plan for {args.plan}")
+        print(f"{stats['segments']} segments: {Colors.GREEN}{stats['reused']} from memory{Colors.RESET}, "
+              f"{Colors.YELLOW}{stats['pending']} to translate{Colors.RESET} "
+              f"({stats['pending_chars']} of {stats['total_chars']} characters)")
+        if changes is not None:
+            print(f"{len(changes)} changed regions since {args.previous}")
+        for segment in plan.pending:
+            first_line = segment.text.splitlines()[0] if segment.text else ""
+            print(f"  {Colors.CYAN}{segment.hash[:12]}{Colors.RESET} {segment.kind:<10} {first_line[:70]}")
+    return 0
+
+
+def learn_pair(args: argparse.Namespace, memory: TranslationMemory) -> int:
+    """Seed the memory from an existing translation"""
+    source, target = args.learn
+    learned = memory.learn(read_text(source), read_text(target))
+    if not args.dry_run:
+        memory.save()
+
+    if args.json:
+        print(json.dumps({"source": str(source), "target": str(target), "learned": learned,
+                          "memory_segments": len(memory.segments)}, indent=2, ensure_ascii=False))
+    elif not args.quiet:
+        display_success(f"Learned {learned} segments from {target} ({len(memory.segments)} in memory)")
+    return 0
+
+
+def apply_translations(args: argparse.Namespace, memory: TranslationMemory) -> int:
+    """Assemble a translated file and remember the new segment translations"""
+    plan = memory.plan(read_text(args.apply))
+    translations = load_translations(args.translations) if args.translations else {}
+    text = plan.assemble(translations)
+    stored = plan.record(translations)
+
+    if args.output is None:
+        print(text, end="")
+    elif args.dry_run:
+        display_info(f"Would write {args.output} and remember {stored} segments")
+        return 0
+    else:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text, encoding="utf-8")
+    if not args.dry_run:
+        memory.save()
+
+    if args.output is not None:
+        # A configured translation written from its source is in sync with it
+        index = SyncStatusIndex.for_locale(args.locale, args.install_dir)
+        source, target = index.relative(args.apply), index.relative(args.output)
+        if source and target and index.expected_target(source) == target:
+            index.record(target, source)
+            index.save()
+        log = open_log(memory, args.install_dir)
+        log.append(source or str(args.apply), "success", target=target or str(args.output),
+                   locale=args.locale, segments=stored)
+        if not args.quiet:
+            display_success(f"Wrote {args.output} ({stored} new segments remembered)")
+    return 0
+
+
+def show_status(args: argparse.Namespace) -> int:
+    """Report the sync status of every configured translation"""
+    entries = SyncStatusIndex.for_locale(args.locale, args.install_dir).status()
+    counts = {status: sum(1 for entry in entries if entry["status"] == status) for status in STATUSES}
+    if args.only:
+        entries = [entry for entry in entries if entry["status"] in args.only]
+
+    if args.json:
+        print(json.dumps({"locale": args.locale, "counts": counts, "files": entries}, indent=2, ensure_ascii=False))
+        return 0
+    if args.quiet:
+        return 0
+
+    display_header("SuperClaude Translate", f"Sync status ({args.locale})")
+    rows = [[entry["status"], entry["target"] or "-", entry["source"] or "-",
+             "yes" if entry.get("target_modified") else ""]
+            for entry in entries
+            if entry["status"] != "current" or entry.get("target_modified") or args.only or args.verbose]
+    if rows:
+        display_table(["Status", "Translation", "Source", "Edited"], rows, "Translations needing attention"
+                      if not args.only else "Translations")
+    print(", ".join(f"{count} {status}" for status, count in counts.items()))
+    if counts["untracked"]:
+        display_info("Record up-to-date translations with: SuperClaude translate --mark [TARGET ...]")
+    return 0
+
+
+def mark_translations(args: argparse.Namespace) -> int:
+    """Record translations as made from the current content of their sources"""
+    index = SyncStatusIndex.for_locale(args.locale, args.install_dir)
+    if args.mark:
+        targets = []
+        for path in args.mark:
+            relative = index.relative(path)
+            if relative is None:
+                raise ValueError(f"{path} is not inside {index.base_dir}")
+            targets.append(relative)
+    else:
+        targets = [entry["target"] for entry in index.status() if entry["status"] == "untracked"]
+
+    for target in targets:
+        index.record(target)
+    if not args.dry_run:
+        index.save()
+
+    if args.json:
+        print(json.dumps({"marked": targets, "dry_run": args.dry_run}, indent=2, ensure_ascii=False))
+    elif not args.quiet:
+        verb = "Would record" if args.dry_run else "Recorded"
+        display_success(f"{verb} {len(targets)} translations as in sync with their sources")
+    return 0
+
+
+def open_log(memory: TranslationMemory, install_dir: Path) -> TranslationLog:
+    """
+    Translation log kept next to the memory, with any legacy JSON log moved into it
+
+    The package's log is kept in the state store too when install_dir has it enabled.
+    """
+    log = TranslationLog.beside(memory.memory_file)
+    if log.log_file == TranslationLog.for_package().log_file:
+        log.state_store = StateStore.open_if_enabled(install_dir)
+    log.migrate_legacy()
+    return log
+
+
+def show_history(args: argparse.Namespace, memory: TranslationMemory) -> int:
+    """Report logged translation events"""
+    log = open_log(memory, args.install_dir)
+    entries = log.query(args.file, args.result, args.since, args.until, args.limit or None)
+    summary = log.summary()
+
+    if args.json:
+        print(json.dumps({"summary": summary, "entries": entries}, indent=2, ensure_ascii=False))
+        return 0
+    if args.quiet:
+        return 0
+
+    display_header("SuperClaude Translate", "Translation history")
+    if entries:
+        rows = [[entry.get("timestamp", ""), entry.get("status", ""), entry.get("file", ""),
+                 entry.get("target", ""), entry.get("message", "")] for entry in entries]
+        display_table(["Time", "Status", "Source", "Translation", "Message"], rows)
+    else:
+        display_info("No matching translation events")
+    statuses = ", ".join(f"{count} {status}" for status, count in summary["statuses"].items())
+    print(f"{summary['entries']} events for {summary['files']} files"
+          + (f" ({statuses}) from {summary['first']} to {summary['last']}" if summary["entries"] else ""))
+    if summary["failing"]:
+        display_warning(f"Latest event failed for {len(summary['failing'])} files: "
+                        + ", ".join(summary["failing"][:5]))
+    return 0
+
+
+def compact_log(args: argparse.Namespace, memory: TranslationMemory) -> int:
+    """Drop old, superseded events from the translation log"""
+    log = open_log(memory, args.install_dir)
+    if args.dry_run:
+        display_info(f"Would compact {log.log_file}, keeping {args.keep_days} days and "
+                     f"{args.keep_per_file} events per file")
+        return 0
+    result = log.compact(args.keep_days, args.keep_per_file)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    elif not args.quiet:
+        display_success(f"Kept {result['kept']} events, dropped {result['dropped']} "
+                        f"({result['bytes_before']} -> {result['bytes_after']} bytes)")
+    return 0
+
+
+def parse_backend_options(options: List[str]) -> Dict[str, str]:
+    """
+    Parse KEY=VALUE backend options
+
+    Raises:
+        ValueError: If an option has no '='
+    """
+    parsed = {}
+    for option in options:
+        key, separator, value = option.partition("=")
+        if not separator or not key:
+            raise ValueError(f"Backend options must be KEY=VALUE: {option}")
+        parsed[key] = value
+    return parsed
+
+
+def run_batch(args: argparse.Namespace, memory: TranslationMemory) -> int:
+    """Translate every batch target through a backend, resuming an interrupted run"""
+    from ... import PROJECT_ROOT
+    config = load_translation_pairs().get(args.locale, {}).get("batch")
+    if config is None:
+        raise ValueError(f"No batch targets configured for locale '{args.locale}'")
+    files = discover_batch_files(PROJECT_ROOT, config["include"], config.get("exclude", []))
+    index = SyncStatusIndex.for_locale(args.locale, args.install_dir)
+
+    # Configured translations are written in place; --output-dir mirrors every file instead
+    outputs: Dict[Path, Path] = {}
+    for path in files:
+        source = path.relative_to(PROJECT_ROOT).as_posix()
+        if args.output_dir:
+            outputs[path] = args.output_dir / source
+        elif index.expected_target(source):
+            outputs[path] = PROJECT_ROOT / index.expected_target(source)
+
+    checkpoint_file = memory.memory_file.with_suffix(".checkpoint.jsonl")
+    if args.dry_run:
+        plans = {path: memory.plan(path.read_text(encoding="utf-8")) for path in files}
+        pending = {segment.hash for plan in plans.values() for segment in plan.pending}
+        if args.json:
+            print(json.dumps({"locale": args.locale, "pending_segments": len(pending),
+                              "files": [{"source": str(path.relative_to(PROJECT_ROOT)),
+                                         "output": str(outputs[path]) if path in outputs else None,
+                                         **plans[path].stats()} for path in files]},
+                             indent=2, ensure_ascii=False))
+        elif not args.quiet:
+            display_header("SuperClaude Translate", f"Batch plan ({args.locale})")
+            for path in files:
+                stats = plans[path].stats()
+                output = (index.relative(outputs[path]) or outputs[path]) if path in outputs else "memory only"
+                print(f"  {str(path.relative_to(PROJECT_ROOT)):<50} {stats['pending']:>4} pending -> {output}")
+            display_info(f"{len(files)} files, {len(pending)} distinct segments to translate")
+        return 0
+
+    if not args.backend:
+        raise ValueError("--batch needs --backend (or --dry-run)")
+    backend = get_backend(args.backend, parse_backend_options(args.backend_option))
+    if isinstance(backend, StubBackend) and (args.memory is None or args.output_dir is None):
+        raise ValueError("The stub backend only tags text; use it with --memory and --output-dir")
+
+    scheduler = TranslationScheduler(memory, backend, checkpoint_file, args.concurrency, args.rate, args.retries)
+    if args.restart:
+        scheduler.clear_checkpoint()
+    plans = scheduler.plan(files)
+
+    progress = None
+    bar = None
+    if not args.quiet and not args.json:
+        display_header("SuperClaude Translate", f"Batch translation ({args.locale}, {backend.name})")
+
+        def progress(done: int, total: int) -> None:
+            nonlocal bar
+            if bar is None:
+                bar = ProgressBar(total, prefix="Segments ")
+            bar.update(done)
+
+    stats = scheduler.run(plans, progress)
+    if bar is not None:
+        print()
+    memory.save()
+    scheduler.clear_checkpoint()
+
+    written = []
+    recorded = False
+    if not stats["interrupted"]:
+        log = open_log(memory, args.install_dir)
+        for path, output in outputs.items():
+            plan = plans[path]
+            source, target = index.relative(path), index.relative(output) or str(output)
+            if plan.pending:
+                # Failed segments; the file is written once a later run translates them
+                log.append(source, "failure", target=target, locale=args.locale, backend=backend.name,
+                           message=f"{len(plan.pending)} segments failed")
+                continue
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(plan.assemble(), encoding="utf-8")
+            written.append(output)
+            log.append(source, "success", target=target, locale=args.locale, backend=backend.name)
+            if index.expected_target(source) == target:
+                index.record(target, source)
+                recorded = True
+        if recorded:
+            index.save()
+
+    seconds = stats["seconds"]
+    if args.json:
+        print(json.dumps({"locale": args.locale, "backend": backend.name, **stats,
+                          "written": [str(path) for path in written]}, indent=2, ensure_ascii=False))
+    elif not args.quiet:
+        rate = f", {stats['translated'] / seconds:.1f} segments/s" if seconds else ""
+        display_info(f"{stats['files']} files, {stats['segments']} segments: {stats['reused']} from memory, "
+                     f"{stats['resumed']} from checkpoint, {stats['translated']} translated in "
+                     f"{format_duration(seconds)}{rate}")
+        if stats["failed"]:
+            display_warning(f"{len(stats['failed'])} segments failed; run the batch again to retry them")
+        if stats["interrupted"]:
+            display_warning("Batch interrupted; finished segments are kept, run it again to continue")
+        else:
+            display_success(f"Wrote {len(written)} translated files")
+    return 1 if stats["failed"] or stats["interrupted"] else 0
+
+
+def collect_markdown(paths: List[Path]) -> List[Path]:
+    """
+    Markdown files named directly or found under directories
+
+    Raises:
+        ValueError: If a path does not exist
+    """
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(path.rglob("*.md")))
+        elif path.is_file():
+            files.append(path)
+        else:
+            raise ValueError(f"File not found: {path}")
+    return files
+
+
+def check_glossary(args: argparse.Namespace) -> int:
+    """Report (and optionally fix) glossary terms left untranslated or translated inconsistently"""
+    engine = GlossaryEngine.from_file(args.glossary) if args.glossary else GlossaryEngine.for_locale(args.locale)
+    files = collect_markdown(args.check)
+
+    results = {}
+    rewritten = 0
+    for path in files:
+        text = path.read_text(encoding="utf-8")
+        findings = engine.scan(text)
+        if not findings:
+            continue
+        results[str(path)] = findings
+        if args.rewrite and not args.dry_run:
+            new_text, _count = engine.rewrite(text)
+            path.write_text(new_text, encoding="utf-8")
+            rewritten += 1
+
+    total = sum(len(findings) for findings in results.values())
+    if args.json:
+        print(json.dumps({"files": len(files), "terms": len(engine.terms), "findings": total,
+                          "rewritten": rewritten, "results": results}, indent=2, ensure_ascii=False))
+    elif not args.quiet:
+        display_header("SuperClaude Translate", f"Glossary check ({len(engine.terms)} terms)")
+        for file, findings in results.items():
+            for finding in findings:
+                color = Colors.YELLOW if finding["kind"] == "untranslated" else Colors.RED
+                print(f"{file}:{finding['line']}: {color}{finding['kind']}{Colors.RESET} "
+                      f"'{finding['text']}' -> {finding['suggestion']}")
+        if total:
+            action = f", rewrote {rewritten} files" if rewritten else ""
+            display_warning(f"{total} glossary findings in {len(results)} of {len(files)} files{action}")
+        else:
+            display_success(f"{len(files)} files follow the glossary")
+    return 1 if total and not rewritten else 0
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute translate operation with parsed arguments"""
+    operation = TranslateOperation()
+    operation.setup_operation_logging(args)
+    logger = get_logger()
+
+    try:
+        # Validate global arguments
+        success, errors = operation.validate_global_args(args)
+        if not success:
+            for error in errors:
+                logger.error(error)
+            return 1
+
+        memory = (TranslationMemory(args.memory, args.locale) if args.memory
+                  else TranslationMemory.for_locale(args.locale))
+        try:
+            if args.plan:
+                return plan_file(args, memory)
+            elif args.learn:
+                return learn_pair(args, memory)
+            elif args.check:
+                return check_glossary(args)
+            elif args.status:
+                return show_status(args)
+            elif args.mark is not None:
+                return mark_translations(args)
+            elif args.history:
+                return show_history(args, memory)
+            elif args.compact_log:
+                return compact_log(args, memory)
+            elif args.batch:
+                return run_batch(args, memory)
+            else:
+                return apply_translations(args, memory)
+        except ValueError as e:
+            display_error(str(e))
+            return 1
+
+    except KeyboardInterrupt:
+        print("\nTranslation cancelled by user")
+        return 130
+    except Exception as e:
+        return operation.handle_operation_error("translate", e)
@@ -18,6 +18,7 @@ from ...utils.ui import (
 )
 from ...utils.environment import get_superclaude_environment_variables, cleanup_environment_variables
 from ...utils.logger import get_logger
+from ...utils.lock import InstallLock, LockTimeout
 from ... import DEFAULT_INSTALL_DIR, PROJECT_ROOT
 from . import OperationBase
 
@@ -38,7 +39,8 @@ def verify_superclaude_file(file_path: Path, component: str) -> bool:
         superclaude_patterns = {
             'core': [
                 'CLAUDE.md', 'FLAGS.md', 'PRINCIPLES.md', 'RULES.md', 
-                'ORCHESTRATOR.md', 'SESSION_LIFECYCLE.md'
+                'ORCHESTRATOR.md', 'SESSION_LIFECYCLE.md',
+                'SUPERCLAUDE_BUNDLE.md', '.superclaude-bundle.json'
             ],
             'commands': [
                 # Commands are only in sc/ subdirectory
@@ -202,7 +204,7 @@ def get_installed_components(install_dir: Path) -> Dict[str, Dict[str, Any]]:
     """Get currently installed components and their versions"""
     try:
         settings_manager = SettingsService(install_dir)
-        return settings_manager.get_installed_components()
+        return InstallLock(install_dir).read_snapshot(settings_manager.get_installed_components)
     except Exception:
         return {}
 
@@ -489,7 +491,8 @@ def display_component_details(component: str, info: Dict[str, Any]) -> Dict[str,
     
     component_paths = {
         'core': {
-            'files': ['CLAUDE.md', 'FLAGS.md', 'PRINCIPLES.md', 'RULES.md', 'ORCHESTRATOR.md', 'SESSION_LIFECYCLE.md'],
+            'files': ['CLAUDE.md', 'FLAGS.md', 'PRINCIPLES.md', 'RULES.md', 'ORCHESTRATOR.md', 'SESSION_LIFECYCLE.md',
+                      'SUPERCLAUDE_BUNDLE.md', '.superclaude-bundle.json'],
             'description': 'Core framework files in ~/.claude/'
         },
         'commands': {
@@ -852,12 +855,16 @@ def run(args: argparse.Namespace) -> int:
                 logger.info("Uninstall cancelled by user")
                 return 0
         
-        # Create backup if not dry run and not keeping backups
-        if not args.dry_run and not args.keep_backups:
-            create_uninstall_backup(args.install_dir, components)
-        
         # Perform uninstall
-        success = perform_uninstall(components, args, info, env_vars)
+        if args.dry_run:
+            success = perform_uninstall(components, args, info, env_vars)
+        else:
+            with InstallLock(args.install_dir, "uninstall", timeout=getattr(args, 'lock_timeout', 300)):
+                # Create backup if not keeping backups
+                if not args.keep_backups:
+                    create_uninstall_backup(args.install_dir, components)
+                
+                success = perform_uninstall(components, args, info, env_vars)
         
         if success:
             if not args.quiet:
@@ -874,6 +881,9 @@ def run(args: argparse.Namespace) -> int:
             display_error("Uninstall completed with some failures. Check logs for details.")
             return 1
             
+    except LockTimeout as e:
+        display_error(str(e))
+        return 1
     except KeyboardInterrupt:
         print(f"\n{Colors.YELLOW}Uninstall cancelled by user{Colors.RESET}")
         return 130
@@ -19,7 +19,8 @@ from ...utils.ui import (
 )
 from ...utils.environment import setup_environment_variables
 from ...utils.logger import get_logger
-from ... import DEFAULT_INSTALL_DIR, PROJECT_ROOT
+from ...utils.lock import InstallLock, LockTimeout
+from ... import DEFAULT_INSTALL_DIR, PROJECT_ROOT, __version__
 from . import OperationBase
 
 
@@ -44,6 +45,7 @@ Examples:
   SuperClaude update --check --verbose     # Check for updates (verbose)
   SuperClaude update --components core mcp # Update specific components
   SuperClaude update --backup --force      # Create backup before update (forced)
+  SuperClaude update --changed-only        # Reinstall only what changed in the source checkout
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         parents=parents
@@ -83,6 +85,13 @@ Examples:
         help="Reinstall components even if versions match"
     )
     
+    parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="Update only the installed components and files whose sources changed since the last "
+             "install (git diff against the recorded commit, or a hash scan without git)"
+    )
+    
     return parser
 
 def check_installation_exists(install_dir: Path) -> bool:
@@ -95,7 +104,7 @@ def get_installed_components(install_dir: Path) -> Dict[str, Dict[str, Any]]:
     """Get currently installed components and their versions"""
     try:
         settings_manager = SettingsService(install_dir)
-        return settings_manager.get_installed_components()
+        return InstallLock(install_dir).read_snapshot(settings_manager.get_installed_components)
     except Exception:
         return {}
 
@@ -159,6 +168,10 @@ def get_components_to_update(args: argparse.Namespace, installed_components: Dic
             return None
         return args.components
     
+    # Incremental update: every installed component, narrowed to its changed files by the installer
+    if getattr(args, 'changed_only', False):
+        return list(installed_components.keys())
+    
     # If no updates available and not forcing reinstall
     if not available_updates and not args.reinstall:
         logger.info("No updates available")
@@ -336,6 +349,7 @@ def perform_update(components: List[str], args: argparse.Namespace) -> bool:
             "backup": backup,
             "dry_run": args.dry_run,
             "update_mode": True,
+            "changed_only": getattr(args, 'changed_only', False),
             "selected_mcp_servers": list(mcp_instance.mcp_servers.keys()) if "mcp" in component_instances else []
         }
         
@@ -457,7 +471,11 @@ def run(args: argparse.Namespace) -> int:
                     return 0
         
         # Perform update
-        success = perform_update(components, args)
+        if args.dry_run:
+            success = perform_update(components, args)
+        else:
+            with InstallLock(args.install_dir, "update", timeout=getattr(args, 'lock_timeout', 300)):
+                success = perform_update(components, args)
         
         if success:
             if not args.quiet:
@@ -474,6 +492,9 @@ def run(args: argparse.Namespace) -> int:
             display_error("Update failed. Check logs for details.")
             return 1
             
+    except LockTimeout as e:
+        display_error(str(e))
+        return 1
     except KeyboardInterrupt:
         print(f"\n{Colors.YELLOW}Update cancelled by user{Colors.RESET}")
         return 130
@@ -33,7 +33,11 @@ class AgentsComponent(Component):
                     "version": __version__,
                     "installed": True,
                     "agents_count": len(self.component_files),
-                    "install_directory": str(self.install_component_subdir)
+                    "install_directory": str(self.install_component_subdir),
+                    "locale": self.locale,
+                    "items": self.items,
+                    "packs": self.packs,
+                    "pack_digest": self.pack_digest
                 }
             }
         }
@@ -67,7 +71,11 @@ class AgentsComponent(Component):
                 "version": __version__,
                 "category": "agents",
                 "agents_count": len(self.component_files),
-                "agents_list": self.component_files
+                "agents_list": self.component_files,
+                "locale": self.locale,
+                "items": self.items,
+                "packs": self.packs,
+                "pack_digest": self.pack_digest
             })
             
             self.logger.info("Registered agents component in metadata")
@@ -127,8 +135,9 @@ class AgentsComponent(Component):
             # Check current version
             current_version = self.settings_manager.get_component_version("agents")
             target_version = self.get_metadata()["version"]
+            packs_changed = self.pack_digest != self.settings_manager.get_metadata_setting("components.agents.pack_digest")
             
-            if current_version == target_version:
+            if current_version == target_version and not packs_changed:
                 self.logger.info(f"Agents component already at version {target_version}")
                 return True
             
@@ -145,7 +154,7 @@ class AgentsComponent(Component):
                         self.logger.debug(f"Backed up agent: {filename}")
             
             # Perform installation (will overwrite existing files)
-            if self._install(config):
+            if self.install(config):
                 self.logger.success(f"Agents component updated to version {target_version}")
                 return True
             else:
@@ -174,10 +183,9 @@ class AgentsComponent(Component):
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
         total_size = 0
-        source_dir = self._get_source_dir()
         
         for filename in self.component_files:
-            file_path = source_dir / filename
+            file_path = self._source_file(filename)
             if file_path.exists():
                 total_size += file_path.stat().st_size
         
@@ -221,13 +229,13 @@ class AgentsComponent(Component):
         if not self.get_installed_version():
             errors.append("Agents component not registered in metadata")
         
-        # Check if at least some standard agents are present
+        # Check if at least some standard agents are present (unless only selected agents are installed)
         expected_agents = [
             "system-architect.md",
             "frontend-architect.md", 
             "backend-architect.md",
             "security-engineer.md"
-        ]
+        ] if self.items is None else []
         
         missing_core_agents = []
         for agent in expected_agents:
@@ -31,7 +31,11 @@ class CommandsComponent(Component):
                 "commands": {
                     "version": __version__,
                     "installed": True,
-                    "files_count": len(self.component_files)
+                    "files_count": len(self.component_files),
+                    "locale": self.locale,
+                    "items": self.items,
+                    "packs": self.packs,
+                    "pack_digest": self.pack_digest
                 }
             },
             "commands": {
@@ -45,9 +49,6 @@ class CommandsComponent(Component):
         """Install commands component"""
         self.logger.info("Installing SuperClaude command definitions...")
 
-        # Check for and migrate existing commands from old location
-        self._migrate_existing_commands()
-
         return super()._install(config);
 
     def _post_install(self) -> bool:
@@ -61,7 +62,11 @@ class CommandsComponent(Component):
             self.settings_manager.add_component_registration("commands", {
                 "version": __version__,
                 "category": "commands",
-                "files_count": len(self.component_files)
+                "files_count": len(self.component_files),
+                "locale": self.locale,
+                "items": self.items,
+                "packs": self.packs,
+                "pack_digest": self.pack_digest
             })
             self.logger.info("Updated metadata with commands component registration")
         except Exception as e:
@@ -155,8 +160,9 @@ class CommandsComponent(Component):
             # Check current version
             current_version = self.settings_manager.get_component_version("commands")
             target_version = self.get_metadata()["version"]
+            packs_changed = self.pack_digest != self.settings_manager.get_metadata_setting("components.commands.pack_digest")
             
-            if current_version == target_version:
+            if current_version == target_version and not packs_changed:
                 self.logger.info(f"Commands component already at version {target_version}")
                 return True
             
@@ -244,10 +250,9 @@ class CommandsComponent(Component):
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
         total_size = 0
-        source_dir = self._get_source_dir()
         
         for filename in self.component_files:
-            file_path = source_dir / filename
+            file_path = self._source_file(filename)
             if file_path.exists():
                 total_size += file_path.stat().st_size
         
@@ -267,64 +272,3 @@ class CommandsComponent(Component):
             "install_directory": str(self.install_dir / "commands" / "sc"),
             "dependencies": self.get_dependencies()
         }
-    
-    def _migrate_existing_commands(self) -> None:
-        """Migrate existing commands from old location to new sc subdirectory"""
-        try:
-            old_commands_dir = self.install_dir / "commands"
-            new_commands_dir = self.install_dir / "commands" / "sc"
-            
-            # Check if old commands exist in root commands directory
-            migrated_count = 0
-            commands_to_migrate = []
-            
-            if old_commands_dir.exists():
-                for filename in self.component_files:
-                    old_file_path = old_commands_dir / filename
-                    if old_file_path.exists() and old_file_path.is_file():
-                        commands_to_migrate.append(filename)
-            
-            if commands_to_migrate:
-                self.logger.info(f"Found {len(commands_to_migrate)} existing commands to migrate to sc/ subdirectory")
-                
-                # Ensure new directory exists
-                if not self.file_manager.ensure_directory(new_commands_dir):
-                    self.logger.error(f"Could not create sc commands directory: {new_commands_dir}")
-                    return
-                
-                # Move files from old to new location
-                for filename in commands_to_migrate:
-                    old_file_path = old_commands_dir / filename
-                    new_file_path = new_commands_dir / filename
-                    
-                    try:
-                        # Copy file to new location
-                        if self.file_manager.copy_file(old_file_path, new_file_path):
-                            # Remove old file
-                            if self.file_manager.remove_file(old_file_path):
-                                migrated_count += 1
-                                self.logger.debug(f"Migrated {filename} to sc/ subdirectory")
-                            else:
-                                self.logger.warning(f"Could not remove old {filename}")
-                        else:
-                            self.logger.warning(f"Could not copy {filename} to sc/ subdirectory")
-                    except Exception as e:
-                        self.logger.warning(f"Error migrating {filename}: {e}")
-                
-                if migrated_count > 0:
-                    self.logger.success(f"Successfully migrated {migrated_count} commands to /sc: namespace")
-                    self.logger.info("Commands are now available as /sc:analyze, /sc:build, etc.")
-                    
-                    # Try to remove old commands directory if empty
-                    try:
-                        if old_commands_dir.exists():
-                            remaining_files = [f for f in old_commands_dir.iterdir() if f.is_file()]
-                            if not remaining_files:
-                                # Only remove if no user files remain
-                                old_commands_dir.rmdir()
-                                self.logger.debug("Removed empty old commands directory")
-                    except Exception as e:
-                        self.logger.debug(f"Could not remove old commands directory: {e}")
-                        
-        except Exception as e:
-            self.logger.warning(f"Error during command migration: {e}")
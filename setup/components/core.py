@@ -65,10 +65,6 @@ class CoreComponent(Component):
             })
 
             self.logger.info("Updated metadata with core component registration")
-            
-            # Migrate any existing SuperClaude data from settings.json
-            if self.settings_manager.migrate_superclaude_data():
-                self.logger.info("Migrated existing SuperClaude data from settings.json")
         except Exception as e:
             self.logger.error(f"Failed to update metadata: {e}")
             return False
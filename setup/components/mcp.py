@@ -21,6 +21,7 @@ except ImportError:
     LOCKING_AVAILABLE = None
 
 from ..core.base import Component
+from ..services.state import StateStore
 from setup import __version__
 from ..utils.ui import display_info, display_warning
 
@@ -180,6 +181,11 @@ class MCPComponent(Component):
                     backup_path = config_path.with_suffix('.json.backup')
                     shutil.copy2(config_path, backup_path)
                     self.logger.debug(f"Created backup: {backup_path}")
+                    
+                    state_store = StateStore.open_if_enabled(self.install_dir)
+                    if state_store:
+                        state_store.record_backup(backup_path.name, "claude_json", backup_path,
+                                                  size=backup_path.stat().st_size)
                 
                 # Save updated config with exclusive lock
                 with open(config_path, 'w') as f:
@@ -5,9 +5,11 @@ Abstract base class for installable components
 from abc import ABC, abstractmethod
 from typing import List, Dict, Tuple, Optional, Any
 from pathlib import Path
-import json
 from ..services.files import FileService
 from ..services.settings import SettingsService
+from ..services.claude_md import CLAUDEMdService
+from ..services.locales import LOCALIZED_COMPONENTS, DEFAULT_LOCALE, localize_items, with_source_frontmatter
+from ..services.packs import PackIndex, PACK_COMPONENTS
 from ..utils.logger import get_logger
 from ..utils.security import SecurityValidator
 
@@ -28,6 +30,21 @@ class Component(ABC):
         # Resolve path safely
         self.install_dir = self._resolve_path_safely(install_dir or DEFAULT_INSTALL_DIR)
         self.settings_manager = SettingsService(self.install_dir)
+        # Localized components install one variant of each item (see setup/services/locales.py),
+        # optionally only the items of a selection (see setup/services/selection.py),
+        # with the items of content packs layered over them (see setup/services/packs.py)
+        self.locale = self._get_installed_locale()
+        self.items = self._get_installed_items()
+        self.packs = self._get_installed_packs()
+        self.pack_index: Optional[PackIndex] = None
+        self.pack_roots: Dict[str, str] = {}
+        self.source_paths: Dict[str, str] = {}
+        self.replaced_files: List[str] = []
+        # Installed files (relative to install_dir) to copy in an incremental install; None copies all
+        self.changed_files: Optional[List[str]] = None
+        # Install-time content transforms (see _transform_content)
+        self.minifier = None
+        self.variant_sources: Dict[str, Path] = {}
         self.component_files = self._discover_component_files()
         self.file_manager = FileService()
         self.install_component_subdir = self.install_dir / component_subdir
@@ -64,7 +81,7 @@ class Component(ABC):
         # Check if all required framework files exist
         missing_files = []
         for filename in self.component_files:
-            source_file = source_dir / filename
+            source_file = self._source_file(filename)
             if not source_file.exists():
                 missing_files.append(filename)
 
@@ -86,12 +103,17 @@ class Component(ABC):
         # Get files to install
         files_to_install = self.get_files_to_install()
 
-        # Validate all files for security
-        is_safe, security_errors = SecurityValidator.validate_component_files(
-            files_to_install, source_dir, self.install_component_subdir
-        )
-        if not is_safe:
-            errors.extend(security_errors)
+        # Validate all files for security (pack items against their pack's directory)
+        files_by_root: Dict[Path, List[Tuple[Path, Path]]] = {}
+        for source, target in files_to_install:
+            root = self.pack_roots.get(target.name)
+            files_by_root.setdefault(Path(root) if root else source_dir, []).append((source, target))
+        for root, files in files_by_root.items():
+            is_safe, security_errors = SecurityValidator.validate_component_files(
+                files, root, self.install_component_subdir
+            )
+            if not is_safe:
+                errors.extend(security_errors)
 
         if not self.file_manager.ensure_directory(self.install_component_subdir):
             errors.append(f"Could not create install directory: {self.install_component_subdir}")
@@ -110,7 +132,7 @@ class Component(ABC):
 
         if source_dir:
             for filename in self.component_files:
-                source = source_dir / filename
+                source = self._source_file(filename)
                 target = self.install_component_subdir / filename
                 files.append((source, target))
 
@@ -129,6 +151,27 @@ class Component(ABC):
     
     def install(self, config: Dict[str, Any]) -> bool:
         try:
+            # Install-time content transforms (localized frontmatter, --minify) applied to copied files
+            self.minifier = config.get("minifier")
+            self.variant_sources = self._localized_variants()
+            self.file_manager.content_transform = (self._transform_content
+                                                   if self.minifier or self.variant_sources else None)
+            # Files already copied from an unchanged source are left alone unless forced
+            self.file_manager.skip_unchanged = not config.get("force", False)
+            self.file_manager.skipped_files = []
+            self.file_manager.only_targets = (None if self.changed_files is None
+                                              else {self.install_dir / path for path in self.changed_files})
+            # Items of a previously installed locale or selection, or whose source is gone
+            removed = []
+            for filename in self.replaced_files:
+                target = self.install_component_subdir / filename
+                if target.is_file() and self.file_manager.remove_file(target):
+                    removed.append(filename)
+                    self.logger.debug(f"Removed {filename}, no longer selected")
+            if removed and self.install_component_subdir == self.install_dir:
+                # Files installed at the top level may be imported by CLAUDE.md
+                CLAUDEMdService(self.install_dir).remove_imports(removed)
+            self.replaced_files = []
             return self._install(config)
         except Exception as e:
             self.logger.exception(f"Unexpected error during {repr(self)} installation: {e}")
@@ -170,7 +213,9 @@ class Component(ABC):
             self.logger.error(f"Only {success_count}/{len(files_to_install)} files copied successfully")
             return False
 
-        self.logger.success(f"{repr(self)} component installed successfully ({success_count} files)")
+        unchanged = len(self.file_manager.skipped_files)
+        self.logger.success(f"{repr(self)} component installed successfully ({success_count} files"
+                            f"{f', {unchanged} unchanged' if unchanged else ''})")
 
         return self._post_install()
 
@@ -228,20 +273,13 @@ class Component(ABC):
             Version string if installed, None otherwise
         """
         self.logger.debug("Checking installed version")
-        metadata_file = self.install_dir / ".superclaude-metadata.json"
-        if metadata_file.exists():
-            self.logger.debug("Metadata file exists, reading version")
-            try:
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                component_name = self.get_metadata()['name']
-                version = metadata.get('components', {}).get(component_name, {}).get('version')
-                self.logger.debug(f"Found version: {version}")
-                return version
-            except Exception as e:
-                self.logger.warning(f"Failed to read version from metadata: {e}")
-        else:
-            self.logger.debug("Metadata file does not exist")
+        try:
+            component_name = self.get_metadata()['name']
+            version = self.settings_manager.get_component_version(component_name)
+            self.logger.debug(f"Found version: {version}")
+            return version
+        except Exception as e:
+            self.logger.warning(f"Failed to read version from metadata: {e}")
         return None
     
     def is_installed(self) -> bool:
@@ -301,11 +339,180 @@ class Component(ABC):
         if not source_dir:
             return []
 
-        return self._discover_files_in_directory(
+        return self._localize(self._discover_files_in_directory(
             source_dir,
             extension='.md',
             exclude_patterns=['README.md', 'CHANGELOG.md', 'LICENSE.md']
-        )
+        ))
+
+    def set_locale(self, locale: str) -> None:
+        """
+        Select the locale variant of each item to install
+
+        Args:
+            locale: Locale name (see setup/services/locales.py); ignored by components without localized content
+        """
+        if self.get_metadata()["name"] not in LOCALIZED_COMPONENTS or locale == self.locale:
+            return
+        self.locale = locale
+        self._rediscover()
+
+    def set_items(self, items: Optional[List[str]]) -> None:
+        """
+        Restrict the component to a selection of its items
+
+        Args:
+            items: English item file names (e.g. ['analyze.md']), or None for every item;
+                ignored by components without selectable items
+        """
+        if self.get_metadata()["name"] not in LOCALIZED_COMPONENTS:
+            return
+        items = sorted(items) if items is not None else None
+        if items == self.items:
+            return
+        self.items = items
+        self._rediscover()
+
+    def set_packs(self, packs: List[str]) -> None:
+        """
+        Layer content packs over the built-in items
+
+        Args:
+            packs: Pack directories or archives (an empty list removes every pack);
+                ignored by components packs can't extend
+
+        Raises:
+            ValueError: If a pack can't be read
+        """
+        if self.get_metadata()["name"] not in PACK_COMPONENTS:
+            return
+        packs = [str(Path(pack).expanduser().resolve()) for pack in packs]
+        self.pack_index = PackIndex.for_install_dir(self.install_dir)
+        self.pack_index.refresh(packs)
+        self.packs = packs
+        self._rediscover()
+
+    @property
+    def pack_digest(self) -> Optional[str]:
+        """Identity of the layered packs' content (None without packs)"""
+        return self.pack_index.data["digest"] if self.pack_index and self.packs else None
+
+    def set_changed_files(self, files: Optional[List[str]], removed: Optional[List[str]] = None) -> None:
+        """
+        Limit the next installation to the files whose source changed
+
+        Args:
+            files: Installed file paths (relative to the install directory) to copy, or None for all
+            removed: Installed file paths whose source is gone, removed before installing
+        """
+        self.changed_files = files
+        for path in removed or []:
+            try:
+                relative = (self.install_dir / path).relative_to(self.install_component_subdir).as_posix()
+            except ValueError:
+                continue
+            if relative not in self.replaced_files:
+                self.replaced_files.append(relative)
+
+    def _rediscover(self) -> None:
+        """Rediscover items after a locale or selection change, noting installed files to remove"""
+        previous = set(self.component_files) | set(self.replaced_files)
+        self.component_files = self._discover_component_files()
+        self.replaced_files = sorted(previous - set(self.component_files))
+
+    def _get_installed_locale(self) -> str:
+        """Locale recorded by the last installation of this component"""
+        name = self.get_metadata()["name"]
+        if name not in LOCALIZED_COMPONENTS:
+            return DEFAULT_LOCALE
+        return self.settings_manager.get_metadata_setting(f"components.{name}.locale", DEFAULT_LOCALE)
+
+    def _get_installed_packs(self) -> List[str]:
+        """Content packs recorded by the last installation of this component"""
+        name = self.get_metadata()["name"]
+        if name not in PACK_COMPONENTS:
+            return []
+        return self.settings_manager.get_metadata_setting(f"components.{name}.packs") or []
+
+    def _get_installed_items(self) -> Optional[List[str]]:
+        """Item selection recorded by the last installation of this component (None: every item)"""
+        name = self.get_metadata()["name"]
+        if name not in LOCALIZED_COMPONENTS:
+            return None
+        return self.settings_manager.get_metadata_setting(f"components.{name}.items")
+
+    def _localize(self, files: List[str]) -> List[str]:
+        """
+        Apply the component's locale and item selection to discovered items
+
+        Args:
+            files: English item file names
+
+        Returns:
+            Installed file names, including localized-only items unless items are selected
+        """
+        name = self.get_metadata()["name"]
+        if name not in LOCALIZED_COMPONENTS:
+            return files
+        self.source_paths = localize_items(name, files, self.locale)
+        self.pack_roots = {}
+        if self.packs:
+            self.source_paths = self._overlay_packs(name, self.source_paths)
+        if self.items is not None:
+            self.source_paths = {item: path for item, path in self.source_paths.items() if item in self.items}
+        return sorted(self.source_paths)
+
+    def _overlay_packs(self, name: str, source_paths: Dict[str, str]) -> Dict[str, str]:
+        """
+        Layer the pack index's items over the built-in ones
+
+        Recorded packs that can no longer be read are served from the stored index.
+
+        Returns:
+            Installed file name -> source path (absolute for pack items)
+        """
+        if self.pack_index is None:
+            self.pack_index = PackIndex.for_install_dir(self.install_dir)
+            try:
+                self.pack_index.refresh(self.packs)
+            except ValueError as e:
+                self.logger.warning(f"Using the stored pack index: {e}")
+                self.pack_index.load()
+        combined = self.pack_index.overlay(name, source_paths)
+        merged = self.pack_index.merged(name)
+        self.pack_roots = {item: merged[item]["root"] for item, path in combined.items()
+                           if item in merged and path == merged[item]["path"]}
+        return combined
+
+    def _localized_variants(self) -> Dict[str, Path]:
+        """Installed file name -> English source of items installed from a locale variant"""
+        source_dir = self._get_source_dir()
+        if not source_dir or self.locale == DEFAULT_LOCALE:
+            return {}
+        return {filename: source_dir / filename for filename, path in self.source_paths.items()
+                if path != filename and filename not in self.pack_roots and (source_dir / filename).is_file()}
+
+    def _transform_content(self, source: Path, target: Path) -> Optional[str]:
+        """
+        Content of an installed file (FileService content transform)
+
+        Locale variants get the frontmatter of their English item; the minifier
+        then applies to the result.
+
+        Returns:
+            Text to write, or None to copy the source unchanged
+        """
+        text = None
+        english = self.variant_sources.get(target.name)
+        if english is not None and source.suffix == ".md":
+            text = with_source_frontmatter(source.read_text(encoding="utf-8"), english.read_text(encoding="utf-8"))
+        if self.minifier:
+            return self.minifier.transform(source, target, text)
+        return text
+
+    def _source_file(self, filename: str) -> Path:
+        """Source of an installed file: its variant for the selected locale, or a pack's item"""
+        return self._get_source_dir() / self.source_paths.get(filename, filename)
 
     def _discover_files_in_directory(self, directory: Path, extension: str = '.md',
                                    exclude_patterns: Optional[List[str]] = None) -> List[str]:
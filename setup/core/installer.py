@@ -6,8 +6,21 @@ from typing import List, Dict, Optional, Set, Tuple, Any
 from pathlib import Path
 import shutil
 import tempfile
+import contextlib
 from datetime import datetime
 from .base import Component
+from .. import CACHE_DIR_NAME
+from ..services.claude_md import CLAUDEMdService
+from ..services.dedup import SharedIncludeService, installed_framework_files
+from ..services.frontmatter import FrontmatterIndex
+from ..services.router import AgentRouter
+from ..services.import_profiles import ImportPolicy
+from ..services.migrations import MigrationService
+from ..services.minify import MarkdownMinifier
+from ..services.state import StateStore
+from ..services.settings import SettingsService
+from ..services.source_sync import SourceSync
+from ..utils.lock import LOCK_DIR_NAME
 from ..utils.logger import get_logger
 
 
@@ -16,17 +29,26 @@ class Installer:
 
     def __init__(self,
                  install_dir: Optional[Path] = None,
-                 dry_run: bool = False):
+                 dry_run: bool = False,
+                 import_policy: Optional[ImportPolicy] = None,
+                 minifier: Optional[MarkdownMinifier] = None,
+                 shared_includes: Optional[bool] = None):
         """
         Initialize installer
         
         Args:
             install_dir: Target installation directory
             dry_run: If True, only simulate installation
+            import_policy: Import profile / context budget (default: the one recorded by the last install)
+            minifier: Markdown minifier for installed files (default: the one recorded by the last install)
+            shared_includes: Factor duplicated sections into shared includes (default: the last install's choice)
         """
         from .. import DEFAULT_INSTALL_DIR
         self.install_dir = install_dir or DEFAULT_INSTALL_DIR
         self.dry_run = dry_run
+        self.import_policy = import_policy
+        self.minifier = minifier
+        self.shared_includes = shared_includes
         self.components: Dict[str, Component] = {}
         self.installed_components: Set[str] = set()
         self.updated_components: Set[str] = set()
@@ -160,7 +182,7 @@ class Installer:
 
             # Copy all files except backups and local directories
             for item in self.install_dir.iterdir():
-                if item.name not in ["backups", "local"]:
+                if item.name not in ["backups", "local", LOCK_DIR_NAME, CACHE_DIR_NAME]:
                     try:
                         if item.is_file():
                             shutil.copy2(item, temp_backup / item.name)
@@ -170,6 +192,8 @@ class Installer:
                         # Log warning but continue backup process
                         self.logger.warning(f"Could not backup {item.name}: {e}")
 
+            files_backed_up = sum(1 for item in temp_backup.rglob("*") if item.is_file())
+
             # Create archive only if there are files to backup
             if any(temp_backup.iterdir()):
                 # shutil.make_archive adds .tar.gz automatically, so use base name without extensions
@@ -183,6 +207,12 @@ class Installer:
                 )
 
         self.backup_path = backup_path
+
+        state_store = StateStore.open_if_enabled(self.install_dir)
+        if state_store and backup_path.exists():
+            state_store.record_backup(backup_path.name, "installation", backup_path,
+                                      size=backup_path.stat().st_size, info={"files": files_backed_up})
+
         return backup_path
 
     def install_component(self, component_name: str,
@@ -206,6 +236,15 @@ class Installer:
         if component_name in self.installed_components:
             return True
 
+        self._configure_component(component_name, config)
+
+        # Incremental installs leave components whose sources are unchanged alone
+        changed = config.get("changed_files")
+        if changed is not None and component_name not in changed:
+            self.logger.info(f"{component_name} is unchanged since the last install")
+            self.skipped_components.add(component_name)
+            return True
+
         # Check prerequisites
         success, errors = component.validate_prerequisites()
         if not success:
@@ -226,6 +265,8 @@ class Installer:
             if success:
                 self.installed_components.add(component_name)
                 self.updated_components.add(component_name)
+                if not self.dry_run:
+                    self._record_installed_files(component_name, component)
             else:
                 self.failed_components.add(component_name)
 
@@ -236,6 +277,107 @@ class Installer:
             self.failed_components.add(component_name)
             return False
 
+    def _configure_component(self, component_name: str, config: Dict[str, Any]) -> None:
+        """Apply the locale, item selection and content packs of an installation to a component"""
+        component = self.components[component_name]
+        if config.get("locale"):
+            component.set_locale(config["locale"])
+        if component_name in config.get("items", {}):
+            component.set_items(config["items"][component_name])
+        if config.get("packs") is not None:
+            component.set_packs(config["packs"])
+
+    def _plan_changed_files(self, ordered_names: List[str], config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Limit an installation to the components and files whose sources changed
+
+        Args:
+            ordered_names: Components to install
+            config: Installation configuration
+
+        Returns:
+            The configuration with changed_files (component -> files, None for all)
+        """
+        sync = SourceSync.for_install_dir(self.install_dir)
+        components = {name: self.components[name] for name in ordered_names}
+        for name in ordered_names:
+            self._configure_component(name, config)
+        plan = sync.plan(components, self._content_settings())
+        described = []
+        for name, files in plan.items():
+            removed = sync.removed_targets(name, components[name])
+            components[name].set_changed_files(files, removed)
+            if files is None:
+                described.append(f"{name} (all files)")
+            else:
+                described.append(f"{name} ({len(files)} changed" + (f", {len(removed)} removed)" if removed else ")"))
+        if plan:
+            self.logger.info(f"Changed since the last install ({sync.method}): {', '.join(described)}")
+        else:
+            self.logger.info(f"No source changes since the last install ({sync.method})")
+        return dict(config, changed_files=plan)
+
+    def _plan_removed_files(self, ordered_names: List[str], config: Dict[str, Any]) -> None:
+        """
+        Remove installed files the last install recorded that are no longer part of their
+        component, such as items deleted from a content pack
+        """
+        sync = SourceSync.for_install_dir(self.install_dir)
+        if not sync.load():
+            return
+        for name in ordered_names:
+            self._configure_component(name, config)
+            removed = sync.removed_targets(name, self.components[name])
+            if removed:
+                self.components[name].set_changed_files(self.components[name].changed_files, removed)
+
+    def _content_settings(self) -> Dict[str, Any]:
+        """Settings besides the sources that change the installed content, compared by --changed-only"""
+        policy = self.import_policy or ImportPolicy.from_metadata(self.install_dir)
+        shared_includes = self.shared_includes
+        if shared_includes is None:
+            shared_includes = SharedIncludeService.is_enabled(self.install_dir)
+        return {
+            "minify": self.minifier.options() if self.minifier else None,
+            "shared_includes": bool(shared_includes),
+            "import_profile": policy.options() if policy else None
+        }
+
+    def _record_sources(self) -> None:
+        """Record the source commit and files of the installed components for incremental installs"""
+        installed = {name: self.components[name] for name in self.installed_components if name in self.components}
+        if not installed:
+            return
+        try:
+            commit = SourceSync.for_install_dir(self.install_dir).record(installed, self._content_settings())
+            if commit:
+                SettingsService(self.install_dir).update_metadata({
+                    "source": {"commit": commit, "synced_at": datetime.now().isoformat(timespec="seconds")}
+                })
+        except Exception as e:
+            self.logger.warning(f"Could not record the installed sources: {e}")
+
+    def _record_installed_files(self, component_name: str, component: Component) -> None:
+        """
+        Record a component's installed files in the state store, if enabled
+        
+        Args:
+            component_name: Name of installed component
+            component: Installed component instance
+        """
+        state_store = StateStore.open_if_enabled(self.install_dir)
+        if not state_store:
+            return
+        
+        try:
+            files = []
+            for _, target in component.get_files_to_install():
+                if target.is_file():
+                    files.append((target, component.file_manager.get_file_hash(target), target.stat().st_size))
+            state_store.record_installed_files(component_name, files)
+        except Exception as e:
+            self.logger.warning(f"Could not record installed files for {component_name}: {e}")
+
     def install_components(self,
                            component_names: List[str],
                            config: Optional[Dict[str, Any]] = None) -> bool:
@@ -266,8 +408,8 @@ class Installer:
                 self.logger.error(f"  - {error}")
             return False
 
-        # Create backup if updating
-        if self.install_dir.exists() and not self.dry_run:
+        # Create backup if updating (unless turned off, as with --no-backup)
+        if self.install_dir.exists() and not self.dry_run and config.get("backup", True):
             self.logger.info("Creating backup of existing installation...")
             try:
                 self.create_backup()
@@ -275,19 +417,82 @@ class Installer:
                 self.logger.error(f"Failed to create backup: {e}")
                 return False
 
-        # Install each component
+        # Bring an older installation's metadata and layout up to date, once
+        if not self.dry_run:
+            try:
+                MigrationService(self.install_dir).run_pending()
+            except RuntimeError as e:
+                self.logger.error(str(e))
+                return False
+
+        # Keep minifying installed files if an earlier install did
+        if self.minifier is None:
+            self.minifier = MarkdownMinifier.from_metadata(self.install_dir, dry_run=self.dry_run)
+        if self.minifier:
+            config = dict(config, minifier=self.minifier)
+
+        if config.get("changed_only"):
+            config = self._plan_changed_files(ordered_names, config)
+        elif not self.dry_run:
+            self._plan_removed_files(ordered_names, config)
+
+        # Install each component, batching their CLAUDE.md import changes
         all_success = True
-        for name in ordered_names:
-            self.logger.info(f"Installing {name}...")
-            if not self.install_component(name, config):
-                all_success = False
-                # Continue installing other components even if one fails
+        with self._claude_md_transaction() as transaction:
+            for name in ordered_names:
+                self.logger.info(f"Installing {name}...")
+                if not self.install_component(name, config):
+                    all_success = False
+                    # Continue installing other components even if one fails
+        if transaction is not None and not transaction.succeeded:
+            self.logger.error("Could not update the CLAUDE.md imports")
+            all_success = False
+
+        if self.minifier:
+            self.minifier.record()
+
+        if not self.dry_run:
+            self._record_sources()
+            self._apply_shared_includes()
+            self._refresh_indexes()
 
         if not self.dry_run:
             self._run_post_install_validation()
 
         return all_success
 
+    def _refresh_indexes(self) -> None:
+        """Refresh the frontmatter index and agent routes of the installation"""
+        try:
+            FrontmatterIndex.for_install_dir(self.install_dir).refresh()
+            AgentRouter.for_install_dir(self.install_dir).load()
+        except Exception as e:
+            self.logger.warning(f"Could not refresh the frontmatter index and agent routes: {e}")
+
+    def _apply_shared_includes(self) -> None:
+        """Factor duplicated sections out of installed files, or inline them again when turned off"""
+        enabled = self.shared_includes
+        if enabled is None:
+            enabled = SharedIncludeService.is_enabled(self.install_dir)
+            if not enabled:
+                return
+        try:
+            service = SharedIncludeService(self.install_dir)
+            files = installed_framework_files(self.install_dir)
+            if enabled:
+                service.factor(files)
+            else:
+                service.inline(files)
+        except Exception as e:
+            self.logger.warning(f"Could not update shared includes: {e}")
+
+    def _claude_md_transaction(self):
+        """CLAUDE.md transaction for this operation (no-op context in dry run)"""
+        if self.dry_run:
+            return contextlib.nullcontext()
+        policy = self.import_policy or ImportPolicy.from_metadata(self.install_dir)
+        return CLAUDEMdService(self.install_dir).transaction(policy)
+
     def _run_post_install_validation(self) -> None:
         """Run post-installation validation for all installed components"""
         self.logger.info("Running post-installation validation...")
@@ -5,12 +5,35 @@ Business logic services for the SuperClaude installation system
 
 from .claude_md import CLAUDEMdService
 from .config import ConfigService
+from .context import ContextBundleService
+from .dedup import DuplicationAnalyzer, SharedIncludeService
 from .files import FileService
+from .frontmatter import FrontmatterIndex
+from .lint import ContentLinter
+from .migrations import MigrationService
+from .minify import MarkdownMinifier
+from .profiler import ContextProfiler
+from .router import AgentRouter
+from .search import SearchIndex
 from .settings import SettingsService
+from .state import StateStore
+from .translation_memory import TranslationMemory
 
 __all__ = [
     'CLAUDEMdService',
     'ConfigService', 
+    'ContextBundleService',
+    'DuplicationAnalyzer',
+    'SharedIncludeService',
     'FileService',
-    'SettingsService'
+    'FrontmatterIndex',
+    'ContentLinter',
+    'MigrationService',
+    'MarkdownMinifier',
+    'ContextProfiler',
+    'AgentRouter',
+    'SearchIndex',
+    'SettingsService',
+    'StateStore',
+    'TranslationMemory'
 ]
\ No newline at end of file
@@ -2,12 +2,67 @@
 CLAUDE.md Manager for preserving user customizations while managing framework imports
 """
 
+import os
 import re
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Set, Dict, Optional
+from typing import List, Set, Dict, Optional, Tuple, Iterator
 from ..utils.logger import get_logger
 
 
+FRAMEWORK_MARKER = "# ═══════════════════════════════════════════════════\n# SuperClaude Framework Components"
+
+IMPORT_PATTERN = re.compile(r'^@([^\s\n]+\.md)\s*$', re.MULTILINE)
+
+DEFAULT_CONTENT = """# SuperClaude Entry Point
+
+This file serves as the entry point for the SuperClaude framework.
+You can add your own custom instructions and configurations here.
+
+The SuperClaude framework components will be automatically imported below.
+"""
+
+
+class CLAUDEMdTransaction:
+    """
+    Batch of CLAUDE.md import changes applied with a single read and write
+    
+    While a transaction is open for an installation directory, add_imports and
+    remove_imports on any CLAUDEMdService for that directory queue their
+    changes here instead of touching the file.
+    """
+    
+    def __init__(self, service: "CLAUDEMdService", policy=None):
+        self.service = service
+        self.policy = policy
+        self.changes: List[Tuple[str, List[str], Optional[str]]] = []
+        # Result of the write when the transaction ended (see CLAUDEMdService.transaction)
+        self.succeeded = True
+    
+    def add(self, files: List[str], category: str) -> None:
+        """Queue imports to add under a category"""
+        self.changes.append(("add", list(files), category))
+    
+    def remove(self, files: List[str]) -> None:
+        """Queue imports to remove from all categories"""
+        self.changes.append(("remove", list(files), None))
+    
+    def commit(self) -> bool:
+        """
+        Apply all queued changes
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        changes, self.changes = self.changes, []
+        if not changes and self.policy is None:
+            return True
+        return self.service._apply_changes(changes, self.policy)
+
+
+_open_transactions: Dict[Path, CLAUDEMdTransaction] = {}
+
+
 class CLAUDEMdService:
     """Manages CLAUDE.md file updates while preserving user customizations"""
     
@@ -39,9 +94,7 @@ class CLAUDEMdService:
                 content = f.read()
             
             # Find all @import statements using regex
-            import_pattern = r'^@([^\s\n]+\.md)\s*$'
-            matches = re.findall(import_pattern, content, re.MULTILINE)
-            existing_imports.update(matches)
+            existing_imports.update(IMPORT_PATTERN.findall(content))
             
             self.logger.debug(f"Found existing imports: {existing_imports}")
             
@@ -78,10 +131,8 @@ class CLAUDEMdService:
             User content without framework imports
         """
         # Look for framework imports section marker
-        framework_marker = "# ═══════════════════════════════════════════════════\n# SuperClaude Framework Components"
-        
-        if framework_marker in content:
-            user_content = content.split(framework_marker)[0].rstrip()
+        if FRAMEWORK_MARKER in content:
+            user_content = content.split(FRAMEWORK_MARKER)[0].rstrip()
         else:
             # If no framework section exists, preserve all content
             user_content = content.rstrip()
@@ -119,10 +170,46 @@ class CLAUDEMdService:
         
         return "\n".join(sections)
     
+    @contextmanager
+    def transaction(self, policy=None) -> Iterator[CLAUDEMdTransaction]:
+        """
+        Collect import changes from every component and write CLAUDE.md once
+        
+        Changes queued before an exception are still applied, so files that
+        were installed keep their imports. Nested calls join the open transaction.
+        Whether the write succeeded is left in the transaction's succeeded.
+        
+        Args:
+            policy: Optional ImportPolicy deciding which framework files are imported
+        
+        Yields:
+            The open transaction
+        """
+        key = self.install_dir.resolve()
+        if key in _open_transactions:
+            yield _open_transactions[key]
+            return
+        
+        transaction = CLAUDEMdTransaction(self, policy)
+        _open_transactions[key] = transaction
+        try:
+            yield transaction
+        finally:
+            del _open_transactions[key]
+            transaction.succeeded = transaction.commit()
+    
+    def _open_transaction(self) -> Optional[CLAUDEMdTransaction]:
+        """Get the transaction open for this installation directory, if any"""
+        if not _open_transactions:
+            return None
+        return _open_transactions.get(self.install_dir.resolve())
+    
     def add_imports(self, files: List[str], category: str = "Framework") -> bool:
         """
         Add new imports with duplicate checking and user content preservation
         
+        Inside a transaction the change is queued until the transaction ends.
+        
         Args:
             files: List of filenames to import
             category: Category name for organizing imports
@@ -130,60 +217,157 @@ class CLAUDEMdService:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            # Ensure CLAUDE.md exists
-            self.ensure_claude_md_exists()
-            
-            # Read existing content and imports
-            existing_content = self.read_existing_content()
-            existing_imports = self.read_existing_imports()
-            
-            # Filter out files already imported
-            new_files = [f for f in files if f not in existing_imports]
+        transaction = self._open_transaction()
+        if transaction is not None:
+            transaction.add(files, category)
+            return True
+        return self._apply_changes([("add", list(files), category)])
+    
+    def _apply_changes(self, changes: List[Tuple[str, List[str], Optional[str]]], policy=None) -> bool:
+        """
+        Apply import changes with one read, one parse and at most one write
+        
+        Args:
+            changes: (action, files, category) tuples, action is "add" or "remove"
+            policy: Optional ImportPolicy filtering the resulting framework imports
             
-            if not new_files:
-                self.logger.info("All files already imported, no changes needed")
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            # A linked context bundle owns the framework imports; CLAUDE.md stays as is
+            from .context import ContextBundleService
+            bundle = ContextBundleService(self.install_dir)
+            if bundle.is_linked():
+                bundle.absorb_import_changes(changes, policy)
                 return True
             
-            self.logger.info(f"Adding {len(new_files)} new imports to category '{category}': {new_files}")
-            
-            # Extract user content (preserve everything before framework section)
+            existing_content = self.read_existing_content()
+            exists = self.claude_md_path.exists()
+            if not exists:
+                if not any(action == "add" for action, _, _ in changes):
+                    return True  # Nothing to remove
+                existing_content = DEFAULT_CONTENT
+            
+            # Parse once
+            existing_imports = set(IMPORT_PATTERN.findall(existing_content))
             user_content = self.extract_user_content(existing_content)
+            framework_imports = self._parse_existing_framework_imports(existing_content)
+            
+            added = removed = 0
+            for action, files, category in changes:
+                if action == "add":
+                    # Filter out files already imported
+                    new_files = [f for f in dict.fromkeys(files) if f not in existing_imports]
+                    if not new_files:
+                        continue
+                    self.logger.info(f"Adding {len(new_files)} new imports to category '{category}': {new_files}")
+                    framework_imports.setdefault(category, []).extend(new_files)
+                    existing_imports.update(new_files)
+                    added += len(new_files)
+                else:
+                    for category_files in framework_imports.values():
+                        for file in files:
+                            if file in category_files:
+                                category_files.remove(file)
+                                existing_imports.discard(file)
+                                removed += 1
+            
+            if policy is not None:
+                before = {file for files in framework_imports.values() for file in files}
+                framework_imports = self._apply_policy(policy, framework_imports, user_content)
+                after = {file for files in framework_imports.values() for file in files}
+                added += len(after - before)
+                removed += len(before - after)
+            
+            if not added and not removed and exists:
+                if any(action == "add" for action, _, _ in changes):
+                    self.logger.info("All files already imported, no changes needed")
+                return True
             
-            # Parse existing framework imports by category
-            existing_framework_imports = self._parse_existing_framework_imports(existing_content)
-            
-            # Add new files to the specified category
-            if category not in existing_framework_imports:
-                existing_framework_imports[category] = []
-            existing_framework_imports[category].extend(new_files)
-            
-            # Build new content
-            new_content_parts = []
+            new_content = self._render(user_content, framework_imports)
+            if exists and new_content == existing_content:
+                self.logger.debug("CLAUDE.md unchanged, skipping write")
+                return True
             
-            # Add user content
-            if user_content.strip():
-                new_content_parts.append(user_content)
-                new_content_parts.append("")  # Add blank line before framework section
+            self._write(new_content)
             
-            # Add organized framework imports
-            framework_section = self.organize_imports_by_category(existing_framework_imports)
-            if framework_section:
-                new_content_parts.append(framework_section)
+            if not exists:
+                self.logger.info("Created CLAUDE.md with default content")
+            if added:
+                self.logger.success(f"Updated CLAUDE.md with {added} new imports")
+            if removed:
+                self.logger.info(f"Removed {removed} imports from CLAUDE.md")
+            return True
             
-            # Write updated content
-            new_content = "\n".join(new_content_parts)
+        except Exception as e:
+            self.logger.error(f"Failed to update CLAUDE.md: {e}")
+            return False
+    
+    def _apply_policy(self, policy, framework_imports: Dict[str, List[str]], user_content: str) -> Dict[str, List[str]]:
+        """Filter framework imports through an import policy, keeping category order"""
+        from ..utils.tokens import count_tokens
+        
+        roots = [(category, file) for category, files in framework_imports.items() for file in files]
+        kept = policy.apply(roots, self.install_dir, count_tokens(user_content, policy.tokenizer_name))
+        
+        filtered: Dict[str, List[str]] = {}
+        for category, file in kept:
+            filtered.setdefault(category, []).append(file)
+        return filtered
+    
+    def replace_imports(self, files_by_category: Dict[str, List[str]]) -> bool:
+        """
+        Replace the whole framework import section, keeping user content
+        
+        Args:
+            files_by_category: Dict mapping category names to lists of files
             
-            with open(self.claude_md_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            existing_content = self.read_existing_content() if self.claude_md_path.exists() else DEFAULT_CONTENT
+            user_content = self.extract_user_content(existing_content)
+            new_content = self._render(user_content, files_by_category)
+            if self.claude_md_path.exists() and new_content == existing_content:
+                return True
             
-            self.logger.success(f"Updated CLAUDE.md with {len(new_files)} new imports")
+            self._write(new_content)
+            self.logger.info("Replaced framework imports in CLAUDE.md")
             return True
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to update CLAUDE.md: {e}")
             return False
     
+    def _render(self, user_content: str, framework_imports: Dict[str, List[str]]) -> str:
+        """Build CLAUDE.md content from user content and framework imports"""
+        # Remove empty categories
+        framework_imports = {k: v for k, v in framework_imports.items() if v}
+        
+        new_content_parts = []
+        
+        # Add user content
+        if user_content.strip():
+            new_content_parts.append(user_content)
+            new_content_parts.append("")  # Add blank line before framework section
+        
+        # Add organized framework imports
+        framework_section = self.organize_imports_by_category(framework_imports)
+        if framework_section:
+            new_content_parts.append(framework_section)
+        
+        return "\n".join(new_content_parts)
+    
+    def _write(self, content: str) -> None:
+        """Write CLAUDE.md through a temporary file and rename"""
+        self.claude_md_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.claude_md_path.with_name(f".{self.claude_md_path.name}.{os.getpid()}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_path, self.claude_md_path)
+    
     def _parse_existing_framework_imports(self, content: str) -> Dict[str, List[str]]:
         """
         Parse existing framework imports organized by category
@@ -197,13 +381,11 @@ class CLAUDEMdService:
         imports_by_category = {}
         
         # Look for framework imports section
-        framework_marker = "# ═══════════════════════════════════════════════════\n# SuperClaude Framework Components"
-        
-        if framework_marker not in content:
+        if FRAMEWORK_MARKER not in content:
             return imports_by_category
         
         # Extract framework section
-        framework_section = content.split(framework_marker)[1] if framework_marker in content else ""
+        framework_section = content.split(FRAMEWORK_MARKER)[1]
         
         # Parse categories and imports
         lines = framework_section.split('\n')
@@ -241,17 +423,8 @@ class CLAUDEMdService:
             # Create directory if it doesn't exist
             self.claude_md_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Default CLAUDE.md content
-            default_content = """# SuperClaude Entry Point
-
-This file serves as the entry point for the SuperClaude framework.
-You can add your own custom instructions and configurations here.
-
-The SuperClaude framework components will be automatically imported below.
-"""
-            
             with open(self.claude_md_path, 'w', encoding='utf-8') as f:
-                f.write(default_content)
+                f.write(DEFAULT_CONTENT)
             
             self.logger.info("Created CLAUDE.md with default content")
             
@@ -263,54 +436,16 @@ The SuperClaude framework components will be automatically imported below.
         """
         Remove specific imports from CLAUDE.md
         
+        Inside a transaction the change is queued until the transaction ends.
+        
         Args:
             files: List of filenames to remove from imports
             
         Returns:
             True if successful, False otherwise
         """
-        try:
-            if not self.claude_md_path.exists():
-                return True  # Nothing to remove
-            
-            existing_content = self.read_existing_content()
-            user_content = self.extract_user_content(existing_content)
-            existing_framework_imports = self._parse_existing_framework_imports(existing_content)
-            
-            # Remove files from all categories
-            removed_any = False
-            for category, category_files in existing_framework_imports.items():
-                for file in files:
-                    if file in category_files:
-                        category_files.remove(file)
-                        removed_any = True
-            
-            # Remove empty categories
-            existing_framework_imports = {k: v for k, v in existing_framework_imports.items() if v}
-            
-            if not removed_any:
-                return True  # Nothing was removed
-            
-            # Rebuild content
-            new_content_parts = []
-            
-            if user_content.strip():
-                new_content_parts.append(user_content)
-                new_content_parts.append("")
-            
-            framework_section = self.organize_imports_by_category(existing_framework_imports)
-            if framework_section:
-                new_content_parts.append(framework_section)
-            
-            # Write updated content
-            new_content = "\n".join(new_content_parts)
-            
-            with open(self.claude_md_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            
-            self.logger.info(f"Removed {len(files)} imports from CLAUDE.md")
+        transaction = self._open_transaction()
+        if transaction is not None:
+            transaction.remove(files)
             return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to remove imports from CLAUDE.md: {e}")
-            return False
\ No newline at end of file
+        return self._apply_changes([("remove", list(files), None)])
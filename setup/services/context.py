@@ -0,0 +1,436 @@
+"""
+Context bundle compilation for SuperClaude installations
+Resolves the CLAUDE.md import closure and flattens it into a single
+deduplicated bundle that CLAUDE.md can import instead of the individual files
+"""
+
+import os
+import re
+import json
+import hashlib
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+from .claude_md import CLAUDEMdService
+from .frontmatter import split_frontmatter
+from ..utils.logger import get_logger
+
+
+IMPORT_LINE = re.compile(r'^@(\S+)\s*$')
+
+# Lines made only of rule / box-drawing characters, optionally behind a heading marker
+DECORATIVE_LINE = re.compile(r'^\s*(#+\s*)?[═─━=\-_*~]{3,}\s*$')
+
+FENCE_LINE = re.compile(r'^\s*(`{3,}|~{3,})')
+
+
+def track_fence(line: str, fence: Optional[str]) -> Optional[str]:
+    """
+    Follow fenced code blocks line by line
+
+    A block is closed only by a fence of the same character at least as long
+    as the one that opened it, so a ~~~ inside a ``` block is code.
+
+    Args:
+        line: Current line
+        fence: Marker of the open block before this line (None outside blocks)
+
+    Returns:
+        Marker of the open block after this line (None outside blocks)
+    """
+    match = FENCE_LINE.match(line)
+    if not match:
+        return fence
+    marker = match.group(1)
+    if fence is None:
+        return marker
+    if marker[0] == fence[0] and len(marker) >= len(fence) and not line.strip()[len(marker):].strip():
+        return None
+    return fence
+
+
+def is_decorative_line(line: str, previous: str) -> bool:
+    """
+    Whether a line outside code is a decorative rule
+
+    A run of "-" or "=" right below a text line underlines a setext heading
+    and is not decorative.
+
+    Args:
+        line: Current line
+        previous: Line above it ("" at the start of the text)
+
+    Returns:
+        True if the line can be dropped
+    """
+    if not DECORATIVE_LINE.match(line):
+        return False
+    stripped = line.strip()
+    if stripped.startswith("#") or set(stripped) - {"-", "="}:
+        return True
+    return not previous.strip() or previous.lstrip().startswith("#")
+
+
+def resolve_import_path(target: str, importing_file: Path) -> Path:
+    """
+    Resolve an @import target the way Claude Code does
+
+    Args:
+        target: Import path as written after the @
+        importing_file: File containing the import
+
+    Returns:
+        Absolute path of the imported file
+    """
+    if target.startswith("~/"):
+        return Path.home() / target[2:]
+    path = Path(target)
+    if path.is_absolute():
+        return path
+    return importing_file.parent / path
+
+
+class ImportGraph:
+    """
+    Import closure of a set of root files
+
+    Files are visited depth-first in root order and each file appears once.
+    An import of a file that is still being expanded is a cycle; it is recorded
+    and not followed.
+    """
+
+    def __init__(self, base_dir: Path):
+        """
+        Initialize import graph
+
+        Args:
+            base_dir: Directory that root import paths are relative to
+        """
+        self.base_dir = base_dir
+        self.order: List[Path] = []
+        self.edges: Dict[Path, List[Path]] = {}
+        self.cycles: List[List[Path]] = []
+        self.missing: List[Tuple[Path, Optional[Path]]] = []
+        self.texts: Dict[Path, str] = {}
+
+    def walk(self, roots: List[str]) -> List[Path]:
+        """
+        Resolve the closure of the given root imports
+
+        Args:
+            roots: Import paths relative to base_dir
+
+        Returns:
+            Files in visit order
+        """
+        entry = self.base_dir / "CLAUDE.md"
+        for root in roots:
+            self._visit(resolve_import_path(root, entry), None, [])
+        return self.order
+
+    def _visit(self, path: Path, parent: Optional[Path], stack: List[Path]) -> None:
+        """Depth-first visit of one file"""
+        path = Path(os.path.normpath(path))
+        if path in stack:
+            self.cycles.append(stack[stack.index(path):] + [path])
+            return
+        if path in self.edges:
+            return
+
+        try:
+            text = path.read_text(encoding="utf-8")
+        except (FileNotFoundError, IsADirectoryError):
+            self.missing.append((path, parent))
+            return
+
+        self.order.append(path)
+        self.texts[path] = text
+        self.edges[path] = []
+        stack.append(path)
+        for line in _lines_outside_fences(text):
+            match = IMPORT_LINE.match(line)
+            if match:
+                child = Path(os.path.normpath(resolve_import_path(match.group(1), path)))
+                self.edges[path].append(child)
+                self._visit(child, path, stack)
+        stack.pop()
+
+    def relative(self, path: Path) -> str:
+        """Display path relative to base_dir when possible"""
+        try:
+            return path.relative_to(self.base_dir).as_posix()
+        except ValueError:
+            return str(path)
+
+
+def _lines_outside_fences(text: str) -> List[str]:
+    """Lines of text that are not inside fenced code blocks"""
+    lines = []
+    fence = None
+    for line in text.splitlines():
+        opened = fence
+        fence = track_fence(line, fence)
+        if opened is None and fence is None:
+            lines.append(line)
+    return lines
+
+
+def _split_blocks(text: str) -> List[str]:
+    """Split markdown into blank-line separated blocks, keeping code fences whole"""
+    blocks = []
+    current: List[str] = []
+    fence = None
+    for line in text.splitlines():
+        fence = track_fence(line, fence)
+        if fence is None and not line.strip():
+            if current:
+                blocks.append("\n".join(current))
+                current = []
+            continue
+        current.append(line)
+    if current:
+        blocks.append("\n".join(current))
+    return blocks
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class ContextBundleService:
+    """Compiles the CLAUDE.md import closure into one flattened bundle"""
+
+    BUNDLE_FILE = "SUPERCLAUDE_BUNDLE.md"
+    MANIFEST_FILE = ".superclaude-bundle.json"
+    FORMAT_VERSION = 2
+    BUNDLE_CATEGORY = "Compiled Bundle"
+    MIN_DEDUP_BLOCK = 40  # Shorter blocks (headings, labels) are never deduplicated
+
+    def __init__(self, install_dir: Path):
+        """
+        Initialize bundle service
+
+        Args:
+            install_dir: Installation directory containing CLAUDE.md
+        """
+        self.install_dir = install_dir
+        self.bundle_file = install_dir / self.BUNDLE_FILE
+        self.manifest_file = install_dir / self.MANIFEST_FILE
+        self.claude_md = CLAUDEMdService(install_dir)
+        self.logger = get_logger()
+
+    def load_manifest(self) -> Dict[str, Any]:
+        """
+        Load the bundle manifest
+
+        Returns:
+            Manifest dict, empty if no bundle was compiled
+        """
+        try:
+            return json.loads(self.manifest_file.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def is_linked(self) -> bool:
+        """Whether CLAUDE.md imports the bundle instead of the individual files"""
+        return bool(self.load_manifest().get("linked")) and self.bundle_file.exists()
+
+    def get_roots(self) -> List[Tuple[str, str]]:
+        """
+        Get the framework imports the bundle is built from
+
+        Combines the roots recorded in the manifest of a linked bundle with any
+        framework imports currently in CLAUDE.md (other than the bundle itself).
+
+        Returns:
+            Ordered (category, file) pairs
+        """
+        manifest = self.load_manifest()
+        roots: List[Tuple[str, str]] = [tuple(root) for root in manifest.get("roots", [])] if manifest.get("linked") else []
+        seen = {file for _, file in roots}
+        content = self.claude_md.read_existing_content()
+        for category, files in self.claude_md._parse_existing_framework_imports(content).items():
+            for file in files:
+                if file != self.BUNDLE_FILE and file not in seen:
+                    roots.append((category, file))
+                    seen.add(file)
+        return roots
+
+    def compile(self, link: bool = False, force: bool = False,
+                roots: Optional[List[Tuple[str, str]]] = None) -> Dict[str, Any]:
+        """
+        Compile the bundle, skipping the write when no source changed
+
+        Args:
+            link: Point CLAUDE.md at the bundle afterwards
+            force: Rebuild even if source hashes match
+            roots: Override the (category, file) roots
+
+        Returns:
+            Result dict with content_hash, changed, files, cycles, missing and size stats
+        """
+        manifest = self.load_manifest()
+        roots = roots if roots is not None else self.get_roots()
+        graph = ImportGraph(self.install_dir)
+        graph.walk([file for _, file in roots])
+
+        for cycle in graph.cycles:
+            self.logger.warning("Import cycle: " + " -> ".join(graph.relative(p) for p in cycle))
+        for path, parent in graph.missing:
+            source = graph.relative(parent) if parent else "CLAUDE.md"
+            self.logger.warning(f"Missing import {graph.relative(path)} (from {source})")
+
+        sources = {graph.relative(path): _sha256(graph.texts[path].encode("utf-8")) for path in graph.order}
+        result = {
+            "bundle": str(self.bundle_file),
+            "files": list(sources),
+            "cycles": [[graph.relative(p) for p in cycle] for cycle in graph.cycles],
+            "missing": [graph.relative(path) for path, _ in graph.missing],
+            "source_bytes": sum(len(text.encode("utf-8")) for text in graph.texts.values()),
+            "changed": False
+        }
+
+        up_to_date = (
+            not force
+            and manifest.get("format_version") == self.FORMAT_VERSION
+            and manifest.get("sources") == sources
+            and self._bundle_hash() == manifest.get("content_hash")
+        )
+        if up_to_date:
+            result["content_hash"] = manifest["content_hash"]
+            result["bundle_bytes"] = self.bundle_file.stat().st_size
+            self.logger.debug("Context bundle is up to date")
+        else:
+            body, stats = self._flatten(graph)
+            content_hash = "sha256:" + _sha256(body.encode("utf-8"))
+            header = (
+                "<!-- SuperClaude context bundle - generated by 'SuperClaude compile', do not edit -->\n"
+                f"<!-- content-hash: {content_hash} -->\n\n"
+            )
+            self._write_atomic(self.bundle_file, header + body)
+            result.update(stats)
+            result["content_hash"] = content_hash
+            result["bundle_bytes"] = len((header + body).encode("utf-8"))
+            result["changed"] = True
+            self.logger.info(f"Compiled {len(sources)} files into {self.BUNDLE_FILE} ({content_hash[:19]})")
+
+        linked = link or bool(manifest.get("linked"))
+        new_manifest = {
+            "format_version": self.FORMAT_VERSION,
+            "content_hash": result["content_hash"],
+            "linked": linked,
+            "roots": [list(root) for root in roots],
+            "sources": sources
+        }
+        if new_manifest != manifest:
+            self._write_atomic(self.manifest_file, json.dumps(new_manifest, indent=2, sort_keys=True))
+
+        if linked:
+            self.claude_md.replace_imports({self.BUNDLE_CATEGORY: [self.BUNDLE_FILE]})
+        result["linked"] = linked
+        return result
+
+    def unlink(self) -> bool:
+        """
+        Restore the individual imports in CLAUDE.md and remove the bundle
+
+        Returns:
+            True if successful, False otherwise
+        """
+        roots = self.get_roots()
+        imports_by_category: Dict[str, List[str]] = {}
+        for category, file in roots:
+            imports_by_category.setdefault(category, []).append(file)
+        if not self.claude_md.replace_imports(imports_by_category):
+            return False
+
+        for path in (self.bundle_file, self.manifest_file):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        self.logger.info(f"Restored {len(roots)} individual imports in CLAUDE.md")
+        return True
+
+    def absorb_import_changes(self, changes: List[Tuple[str, List[str], Optional[str]]], policy=None) -> None:
+        """
+        Apply CLAUDE.md import changes to the bundle roots and recompile
+
+        Used while the bundle is linked, so installs and updates rewrite only
+        the bundle and leave CLAUDE.md alone.
+
+        Args:
+            changes: (action, files, category) tuples as queued by CLAUDEMdService
+            policy: Optional ImportPolicy filtering the resulting roots
+        """
+        roots = self.get_roots()
+        for action, files, category in changes:
+            if action == "add":
+                present = {file for _, file in roots}
+                roots.extend((category, file) for file in dict.fromkeys(files) if file not in present)
+            else:
+                roots = [root for root in roots if root[1] not in files]
+        if policy is not None:
+            roots = policy.apply(roots, self.install_dir)
+        self.compile(roots=roots)
+
+    def _flatten(self, graph: ImportGraph) -> Tuple[str, Dict[str, int]]:
+        """Concatenate the closure, dropping imports, decorative rules and repeated blocks
+
+        Frontmatter blocks and setext heading underlines are kept.
+        """
+        seen_blocks: Set[str] = set()
+        sections = []
+        stats = {"duplicate_blocks": 0, "separator_lines": 0}
+
+        for path in graph.order:
+            frontmatter, body = split_frontmatter(graph.texts[path])
+            lines = []
+            fence = None
+            previous = ""
+            for line in body.splitlines():
+                opened = fence
+                fence = track_fence(line, fence)
+                if opened is None and fence is None:
+                    if IMPORT_LINE.match(line):
+                        continue
+                    if is_decorative_line(line, previous):
+                        stats["separator_lines"] += 1
+                        previous = ""
+                        continue
+                previous = line
+                lines.append(line.rstrip())
+
+            kept = [frontmatter.rstrip("\n")] if frontmatter else []
+            for block in _split_blocks("\n".join(lines)):
+                key = re.sub(r'\s+', ' ', block).strip()
+                if len(key) >= self.MIN_DEDUP_BLOCK:
+                    if key in seen_blocks:
+                        stats["duplicate_blocks"] += 1
+                        continue
+                    seen_blocks.add(key)
+                kept.append(block)
+
+            if kept:
+                sections.append(f"<!-- source: {graph.relative(path)} -->\n" + "\n\n".join(kept))
+
+        return "\n\n".join(sections) + "\n", stats
+
+    def _bundle_hash(self) -> Optional[str]:
+        """Content hash recorded in the bundle header, verified against its body"""
+        try:
+            content = self.bundle_file.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        header, _, body = content.partition("\n\n")
+        match = re.search(r'content-hash: (sha256:[0-9a-f]{64})', header)
+        if not match or match.group(1) != "sha256:" + _sha256(body.encode("utf-8")):
+            return None  # Edited by hand or truncated
+        return match.group(1)
+
+    def _write_atomic(self, path: Path, content: str) -> None:
+        """Write content through a temporary file and rename"""
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_path, path)
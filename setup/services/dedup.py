@@ -0,0 +1,505 @@
+"""
+Cross-file section duplication analysis for SuperClaude framework content
+Fingerprints every heading section with shingled hashes and clusters near-identical
+sections across files for the duplication report; sections duplicated verbatim
+across the files CLAUDE.md imports can be factored into shared include files
+"""
+
+import os
+import re
+import hashlib
+from pathlib import Path
+from typing import List, Dict, Any, Tuple, Set
+
+from .context import ImportGraph, ContextBundleService, track_fence
+from .settings import SettingsService
+from ..utils.logger import get_logger
+
+
+SECTION_HEADING = re.compile(r'^(#{2,6})\s+(.*?)\s*$')
+WORD = re.compile(r'\w+')
+IMPORT_ONLY = re.compile(r'^\s*@(\S+)\s*$')
+
+
+class Section:
+    """One heading section of a Markdown file"""
+
+    def __init__(self, file: str, heading: str, level: int, start: int, end: int, body: str):
+        """
+        Initialize section
+
+        Args:
+            file: File the section belongs to (display path)
+            heading: Heading title
+            level: Heading level (2-6)
+            start: Index of the heading line
+            end: Index one past the last body line
+            body: Section text without the heading line
+        """
+        self.file = file
+        self.heading = heading
+        self.level = level
+        self.start = start
+        self.end = end
+        self.body = body
+        self.bytes = len(body.encode("utf-8"))
+        words = WORD.findall(body.lower())
+        self.fingerprint = hashlib.sha256(" ".join(words).encode("utf-8")).hexdigest()
+        self.words = words
+        self.shingles: frozenset = frozenset()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"file": self.file, "heading": self.heading, "bytes": self.bytes}
+
+
+def split_sections(file: str, text: str) -> List[Section]:
+    """
+    Split Markdown into leaf heading sections (heading to the next heading of any level)
+
+    Headings inside fenced code and the level-1 title are not section boundaries;
+    text before the first level-2+ heading is not a section.
+
+    Args:
+        file: Display path of the file
+        text: Markdown text
+
+    Returns:
+        Sections in file order
+    """
+    lines = text.splitlines()
+    headings: List[Tuple[int, int, str]] = []
+    fence = None
+    for index, line in enumerate(lines):
+        opened = fence
+        fence = track_fence(line, fence)
+        if opened is not None or fence is not None:
+            continue
+        match = SECTION_HEADING.match(line)
+        if match:
+            headings.append((index, len(match.group(1)), match.group(2)))
+
+    sections = []
+    for position, (index, level, title) in enumerate(headings):
+        end = headings[position + 1][0] if position + 1 < len(headings) else len(lines)
+        body = "\n".join(lines[index + 1:end]).strip("\n")
+        sections.append(Section(file, title, level, index, end, body))
+    return sections
+
+
+def _shingle_hashes(words: List[str], size: int) -> frozenset:
+    """64-bit hashes of the word shingles of a section (the whole section if it is shorter)"""
+    if not words:
+        return frozenset()
+    if len(words) <= size:
+        grams = [" ".join(words)]
+    else:
+        grams = [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+    return frozenset(int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "big")
+                     for gram in grams)
+
+
+class DuplicationAnalyzer:
+    """Finds near-identical sections across a Markdown corpus"""
+
+    DEFAULT_SHINGLE_SIZE = 5
+    DEFAULT_THRESHOLD = 0.8
+    DEFAULT_MIN_BYTES = 80
+
+    def __init__(self, shingle_size: int = DEFAULT_SHINGLE_SIZE, threshold: float = DEFAULT_THRESHOLD,
+                 min_bytes: int = DEFAULT_MIN_BYTES):
+        """
+        Initialize analyzer
+
+        Args:
+            shingle_size: Words per shingle
+            threshold: Minimum Jaccard similarity of shingle sets for two sections to be duplicates
+            min_bytes: Sections smaller than this are ignored
+
+        Raises:
+            ValueError: If an option is out of range
+        """
+        if shingle_size < 1:
+            raise ValueError("Shingle size must be at least 1")
+        if not 0 < threshold <= 1:
+            raise ValueError("Similarity threshold must be in (0, 1]")
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.min_bytes = min_bytes
+        self.sections: List[Section] = []
+        self.file_bytes: Dict[str, int] = {}
+
+    def add_file(self, file: str, text: str) -> None:
+        """
+        Add one file to the corpus
+
+        Args:
+            file: Display path
+            text: Markdown text
+        """
+        self.file_bytes[file] = len(text.encode("utf-8"))
+        for section in split_sections(file, text):
+            if section.bytes >= self.min_bytes:
+                section.shingles = _shingle_hashes(section.words, self.shingle_size)
+                self.sections.append(section)
+
+    def add_files(self, paths: List[Path], base_dir: Path) -> None:
+        """Add files read from disk, displayed relative to base_dir"""
+        for path in sorted(paths):
+            try:
+                display = path.relative_to(base_dir).as_posix()
+            except ValueError:
+                display = str(path)
+            self.add_file(display, path.read_text(encoding="utf-8"))
+
+    def similar_pairs(self) -> List[Tuple[int, int, float]]:
+        """
+        Section pairs from different files at or above the similarity threshold
+
+        Candidates come from an inverted index of shingle hashes, so only
+        sections sharing at least one shingle are compared.
+
+        Returns:
+            (section index, section index, Jaccard similarity) tuples
+        """
+        postings: Dict[int, List[int]] = {}
+        for index, section in enumerate(self.sections):
+            for shingle in section.shingles:
+                postings.setdefault(shingle, []).append(index)
+
+        shared: Dict[Tuple[int, int], int] = {}
+        for members in postings.values():
+            if len(members) < 2:
+                continue
+            for i, first in enumerate(members):
+                for second in members[i + 1:]:
+                    shared[(first, second)] = shared.get((first, second), 0) + 1
+
+        pairs = []
+        for (first, second), count in shared.items():
+            a, b = self.sections[first], self.sections[second]
+            if a.file == b.file:
+                continue
+            similarity = count / (len(a.shingles) + len(b.shingles) - count)
+            if similarity >= self.threshold:
+                pairs.append((first, second, similarity))
+        return pairs
+
+    def clusters(self) -> List[Dict[str, Any]]:
+        """
+        Group duplicate sections (single-link over similar pairs)
+
+        Returns:
+            Cluster dicts with heading, exact, similarity (lowest linking pair),
+            members and redundant_bytes (bytes beyond one copy), largest first
+        """
+        parent = list(range(len(self.sections)))
+
+        def find(index: int) -> int:
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        pairs = self.similar_pairs()
+        for first, second, _ in pairs:
+            root_a, root_b = find(first), find(second)
+            if root_a != root_b:
+                parent[root_b] = root_a
+
+        lowest: Dict[int, float] = {}
+        for first, _, similarity in pairs:
+            root = find(first)
+            lowest[root] = min(similarity, lowest.get(root, 1.0))
+
+        groups: Dict[int, List[int]] = {}
+        for index in range(len(self.sections)):
+            groups.setdefault(find(index), []).append(index)
+
+        clusters = []
+        for root, members in groups.items():
+            if len(members) < 2:
+                continue
+            sections = [self.sections[index] for index in members]
+            clusters.append({
+                "heading": max({s.heading for s in sections}, key=lambda h: sum(s.heading == h for s in sections)),
+                "exact": len({s.fingerprint for s in sections}) == 1,
+                "similarity": round(lowest.get(root, 1.0), 3),
+                "members": [s.to_dict() for s in sections],
+                "redundant_bytes": sum(s.bytes for s in sections) - max(s.bytes for s in sections)
+            })
+        clusters.sort(key=lambda cluster: -cluster["redundant_bytes"])
+        return clusters
+
+    def heading_similarity(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Mean pairwise similarity of sections sharing a heading title across files
+
+        Shows boilerplate headings (Boundaries, Tool Coordination, ...) even
+        when their bodies differ too much to count as duplicates.
+
+        Returns:
+            Dict of heading -> {files, bytes, mean_similarity}, most files first
+        """
+        by_heading: Dict[str, List[Section]] = {}
+        for section in self.sections:
+            by_heading.setdefault(section.heading.strip().lower(), []).append(section)
+
+        result = {}
+        for sections in by_heading.values():
+            files = {section.file for section in sections}
+            if len(files) < 2:
+                continue
+            total, pairs = 0.0, 0
+            for i, a in enumerate(sections):
+                for b in sections[i + 1:]:
+                    if a.file != b.file and (a.shingles or b.shingles):
+                        total += len(a.shingles & b.shingles) / len(a.shingles | b.shingles)
+                        pairs += 1
+            result[sections[0].heading] = {
+                "files": len(files),
+                "bytes": sum(section.bytes for section in sections),
+                "mean_similarity": round(total / pairs, 3) if pairs else 0.0
+            }
+        return dict(sorted(result.items(), key=lambda item: (-item[1]["files"], -item[1]["bytes"])))
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Duplication report for the corpus
+
+        Returns:
+            Dict with options, totals, duplication_ratio, clusters, per-file ratios and headings
+        """
+        clusters = self.clusters()
+        total_bytes = sum(self.file_bytes.values())
+        redundant = sum(cluster["redundant_bytes"] for cluster in clusters)
+
+        # Charge each cluster's redundant copies to the files holding them (all but the largest)
+        per_file = {file: 0 for file in self.file_bytes}
+        for cluster in clusters:
+            members = sorted(cluster["members"], key=lambda member: -member["bytes"])
+            for member in members[1:]:
+                per_file[member["file"]] += member["bytes"]
+
+        return {
+            "shingle_size": self.shingle_size,
+            "threshold": self.threshold,
+            "min_bytes": self.min_bytes,
+            "files": len(self.file_bytes),
+            "sections": len(self.sections),
+            "total_bytes": total_bytes,
+            "redundant_bytes": redundant,
+            "duplication_ratio": round(redundant / total_bytes, 4) if total_bytes else 0.0,
+            "clusters": clusters,
+            "file_ratios": {
+                file: round(per_file[file] / size, 4) if size else 0.0
+                for file, size in sorted(self.file_bytes.items(), key=lambda item: -per_file[item[0]])
+                if per_file[file]
+            },
+            "headings": self.heading_similarity()
+        }
+
+
+def installed_framework_files(install_dir: Path) -> List[Path]:
+    """
+    Markdown files installed by SuperClaude components
+
+    Args:
+        install_dir: Installation directory
+
+    Returns:
+        Installed file paths that exist
+    """
+    from .profiler import ContextProfiler
+    return sorted(path for path in ContextProfiler(install_dir).get_ownership()
+                  if path.suffix.lower() == ".md" and path.is_file())
+
+
+def split_sections_of(texts: Dict[str, str]) -> List[Section]:
+    """Sections of several files, in file order"""
+    sections = []
+    for file, text in texts.items():
+        sections.extend(split_sections(file, text))
+    return sections
+
+
+class SharedIncludeService:
+    """
+    Factors sections duplicated verbatim across imported framework files into shared includes
+
+    Only files loaded through CLAUDE.md imports are factored: Claude Code expands
+    @imports there, but not in slash command or subagent files, which would lose
+    the factored text. Near-duplicate sections are reported by DuplicationAnalyzer
+    and left for authors to merge.
+    """
+
+    SHARED_DIR = "shared"
+    METADATA_KEY = "shared_includes"
+
+    def __init__(self, install_dir: Path, min_bytes: int = DuplicationAnalyzer.DEFAULT_MIN_BYTES,
+                 min_files: int = 2):
+        """
+        Initialize shared include service
+
+        Args:
+            install_dir: Installation directory
+            min_bytes: Smallest section worth factoring out
+            min_files: Files that must share a section before it is factored
+        """
+        self.install_dir = install_dir
+        self.shared_dir = install_dir / self.SHARED_DIR
+        self.min_bytes = min_bytes
+        self.min_files = max(2, min_files)
+        self.logger = get_logger()
+
+    @classmethod
+    def is_enabled(cls, install_dir: Path) -> bool:
+        """Whether a previous install turned shared includes on"""
+        recorded = SettingsService(install_dir).get_metadata_setting(cls.METADATA_KEY)
+        return bool(recorded and recorded.get("enabled"))
+
+    def factor(self, files: List[Path]) -> Dict[str, Any]:
+        """
+        Replace verbatim duplicate sections with an @import of one shared copy
+
+        Only sections whose text is identical up to whitespace, in files that
+        CLAUDE.md imports, are factored, so the content each file loads is
+        unchanged. Files outside the imports that still reference a shared include
+        get the section back inline, and includes no longer referenced by any file
+        are removed.
+
+        Args:
+            files: Installed Markdown files to consider
+
+        Returns:
+            Dict with includes (include -> files) and bytes_saved
+        """
+        imported = self._imported_files()
+        self._inline_files([path for path in files if Path(os.path.normpath(path)) not in imported])
+
+        texts: Dict[str, str] = {}
+        paths: Dict[str, Path] = {}
+        for path in sorted(set(files)):
+            if (not path.is_file() or self.shared_dir in path.parents
+                    or Path(os.path.normpath(path)) not in imported):
+                continue
+            display = path.relative_to(self.install_dir).as_posix()
+            texts[display] = path.read_text(encoding="utf-8")
+            paths[display] = path
+
+        # Sections factored by an earlier run keep their include alive
+        includes: Dict[str, List[str]] = {}
+        groups: Dict[str, List[Section]] = {}
+        for section in split_sections_of(texts):
+            match = IMPORT_ONLY.match(section.body)
+            if match:
+                target = Path(os.path.normpath(paths[section.file].parent / match.group(1)))
+                if self.shared_dir in target.parents:
+                    includes.setdefault(target.relative_to(self.install_dir).as_posix(), []).append(section.file)
+            elif section.bytes >= self.min_bytes:
+                key = hashlib.sha256(" ".join(section.body.split()).encode("utf-8")).hexdigest()
+                groups.setdefault(key, []).append(section)
+
+        replacements: Dict[str, List[Tuple[Section, str]]] = {}
+        for fingerprint, sections in groups.items():
+            files_with = {section.file for section in sections}
+            if len(files_with) < self.min_files:
+                continue
+            include = self._write_include(sections[0], fingerprint)
+            includes[include] = sorted(files_with | set(includes.get(include, [])))
+            for section in sections:
+                target = os.path.relpath(self.install_dir / include, paths[section.file].parent)
+                replacements.setdefault(section.file, []).append((section, f"@{Path(target).as_posix()}"))
+
+        for file, changes in replacements.items():
+            lines = texts[file].splitlines()
+            for section, import_line in sorted(changes, key=lambda change: -change[0].start):
+                lines[section.start + 1:section.end] = [import_line, ""] if section.end < len(lines) else [import_line]
+            paths[file].write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        self._remove_stale(includes)
+        bytes_saved = sum((len(members) - 1) * (self.install_dir / include).stat().st_size
+                          for include, members in includes.items() if (self.install_dir / include).is_file())
+        SettingsService(self.install_dir).update_metadata({self.METADATA_KEY: {
+            "enabled": True,
+            "includes": [{"path": include, "files": members} for include, members in sorted(includes.items())],
+            "bytes_saved": bytes_saved
+        }})
+        if includes:
+            self.logger.info(f"Factored {len(includes)} duplicated sections into {self.SHARED_DIR}/ "
+                             f"({bytes_saved:,} bytes saved)")
+        else:
+            self.logger.info("No sections are duplicated verbatim across the files CLAUDE.md imports")
+        return {"includes": includes, "bytes_saved": bytes_saved}
+
+    def inline(self, files: List[Path]) -> int:
+        """
+        Expand shared include imports back into the files and remove the includes
+
+        Args:
+            files: Installed Markdown files to consider
+
+        Returns:
+            Number of files rewritten
+        """
+        rewritten = self._inline_files(files)
+        self._remove_stale({})
+        settings_manager = SettingsService(self.install_dir)
+        if settings_manager.get_metadata_setting(self.METADATA_KEY):
+            settings_manager.update_metadata({self.METADATA_KEY: {"enabled": False, "includes": [], "bytes_saved": 0}})
+        return rewritten
+
+    def _imported_files(self) -> Set[Path]:
+        """Files loaded through CLAUDE.md imports (through the bundle's sources when it is linked)"""
+        graph = ImportGraph(self.install_dir)
+        graph.walk(["CLAUDE.md"])
+        bundle = ContextBundleService(self.install_dir)
+        if bundle.is_linked():
+            graph.walk([file for _, file in bundle.get_roots()])
+        return set(graph.order)
+
+    def _inline_files(self, files: List[Path]) -> int:
+        """Expand shared include imports in files, returning the number of files rewritten"""
+        rewritten = 0
+        for path in sorted(set(files)):
+            if not path.is_file():
+                continue
+            text = path.read_text(encoding="utf-8")
+            lines = text.splitlines()
+            expanded = False
+            for section in reversed(split_sections(path.name, text)):
+                match = IMPORT_ONLY.match(section.body)
+                if not match:
+                    continue
+                include = Path(os.path.normpath(path.parent / match.group(1)))
+                if self.shared_dir in include.parents and include.is_file():
+                    body = include.read_text(encoding="utf-8").rstrip("\n").splitlines()
+                    lines[section.start + 1:section.end] = body + ([""] if section.end < len(lines) else [])
+                    expanded = True
+            if expanded:
+                path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+                rewritten += 1
+        return rewritten
+
+    def _write_include(self, section: Section, fingerprint: str) -> str:
+        """Write one shared include and return its path relative to the install dir"""
+        slug = re.sub(r'[^a-z0-9]+', '-', section.heading.lower()).strip('-') or "section"
+        name = f"{self.SHARED_DIR}/{slug}-{fingerprint[:8]}.md"
+        path = self.install_dir / name
+        content = section.body + "\n"
+        if not path.exists() or path.read_text(encoding="utf-8") != content:
+            self.shared_dir.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+        return name
+
+    def _remove_stale(self, includes: Dict[str, List[str]]) -> None:
+        """Remove includes that are no longer referenced"""
+        if not self.shared_dir.is_dir():
+            return
+        for path in self.shared_dir.glob("*.md"):
+            if path.relative_to(self.install_dir).as_posix() not in includes:
+                path.unlink()
+        try:
+            self.shared_dir.rmdir()
+        except OSError:
+            pass  # Not empty
+
@@ -4,7 +4,7 @@ Cross-platform file management for SuperClaude installation system
 
 import shutil
 import stat
-from typing import List, Optional, Callable, Dict, Any
+from typing import List, Optional, Callable, Dict, Any, Set
 from pathlib import Path
 import fnmatch
 import hashlib
@@ -23,6 +23,13 @@ class FileService:
         self.dry_run = dry_run
         self.copied_files: List[Path] = []
         self.created_dirs: List[Path] = []
+        # Optional (source, target) -> text hook; returning None copies the file unchanged
+        self.content_transform: Optional[Callable[[Path, Path], Optional[str]]] = None
+        # Leave targets alone that were copied from a source with the same size and modification time
+        self.skip_unchanged = False
+        self.skipped_files: List[Path] = []
+        # Copy only these targets; the others are counted as unchanged (None copies every target)
+        self.only_targets: Optional[Set[Path]] = None
         
     def copy_file(self, source: Path, target: Path, preserve_permissions: bool = True) -> bool:
         """
@@ -46,12 +53,24 @@ class FileService:
             print(f"[DRY RUN] Would copy {source} -> {target}")
             return True
         
+        if (self.only_targets is not None and target not in self.only_targets) or (
+                self.skip_unchanged and preserve_permissions and not self.content_transform
+                and self._is_unchanged_copy(source, target)):
+            self.skipped_files.append(target)
+            return True
+        
         try:
             # Ensure target directory exists
             target.parent.mkdir(parents=True, exist_ok=True)
             
+            content = self.content_transform(source, target) if self.content_transform else None
+            
             # Copy file
-            if preserve_permissions:
+            if content is not None:
+                target.write_text(content, encoding='utf-8')
+                if preserve_permissions:
+                    shutil.copymode(source, target)
+            elif preserve_permissions:
                 shutil.copy2(source, target)
             else:
                 shutil.copy(source, target)
@@ -63,6 +82,15 @@ class FileService:
             print(f"Error copying {source} to {target}: {e}")
             return False
     
+    def _is_unchanged_copy(self, source: Path, target: Path) -> bool:
+        """Whether target is a copy2 of source as it is now (same size and modification time)"""
+        try:
+            source_stat = source.stat()
+            target_stat = target.stat()
+        except OSError:
+            return False
+        return source_stat.st_size == target_stat.st_size and source_stat.st_mtime_ns == target_stat.st_mtime_ns
+    
     def copy_directory(self, source: Path, target: Path, ignore_patterns: Optional[List[str]] = None) -> bool:
         """
         Recursively copy directory with gitignore-style patterns
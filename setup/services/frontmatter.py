@@ -0,0 +1,377 @@
+"""
+Frontmatter index for SuperClaude commands, agents and modes
+Parses the YAML frontmatter of every command and agent file (and the heading of
+every mode file, which has no frontmatter) once and keeps the result in a compact
+JSON index keyed by content hash, so metadata queries over the whole corpus read
+a single file
+"""
+
+import os
+import re
+import json
+import hashlib
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from ..utils.logger import get_logger
+
+
+# Japanese frontmatter keys used by the translated agents
+KEY_ALIASES = {
+    "名前": "name",
+    "説明": "description",
+    "カテゴリー": "category",
+    "カテゴリ": "category",
+    "ツール": "tools",
+    "複雑さ": "complexity",
+    "ペルソナ": "personas",
+}
+
+LIST_FIELDS = {"tools", "personas", "mcp-servers"}
+LIST_SEPARATOR = re.compile(r'\s*[,、，]\s*')
+FILTER_EXPRESSION = re.compile(r'^\s*([^=!~\s]+)\s*(!=|=|~)\s*(.*?)\s*$')
+MODE_PURPOSE = re.compile(r'^\*\*Purpose\*\*:\s*(.+)$', re.MULTILINE)
+
+
+def parse_frontmatter(text: str) -> Dict[str, Any]:
+    """
+    Parse the leading frontmatter block of a Markdown file
+
+    Supports the subset the framework uses: "key: value" scalars (optionally
+    quoted), flow lists ("[a, b]"), block lists ("- a") and comments. Keys are
+    normalized to their English names; list fields are always lists.
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        Dict of fields, empty if the file has no frontmatter
+    """
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != "---":
+        return {}
+
+    fields: Dict[str, Any] = {}
+    key = None
+    for line in lines[1:]:
+        stripped = line.strip()
+        if stripped == "---":
+            break
+        if not stripped or stripped.startswith("#"):
+            continue
+        if stripped.startswith("- ") and key is not None:
+            if not isinstance(fields.get(key), list):
+                fields[key] = []
+            fields[key].append(_unquote(stripped[2:]))
+            continue
+        name, separator, value = stripped.partition(":")
+        if not separator:
+            continue
+        key = KEY_ALIASES.get(name.strip(), name.strip())
+        fields[key] = _parse_value(value.strip())
+    else:
+        return {}  # Unterminated block is not frontmatter
+
+    for field in LIST_FIELDS & set(fields):
+        if not isinstance(fields[field], list):
+            fields[field] = [item for item in LIST_SEPARATOR.split(fields[field]) if item] if fields[field] else []
+    return fields
+
+
+def parse_mode_header(text: str) -> Dict[str, Any]:
+    """
+    Metadata of a mode file: its frontmatter, or else its title and purpose
+
+    Args:
+        text: Markdown text of a MODE_*.md file
+
+    Returns:
+        Dict with title and description when present
+    """
+    fields = parse_frontmatter(text)
+    if fields:
+        return fields
+    for line in text.splitlines():
+        if line.startswith("# "):
+            fields["title"] = line[2:].strip()
+            break
+    purpose = MODE_PURPOSE.search(text)
+    if purpose:
+        fields["description"] = purpose.group(1).strip()
+    return fields
+
+
+def split_frontmatter(text: str) -> Tuple[str, str]:
+    """
+    Split a leading frontmatter block from the body
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        (frontmatter block including its "---" lines, body); the block is empty if there is none
+    """
+    lines = text.splitlines(keepends=True)
+    if not lines or lines[0].rstrip() != "---":
+        return "", text
+    for index in range(1, len(lines)):
+        if lines[index].rstrip() == "---":
+            frontmatter = "".join(lines[:index + 1])
+            if not frontmatter.endswith("\n"):
+                frontmatter += "\n"
+            return frontmatter, "".join(lines[index + 1:])
+    return "", text
+
+
+def _parse_value(value: str) -> Any:
+    """Parse a scalar or flow-list value"""
+    if value.startswith("[") and value.endswith("]"):
+        inner = value[1:-1].strip()
+        return [_unquote(item) for item in LIST_SEPARATOR.split(inner) if item] if inner else []
+    return _unquote(value)
+
+
+def _unquote(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def parse_filter(expression: str) -> Tuple[str, str, str]:
+    """
+    Parse a filter expression
+
+    "key=value" matches exactly (list fields: any item), "key!=value" is its
+    negation and "key~text" matches a substring; comparisons ignore case.
+
+    Args:
+        expression: Filter expression
+
+    Returns:
+        (key, operator, value) tuple
+
+    Raises:
+        ValueError: If the expression is malformed
+    """
+    match = FILTER_EXPRESSION.match(expression)
+    if not match:
+        raise ValueError(f"Invalid filter '{expression}' (expected key=value, key!=value or key~text)")
+    key, operator, value = match.groups()
+    return KEY_ALIASES.get(key, key), operator, value
+
+
+def matches(entry: Dict[str, Any], filters: List[Tuple[str, str, str]]) -> bool:
+    """Whether an index entry satisfies every parsed filter"""
+    for key, operator, value in filters:
+        field = entry.get(key)
+        items = field if isinstance(field, list) else ([] if field is None else [field])
+        items = [str(item).lower() for item in items]
+        value = value.lower()
+        if operator == "~":
+            found = any(value in item for item in items)
+        else:
+            found = value in items
+        if found == (operator == "!="):
+            return False
+    return True
+
+
+class FrontmatterIndex:
+    """JSON index of command, agent and mode metadata"""
+
+    FORMAT_VERSION = 2
+    INDEX_FILE = "frontmatter_index.json"
+    KINDS = ("commands", "agents", "modes")
+    # Modes sit next to other framework files (at the top of an installation), so only
+    # their own files are indexed, without descending into subdirectories
+    MODE_PATTERN = "MODE_*.md"
+
+    def __init__(self, base_dir: Path, roots: Dict[str, str], index_file: Path,
+                 build_file: Optional[Path] = None):
+        """
+        Initialize index
+
+        Args:
+            base_dir: Directory that indexed paths are relative to
+            roots: Kind -> subdirectory of base_dir holding its Markdown files
+            index_file: Where the index is stored
+            build_file: Read-only index generated at build time, loaded if index_file is not usable
+        """
+        self.base_dir = base_dir
+        self.roots = roots
+        self.index_file = index_file
+        self.build_file = build_file
+        self.logger = get_logger()
+        self.data: Dict[str, Any] = {"format_version": self.FORMAT_VERSION, "files": {}, "entries": {}}
+        self.loaded = False
+
+    @classmethod
+    def for_package(cls, install_dir: Optional[Path] = None, build: bool = False) -> "FrontmatterIndex":
+        """
+        Index of the package sources
+
+        The index generated at build time into setup/data is read as is; when
+        the sources changed since, the refreshed index is kept in the user's
+        cache directory.
+
+        Args:
+            install_dir: Installation directory whose cache holds refreshed indexes
+            build: Write the index shipped in setup/data instead (build time)
+        """
+        from .. import PROJECT_ROOT, DATA_DIR, package_cache_dir
+        roots = {"commands": "Commands", "agents": "Agents", "modes": "Modes"}
+        if build:
+            return cls(PROJECT_ROOT / "SuperClaude", roots, DATA_DIR / cls.INDEX_FILE)
+        return cls(PROJECT_ROOT / "SuperClaude", roots, package_cache_dir(install_dir) / cls.INDEX_FILE,
+                   DATA_DIR / cls.INDEX_FILE)
+
+    @classmethod
+    def for_install_dir(cls, install_dir: Path) -> "FrontmatterIndex":
+        """Index of installed commands, agents and modes, generated at install time"""
+        from .. import CACHE_DIR_NAME
+        return cls(install_dir, {"commands": "commands", "agents": "agents", "modes": ""},
+                   install_dir / CACHE_DIR_NAME / cls.INDEX_FILE)
+
+    def load(self) -> bool:
+        """
+        Load the stored index, or else the build-time index (one file read)
+
+        Returns:
+            True if a compatible index was loaded
+        """
+        for index_file in (self.index_file, self.build_file):
+            if index_file is None:
+                continue
+            try:
+                data = json.loads(index_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if data.get("format_version") != self.FORMAT_VERSION:
+                continue
+            self.data = data
+            self.loaded = True
+            return True
+        return False
+
+    def refresh(self, save: bool = True) -> int:
+        """
+        Bring the index up to date with the files on disk
+
+        Files whose size and modification time match the index are not opened;
+        changed files are hashed and only parsed if their content is new.
+
+        Args:
+            save: Write the index back if anything changed (errors are ignored)
+
+        Returns:
+            Number of files added, changed or removed
+        """
+        if not self.loaded:
+            self.load()
+        files: Dict[str, Dict[str, Any]] = self.data["files"]
+        entries: Dict[str, Dict[str, Any]] = self.data["entries"]
+        seen = set()
+        changed = 0
+        touched = 0
+
+        for kind, subdir in self.roots.items():
+            root = self.base_dir / subdir
+            if not root.is_dir():
+                continue
+            paths = root.glob(self.MODE_PATTERN) if kind == "modes" else root.rglob("*.md")
+            for path in sorted(paths):
+                relative = path.relative_to(self.base_dir).as_posix()
+                seen.add(relative)
+                stat = path.stat()
+                recorded = files.get(relative)
+                if recorded and recorded["size"] == stat.st_size and recorded["mtime_ns"] == stat.st_mtime_ns:
+                    continue
+
+                data = path.read_bytes()
+                content_hash = hashlib.sha256(data).hexdigest()
+                if content_hash not in entries:
+                    parse = parse_mode_header if kind == "modes" else parse_frontmatter
+                    entries[content_hash] = parse(data.decode("utf-8"))
+                if not recorded or recorded["hash"] != content_hash:
+                    changed += 1
+                else:
+                    touched += 1  # Same content; only the stat signature is refreshed
+                files[relative] = {
+                    "kind": kind,
+                    "hash": content_hash,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "locale": "ja" if "JP" in path.relative_to(root).parts else "en"
+                }
+
+        for relative in [relative for relative in files if relative not in seen]:
+            del files[relative]
+            changed += 1
+
+        # Drop entries no file points at any more
+        live = {record["hash"] for record in files.values()}
+        for content_hash in [content_hash for content_hash in entries if content_hash not in live]:
+            del entries[content_hash]
+
+        if save and (changed or touched or not self.loaded):
+            self.save()
+        return changed
+
+    def save(self) -> bool:
+        """
+        Write the index atomically
+
+        Returns:
+            True if written, False if the location is not writable
+        """
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.index_file.with_name(f".{self.index_file.name}.{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(self.data, ensure_ascii=False, sort_keys=True, separators=(",", ":")),
+                                 encoding="utf-8")
+            os.replace(temp_file, self.index_file)
+            self.loaded = True
+            return True
+        except OSError as e:
+            self.logger.debug(f"Could not write frontmatter index {self.index_file}: {e}")
+            return False
+
+    def query(self, kind: Optional[str] = None, filters: Optional[List[str]] = None,
+              locale: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Query indexed commands, agents or modes
+
+        Args:
+            kind: "commands", "agents", "modes" or None for all
+            filters: Filter expressions (see parse_filter), all must match
+            locale: Only entries of this locale ("en" or "ja")
+
+        Returns:
+            Entry dicts (path, kind, locale plus frontmatter fields) sorted by kind and name
+
+        Raises:
+            ValueError: If the kind or a filter is invalid
+        """
+        if kind is not None and kind not in self.KINDS:
+            raise ValueError(f"Unknown kind: {kind} (expected {' or '.join(self.KINDS)})")
+        parsed = [parse_filter(expression) for expression in filters or []]
+
+        results = []
+        for relative, record in self.data["files"].items():
+            if (kind and record["kind"] != kind) or (locale and record["locale"] != locale):
+                continue
+            entry = dict(self.data["entries"].get(record["hash"], {}))
+            entry.update(path=relative, kind=record["kind"], locale=record["locale"])
+            entry.setdefault("name", _default_name(record["kind"], relative))
+            if matches(entry, parsed):
+                results.append(entry)
+        return sorted(results, key=lambda entry: (entry["kind"], entry["locale"], entry["name"]))
+
+
+def _default_name(kind: str, relative: str) -> str:
+    """Name of an entry without a name field: the file stem (MODE_Task_Management -> task-management)"""
+    stem = Path(relative).stem
+    if kind == "modes" and stem.startswith("MODE_"):
+        return stem[len("MODE_"):].lower().replace("_", "-")
+    return stem
@@ -0,0 +1,308 @@
+"""
+Glossary engine for SuperClaude translations
+Compiles the translation glossary into an Aho-Corasick automaton so that a
+document is checked against every term in one pass, whatever the glossary size:
+English terms left untranslated, discouraged translations, and rewriting
+"""
+
+import re
+import json
+from bisect import bisect_right
+from collections import deque
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from .context import FENCE_LINE, track_fence
+from .translation_memory import translations_file
+
+
+# Inline code, URLs, link targets and HTML tags are never checked or rewritten
+PROTECTED = re.compile(r'`[^`\n]*`|https?://\S+|\]\([^)]*\)|<[^>\n]*>')
+
+
+def _fold(text: str) -> str:
+    """Lower-case text without changing its length (characters that expand stay as they are)"""
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+def _is_word(char: str) -> bool:
+    """Characters that continue an identifier (translation-agent-jp, @agent-security, path/to)"""
+    return char.isascii() and (char.isalnum() or char in "_-@/")
+
+
+class GlossaryTerm:
+    """One glossary rule"""
+
+    def __init__(self, source: str, translation: str, case_sensitive: bool = False,
+                 whole_word: Optional[bool] = None, avoid: Optional[List[str]] = None):
+        """
+        Initialize term
+
+        Args:
+            source: Source-language term
+            translation: Required translation
+            case_sensitive: Match the source term's case exactly
+            whole_word: Require word boundaries (default: for terms starting and ending with a word character)
+            avoid: Discouraged translations reported as inconsistent
+        """
+        if not source or not translation:
+            raise ValueError("Glossary terms need a source term and a translation")
+        self.source = source
+        self.translation = translation
+        self.case_sensitive = case_sensitive
+        self.whole_word = whole_word if whole_word is not None else (source[0].isalnum() and source[-1].isalnum())
+        self.avoid = avoid or []
+
+    def forms(self) -> List[str]:
+        """Source term plus its English plural for whole-word lower-case terms"""
+        if not self.whole_word or self.case_sensitive or not self.source.isascii() or not self.source[-1].isalpha():
+            return [self.source]
+        if self.source.endswith(("s", "x", "ch", "sh")):
+            return [self.source, self.source + "es"]
+        if self.source.endswith("y") and self.source[-2:-1] not in ("a", "e", "o", "u", ""):
+            return [self.source, self.source[:-1] + "ies"]
+        return [self.source, self.source + "s"]
+
+    @classmethod
+    def from_entry(cls, source: str, value: Any) -> "GlossaryTerm":
+        """
+        Term from a glossary file entry
+
+        Entries are either a translation string or an object with translation,
+        case_sensitive, whole_word and avoid keys.
+
+        Raises:
+            ValueError: If the entry is malformed
+        """
+        if isinstance(value, str):
+            return cls(source, value)
+        if isinstance(value, dict) and isinstance(value.get("translation"), str):
+            return cls(source, value["translation"], bool(value.get("case_sensitive", False)),
+                       value.get("whole_word"), list(value.get("avoid", [])))
+        raise ValueError(f"Invalid glossary entry for '{source}'")
+
+
+class AhoCorasick:
+    """Multi-pattern string matcher; matching time is linear in the text plus the matches"""
+
+    def __init__(self):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[int]] = [[]]
+        self.lengths: List[int] = []
+        self.built = False
+
+    def add(self, pattern: str) -> int:
+        """
+        Add a pattern
+
+        Returns:
+            Pattern id
+        """
+        state = 0
+        for char in pattern:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][char] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            state = next_state
+        pattern_id = len(self.lengths)
+        self.lengths.append(len(pattern))
+        self.output[state].append(pattern_id)
+        self.built = False
+        return pattern_id
+
+    def build(self) -> None:
+        """Compute failure links (breadth first) and merge outputs along them"""
+        queue = deque(self.goto[0].values())
+        for state in queue:
+            self.fail[state] = 0
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+        self.built = True
+
+    def find(self, text: str) -> List[Tuple[int, int, int]]:
+        """
+        All pattern occurrences in text
+
+        Returns:
+            (start, end, pattern id) tuples ordered by end position
+        """
+        if not self.built:
+            self.build()
+        goto, fail, output, lengths = self.goto, self.fail, self.output, self.lengths
+        matches = []
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in output[state]:
+                matches.append((position + 1 - lengths[pattern_id], position + 1, pattern_id))
+        return matches
+
+
+class GlossaryEngine:
+    """Checks and rewrites documents against a glossary"""
+
+    def __init__(self, terms: List[GlossaryTerm]):
+        """
+        Initialize engine
+
+        Args:
+            terms: Glossary rules
+        """
+        self.terms = terms
+        self.automaton = AhoCorasick()
+        # Pattern id -> (term index, "source" or "avoid", pattern text)
+        self.patterns: List[Tuple[int, str, str]] = []
+        for index, term in enumerate(terms):
+            sources = [("source", form) for form in term.forms()]
+            for kind, pattern in sources + [("avoid", avoid) for avoid in term.avoid]:
+                folded = pattern if kind == "avoid" else _fold(pattern)
+                self.automaton.add(folded)
+                self.patterns.append((index, kind, pattern))
+        self.automaton.build()
+
+    @classmethod
+    def from_file(cls, path: Path) -> "GlossaryEngine":
+        """
+        Engine for a JSON glossary file
+
+        Raises:
+            ValueError: If the file is missing or malformed
+        """
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except OSError as e:
+            raise ValueError(f"Cannot read glossary {path}: {e}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in glossary {path}: {e}")
+        if not isinstance(data, dict):
+            raise ValueError(f"Glossary {path} must be a JSON object of term: translation")
+        return cls([GlossaryTerm.from_entry(source, value) for source, value in data.items()])
+
+    @classmethod
+    def for_locale(cls, locale: str = "ja") -> "GlossaryEngine":
+        """Engine for the package glossary of a locale"""
+        return cls.from_file(translations_file("glossary", locale))
+
+    def scan(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Find glossary terms in a translated document
+
+        Source terms (and their plurals) outside code, URLs and tags are reported as untranslated;
+        avoided translations as inconsistent. Overlapping matches resolve to
+        the leftmost, then longest.
+
+        Args:
+            text: Document text
+
+        Returns:
+            Dicts with start, end, line, kind ("untranslated" or "inconsistent"), text, term and suggestion
+        """
+        protected = self._protected_ranges(text)
+        starts = [start for start, _end in protected]
+        folded = _fold(text)
+
+        candidates = []
+        for start, end, pattern_id in self.automaton.find(folded):
+            index, kind, pattern = self.patterns[pattern_id]
+            term = self.terms[index]
+            if kind == "source":
+                if term.case_sensitive and text[start:end] != pattern:
+                    continue
+            elif text[start:end] != pattern:
+                continue  # Avoided translations are matched exactly
+            if term.whole_word and kind == "source" and (
+                    (start > 0 and _is_word(text[start - 1])) or (end < len(text) and _is_word(text[end]))):
+                continue
+            position = bisect_right(starts, start) - 1
+            if position >= 0 and start < protected[position][1]:
+                continue
+            candidates.append((start, -end, index, kind))
+
+        findings = []
+        covered = 0
+        line, line_start = 1, 0
+        for start, negative_end, index, kind in sorted(candidates):
+            end = -negative_end
+            if start < covered:
+                continue
+            covered = end
+            line += text.count("\n", line_start, start)
+            line_start = start
+            term = self.terms[index]
+            findings.append({
+                "start": start,
+                "end": end,
+                "line": line,
+                "kind": "untranslated" if kind == "source" else "inconsistent",
+                "text": text[start:end],
+                "term": term.source,
+                "suggestion": term.translation
+            })
+        return findings
+
+    def rewrite(self, text: str) -> Tuple[str, int]:
+        """
+        Replace every finding with the glossary translation in one pass
+
+        Args:
+            text: Document text
+
+        Returns:
+            (rewritten text, number of replacements)
+        """
+        findings = self.scan(text)
+        parts = []
+        position = 0
+        for finding in findings:
+            parts.append(text[position:finding["start"]])
+            parts.append(finding["suggestion"])
+            position = finding["end"]
+        parts.append(text[position:])
+        return "".join(parts), len(findings)
+
+    @staticmethod
+    def _protected_ranges(text: str) -> List[Tuple[int, int]]:
+        """Sorted, non-overlapping character ranges of frontmatter keys, fenced code, inline code, URLs and tags"""
+        ranges = []
+        offset = 0
+        fence_start = None
+        fence = None
+        in_frontmatter = text.startswith("---")
+        for number, line in enumerate(text.splitlines(keepends=True)):
+            if in_frontmatter:
+                if number and line.strip() == "---":
+                    in_frontmatter = False
+                elif ":" in line:
+                    ranges.append((offset, offset + line.index(":")))
+            elif fence_start is not None or FENCE_LINE.match(line):
+                opened = fence
+                fence = track_fence(line, fence)
+                if opened is None:
+                    fence_start = offset
+                elif fence is None:
+                    ranges.append((fence_start, offset + len(line)))
+                    fence_start = None
+            elif fence_start is None:
+                ranges.extend((offset + match.start(), offset + match.end()) for match in PROTECTED.finditer(line))
+            offset += len(line)
+        if fence_start is not None:
+            ranges.append((fence_start, offset))
+        return ranges
@@ -0,0 +1,185 @@
+"""
+Import profiles for SuperClaude installations
+Decides which installed framework files CLAUDE.md imports, by named profile
+and an optional session token budget; the rest stay installed on disk only
+"""
+
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from .context import ImportGraph
+from .settings import SettingsService
+from ..utils.tokens import get_tokenizer
+from ..utils.logger import get_logger
+
+
+_profiles_cache: Optional[Dict[str, Any]] = None
+
+
+def load_import_profiles() -> Dict[str, Any]:
+    """
+    Load the import profile definitions from setup/data/import_profiles.json
+
+    Returns:
+        Dict with default_profile, profiles, pinned and drop_order
+    """
+    global _profiles_cache
+    if _profiles_cache is None:
+        from .. import DATA_DIR
+        with open(DATA_DIR / "import_profiles.json", 'r', encoding='utf-8') as f:
+            _profiles_cache = json.load(f)
+    return _profiles_cache
+
+
+def get_profile_names() -> List[str]:
+    """Get the names of all import profiles"""
+    return list(load_import_profiles()["profiles"])
+
+
+class ImportPolicy:
+    """Selects framework imports for CLAUDE.md from a profile and token budget"""
+
+    METADATA_KEY = "imports"
+
+    def __init__(self, profile: Optional[str] = None, budget: Optional[int] = None,
+                 custom_imports: Optional[List[str]] = None, tokenizer: Optional[str] = None):
+        """
+        Initialize import policy
+
+        Args:
+            profile: Profile name (default from import_profiles.json)
+            budget: Maximum estimated tokens loaded per session
+            custom_imports: Files to import with the custom profile
+            tokenizer: Tokenizer used for the budget (default: heuristic)
+
+        Raises:
+            ValueError: If the profile is unknown, the budget is not positive,
+                        or the custom profile has no files
+        """
+        definitions = load_import_profiles()
+        self.profile = profile or definitions["default_profile"]
+        if self.profile not in definitions["profiles"]:
+            raise ValueError(f"Unknown import profile: {self.profile} (available: {', '.join(definitions['profiles'])})")
+        if budget is not None and budget <= 0:
+            raise ValueError("Context budget must be a positive number of tokens")
+        if self.profile == "custom" and not custom_imports:
+            raise ValueError("The custom import profile requires --imports")
+
+        self.budget = budget
+        self.custom_imports = list(custom_imports or [])
+        self.tokenizer_name = tokenizer
+        self.pinned = set(definitions.get("pinned", []))
+        self.drop_order = list(definitions.get("drop_order", []))
+        self.logger = get_logger()
+
+        if self.profile == "custom":
+            self.allowed: Optional[set] = set(self.custom_imports)
+        else:
+            imports = definitions["profiles"][self.profile]["imports"]
+            self.allowed = None if imports == "*" else set(imports)
+
+    @classmethod
+    def from_metadata(cls, install_dir: Path) -> Optional["ImportPolicy"]:
+        """
+        Restore the policy recorded by a previous install
+
+        Args:
+            install_dir: Installation directory
+
+        Returns:
+            ImportPolicy or None if no profile or budget was ever chosen
+        """
+        recorded = SettingsService(install_dir).get_metadata_setting(cls.METADATA_KEY)
+        if not recorded or (recorded.get("profile") is None and recorded.get("budget") is None):
+            return None
+        try:
+            return cls(recorded.get("profile"), recorded.get("budget"), recorded.get("custom_imports"),
+                       recorded.get("tokenizer"))
+        except ValueError as e:
+            get_logger().warning(f"Ignoring recorded import profile: {e}")
+            return None
+
+    def apply(self, roots: List[Tuple[str, str]], install_dir: Path, base_tokens: int = 0) -> List[Tuple[str, str]]:
+        """
+        Select the roots CLAUDE.md should import and record the outcome in the metadata
+
+        Files deferred by an earlier run are reconsidered, so a larger profile
+        or budget brings them back without reinstalling their component.
+
+        Args:
+            roots: Candidate (category, file) imports
+            install_dir: Installation directory
+            base_tokens: Tokens loaded regardless of imports (CLAUDE.md's own text)
+
+        Returns:
+            Selected (category, file) imports, in input order
+        """
+        settings_manager = SettingsService(install_dir)
+        recorded = settings_manager.get_metadata_setting(self.METADATA_KEY, {}) or {}
+
+        candidates = list(roots)
+        known = {file for _, file in candidates}
+        for category, file in recorded.get("deferred", []):
+            if file not in known and (install_dir / file).exists():
+                candidates.append((category, file))
+                known.add(file)
+
+        kept = [root for root in candidates if self.allowed is None or root[1] in self.allowed]
+        tokens = base_tokens
+
+        if self.budget is not None:
+            costs = self._measure(kept, install_dir)
+            tokens += sum(costs.values())
+            kept_files = {file for _, file in kept}
+            for file in self.drop_order:
+                if tokens <= self.budget:
+                    break
+                if file in kept_files and file not in self.pinned:
+                    kept_files.discard(file)
+                    tokens -= costs.get(file, 0)
+            kept = [root for root in kept if root[1] in kept_files]
+            if tokens > self.budget:
+                self.logger.warning(
+                    f"Imported framework files need ~{tokens:,} tokens, over the context budget of {self.budget:,}"
+                )
+
+        deferred = [root for root in candidates if root not in kept]
+        if deferred:
+            self.logger.info(
+                f"Import profile '{self.profile}': {len(deferred)} files installed but not imported: "
+                + ", ".join(file for _, file in deferred)
+            )
+
+        settings_manager.update_metadata({self.METADATA_KEY: {
+            **self.options(),
+            "imported": [file for _, file in kept],
+            "deferred": [list(root) for root in deferred],
+            "estimated_tokens": tokens if self.budget is not None else None
+        }})
+        return kept
+
+    def options(self) -> Dict[str, Any]:
+        """Profile, budget, custom imports and tokenizer, as recorded in the metadata"""
+        return {
+            "profile": self.profile,
+            "budget": self.budget,
+            "custom_imports": self.custom_imports,
+            "tokenizer": self.tokenizer_name
+        }
+
+    def _measure(self, roots: List[Tuple[str, str]], install_dir: Path) -> Dict[str, int]:
+        """Estimated tokens of each root's import closure, counting shared files once"""
+        tokenizer = get_tokenizer(self.tokenizer_name)
+        counted = set()
+        costs = {}
+        for _, file in roots:
+            graph = ImportGraph(install_dir)
+            graph.walk([file])
+            cost = 0
+            for path in graph.order:
+                if path not in counted:
+                    counted.add(path)
+                    cost += tokenizer.count(graph.texts[path])
+            costs[file] = cost
+        return costs
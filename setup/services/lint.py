@@ -0,0 +1,311 @@
+"""
+Content linter for SuperClaude framework Markdown
+Runs a set of rules over every Markdown file of the framework sources in a
+process pool and caches each file's findings by content hash, so an unchanged
+tree is re-checked without parsing anything
+"""
+
+import os
+import re
+import json
+import hashlib
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Callable, Optional, Tuple
+
+from .context import IMPORT_LINE, track_fence
+from .frontmatter import KEY_ALIASES, parse_frontmatter
+from .selection import load_persona_aliases
+from ..utils.logger import get_logger
+
+
+FRONTMATTER_LINE = re.compile(r'^\s*(#.*|-\s+.*|[^\s:#][^:]*:(\s.*)?)?$')
+
+# Directories whose files must start with frontmatter
+FRONTMATTER_DIRS = ("Commands", "Agents")
+REQUIRED_FIELDS = ("name", "description")
+
+ERROR = "error"
+WARNING = "warning"
+
+# Rule id -> (severity, check); checks yield (line, message) pairs
+RULES: Dict[str, Tuple[str, Callable]] = {}
+
+
+def rule(rule_id: str, severity: str):
+    """Register a lint rule"""
+    def register(check: Callable) -> Callable:
+        RULES[rule_id] = (severity, check)
+        return check
+    return register
+
+
+class LintFile:
+    """A Markdown file prepared for the rules"""
+
+    def __init__(self, relative: str, text: str):
+        self.relative = relative
+        self.parts = Path(relative).parts
+        self.lines = text.splitlines()
+        self.meta = parse_frontmatter(text)
+
+        # Index of the closing frontmatter delimiter (None without frontmatter, -1 if unterminated)
+        self.frontmatter_end: Optional[int] = None
+        if self.lines and self.lines[0].strip() == "---":
+            self.frontmatter_end = next(
+                (index for index, line in enumerate(self.lines[1:], 1) if line.strip() == "---"), -1)
+
+    def field_line(self, field: str) -> int:
+        """1-based line of a frontmatter field (1 if not found)"""
+        for index, line in enumerate(self.lines[1:self.frontmatter_end or 0], 1):
+            key = line.split(":", 1)[0].strip()
+            if KEY_ALIASES.get(key, key) == field:
+                return index + 1
+        return 1
+
+    def body_lines(self):
+        """(1-based line, text) of lines outside frontmatter and fenced code"""
+        start = self.frontmatter_end + 1 if self.frontmatter_end and self.frontmatter_end > 0 else 0
+        fence = None
+        for index in range(start, len(self.lines)):
+            line = self.lines[index]
+            opened = fence
+            fence = track_fence(line, fence)
+            if opened is None and fence is None:
+                yield index + 1, line
+
+
+@rule("frontmatter-missing", ERROR)
+def check_frontmatter_missing(file: LintFile, context: Dict[str, Any]):
+    if file.parts[0] in FRONTMATTER_DIRS and file.frontmatter_end is None:
+        yield 1, f"{file.parts[0][:-1]} file has no frontmatter block"
+
+
+@rule("frontmatter-unterminated", ERROR)
+def check_frontmatter_unterminated(file: LintFile, context: Dict[str, Any]):
+    if file.frontmatter_end == -1:
+        yield 1, "Frontmatter block is not closed with ---"
+
+
+@rule("frontmatter-syntax", ERROR)
+def check_frontmatter_syntax(file: LintFile, context: Dict[str, Any]):
+    if not file.frontmatter_end or file.frontmatter_end < 0:
+        return
+    for index in range(1, file.frontmatter_end):
+        line = file.lines[index]
+        if not FRONTMATTER_LINE.match(line):
+            yield index + 1, f"Not a 'key: value' or list line: {line.strip()[:60]}"
+        elif "[" in line and line.count("[") != line.count("]"):
+            yield index + 1, "Unbalanced [ ] in list value"
+
+
+@rule("frontmatter-required", ERROR)
+def check_frontmatter_required(file: LintFile, context: Dict[str, Any]):
+    if not file.frontmatter_end or file.frontmatter_end < 0:
+        return
+    for field in REQUIRED_FIELDS:
+        if not file.meta.get(field):
+            yield 1, f"Frontmatter has no '{field}'"
+
+
+@rule("unknown-persona", WARNING)
+def check_unknown_persona(file: LintFile, context: Dict[str, Any]):
+    agents = context["agents"]
+    aliases = context["persona_aliases"]
+    # Legacy short persona names ("architect", "security") match a part of an agent name
+    parts = {part for name in agents for part in name.split("-")}
+    for persona in file.meta.get("personas", []):
+        agent = aliases.get(persona, persona)
+        if agent in agents or (persona not in aliases and persona in parts):
+            continue
+        if persona in aliases:
+            yield file.field_line("personas"), (f"Persona '{persona}' is an alias of '{agent}', "
+                                                f"which matches no agent in Agents/")
+        else:
+            yield file.field_line("personas"), f"Persona '{persona}' matches no agent in Agents/"
+
+
+@rule("unknown-mcp-server", ERROR)
+def check_unknown_mcp_server(file: LintFile, context: Dict[str, Any]):
+    for server in file.meta.get("mcp-servers", []):
+        if server.lower() not in context["mcp_configs"]:
+            yield file.field_line("mcp-servers"), f"MCP server '{server}' has no MCP/configs/{server}.json"
+
+
+@rule("dangling-import", ERROR)
+def check_dangling_import(file: LintFile, context: Dict[str, Any]):
+    directory = Path(file.relative).parent
+    for line_number, line in file.body_lines():
+        match = IMPORT_LINE.match(line.strip())
+        if not match:
+            continue
+        target = match.group(1)
+        # Framework files are installed side by side, so an import of a sibling file name also resolves
+        if (directory / target).as_posix() not in context["files"] and target not in context["file_names"]:
+            yield line_number, f"Import @{target} does not resolve to a framework file"
+
+
+@rule("unclosed-fence", ERROR)
+def check_unclosed_fence(file: LintFile, context: Dict[str, Any]):
+    fence, opened = None, None
+    for index, line in enumerate(file.lines):
+        previous = fence
+        fence = track_fence(line, fence)
+        if previous is None and fence is not None:
+            opened = index + 1
+    if fence is not None:
+        yield opened, "Code fence is never closed"
+
+
+def lint_text(relative: str, text: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Run every rule over one file
+
+    Args:
+        relative: Path relative to the linted root (posix)
+        text: File content
+        context: Tree-wide facts the rules check against (agents, MCP configs, files)
+
+    Returns:
+        Finding dicts (path, line, rule, severity, message) sorted by line
+    """
+    file = LintFile(relative, text)
+    findings = []
+    for rule_id, (severity, check) in RULES.items():
+        for line, message in check(file, context):
+            findings.append({"path": relative, "line": line, "rule": rule_id,
+                             "severity": severity, "message": message})
+    return sorted(findings, key=lambda finding: (finding["line"], finding["rule"]))
+
+
+def _lint_job(job: Tuple[str, str, Dict[str, Any]]) -> Tuple[str, List[Dict[str, Any]]]:
+    """Process pool entry point"""
+    relative, text, context = job
+    return relative, lint_text(relative, text, context)
+
+
+class ContentLinter:
+    """Lints framework Markdown with a per-file result cache"""
+
+    VERSION = 2
+    CACHE_FILE = "lint_cache.json"
+
+    # Below this many files to check, starting worker processes costs more than it saves
+    PARALLEL_THRESHOLD = 16
+
+    def __init__(self, root: Path, cache_file: Optional[Path] = None, jobs: Optional[int] = None):
+        """
+        Initialize linter
+
+        Args:
+            root: Framework source directory (containing Commands/, Agents/, MCP/ ...)
+            cache_file: Where findings are cached (None disables the cache)
+            jobs: Worker processes (default: CPU count)
+        """
+        self.root = root
+        self.cache_file = cache_file
+        self.jobs = jobs or os.cpu_count() or 1
+        self.logger = get_logger()
+        self.stats = {"files": 0, "checked": 0, "cached": 0}
+
+    @classmethod
+    def for_package(cls, jobs: Optional[int] = None, install_dir: Optional[Path] = None) -> "ContentLinter":
+        """Linter over the package's framework sources, caching in the user's cache directory"""
+        from .. import PROJECT_ROOT, package_cache_dir
+        return cls(PROJECT_ROOT / "SuperClaude", package_cache_dir(install_dir) / cls.CACHE_FILE, jobs)
+
+    def build_context(self, texts: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Collect the tree-wide facts rules check against
+
+        Args:
+            texts: Relative path -> content of every linted file
+
+        Returns:
+            Dict with agent names, persona aliases, MCP config names and framework file paths
+        """
+        agents = sorted(parse_frontmatter(text).get("name") or Path(relative).stem
+                        for relative, text in texts.items()
+                        if Path(relative).parent.as_posix() == "Agents")
+        configs_dir = self.root / "MCP" / "configs"
+        mcp_configs = sorted(path.stem.lower() for path in configs_dir.glob("*.json")) if configs_dir.is_dir() else []
+        return {
+            "agents": agents,
+            "persona_aliases": load_persona_aliases(),
+            "mcp_configs": mcp_configs,
+            "files": sorted(texts),
+            "file_names": sorted({Path(relative).name for relative in texts})
+        }
+
+    def lint(self, use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Lint every Markdown file under the root
+
+        Files whose content hash and tree context match the cache are not checked again;
+        the rest are checked in a process pool when there are enough of them.
+
+        Args:
+            use_cache: Read cached findings (the cache is always rewritten)
+
+        Returns:
+            Findings of all files sorted by path and line
+        """
+        texts: Dict[str, str] = {}
+        hashes: Dict[str, str] = {}
+        for path in sorted(self.root.rglob("*.md")):
+            if "__pycache__" in path.parts:
+                continue
+            data = path.read_bytes()
+            relative = path.relative_to(self.root).as_posix()
+            texts[relative] = data.decode("utf-8", errors="replace")
+            hashes[relative] = hashlib.sha256(data).hexdigest()
+
+        context = self.build_context(texts)
+        signature = hashlib.sha256(json.dumps(
+            [self.VERSION, sorted(RULES), context], sort_keys=True).encode("utf-8")).hexdigest()
+
+        cached = self._load_cache(signature) if use_cache else {}
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        pending = []
+        for relative, content_hash in hashes.items():
+            entry = cached.get(relative)
+            if entry and entry["hash"] == content_hash:
+                results[relative] = entry["findings"]
+            else:
+                pending.append((relative, texts[relative], context))
+
+        if len(pending) >= self.PARALLEL_THRESHOLD and self.jobs > 1:
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(pending))) as executor:
+                results.update(executor.map(_lint_job, pending, chunksize=max(1, len(pending) // (self.jobs * 4))))
+        else:
+            results.update(_lint_job(job) for job in pending)
+
+        self.stats = {"files": len(hashes), "checked": len(pending), "cached": len(hashes) - len(pending)}
+        if pending or len(cached) != len(hashes):
+            self._save_cache(signature, {relative: {"hash": hashes[relative], "findings": results[relative]}
+                                         for relative in hashes})
+
+        return [finding for relative in sorted(results) for finding in results[relative]]
+
+    def _load_cache(self, signature: str) -> Dict[str, Dict[str, Any]]:
+        """Cached findings, empty if missing or made for other rules or another tree context"""
+        if not self.cache_file:
+            return {}
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data.get("files", {}) if data.get("signature") == signature else {}
+
+    def _save_cache(self, signature: str, files: Dict[str, Dict[str, Any]]) -> None:
+        """Write the cache atomically (errors are ignored)"""
+        if not self.cache_file:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.cache_file.with_name(f".{self.cache_file.name}.{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps({"signature": signature, "files": files}, ensure_ascii=False,
+                                            separators=(",", ":")), encoding="utf-8")
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            self.logger.debug(f"Could not write lint cache {self.cache_file}: {e}")
@@ -0,0 +1,195 @@
+"""
+Locale variants of installable content
+Maps every agent and command file to its translation for each configured
+locale, so a component installs exactly one variant per item: the localized
+file where one exists, the English file otherwise
+"""
+
+import os
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from .translation_status import load_translation_pairs, expected_target
+from .frontmatter import split_frontmatter
+from ..utils.logger import get_logger
+
+
+DEFAULT_LOCALE = "en"
+LOCALE_MAP_FILE = "locale_map.json"
+FORMAT_VERSION = 1
+
+# Component name -> source directory (relative to the project root) of its localizable items
+LOCALIZED_COMPONENTS = {
+    "agents": "SuperClaude/Agents",
+    "commands": "SuperClaude/Commands",
+}
+
+_map_cache: Optional[Dict[str, Any]] = None
+
+
+def build_locale_map(base_dir: Path) -> Dict[str, Any]:
+    """
+    Compute the locale map from the translation pairs and the files on disk
+
+    For every locale and component, "variants" maps an English item (file name in the
+    component's source directory) to its translation, and "extras" lists localized
+    files with no English counterpart; paths are relative to the source directory.
+
+    Args:
+        base_dir: Project root
+
+    Returns:
+        Dict with format_version and locales
+    """
+    locales: Dict[str, Any] = {}
+    for locale, config in load_translation_pairs().items():
+        components = {}
+        for component, source_dir in LOCALIZED_COMPONENTS.items():
+            root = base_dir / source_dir
+            if not root.is_dir():
+                continue
+            variants = {}
+            localized_dirs = set()
+            for path in sorted(root.glob("*.md")):
+                target = expected_target(config, f"{source_dir}/{path.name}")
+                if target is None or not target.startswith(f"{source_dir}/"):
+                    continue
+                localized_dirs.add(Path(target).parent)
+                if (base_dir / target).is_file():
+                    variants[path.name] = target[len(source_dir) + 1:]
+            used = set(variants.values())
+            extras = sorted(
+                path.relative_to(root).as_posix()
+                for directory in localized_dirs for path in (base_dir / directory).glob("*.md")
+                if path.relative_to(root).as_posix() not in used and not (root / path.name).exists()
+            )
+            if variants or extras:
+                components[component] = {"variants": variants, "extras": extras}
+        locales[locale] = components
+    return {"format_version": FORMAT_VERSION, "locales": locales}
+
+
+def save_locale_map(data: Dict[str, Any], path: Optional[Path] = None) -> bool:
+    """
+    Write a locale map atomically
+
+    Args:
+        data: Map from build_locale_map
+        path: Target file (default: setup/data/locale_map.json)
+
+    Returns:
+        True if the file was written
+    """
+    if path is None:
+        from .. import DATA_DIR
+        path = DATA_DIR / LOCALE_MAP_FILE
+    try:
+        temp_file = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temp_file.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        os.replace(temp_file, path)
+        return True
+    except OSError as e:
+        get_logger().debug(f"Could not write locale map {path}: {e}")
+        return False
+
+
+def load_locale_map() -> Dict[str, Any]:
+    """
+    The locale map generated at build time into setup/data/locale_map.json
+
+    A missing or outdated map (one naming a file that no longer exists, as in a
+    source checkout) is recomputed from the translation pairs.
+
+    Returns:
+        Dict with format_version and locales
+    """
+    global _map_cache
+    if _map_cache is None:
+        from .. import PROJECT_ROOT, DATA_DIR
+        try:
+            data = json.loads((DATA_DIR / LOCALE_MAP_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = None
+        if not (isinstance(data, dict) and data.get("format_version") == FORMAT_VERSION
+                and _files_exist(data, PROJECT_ROOT)):
+            data = build_locale_map(PROJECT_ROOT)
+        _map_cache = data
+    return _map_cache
+
+
+def get_locales() -> List[str]:
+    """Locales content can be installed in (English first)"""
+    return [DEFAULT_LOCALE] + sorted(locale for locale in load_locale_map()["locales"] if locale != DEFAULT_LOCALE)
+
+
+def validate_locale(locale: str) -> str:
+    """
+    Check a locale name
+
+    Returns:
+        The locale
+
+    Raises:
+        ValueError: If no content is localized for it
+    """
+    if locale not in get_locales():
+        raise ValueError(f"Unknown locale '{locale}' (available: {', '.join(get_locales())})")
+    return locale
+
+
+def localize_items(component: str, items: List[str], locale: Optional[str]) -> Dict[str, str]:
+    """
+    Pick one variant of every item of a component
+
+    Args:
+        component: Component name (see LOCALIZED_COMPONENTS)
+        items: English item file names
+        locale: Locale to install (None or "en": English)
+
+    Returns:
+        Installed file name -> source path relative to the component's source directory,
+        for the items plus the locale's localized-only extras
+    """
+    selected = {item: item for item in items}
+    if not locale or locale == DEFAULT_LOCALE:
+        return selected
+    entry = load_locale_map()["locales"].get(locale, {}).get(component, {})
+    for item, variant in entry.get("variants", {}).items():
+        if item in selected:
+            selected[item] = variant
+    for extra in entry.get("extras", []):
+        selected.setdefault(Path(extra).name, extra)
+    return selected
+
+
+def with_source_frontmatter(localized: str, source: str) -> str:
+    """
+    A localized item with the frontmatter of its English source
+
+    Translations localize their frontmatter too (Japanese keys such as 名前 and ツール,
+    translated names and tool lists), which Claude Code can't register; the installed
+    file keeps the English frontmatter and the localized body.
+
+    Args:
+        localized: Text of the localized variant
+        source: Text of the English item
+
+    Returns:
+        Text to install (the localized text as is if the English item has no frontmatter)
+    """
+    frontmatter, _ = split_frontmatter(source)
+    if not frontmatter:
+        return localized
+    _, body = split_frontmatter(localized)
+    return frontmatter + body
+
+
+def _files_exist(data: Dict[str, Any], base_dir: Path) -> bool:
+    for components in data.get("locales", {}).values():
+        for component, entry in components.items():
+            root = base_dir / LOCALIZED_COMPONENTS.get(component, "")
+            for relative in list(entry.get("variants", {}).values()) + entry.get("extras", []):
+                if not (root / relative).is_file():
+                    return False
+    return True
@@ -0,0 +1,220 @@
+"""
+Versioned migrations for SuperClaude installations
+Upgrades the metadata schema and the on-disk layout of an installation
+directory exactly once, recording the applied versions in the metadata file
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional
+
+from .settings import SettingsService
+from ..utils.logger import get_logger
+
+
+SCHEMA_TRACK = "schema"
+LAYOUT_TRACK = "layout"
+TRACKS = (SCHEMA_TRACK, LAYOUT_TRACK)
+
+
+class Migration:
+    """A single migration step on one version track"""
+
+    def __init__(self, track: str, version: int, name: str, description: str,
+                 apply: Callable[["MigrationContext"], bool]):
+        """
+        Initialize migration
+
+        Args:
+            track: Version track (schema or layout)
+            version: Version the track is at after this migration
+            name: Short identifier recorded in the migration history
+            description: Human-readable description
+            apply: Function performing the migration; returns True if it changed anything.
+                   Must be idempotent, it can be re-run after an interrupted upgrade.
+        """
+        self.track = track
+        self.version = version
+        self.name = name
+        self.description = description
+        self.apply = apply
+
+    def __repr__(self) -> str:
+        return f"<Migration {self.track}@{self.version} {self.name}>"
+
+
+class MigrationContext:
+    """State handed to migrations"""
+
+    def __init__(self, install_dir: Path, settings_manager: SettingsService):
+        self.install_dir = install_dir
+        self.settings_manager = settings_manager
+        self.logger = get_logger()
+
+
+_REGISTRY: List[Migration] = []
+
+
+def register_migration(track: str, version: int, name: str, description: str):
+    """
+    Decorator registering a migration function
+
+    Versions must increase by one per track, starting at 1.
+
+    Raises:
+        ValueError: If the track is unknown or the version is out of sequence
+    """
+    if track not in TRACKS:
+        raise ValueError(f"Unknown migration track: {track}")
+
+    def decorator(func: Callable[[MigrationContext], bool]) -> Callable[[MigrationContext], bool]:
+        expected = max((m.version for m in _REGISTRY if m.track == track), default=0) + 1
+        if version != expected:
+            raise ValueError(f"Migration {name} has {track} version {version}, expected {expected}")
+        _REGISTRY.append(Migration(track, version, name, description, func))
+        return func
+
+    return decorator
+
+
+def get_migrations(track: Optional[str] = None) -> List[Migration]:
+    """
+    Get registered migrations in application order
+
+    Args:
+        track: Limit to one track
+
+    Returns:
+        Migrations sorted by track order and version
+    """
+    migrations = [m for m in _REGISTRY if track is None or m.track == track]
+    return sorted(migrations, key=lambda m: (TRACKS.index(m.track), m.version))
+
+
+def latest_version(track: str) -> int:
+    """Get the version a track reaches after all registered migrations"""
+    return max((m.version for m in _REGISTRY if m.track == track), default=0)
+
+
+class MigrationService:
+    """Runs pending migrations against an installation directory"""
+
+    METADATA_KEY = "migrations"
+
+    def __init__(self, install_dir: Path):
+        """
+        Initialize migration service
+
+        Args:
+            install_dir: Installation directory
+        """
+        self.install_dir = install_dir
+        self.settings_manager = SettingsService(install_dir)
+        self.logger = get_logger()
+
+    def get_versions(self) -> Dict[str, int]:
+        """
+        Get the recorded version of each track
+
+        Returns:
+            Dict mapping track name to version (0 if never migrated)
+        """
+        return {
+            track: self.settings_manager.get_metadata_setting(f"{self.METADATA_KEY}.{track}_version", 0)
+            for track in TRACKS
+        }
+
+    def get_pending(self) -> List[Migration]:
+        """
+        Get migrations not yet applied to this installation
+
+        Returns:
+            Pending migrations in application order
+        """
+        versions = self.get_versions()
+        if all(versions[track] >= latest_version(track) for track in TRACKS):
+            return []
+        return [m for m in get_migrations() if m.version > versions[m.track]]
+
+    def run_pending(self, dry_run: bool = False) -> List[Migration]:
+        """
+        Apply pending migrations in order, recording each one as it completes
+
+        In steady state this is a single lookup in the (cached) metadata file.
+
+        Args:
+            dry_run: Only report what would run
+
+        Returns:
+            Migrations that were applied (or would be, in dry run)
+
+        Raises:
+            RuntimeError: If a migration fails; earlier migrations stay recorded
+        """
+        pending = self.get_pending()
+        if not pending or dry_run:
+            return pending
+
+        context = MigrationContext(self.install_dir, self.settings_manager)
+        applied = []
+        for migration in pending:
+            self.logger.debug(f"Running migration {migration.track} v{migration.version}: {migration.description}")
+            try:
+                changed = migration.apply(context)
+            except Exception as e:
+                raise RuntimeError(f"Migration {migration.name} failed: {e}") from e
+
+            if changed:
+                self.logger.info(f"Migrated installation: {migration.description}")
+            self._record(migration, changed)
+            applied.append(migration)
+
+        return applied
+
+    def _record(self, migration: Migration, changed: bool) -> None:
+        """Record a completed migration in the metadata"""
+        metadata = self.settings_manager.load_metadata()
+        state = metadata.setdefault(self.METADATA_KEY, {})
+        state[f"{migration.track}_version"] = migration.version
+        state.setdefault("history", []).append({
+            "track": migration.track,
+            "version": migration.version,
+            "name": migration.name,
+            "changed": changed,
+            "applied_at": datetime.now().isoformat()
+        })
+        self.settings_manager.save_metadata(metadata)
+
+
+@register_migration(SCHEMA_TRACK, 1, "settings-to-metadata",
+                    "moved SuperClaude data from settings.json to .superclaude-metadata.json")
+def _migrate_settings_to_metadata(context: MigrationContext) -> bool:
+    """Move SuperClaude fields out of Claude Code's settings.json"""
+    return context.settings_manager.migrate_superclaude_data()
+
+
+@register_migration(LAYOUT_TRACK, 1, "commands-sc-namespace",
+                    "moved command definitions into commands/sc/ for the /sc: namespace")
+def _migrate_commands_namespace(context: MigrationContext) -> bool:
+    """Move framework commands from commands/ into commands/sc/"""
+    from .. import PROJECT_ROOT
+
+    old_commands_dir = context.install_dir / "commands"
+    new_commands_dir = old_commands_dir / "sc"
+    source_dir = PROJECT_ROOT / "SuperClaude" / "Commands"
+    if not old_commands_dir.is_dir() or not source_dir.is_dir():
+        return False
+
+    # Only framework command files move; user commands stay where they are
+    framework_commands = {f.name for f in source_dir.glob("*.md")}
+    to_migrate = [f for f in old_commands_dir.iterdir() if f.is_file() and f.name in framework_commands]
+    if not to_migrate:
+        return False
+
+    new_commands_dir.mkdir(parents=True, exist_ok=True)
+    for old_file in to_migrate:
+        old_file.replace(new_commands_dir / old_file.name)
+        context.logger.debug(f"Migrated {old_file.name} to sc/ subdirectory")
+
+    context.logger.info("Commands are now available as /sc:analyze, /sc:build, etc.")
+    return True
@@ -0,0 +1,301 @@
+"""
+Install-time Markdown minification for SuperClaude framework files
+Collapses whitespace, strips decorative separators and optionally drops
+whole sections, leaving frontmatter and code blocks byte-for-byte intact
+"""
+
+import re
+import json
+import fnmatch
+import hashlib
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from .context import is_decorative_line, track_fence
+from .settings import SettingsService
+from ..utils.tokens import get_tokenizer
+from ..utils.logger import get_logger
+
+
+HEADING_LINE = re.compile(r'^(#{1,6})\s+(.*?)(?:\s+#+)?\s*$')
+TABLE_SEPARATOR = re.compile(r'^\s*\|?(\s*:?-+:?\s*\|)+\s*:?-*:?\s*\|?\s*$')
+LEADING_SYMBOLS = re.compile(r'^[\u2190-\u2bff\ufe0f\u200d\U0001f000-\U0001faff\s]+')
+INNER_SPACES = re.compile(r'(?<=\S) {2,}(?=\S)')
+TABLE_CELL_PADDING = re.compile(r' *(?<!\\)\| *')
+
+
+class MarkdownMinifier:
+    """Transforms framework Markdown into a more compact, equivalent form"""
+
+    # Bump when the transform changes so cached output is not reused
+    VERSION = 2
+    METADATA_KEY = "minify"
+    CACHE_SUBDIR = "minify"
+
+    def __init__(self, install_dir: Path, drop_sections: Optional[List[str]] = None,
+                 tokenizer: Optional[str] = None, dry_run: bool = False):
+        """
+        Initialize minifier
+
+        Args:
+            install_dir: Installation directory (holds the output cache)
+            drop_sections: Heading titles (fnmatch patterns, case-insensitive) whose
+                           sections are removed, e.g. ["Examples"]
+            tokenizer: Tokenizer used for the savings report (default: heuristic)
+            dry_run: If True, never write the cache
+
+        Raises:
+            ValueError: If the tokenizer can't be loaded
+        """
+        from .. import CACHE_DIR_NAME
+
+        self.install_dir = install_dir
+        self.drop_sections = sorted({pattern.strip() for pattern in drop_sections or [] if pattern.strip()})
+        self.tokenizer_name = tokenizer
+        self.tokenizer = get_tokenizer(tokenizer)
+        self.dry_run = dry_run
+        self.cache_dir = install_dir / CACHE_DIR_NAME / self.CACHE_SUBDIR
+        self.logger = get_logger()
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self._index: Optional[Dict[str, Dict[str, int]]] = None
+
+    @classmethod
+    def from_metadata(cls, install_dir: Path, dry_run: bool = False) -> Optional["MarkdownMinifier"]:
+        """
+        Restore the minify options recorded by a previous install
+
+        Args:
+            install_dir: Installation directory
+            dry_run: If True, never write the cache
+
+        Returns:
+            MarkdownMinifier or None if the installation is not minified
+        """
+        recorded = SettingsService(install_dir).get_metadata_setting(cls.METADATA_KEY)
+        if not recorded or not recorded.get("enabled"):
+            return None
+        try:
+            return cls(install_dir, recorded.get("drop_sections"), recorded.get("tokenizer"), dry_run=dry_run)
+        except ValueError as e:
+            get_logger().warning(f"Ignoring recorded minify options: {e}")
+            return None
+
+    @classmethod
+    def disable(cls, install_dir: Path) -> None:
+        """Record that future installs and updates copy files unchanged"""
+        settings_manager = SettingsService(install_dir)
+        if settings_manager.get_metadata_setting(cls.METADATA_KEY):
+            settings_manager.update_metadata({cls.METADATA_KEY: {"enabled": False}})
+
+    def minify(self, text: str) -> str:
+        """
+        Minify Markdown text
+
+        Args:
+            text: Markdown source
+
+        Returns:
+            Minified Markdown ending in a single newline
+        """
+        frontmatter, body = _split_frontmatter(text)
+
+        output: List[str] = []
+        fence = None
+        dropping_level = 0
+        for line in body.splitlines():
+            opened = fence
+            fence = track_fence(line, fence)
+            if (opened is None) != (fence is None):
+                if not dropping_level:
+                    output.append(line.rstrip())
+                continue
+            if fence is not None:
+                if not dropping_level:
+                    output.append(line)
+                continue
+
+            if is_decorative_line(line, output[-1] if output else ""):
+                continue
+
+            heading = HEADING_LINE.match(line)
+            if heading:
+                level = len(heading.group(1))
+                title = LEADING_SYMBOLS.sub("", heading.group(2)) or heading.group(2)
+                if dropping_level and level > dropping_level:
+                    continue
+                dropping_level = level if self._drops(title) else 0
+                if not dropping_level:
+                    output.append(f"{heading.group(1)} {title}")
+                continue
+            if dropping_level:
+                continue
+
+            output.append(_compact_line(line))
+
+        # Collapse blank-line runs, drop blank lines around headings (an ATX
+        # heading is a block on its own) and trim blank lines at both ends
+        lines: List[str] = []
+        for line in output:
+            if line:
+                if line.startswith("#") and HEADING_LINE.match(line) and lines and not lines[-1]:
+                    lines.pop()
+                lines.append(line)
+            elif lines and lines[-1] and not HEADING_LINE.match(lines[-1]):
+                lines.append(line)
+        while lines and not lines[-1]:
+            lines.pop()
+        return frontmatter + "\n".join(lines) + "\n"
+
+    def transform(self, source: Path, target: Path, text: Optional[str] = None) -> Optional[str]:
+        """
+        Minified content for a file being installed (FileService content transform)
+
+        Output is cached by source hash and options, so unchanged sources are
+        not transformed again on the next install or update.
+
+        Args:
+            source: Package source file
+            target: Installation target path
+            text: Content to minify instead of the source file's (already transformed)
+
+        Returns:
+            Minified text, or None to copy files that are not Markdown unchanged
+        """
+        if source.suffix.lower() != ".md":
+            return None
+
+        data = source.read_bytes() if text is None else text.encode("utf-8")
+        key = self._cache_key(data)
+        cached = self.cache_dir / f"{key}.md"
+        index = self._load_index()
+        hit = cached.exists() and key in index
+
+        if hit:
+            text = cached.read_text(encoding="utf-8")
+            entry = index[key]
+        else:
+            original = data.decode("utf-8")
+            text = self.minify(original)
+            entry = {
+                "source_bytes": len(data),
+                "output_bytes": len(text.encode("utf-8")),
+                "source_tokens": self.tokenizer.count(original),
+                "output_tokens": self.tokenizer.count(text)
+            }
+            if not self.dry_run:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                cached.write_text(text, encoding="utf-8")
+                index[key] = entry
+                self._save_index()
+
+        try:
+            path = target.relative_to(self.install_dir).as_posix()
+        except ValueError:
+            path = str(target)
+        self.stats[path] = dict(entry, cached=hit)
+        return text
+
+    def report(self) -> List[Dict[str, Any]]:
+        """
+        Savings of the files transformed so far, largest token saving first
+
+        Returns:
+            List of dicts with path, source/output bytes and tokens, bytes_saved and tokens_saved
+        """
+        rows = []
+        for path, entry in self.stats.items():
+            rows.append(dict(entry, path=path,
+                             bytes_saved=entry["source_bytes"] - entry["output_bytes"],
+                             tokens_saved=entry["source_tokens"] - entry["output_tokens"]))
+        return sorted(rows, key=lambda row: -row["tokens_saved"])
+
+    def record(self) -> None:
+        """
+        Record the options and per-file savings in the metadata so updates keep minifying
+
+        Savings of files not transformed by this run (other components) are kept.
+        """
+        if self.dry_run:
+            return
+        settings_manager = SettingsService(self.install_dir)
+        recorded = settings_manager.get_metadata_setting(self.METADATA_KEY, {}) or {}
+        files = {}
+        if recorded.get("drop_sections") == self.drop_sections and isinstance(recorded.get("files"), list):
+            files = {entry["path"]: entry for entry in recorded["files"]}
+        for row in self.report():
+            files[row["path"]] = {"path": row["path"], "bytes_saved": row["bytes_saved"],
+                                  "tokens_saved": row["tokens_saved"]}
+
+        settings_manager.update_metadata({self.METADATA_KEY: {
+            "enabled": True,
+            "version": self.VERSION,
+            "drop_sections": self.drop_sections,
+            "tokenizer": self.tokenizer_name,
+            "files": sorted(files.values(), key=lambda entry: entry["path"]),
+            "bytes_saved": sum(entry["bytes_saved"] for entry in files.values()),
+            "tokens_saved": sum(entry["tokens_saved"] for entry in files.values())
+        }})
+
+    def options(self) -> Dict[str, Any]:
+        """Everything besides the source content that affects the output"""
+        return {"version": self.VERSION, "drop_sections": self.drop_sections, "tokenizer": self.tokenizer.name}
+
+    def _drops(self, title: str) -> bool:
+        """Whether a heading title matches a drop rule"""
+        title = title.lower()
+        return any(fnmatch.fnmatchcase(title, pattern.lower()) for pattern in self.drop_sections)
+
+    def _cache_key(self, data: bytes) -> str:
+        """Hash of source content and everything that affects the output"""
+        options = json.dumps(self.options(), sort_keys=True)
+        return hashlib.sha256(options.encode("utf-8") + b"\0" + data).hexdigest()
+
+    def _load_index(self) -> Dict[str, Dict[str, int]]:
+        """Load the cache index (measurements of cached outputs)"""
+        if self._index is None:
+            index_file = self.cache_dir / "index.json"
+            try:
+                self._index = json.loads(index_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _save_index(self) -> None:
+        index_file = self.cache_dir / "index.json"
+        temp_file = index_file.with_suffix(".tmp")
+        temp_file.write_text(json.dumps(self._index, indent=2, sort_keys=True), encoding="utf-8")
+        temp_file.replace(index_file)
+
+
+def _split_frontmatter(text: str) -> Tuple[str, str]:
+    """Split a leading YAML frontmatter block (kept verbatim) from the body"""
+    if not text.startswith("---"):
+        return "", text
+    lines = text.splitlines(keepends=True)
+    if lines[0].rstrip() != "---":
+        return "", text
+    for index in range(1, len(lines)):
+        if lines[index].rstrip() == "---":
+            frontmatter = "".join(lines[:index + 1])
+            if not frontmatter.endswith("\n"):
+                frontmatter += "\n"
+            return frontmatter, "".join(lines[index + 1:])
+    return "", text
+
+
+def _compact_line(line: str) -> str:
+    """Collapse padding inside a prose or table line, keeping its indentation and hard breaks"""
+    hard_break = line.endswith("  ") and bool(line.strip())
+    line = line.rstrip()
+    if TABLE_SEPARATOR.match(line):
+        cells = [cell.strip() for cell in line.strip().strip("|").split("|")]
+        return "|" + "|".join(_compact_separator(cell) for cell in cells) + "|"
+    if line.lstrip().startswith("|"):
+        indent = line[:len(line) - len(line.lstrip())]
+        return indent + TABLE_CELL_PADDING.sub(lambda match: match.group(0).strip().join("  "), line.strip()).strip()
+    return INNER_SPACES.sub(" ", line) + ("  " if hard_break else "")
+
+
+def _compact_separator(cell: str) -> str:
+    """Shortest table separator cell with the same alignment"""
+    return (":" if cell.startswith(":") else "") + "---" + (":" if cell.endswith(":") and len(cell) > 1 else "")
@@ -0,0 +1,356 @@
+"""
+Content packs for SuperClaude
+Organizations layer their own commands and agents over the built-in content
+with versioned packs: directories or archives (.zip, .tar.gz, .tgz, .tar)
+holding a pack.json manifest. Packs are scanned once per version into a merged
+index that resolves name collisions by priority, so installs read one file
+instead of rescanning every pack
+"""
+
+import os
+import re
+import json
+import shutil
+import hashlib
+import tarfile
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import List, Dict, Any, Optional
+
+from ..utils.logger import get_logger
+
+
+PACK_MANIFEST = "pack.json"
+ARCHIVE_SUFFIXES = (".zip", ".tar.gz", ".tgz", ".tar")
+
+# Priority of the built-in content: packs above it override built-in items, packs at or below only add items
+BUILTIN_PRIORITY = 0
+DEFAULT_PRIORITY = 100
+
+# Component -> default directory of its items inside a pack
+PACK_COMPONENTS = {
+    "commands": "Commands",
+    "agents": "Agents",
+}
+
+PACK_NAME = re.compile(r'^[A-Za-z0-9][A-Za-z0-9._-]*$')
+
+
+class ContentPack:
+    """A pack directory or archive and its manifest"""
+
+    def __init__(self, source: Path, manifest: Dict[str, Any], root: str = ""):
+        """
+        Initialize pack
+
+        Args:
+            source: Pack directory or archive
+            manifest: Parsed pack.json
+            root: Directory of pack.json inside an archive ("" for the archive root)
+
+        Raises:
+            ValueError: If the manifest is invalid
+        """
+        if not isinstance(manifest, dict):
+            raise ValueError(f"Pack {source}: {PACK_MANIFEST} must be a JSON object")
+        self.source = source
+        self.root = root
+        self.name = str(manifest.get("name", ""))
+        self.version = str(manifest.get("version", ""))
+        if not PACK_NAME.match(self.name):
+            raise ValueError(f"Pack {source}: 'name' must be letters, digits, '.', '_' or '-'")
+        if not self.version:
+            raise ValueError(f"Pack {source}: 'version' is required")
+        try:
+            self.priority = int(manifest.get("priority", DEFAULT_PRIORITY))
+        except (TypeError, ValueError):
+            raise ValueError(f"Pack {source}: 'priority' must be an integer")
+        directories = manifest.get("components", {})
+        if not isinstance(directories, dict) or any(name not in PACK_COMPONENTS for name in directories):
+            raise ValueError(f"Pack {source}: 'components' maps {' or '.join(PACK_COMPONENTS)} to directories")
+        self.directories = {component: str(directories.get(component, default))
+                            for component, default in PACK_COMPONENTS.items()}
+
+    @classmethod
+    def load(cls, source: Path) -> "ContentPack":
+        """
+        Read a pack's manifest (archives are not extracted)
+
+        Args:
+            source: Pack directory or archive
+
+        Returns:
+            ContentPack
+
+        Raises:
+            ValueError: If the pack or its manifest can't be read
+        """
+        source = source.expanduser().resolve()
+        try:
+            if source.is_dir():
+                return cls(source, json.loads((source / PACK_MANIFEST).read_text(encoding="utf-8")))
+            if not source.is_file() or not source.name.endswith(ARCHIVE_SUFFIXES):
+                raise ValueError(f"Pack {source} is neither a directory nor a {'/'.join(ARCHIVE_SUFFIXES)} archive")
+            names = _archive_names(source)
+            manifests = sorted((name for name in names if PurePosixPath(name).name == PACK_MANIFEST
+                                and len(PurePosixPath(name).parts) <= 2), key=len)
+            if not manifests:
+                raise ValueError(f"Pack {source} has no {PACK_MANIFEST} at its top level")
+            root = str(PurePosixPath(manifests[0]).parent).strip(".")
+            return cls(source, json.loads(_archive_read(source, manifests[0])), root)
+        except (OSError, KeyError, tarfile.TarError, zipfile.BadZipFile, json.JSONDecodeError) as e:
+            raise ValueError(f"Could not read pack {source}: {e}")
+
+    @property
+    def is_archive(self) -> bool:
+        return not self.source.is_dir()
+
+    def fingerprint(self) -> str:
+        """
+        Cheap identity of the pack's content: its version and the stat signature of
+        the archive, or of the manifest and every item file of a directory pack (items
+        can be added, edited or removed without touching pack.json); a change triggers
+        a rescan
+        """
+        if self.is_archive:
+            stat = self.source.stat()
+            return f"{self.version}:{stat.st_size}:{stat.st_mtime_ns}"
+        signatures = []
+        for path in [self.source / PACK_MANIFEST] + [
+                path for directory in sorted(set(self.directories.values()))
+                for path in sorted((self.source / directory).glob("*.md"))]:
+            stat = path.stat()
+            signatures.append(f"{path.relative_to(self.source).as_posix()}:{stat.st_size}:{stat.st_mtime_ns}")
+        digest = hashlib.sha256("\n".join(signatures).encode("utf-8")).hexdigest()[:16]
+        return f"{self.version}:{digest}"
+
+    def scan(self, extract_dir: Path) -> Dict[str, Any]:
+        """
+        List the pack's items, extracting an archive first
+
+        Args:
+            extract_dir: Directory archives are extracted under
+
+        Returns:
+            Dict with root (directory holding the pack's content) and
+            items (component -> file name -> path relative to root)
+        """
+        if self.is_archive:
+            root = extract_dir / f"{self.name}-{hashlib.sha256(self.fingerprint().encode()).hexdigest()[:12]}"
+            if not root.is_dir():
+                _extract_archive(self.source, root)
+            root = root / self.root if self.root else root
+        else:
+            root = self.source
+        items: Dict[str, Dict[str, str]] = {}
+        for component, directory in self.directories.items():
+            found = {path.name: path.relative_to(root).as_posix()
+                     for path in sorted((root / directory).glob("*.md")) if path.is_file()}
+            if found:
+                items[component] = found
+        return {"root": str(root), "items": items}
+
+
+class PackIndex:
+    """Merged index of the items of every registered pack"""
+
+    FORMAT_VERSION = 1
+    INDEX_FILE = "pack_index.json"
+    EXTRACT_SUBDIR = "packs"
+
+    def __init__(self, index_file: Path, extract_dir: Path):
+        """
+        Initialize index
+
+        Args:
+            index_file: Where the index is stored
+            extract_dir: Where archives are extracted
+        """
+        self.index_file = index_file
+        self.extract_dir = extract_dir
+        self.logger = get_logger()
+        self.data: Dict[str, Any] = self._empty()
+
+    @classmethod
+    def for_install_dir(cls, install_dir: Path) -> "PackIndex":
+        """Index of the packs installed into an installation directory"""
+        from .. import CACHE_DIR_NAME
+        cache_dir = install_dir / CACHE_DIR_NAME
+        return cls(cache_dir / cls.INDEX_FILE, cache_dir / cls.EXTRACT_SUBDIR)
+
+    def load(self) -> bool:
+        """
+        Load the stored index
+
+        Returns:
+            True if a compatible index was loaded
+        """
+        try:
+            data = json.loads(self.index_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if not isinstance(data, dict) or data.get("format_version") != self.FORMAT_VERSION:
+            return False
+        self.data = data
+        return True
+
+    def refresh(self, sources: List[str], force: bool = False) -> Dict[str, Any]:
+        """
+        Bring the index up to date with a list of packs
+
+        Packs whose fingerprint matches the index are not rescanned; the merged
+        namespace is recomputed and the index saved only if a layer changed.
+
+        Args:
+            sources: Pack directories or archives, in any order
+            force: Rescan every pack
+
+        Returns:
+            The index
+
+        Raises:
+            ValueError: If a pack can't be read or two packs share a name
+        """
+        self.load()
+        previous = self.data.get("layers", {})
+        layers: Dict[str, Any] = {}
+        for source in sources:
+            pack = ContentPack.load(Path(source))
+            if pack.name in layers:
+                raise ValueError(f"Packs {layers[pack.name]['source']} and {pack.source} are both named {pack.name}")
+            fingerprint = pack.fingerprint()
+            layer = previous.get(pack.name)
+            if force or not layer or layer.get("fingerprint") != fingerprint or layer.get("source") != str(pack.source) \
+                    or not Path(layer.get("root", "")).is_dir():
+                self.logger.debug(f"Scanning pack {pack.name} {pack.version}")
+                layer = {"source": str(pack.source), "fingerprint": fingerprint, **pack.scan(self.extract_dir)}
+            layer.update({"version": pack.version, "priority": pack.priority})
+            layers[pack.name] = layer
+
+        if layers != previous or not self.index_file.is_file():
+            self.data = self._merge(layers)
+            self._save()
+            self._prune_extracted(layers)
+        return self.data
+
+    def merged(self, component: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Winning item of every name in a component
+
+        Returns:
+            File name -> {pack, priority, root (pack content directory), path (absolute source file)}
+        """
+        return self.data.get("merged", {}).get(component, {})
+
+    def overlay(self, component: str, builtin: Dict[str, str]) -> Dict[str, str]:
+        """
+        Layer the packs' items over a component's built-in items
+
+        Args:
+            component: Component name (see PACK_COMPONENTS)
+            builtin: Installed file name -> built-in source path
+
+        Returns:
+            Installed file name -> source path; pack items are absolute paths
+        """
+        combined = dict(builtin)
+        for name, item in self.merged(component).items():
+            if name not in builtin or item["priority"] > BUILTIN_PRIORITY:
+                combined[name] = item["path"]
+        return combined
+
+    def _merge(self, layers: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve name collisions: the highest priority wins, ties go to the first pack name"""
+        merged: Dict[str, Dict[str, Any]] = {}
+        shadowed: Dict[str, Dict[str, List[str]]] = {}
+        ordered = sorted(layers.items(), key=lambda layer: (-layer[1]["priority"], layer[0]))
+        for name, layer in ordered:
+            for component, items in layer["items"].items():
+                winners = merged.setdefault(component, {})
+                for file_name, relative in items.items():
+                    if file_name in winners:
+                        shadowed.setdefault(component, {}).setdefault(file_name, []).append(name)
+                        continue
+                    winners[file_name] = {"pack": name, "priority": layer["priority"], "root": layer["root"],
+                                          "path": str(Path(layer["root"]) / relative)}
+        digest = hashlib.sha256(json.dumps(layers, sort_keys=True).encode()).hexdigest()[:16]
+        return {"format_version": self.FORMAT_VERSION, "digest": digest if layers else None,
+                "layers": layers, "merged": merged, "shadowed": shadowed}
+
+    def _prune_extracted(self, layers: Dict[str, Any]) -> None:
+        """Remove extracted archives no layer uses any more"""
+        if not self.extract_dir.is_dir():
+            return
+        prefix = str(self.extract_dir) + os.sep
+        in_use = {layer["root"][len(prefix):].split(os.sep)[0]
+                  for layer in layers.values() if layer["root"].startswith(prefix)}
+        for path in self.extract_dir.iterdir():
+            if path.is_dir() and path.name not in in_use:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _empty(self) -> Dict[str, Any]:
+        return {"format_version": self.FORMAT_VERSION, "digest": None, "layers": {}, "merged": {}, "shadowed": {}}
+
+    def _save(self) -> None:
+        """Write the index atomically (errors are ignored; it is rebuilt from the packs)"""
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.index_file.with_name(f".{self.index_file.name}.{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(self.data, ensure_ascii=False, indent=1), encoding="utf-8")
+            os.replace(temp_file, self.index_file)
+        except OSError as e:
+            self.logger.debug(f"Could not write pack index {self.index_file}: {e}")
+
+
+def _archive_names(archive: Path) -> List[str]:
+    if archive.name.endswith(".zip"):
+        with zipfile.ZipFile(archive) as f:
+            return f.namelist()
+    with tarfile.open(archive) as f:
+        return f.getnames()
+
+
+def _archive_read(archive: Path, name: str) -> str:
+    if archive.name.endswith(".zip"):
+        with zipfile.ZipFile(archive) as f:
+            return f.read(name).decode("utf-8")
+    with tarfile.open(archive) as f:
+        return f.extractfile(name).read().decode("utf-8")
+
+
+def _extract_archive(archive: Path, target: Path) -> None:
+    """
+    Extract regular files of an archive into target
+
+    Raises:
+        ValueError: If a member would be written outside target
+    """
+    temp_dir = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    temp_dir.mkdir(parents=True)
+    try:
+        if archive.name.endswith(".zip"):
+            with zipfile.ZipFile(archive) as f:
+                members = [info for info in f.infolist() if not info.is_dir()]
+                for info in members:
+                    destination = _member_path(temp_dir, info.filename)
+                    destination.parent.mkdir(parents=True, exist_ok=True)
+                    destination.write_bytes(f.read(info))
+        else:
+            with tarfile.open(archive) as f:
+                for member in f.getmembers():
+                    if not member.isfile():
+                        continue
+                    destination = _member_path(temp_dir, member.name)
+                    destination.parent.mkdir(parents=True, exist_ok=True)
+                    destination.write_bytes(f.extractfile(member).read())
+        os.replace(temp_dir, target)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _member_path(base: Path, name: str) -> Path:
+    relative = PurePosixPath(name)
+    if relative.is_absolute() or ".." in relative.parts:
+        raise ValueError(f"Archive member {name} would be extracted outside the pack directory")
+    return base.joinpath(*relative.parts)
@@ -0,0 +1,269 @@
+"""
+Context token profiling for SuperClaude installations
+Measures how many tokens the CLAUDE.md import closure adds to every session
+and attributes them to components and import categories
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from .context import ImportGraph, ContextBundleService, resolve_import_path
+from .claude_md import CLAUDEMdService
+from .minify import MarkdownMinifier
+from .settings import SettingsService
+from ..utils.tokens import get_tokenizer, DEFAULT_TOKENIZER
+from ..utils.logger import get_logger
+
+
+BUNDLE_SECTION = re.compile(r'^<!-- source: (.+?) -->$', re.MULTILINE)
+
+USER_COMPONENT = "user"
+ENTRY_CATEGORY = "Entry Point"
+USER_CATEGORY = "User Imports"
+
+
+class ContextProfiler:
+    """Estimates per-file session token cost of installed framework content"""
+
+    # CLAUDE.md categories the components import their files under
+    IMPORT_CATEGORIES = {
+        "core": "Core Framework",
+        "modes": "Behavioral Modes",
+        "mcp_docs": "MCP Documentation"
+    }
+
+    def __init__(self, install_dir: Path, tokenizer: Optional[str] = None):
+        """
+        Initialize profiler
+
+        Args:
+            install_dir: Installation directory containing CLAUDE.md
+            tokenizer: Tokenizer name or "module:ClassName" (default: heuristic)
+
+        Raises:
+            ValueError: If the tokenizer can't be loaded
+        """
+        self.install_dir = install_dir
+        self.tokenizer_name = tokenizer or DEFAULT_TOKENIZER
+        self.tokenizer = get_tokenizer(self.tokenizer_name)
+        self.logger = get_logger()
+        self._ownership: Optional[Dict[Path, Tuple[str, Path]]] = None
+
+    def profile(self, include_update_delta: bool = True) -> Dict[str, Any]:
+        """
+        Profile the import closure loaded at session start
+
+        Args:
+            include_update_delta: Also compare installed files with the package sources
+
+        Returns:
+            Report dict (see _build_report), plus update_delta when requested
+        """
+        graph = ImportGraph(self.install_dir)
+        graph.walk(["CLAUDE.md"])
+        categories = self._category_map(graph)
+        ownership = self.get_ownership()
+
+        entries = []
+        for path in graph.order:
+            text = graph.texts[path]
+            relative = graph.relative(path)
+            if path.name == ContextBundleService.BUNDLE_FILE:
+                # Attribute bundle sections to the files they were compiled from
+                for source, section in _split_bundle(text):
+                    source_path = Path(os.path.normpath(self.install_dir / source))
+                    entries.append(self._entry(source, section, ownership.get(source_path, (USER_COMPONENT,))[0],
+                                               categories.get(source_path, USER_CATEGORY), via=relative))
+                continue
+
+            if path == self.install_dir / "CLAUDE.md":
+                component, category = USER_COMPONENT, ENTRY_CATEGORY
+            else:
+                component = ownership.get(path, (USER_COMPONENT,))[0]
+                category = categories.get(path, USER_CATEGORY)
+            entries.append(self._entry(relative, text, component, category))
+
+        report = self._build_report(entries)
+        report["install_dir"] = str(self.install_dir)
+        report["cycles"] = [[graph.relative(p) for p in cycle] for cycle in graph.cycles]
+        report["missing"] = [graph.relative(path) for path, _ in graph.missing]
+        if include_update_delta:
+            report["update_delta"] = self.update_delta(graph)
+        return report
+
+    def profile_sources(self, components: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Profile the files a fresh install would import, straight from the package
+
+        Used by CI to check the framework's context budget without installing.
+
+        Args:
+            components: Components to include (default: all that add imports)
+
+        Returns:
+            Report dict
+        """
+        components = components or list(self.IMPORT_CATEGORIES)
+        entries = []
+        for name, instance in self._component_instances(components, all_mcp_docs=True).items():
+            for source, target in instance.get_files_to_install():
+                text = source.read_text(encoding="utf-8")
+                entries.append(self._entry(target.relative_to(self.install_dir).as_posix(), text, name,
+                                           self.IMPORT_CATEGORIES.get(name, USER_CATEGORY)))
+        return self._build_report(entries)
+
+    def update_delta(self, graph: ImportGraph) -> Dict[str, Any]:
+        """
+        Token change a pending update would make to the session context
+
+        Compares each imported, component-owned file with its package source
+        (minified first if the installation is), and counts package files an
+        update would add to components that are already imported.
+
+        Args:
+            graph: Walked import graph of the installation
+
+        Returns:
+            Dict with total delta and per-file changes
+        """
+        ownership = self.get_ownership()
+        loaded = set(graph.order)
+        bundle_sources = set(ContextBundleService(self.install_dir).load_manifest().get("sources", {}))
+        loaded.update(Path(os.path.normpath(self.install_dir / source)) for source in bundle_sources)
+        imported_components = {ownership[path][0] for path in loaded if path in ownership}
+        minifier = MarkdownMinifier.from_metadata(self.install_dir, dry_run=True)
+
+        changes = []
+        for target, (component, source) in sorted(ownership.items()):
+            if target in loaded:
+                installed_tokens = self._count(target.read_text(encoding="utf-8"))
+            elif component in imported_components and not target.exists():
+                installed_tokens = 0
+            else:
+                continue
+            source_text = source.read_text(encoding="utf-8")
+            if minifier and source.suffix.lower() == ".md":
+                source_text = minifier.minify(source_text)
+            source_tokens = self._count(source_text)
+            if source_tokens != installed_tokens:
+                changes.append({
+                    "path": target.relative_to(self.install_dir).as_posix(),
+                    "component": component,
+                    "installed_tokens": installed_tokens,
+                    "source_tokens": source_tokens,
+                    "delta": source_tokens - installed_tokens
+                })
+
+        changes.sort(key=lambda change: -abs(change["delta"]))
+        return {"total": sum(change["delta"] for change in changes), "files": changes}
+
+    def _entry(self, path: str, text: str, component: str, category: str, via: Optional[str] = None) -> Dict[str, Any]:
+        """Measure one file or bundle section"""
+        entry = {
+            "path": path,
+            "component": component,
+            "category": category,
+            "tokens": self._count(text),
+            "bytes": len(text.encode("utf-8"))
+        }
+        if via:
+            entry["via"] = via
+        return entry
+
+    def _count(self, text: str) -> int:
+        return self.tokenizer.count(text)
+
+    def _build_report(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Aggregate file entries
+
+        Returns:
+            Dict with tokenizer, total_tokens, total_bytes, files (largest first),
+            components and categories (token totals, largest first)
+        """
+        by_component: Dict[str, int] = {}
+        by_category: Dict[str, int] = {}
+        for entry in entries:
+            by_component[entry["component"]] = by_component.get(entry["component"], 0) + entry["tokens"]
+            by_category[entry["category"]] = by_category.get(entry["category"], 0) + entry["tokens"]
+
+        return {
+            "tokenizer": self.tokenizer_name,
+            "total_tokens": sum(entry["tokens"] for entry in entries),
+            "total_bytes": sum(entry["bytes"] for entry in entries),
+            "files": sorted(entries, key=lambda entry: -entry["tokens"]),
+            "components": dict(sorted(by_component.items(), key=lambda item: -item[1])),
+            "categories": dict(sorted(by_category.items(), key=lambda item: -item[1]))
+        }
+
+    def _category_map(self, graph: ImportGraph) -> Dict[Path, str]:
+        """Map each loaded file to the CLAUDE.md category its root import is listed under"""
+        claude_md = CLAUDEMdService(self.install_dir)
+        roots: List[Tuple[str, str]] = []
+        for category, files in claude_md._parse_existing_framework_imports(claude_md.read_existing_content()).items():
+            roots.extend((category, file) for file in files)
+        roots.extend(tuple(root) for root in ContextBundleService(self.install_dir).load_manifest().get("roots", []))
+
+        entry = self.install_dir / "CLAUDE.md"
+        categories: Dict[Path, str] = {}
+        for category, file in roots:
+            root = Path(os.path.normpath(resolve_import_path(file, entry)))
+            self._inherit(graph, root, category, categories)
+        return categories
+
+    def _inherit(self, graph: ImportGraph, path: Path, category: str, categories: Dict[Path, str]) -> None:
+        """Assign category to path and everything it imports that has none yet"""
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            if current in categories:
+                continue
+            categories[current] = category
+            stack.extend(graph.edges.get(current, []))
+
+    def get_ownership(self) -> Dict[Path, Tuple[str, Path]]:
+        """Map installed file paths to (component, package source path)"""
+        if self._ownership is None:
+            installed = SettingsService(self.install_dir).get_installed_components()
+            self._ownership = {}
+            for name, instance in self._component_instances(list(installed)).items():
+                for source, target in instance.get_files_to_install():
+                    self._ownership[Path(os.path.normpath(target))] = (name, source)
+        return self._ownership
+
+    def _component_instances(self, names: List[str], all_mcp_docs: bool = False) -> Dict[str, Any]:
+        """Create component instances bound to the install directory"""
+        from ..core.registry import ComponentRegistry
+        from .. import PROJECT_ROOT
+
+        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+        registry.discover_components()
+        instances = registry.create_component_instances(
+            [name for name in names if name in registry.list_components()], self.install_dir
+        )
+
+        docs = instances.get("mcp_docs")
+        if docs is not None:
+            if all_mcp_docs:
+                servers = list(docs.server_docs_map)
+            else:
+                servers = SettingsService(self.install_dir).get_metadata_setting(
+                    "components.mcp_docs.servers_documented", []
+                )
+            docs.set_selected_servers(servers)
+        return instances
+
+
+def _split_bundle(text: str) -> List[Tuple[str, str]]:
+    """Split a compiled bundle into (source, section text) pairs; the header counts as the bundle's own"""
+    sections = []
+    matches = list(BUNDLE_SECTION.finditer(text))
+    if not matches:
+        return [(ContextBundleService.BUNDLE_FILE, text)]
+    sections.append((ContextBundleService.BUNDLE_FILE, text[:matches[0].start()]))
+    for index, match in enumerate(matches):
+        end = matches[index + 1].start() if index + 1 < len(matches) else len(text)
+        sections.append((match.group(1), text[match.start():end]))
+    return sections
@@ -0,0 +1,207 @@
+"""
+Deterministic agent routing for SuperClaude
+Builds an inverted index of terms and two-word phrases from each agent's
+frontmatter description and Triggers section, and ranks agents for a task
+description without calling a model
+"""
+
+import os
+import math
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Tuple, Optional
+
+from .frontmatter import parse_frontmatter
+from .dedup import split_sections
+from ..utils.text import analyze
+from ..utils.logger import get_logger
+
+
+class AgentRouter:
+    """Inverted-index scorer that ranks agents for a task description"""
+
+    FORMAT_VERSION = 1
+    INDEX_FILE = "agent_routes.json"
+
+    # Weight of one occurrence per source field; phrases (adjacent term pairs) count extra
+    FIELD_WEIGHTS = {"name": 3.0, "triggers": 2.0, "description": 1.5, "focus": 0.5}
+    PHRASE_BOOST = 1.5
+
+    # Section headings read per field (Japanese agents use translated headings)
+    FIELD_HEADINGS = {
+        "triggers": ("triggers", "トリガー"),
+        "focus": ("focus areas", "重点分野")
+    }
+
+    def __init__(self, agents_dir: Path, index_file: Path, build_file: Optional[Path] = None):
+        """
+        Initialize router
+
+        Args:
+            agents_dir: Directory of agent Markdown files (top level only)
+            index_file: Where the routing index is stored
+            build_file: Read-only index generated at build time, loaded if index_file is not usable
+        """
+        self.agents_dir = agents_dir
+        self.index_file = index_file
+        self.build_file = build_file
+        self.logger = get_logger()
+        self.agents: Dict[str, Dict[str, str]] = {}
+        self.postings: Dict[str, Dict[str, float]] = {}
+        self.sources: Dict[str, List[int]] = {}
+
+    @classmethod
+    def for_package(cls, install_dir: Optional[Path] = None, build: bool = False) -> "AgentRouter":
+        """
+        Router over the package's agent sources
+
+        The index generated at build time into setup/data is read as is; when
+        an agent changed since, the rebuilt index is kept in the user's cache
+        directory.
+
+        Args:
+            install_dir: Installation directory whose cache holds rebuilt indexes
+            build: Write the index shipped in setup/data instead (build time)
+        """
+        from .. import PROJECT_ROOT, DATA_DIR, package_cache_dir
+        agents_dir = PROJECT_ROOT / "SuperClaude" / "Agents"
+        if build:
+            return cls(agents_dir, DATA_DIR / cls.INDEX_FILE)
+        return cls(agents_dir, package_cache_dir(install_dir) / cls.INDEX_FILE, DATA_DIR / cls.INDEX_FILE)
+
+    @classmethod
+    def for_install_dir(cls, install_dir: Path) -> "AgentRouter":
+        """Router over installed agents"""
+        from .. import CACHE_DIR_NAME
+        return cls(install_dir / "agents", install_dir / CACHE_DIR_NAME / cls.INDEX_FILE)
+
+    def load(self, refresh: bool = True) -> "AgentRouter":
+        """
+        Load the stored index, rebuilding it if an agent file was added, removed or changed
+
+        Args:
+            refresh: Compare the agent files' size and mtime with the index (no file is opened)
+
+        Returns:
+            self
+        """
+        for index_file in (self.index_file, self.build_file):
+            if index_file is None:
+                continue
+            try:
+                data = json.loads(index_file.read_text(encoding="utf-8"))
+                if data.get("format_version") == self.FORMAT_VERSION:
+                    self.agents, self.postings, self.sources = data["agents"], data["postings"], data["sources"]
+                    break
+            except (OSError, ValueError, KeyError):
+                continue
+
+        if refresh and self.sources != self._signatures():
+            self.build()
+            self.save()
+        return self
+
+    def build(self) -> None:
+        """Index every agent file"""
+        fields_by_agent: Dict[str, Dict[str, List[List[str]]]] = {}
+        self.agents = {}
+        for path in sorted(self.agents_dir.glob("*.md")):
+            text = path.read_text(encoding="utf-8")
+            meta = parse_frontmatter(text)
+            name = meta.get("name") or path.stem
+            self.agents[name] = {"file": path.name, "description": meta.get("description", "")}
+
+            fields = {"name": [analyze(name.replace("-", " "))], "description": [analyze(meta.get("description", ""))]}
+            for section in split_sections(path.name, text):
+                for field, headings in self.FIELD_HEADINGS.items():
+                    if section.heading.strip().lower() in headings:
+                        fields.setdefault(field, []).extend(
+                            analyze(line) for line in section.body.splitlines() if line.strip()
+                        )
+            fields_by_agent[name] = fields
+
+        # Field-weighted term and phrase frequencies per agent, then idf
+        weights: Dict[str, Dict[str, float]] = {}
+        for name, fields in fields_by_agent.items():
+            for field, lines in fields.items():
+                for terms in lines:
+                    for term in terms:
+                        self._add(weights, term, name, self.FIELD_WEIGHTS[field])
+                    for first, second in zip(terms, terms[1:]):
+                        self._add(weights, f"{first} {second}", name, self.FIELD_WEIGHTS[field] * self.PHRASE_BOOST)
+
+        count = len(self.agents)
+        self.postings = {}
+        for term, by_agent in weights.items():
+            idf = math.log(1 + count / len(by_agent))
+            self.postings[term] = {name: round(weight * idf, 4) for name, weight in by_agent.items()}
+        self.sources = self._signatures()
+
+    def save(self) -> bool:
+        """
+        Write the index atomically
+
+        Returns:
+            True if written, False if the location is not writable
+        """
+        data = {"format_version": self.FORMAT_VERSION, "agents": self.agents,
+                "postings": self.postings, "sources": self.sources}
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.index_file.with_name(f".{self.index_file.name}.{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":")),
+                                 encoding="utf-8")
+            os.replace(temp_file, self.index_file)
+            return True
+        except OSError as e:
+            self.logger.debug(f"Could not write routing index {self.index_file}: {e}")
+            return False
+
+    def route(self, text: str, top: int = 3) -> List[Dict[str, Any]]:
+        """
+        Rank agents for a task description
+
+        Scores are the summed weights of the query's distinct terms and phrases;
+        ties are broken by agent name, so the result is deterministic.
+
+        Args:
+            text: Task description
+            top: Number of agents to return
+
+        Returns:
+            Dicts with agent, score, confidence (share of the top score) and matched terms
+        """
+        terms = analyze(text)
+        query = set(terms)
+        query.update(f"{first} {second}" for first, second in zip(terms, terms[1:]))
+
+        scores: Dict[str, float] = {}
+        matched: Dict[str, List[str]] = {}
+        for term in query:
+            for name, weight in self.postings.get(term, {}).items():
+                scores[name] = scores.get(name, 0.0) + weight
+                matched.setdefault(name, []).append(term)
+
+        ranked: List[Tuple[str, float]] = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:top]
+        best = ranked[0][1] if ranked else 0.0
+        return [{
+            "agent": name,
+            "file": self.agents.get(name, {}).get("file"),
+            "score": round(score, 3),
+            "confidence": round(score / best, 3) if best else 0.0,
+            "matched": sorted(matched[name])
+        } for name, score in ranked]
+
+    def _signatures(self) -> Dict[str, List[int]]:
+        """Size and mtime of each agent file"""
+        signatures = {}
+        if self.agents_dir.is_dir():
+            for path in self.agents_dir.glob("*.md"):
+                stat = path.stat()
+                signatures[path.name] = [stat.st_size, stat.st_mtime_ns]
+        return signatures
+
+    @staticmethod
+    def _add(weights: Dict[str, Dict[str, float]], term: str, name: str, weight: float) -> None:
+        by_agent = weights.setdefault(term, {})
+        by_agent[name] = by_agent.get(name, 0.0) + weight
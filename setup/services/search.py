@@ -0,0 +1,333 @@
+"""
+Offline full-text search for SuperClaude framework content and documentation
+Keeps a persistent BM25 index of every heading section of the Markdown corpus,
+updated incrementally as files change, and answers ranked queries with snippets
+"""
+
+import os
+import re
+import json
+import math
+import hashlib
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from .context import FENCE_LINE, track_fence
+from ..utils.text import analyze
+from ..utils.logger import get_logger
+
+
+HEADING = re.compile(r'^(#{1,6})\s+(.*?)\s*$')
+
+# HTML tags, Markdown emphasis and link syntax removed from snippets
+MARKUP = re.compile(r'<[^>]*>|[*_`>|]+|\[([^\]]*)\]\([^)]*\)')
+
+
+def split_search_sections(text: str) -> List[Tuple[str, int, int]]:
+    """
+    Split Markdown into sections at every heading outside fenced code
+
+    Text before the first heading is a section with an empty heading.
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        (heading, first line, end line) tuples; lines are 0-based, end is exclusive
+    """
+    lines = text.splitlines()
+    sections = []
+    heading, start = "", 0
+    fence = None
+    for index, line in enumerate(lines):
+        opened = fence
+        fence = track_fence(line, fence)
+        if opened is not None or fence is not None:
+            continue
+        match = HEADING.match(line)
+        if match:
+            if index > start or heading:
+                sections.append((heading, start, index))
+            heading, start = match.group(2), index
+    if len(lines) > start or heading:
+        sections.append((heading, start, len(lines)))
+    return sections
+
+
+class SearchIndex:
+    """Persistent BM25 index over Markdown heading sections"""
+
+    FORMAT_VERSION = 2
+    INDEX_FILE = "search_index.json"
+
+    # BM25 parameters; heading terms are counted HEADING_WEIGHT times
+    K1 = 1.2
+    B = 0.75
+    HEADING_WEIGHT = 3
+
+    SNIPPET_CHARS = 160
+    SNIPPET_LOOKAHEAD = 8
+
+    def __init__(self, base_dir: Path, roots: List[Tuple[str, str]], index_file: Path):
+        """
+        Initialize index
+
+        Args:
+            base_dir: Directory that indexed paths are relative to
+            roots: (subdirectory of base_dir, glob pattern) pairs selecting the indexed files
+            index_file: Where the index is stored
+        """
+        self.base_dir = base_dir
+        self.roots = roots
+        self.index_file = index_file
+        self.logger = get_logger()
+        self.data: Dict[str, Any] = self._empty()
+        self.loaded = False
+
+    @classmethod
+    def for_package(cls, install_dir: Optional[Path] = None) -> "SearchIndex":
+        """Index of the package's framework sources and documentation, cached in the user's cache directory"""
+        from .. import PROJECT_ROOT, package_cache_dir
+        return cls(PROJECT_ROOT, [("SuperClaude", "**/*.md"), ("Docs", "**/*.md")],
+                   package_cache_dir(install_dir) / cls.INDEX_FILE)
+
+    @classmethod
+    def for_install_dir(cls, install_dir: Path) -> "SearchIndex":
+        """Index of the installed framework files, commands and agents"""
+        from .. import CACHE_DIR_NAME
+        return cls(install_dir, [(".", "*.md"), ("commands", "**/*.md"), ("agents", "**/*.md")],
+                   install_dir / CACHE_DIR_NAME / cls.INDEX_FILE)
+
+    def _empty(self) -> Dict[str, Any]:
+        return {"format_version": self.FORMAT_VERSION, "files": {}, "postings": {}, "next_id": 0}
+
+    def load(self) -> bool:
+        """
+        Load the stored index (one file read)
+
+        Returns:
+            True if a compatible index was loaded
+        """
+        try:
+            data = json.loads(self.index_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if data.get("format_version") != self.FORMAT_VERSION:
+            return False
+        self.data = data
+        self.loaded = True
+        return True
+
+    def refresh(self, save: bool = True) -> int:
+        """
+        Bring the index up to date with the files on disk
+
+        Files whose size and modification time match the index are not opened;
+        changed files are hashed and only re-indexed if their content changed.
+
+        Args:
+            save: Write the index back if anything changed (errors are ignored)
+
+        Returns:
+            Number of files added, changed or removed
+        """
+        if not self.loaded:
+            self.load()
+        files: Dict[str, Dict[str, Any]] = self.data["files"]
+        seen = set()
+        changed = 0
+        touched = 0
+
+        for path in self._paths():
+            relative = path.relative_to(self.base_dir).as_posix()
+            seen.add(relative)
+            stat = path.stat()
+            recorded = files.get(relative)
+            if recorded and recorded["size"] == stat.st_size and recorded["mtime_ns"] == stat.st_mtime_ns:
+                continue
+
+            data = path.read_bytes()
+            content_hash = hashlib.sha256(data).hexdigest()
+            if recorded and recorded["hash"] == content_hash:
+                recorded.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                touched += 1  # Same content; only the stat signature is refreshed
+                continue
+
+            if recorded:
+                self._remove(relative)
+            self._add(relative, data.decode("utf-8", errors="replace"), content_hash, stat)
+            changed += 1
+
+        for relative in [relative for relative in files if relative not in seen]:
+            self._remove(relative)
+            changed += 1
+
+        if save and (changed or touched or not self.loaded):
+            self.save()
+        return changed
+
+    def save(self) -> bool:
+        """
+        Write the index atomically
+
+        Returns:
+            True if written, False if the location is not writable
+        """
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.index_file.with_name(f".{self.index_file.name}.{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(self.data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+            os.replace(temp_file, self.index_file)
+            self.loaded = True
+            return True
+        except OSError as e:
+            self.logger.debug(f"Could not write search index {self.index_file}: {e}")
+            return False
+
+    def search(self, query: str, top: int = 10, locale: Optional[str] = None,
+               path_prefix: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Rank sections for a query with BM25
+
+        Args:
+            query: Query text (English words or Japanese)
+            top: Number of hits to return
+            locale: Only files of this locale ("en" or "ja")
+            path_prefix: Only files whose relative path starts with this
+
+        Returns:
+            Hit dicts with path, heading, line (1-based), score, snippet and matched terms
+        """
+        terms = list(dict.fromkeys(analyze(query)))
+        files = self.data["files"]
+        by_id = {record["id"]: relative for relative, record in files.items()}
+        lengths: Dict[str, int] = {}
+        for record in files.values():
+            for number, section in enumerate(record["sections"]):
+                lengths[f"{record['id']}.{number}"] = section[3]
+        count = len(lengths)
+        if not terms or not count:
+            return []
+        average = sum(lengths.values()) / count
+
+        scores: Dict[str, float] = {}
+        matched: Dict[str, List[str]] = {}
+        for term in terms:
+            postings = self.data["postings"].get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for key, frequency in postings.items():
+                norm = self.K1 * (1 - self.B + self.B * lengths[key] / average)
+                scores[key] = scores.get(key, 0.0) + idf * frequency * (self.K1 + 1) / (frequency + norm)
+                matched.setdefault(key, []).append(term)
+
+        hits = []
+        for key, score in sorted(scores.items(), key=lambda item: (-item[1], item[0])):
+            file_id, number = key.split(".")
+            relative = by_id[int(file_id)]
+            record = files[relative]
+            if (locale and record["locale"] != locale) or (path_prefix and not relative.startswith(path_prefix)):
+                continue
+            heading, start, _end, _length = record["sections"][int(number)]
+            hits.append({"path": relative, "heading": heading, "line": start + 1, "score": round(score, 3),
+                         "matched": matched[key], "_section": record["sections"][int(number)]})
+            if len(hits) >= top:
+                break
+
+        for hit in hits:
+            hit["snippet"] = self._snippet(hit["path"], hit.pop("_section"), set(hit["matched"]))
+        return hits
+
+    def _paths(self) -> List[Path]:
+        """Indexed files on disk, skipping hidden directories such as caches"""
+        paths = set()
+        for subdir, pattern in self.roots:
+            root = self.base_dir / subdir
+            if root.is_dir():
+                paths.update(path for path in root.glob(pattern) if path.is_file()
+                             and not any(part.startswith(".") for part in path.relative_to(self.base_dir).parts))
+        return sorted(paths)
+
+    def _add(self, relative: str, text: str, content_hash: str, stat: os.stat_result) -> None:
+        """Index the sections of one file"""
+        file_id = self.data["next_id"]
+        self.data["next_id"] += 1
+        lines = text.splitlines()
+        postings = self.data["postings"]
+        sections = []
+        terms_seen = set()
+        for number, (heading, start, end) in enumerate(split_search_sections(text)):
+            body = "\n".join(lines[start + 1:end] if heading else lines[start:end])
+            terms = analyze(heading) * self.HEADING_WEIGHT + analyze(body)
+            frequencies: Dict[str, int] = {}
+            for term in terms:
+                frequencies[term] = frequencies.get(term, 0) + 1
+            key = f"{file_id}.{number}"
+            for term, frequency in frequencies.items():
+                postings.setdefault(term, {})[key] = frequency
+            terms_seen.update(frequencies)
+            sections.append([heading, start, end, len(terms)])
+
+        parts = Path(relative).parts
+        self.data["files"][relative] = {
+            "id": file_id,
+            "hash": content_hash,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "locale": "ja" if any(part == "JP" or part.endswith("-jp") for part in parts) else "en",
+            "sections": sections,
+            "terms": sorted(terms_seen)
+        }
+
+    def _remove(self, relative: str) -> None:
+        """Drop one file's sections from the index"""
+        record = self.data["files"].pop(relative)
+        prefix = f"{record['id']}."
+        postings = self.data["postings"]
+        for term in record["terms"]:
+            by_key = postings.get(term, {})
+            for key in [key for key in by_key if key.startswith(prefix)]:
+                del by_key[key]
+            if not by_key:
+                postings.pop(term, None)
+
+    def _snippet(self, relative: str, section: List[Any], terms: set) -> str:
+        """
+        Section line with the most matched terms, trimmed around the first match
+
+        A heading directly followed by a subheading takes its snippet from the text that follows.
+        """
+        heading, start, end, _length = section
+        try:
+            lines = (self.base_dir / relative).read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return ""
+        body = lines[start + 1:end] if heading else lines[start:end]
+        if not any(MARKUP.sub(r"\1", line).strip() for line in body):
+            body = lines[end:end + self.SNIPPET_LOOKAHEAD]
+
+        best, best_hits = "", 0
+        for line in body:
+            if FENCE_LINE.match(line) or HEADING.match(line):
+                continue
+            clean = " ".join(MARKUP.sub(r"\1", line).split())
+            if not clean:
+                continue
+            hits = len(terms.intersection(analyze(clean)))
+            if hits > best_hits:
+                best, best_hits = clean, hits
+            elif not best:
+                best = clean
+        if len(best) <= self.SNIPPET_CHARS:
+            return best
+
+        # Center the window on the first word that analyzes to a matched term
+        position = 0
+        for match in re.finditer(r"\S+", best):
+            if terms.intersection(analyze(match.group())):
+                position = match.start()
+                break
+        begin = max(0, min(position - self.SNIPPET_CHARS // 4, len(best) - self.SNIPPET_CHARS))
+        snippet = best[begin:begin + self.SNIPPET_CHARS]
+        return ("…" if begin else "") + snippet + ("…" if begin + self.SNIPPET_CHARS < len(best) else "")
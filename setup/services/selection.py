@@ -0,0 +1,147 @@
+"""
+Item-level install selection for SuperClaude
+Resolves the commands and agents a user asks for into the set of files that
+must be installed with them: personas named in frontmatter pull in agents,
+mcp-servers pull in MCP server configurations and their documentation
+"""
+
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set
+
+from .frontmatter import FrontmatterIndex
+
+
+# Item kinds that can be selected individually, mapped to their component
+SELECTABLE_COMPONENTS = ("commands", "agents")
+
+_aliases_cache: Optional[Dict[str, str]] = None
+
+
+def load_persona_aliases() -> Dict[str, str]:
+    """
+    Load the legacy persona names from setup/data/persona_aliases.json
+
+    Returns:
+        Dict of persona name (as used in command frontmatter) -> agent name
+    """
+    global _aliases_cache
+    if _aliases_cache is None:
+        from .. import DATA_DIR
+        with open(DATA_DIR / "persona_aliases.json", 'r', encoding='utf-8') as f:
+            _aliases_cache = json.load(f)
+    return _aliases_cache
+
+
+def parse_item_list(values: Optional[List[str]]) -> Optional[List[str]]:
+    """
+    Flatten repeated and comma-separated item arguments
+
+    Args:
+        values: Argument values such as ["analyze,implement", "test"]
+
+    Returns:
+        Item names, None if no values were given, or ["all"] to clear a recorded selection
+    """
+    if values is None:
+        return None
+    items = [item.strip() for value in values for item in value.split(",") if item.strip()]
+    return ["all"] if "all" in items else items
+
+
+class ItemSelection:
+    """Dependency closure of selected commands and agents"""
+
+    def __init__(self, index: FrontmatterIndex, aliases: Dict[str, str]):
+        """
+        Initialize selection
+
+        Args:
+            index: Frontmatter index of the command and agent sources
+            aliases: Legacy persona name -> agent name
+        """
+        self.index = index
+        self.aliases = aliases
+        # Kind -> item name -> entry (English sources only; locale variants are picked at install)
+        self.items: Dict[str, Dict[str, Dict[str, Any]]] = {kind: {} for kind in SELECTABLE_COMPONENTS}
+        for kind in SELECTABLE_COMPONENTS:
+            for entry in index.query(kind, locale="en"):
+                self.items[kind][entry["name"]] = entry
+                self.items[kind].setdefault(Path(entry["path"]).stem, entry)
+
+    @classmethod
+    def for_package(cls, install_dir: Optional[Path] = None) -> "ItemSelection":
+        """Selection over the package's command and agent sources"""
+        index = FrontmatterIndex.for_package(install_dir)
+        index.refresh()
+        return cls(index, load_persona_aliases())
+
+    def resolve(self, commands: Optional[List[str]] = None, agents: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Compute the closure of a selection
+
+        Args:
+            commands: Command names (analyze, sc:analyze or analyze.md)
+            agents: Agent names (frontmatter name or file name)
+
+        Returns:
+            Dict with commands and agents (sorted file names), mcp_servers (sorted),
+            required_by (item -> items that pulled it in) and unknown_personas
+
+        Raises:
+            ValueError: If a requested command or agent does not exist
+        """
+        selected: Dict[str, Set[str]] = {kind: set() for kind in SELECTABLE_COMPONENTS}
+        servers: Set[str] = set()
+        required_by: Dict[str, List[str]] = {}
+        unknown: Set[str] = set()
+
+        queue = []
+        for kind, names in (("commands", commands or []), ("agents", agents or [])):
+            for name in names:
+                entry = self._lookup(kind, name)
+                if entry is None:
+                    raise ValueError(f"Unknown {kind[:-1]}: {name} (available: "
+                                     f"{', '.join(sorted({Path(e['path']).stem for e in self.items[kind].values()}))})")
+                queue.append(entry)
+
+        while queue:
+            entry = queue.pop()
+            file_name = Path(entry["path"]).name
+            if file_name in selected[entry["kind"]]:
+                continue
+            selected[entry["kind"]].add(file_name)
+            for persona in _as_list(entry.get("personas")):
+                agent = self._lookup("agents", self.aliases.get(persona, persona))
+                if agent is None:
+                    unknown.add(persona)
+                    continue
+                required_by.setdefault(Path(agent["path"]).name, []).append(file_name)
+                queue.append(agent)
+            for server in _as_list(entry.get("mcp-servers")):
+                servers.add(server.lower())
+                required_by.setdefault(f"mcp:{server.lower()}", []).append(file_name)
+
+        return {
+            "commands": sorted(selected["commands"]),
+            "agents": sorted(selected["agents"]),
+            "mcp_servers": sorted(servers),
+            "required_by": {item: sorted(set(sources)) for item, sources in sorted(required_by.items())},
+            "unknown_personas": sorted(unknown)
+        }
+
+    def _lookup(self, kind: str, name: str) -> Optional[Dict[str, Any]]:
+        name = name.strip()
+        if kind == "commands" and name.startswith("sc:"):
+            name = name[3:]
+        if name.endswith(".md"):
+            name = name[:-3]
+        return self.items[kind].get(name)
+
+
+def _as_list(value: Any) -> List[str]:
+    if isinstance(value, list):
+        return [str(item) for item in value if str(item).strip()]
+    if isinstance(value, str) and value.strip():
+        return [value.strip()]
+    return []
@@ -4,17 +4,109 @@ Handles settings.json migration to the new SuperClaude metadata json file
 Allows for manipulation of these json files with deep merge and backup
 """
 
+import os
 import json
-import shutil
-from typing import Dict, Any, Optional, List
+import hashlib
+import threading
+from typing import Dict, Any, Optional, List, Tuple, Iterator
 from pathlib import Path
 from datetime import datetime
 import copy
 
+from .state import StateStore
+
+
+_MISSING = object()
+
+
+class _DocumentCache:
+    """
+    Process-wide cache of parsed JSON documents
+    
+    Entries are keyed by path and validated against (st_mtime_ns, st_size), so a
+    repeated read costs one stat instead of a parse. Dotted-path lookups are
+    memoized per document and dropped whenever the document changes.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[Path, Tuple[Tuple[int, int], Any, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+    
+    def _entry(self, path: Path) -> Optional[Tuple[Tuple[int, int], Any, Dict[str, Any]]]:
+        """Return a valid cache entry for path, parsing the file if needed"""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self.invalidate(path)
+            return None
+        
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                return entry
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+        
+        entry = (signature, document, {})
+        with self._lock:
+            self._entries[path] = entry
+        return entry
+    
+    def load(self, path: Path) -> Optional[Any]:
+        """
+        Get the parsed document at path
+        
+        The returned object is shared; callers must not mutate it.
+        
+        Returns:
+            Parsed document or None if the file doesn't exist
+        """
+        entry = self._entry(path)
+        return entry[1] if entry is not None else None
+    
+    def lookup(self, path: Path, key_path: str) -> Any:
+        """
+        Resolve a dot-separated key path in the document at path
+        
+        Returns:
+            Value (shared) or _MISSING if the file or key doesn't exist
+        """
+        entry = self._entry(path)
+        if entry is None:
+            return _MISSING
+        
+        memo = entry[2]
+        if key_path in memo:
+            return memo[key_path]
+        
+        try:
+            value = entry[1]
+            for key in key_path.split('.'):
+                value = value[key]
+        except (KeyError, TypeError, IndexError):
+            value = _MISSING
+        
+        with self._lock:
+            memo[key_path] = value
+        return value
+    
+    def invalidate(self, path: Path) -> None:
+        """Drop the cached document for path"""
+        with self._lock:
+            self._entries.pop(path, None)
+
+
+_document_cache = _DocumentCache()
+
 
 class SettingsService:
     """Manages settings.json file operations"""
     
+    BACKUP_FORMAT_VERSION = 2  # 2: entries record their byte offset in the history log
+    BACKUP_COMPACT_INTERVAL = 32  # Max patches replayed on restore
+    
     def __init__(self, install_dir: Path):
         """
         Initialize settings manager
@@ -26,6 +118,8 @@ class SettingsService:
         self.settings_file = install_dir / "settings.json"
         self.metadata_file = install_dir / ".superclaude-metadata.json"
         self.backup_dir = install_dir / "backups" / "settings"
+        self.backup_index_file = self.backup_dir / "index.json"
+        self.backup_history_file = self.backup_dir / "history.jsonl"
         
     def load_settings(self) -> Dict[str, Any]:
         """
@@ -34,14 +128,7 @@ class SettingsService:
         Returns:
             Settings dict (empty if file doesn't exist)
         """
-        if not self.settings_file.exists():
-            return {}
-        
-        try:
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            raise ValueError(f"Could not load settings from {self.settings_file}: {e}")
+        return copy.deepcopy(self._load_document(self.settings_file, "settings"))
     
     def save_settings(self, settings: Dict[str, Any], create_backup: bool = True) -> None:
         """
@@ -60,10 +147,11 @@ class SettingsService:
         
         # Save with pretty formatting
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False, sort_keys=True)
+            _write_json_atomic(self.settings_file, settings)
         except IOError as e:
             raise ValueError(f"Could not save settings to {self.settings_file}: {e}")
+        finally:
+            _document_cache.invalidate(self.settings_file)
     
     def load_metadata(self) -> Dict[str, Any]:
         """
@@ -72,14 +160,7 @@ class SettingsService:
         Returns:
             Metadata dict (empty if file doesn't exist)
         """
-        if not self.metadata_file.exists():
-            return {}
-        
-        try:
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            raise ValueError(f"Could not load metadata from {self.metadata_file}: {e}")
+        return copy.deepcopy(self._load_document(self.metadata_file, "metadata"))
     
     def save_metadata(self, metadata: Dict[str, Any]) -> None:
         """
@@ -93,10 +174,11 @@ class SettingsService:
         
         # Save with pretty formatting
         try:
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False, sort_keys=True)
+            _write_json_atomic(self.metadata_file, metadata)
         except IOError as e:
             raise ValueError(f"Could not save metadata to {self.metadata_file}: {e}")
+        finally:
+            _document_cache.invalidate(self.metadata_file)
 
     def merge_metadata(self, modifications: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -195,15 +277,7 @@ class SettingsService:
         Returns:
             Setting value or default
         """
-        settings = self.load_settings()
-        
-        try:
-            value = settings
-            for key in key_path.split('.'):
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return self._lookup(self.settings_file, "settings", key_path, default)
     
     def set_setting(self, key_path: str, value: Any, create_backup: bool = True) -> None:
         """
@@ -276,6 +350,10 @@ class SettingsService:
         }
         
         self.save_metadata(metadata)
+        
+        state_store = StateStore.open_if_enabled(self.install_dir)
+        if state_store:
+            state_store.upsert_component(component_name, metadata["components"][component_name])
     
     def remove_component_registration(self, component_name: str) -> bool:
         """
@@ -287,6 +365,10 @@ class SettingsService:
         Returns:
             True if component was removed, False if not found
         """
+        state_store = StateStore.open_if_enabled(self.install_dir)
+        if state_store:
+            state_store.remove_component(component_name)
+        
         metadata = self.load_metadata()
         if "components" in metadata and component_name in metadata["components"]:
             del metadata["components"][component_name]
@@ -298,11 +380,15 @@ class SettingsService:
         """
         Get all installed components from registry
         
+        Read from the state store when it is enabled.
+        
         Returns:
             Dict of component_name -> component_info
         """
-        metadata = self.load_metadata()
-        return metadata.get("components", {})
+        state_store = StateStore.open_if_enabled(self.install_dir)
+        if state_store:
+            return state_store.get_components()
+        return self._lookup(self.metadata_file, "metadata", "components", {})
     
     def is_component_installed(self, component_name: str) -> bool:
         """
@@ -314,8 +400,7 @@ class SettingsService:
         Returns:
             True if component is installed, False otherwise
         """
-        components = self.get_installed_components()
-        return component_name in components
+        return self._lookup(self.metadata_file, "metadata", f"components.{component_name}", None) is not None
     
     def get_component_version(self, component_name: str) -> Optional[str]:
         """
@@ -327,9 +412,7 @@ class SettingsService:
         Returns:
             Version string or None if not installed
         """
-        components = self.get_installed_components()
-        component_info = components.get(component_name, {})
-        return component_info.get("version")
+        return self._lookup(self.metadata_file, "metadata", f"components.{component_name}.version", None)
     
     def update_framework_version(self, version: str) -> None:
         """
@@ -376,15 +459,48 @@ class SettingsService:
         Returns:
             Metadata value or default
         """
-        metadata = self.load_metadata()
+        return self._lookup(self.metadata_file, "metadata", key_path, default)
+    
+    def _load_document(self, path: Path, description: str) -> Dict[str, Any]:
+        """
+        Load a JSON document through the process-wide cache
         
+        Args:
+            path: Path to the JSON file
+            description: Name used in error messages
+            
+        Returns:
+            Shared document dict (empty if file doesn't exist); do not mutate
+        """
         try:
-            value = metadata
-            for key in key_path.split('.'):
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
+            document = _document_cache.load(path)
+        except (json.JSONDecodeError, IOError) as e:
+            raise ValueError(f"Could not load {description} from {path}: {e}")
+        return document if document is not None else {}
+    
+    def _lookup(self, path: Path, description: str, key_path: str, default: Any) -> Any:
+        """
+        Memoized dot-notation lookup in a cached JSON document
+        
+        Args:
+            path: Path to the JSON file
+            description: Name used in error messages
+            key_path: Dot-separated path
+            default: Default value if file or key not found
+            
+        Returns:
+            Copy of the value, or default
+        """
+        try:
+            value = _document_cache.lookup(path, key_path)
+        except (json.JSONDecodeError, IOError) as e:
+            raise ValueError(f"Could not load {description} from {path}: {e}")
+        
+        if value is _MISSING:
             return default
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
     
     def _deep_merge(self, base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -407,53 +523,351 @@ class SettingsService:
         
         return result
     
-    def _create_settings_backup(self) -> Path:
+    def _create_settings_backup(self) -> Optional[str]:
         """
-        Create timestamped backup of settings.json
+        Record current settings.json in the backup history
+        
+        The history is a base snapshot followed by a chain of JSON patches.
+        Saves whose content hash matches the latest entry are skipped.
+        Starting a new base first drops the chains older than the current one,
+        so the history keeps between one and two chains of entries.
         
         Returns:
-            Path to backup file
+            Name of the recorded backup entry, or None if content was unchanged
         """
         if not self.settings_file.exists():
             raise ValueError("Cannot backup non-existent settings file")
         
+        current = self.load_settings()
+        content_hash = _settings_hash(current)
+        
+        index = self._load_backup_index()
+        entries = index["entries"]
+        if entries and entries[-1]["hash"] == content_hash:
+            return None
+        
         # Create backup directory
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         
-        # Create timestamped backup
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_file = self.backup_dir / f"settings_{timestamp}.json"
+        now = datetime.now()
+        name = f"settings_{now.strftime('%Y%m%d_%H%M%S_%f')}"
+        
+        # Fold the patch chain into a fresh base every COMPACT_INTERVAL entries
+        # so a restore never has to replay more than that many patches
+        since_base = 0
+        for entry in reversed(entries):
+            if entry.get("base"):
+                break
+            since_base += 1
+        
+        if not entries or since_base >= self.BACKUP_COMPACT_INTERVAL:
+            self._compact_backup_history(index)
+            entries = index["entries"]
+            record = {"name": name, "snapshot": current}
+        else:
+            previous = self._reconstruct_backup(entries[-1]["name"], entries)
+            record = {"name": name, "patch": _json_diff(previous, current)}
+        
+        offset = self._append_backup_record(record)
+        
+        entries.append({
+            "name": name,
+            "created": now.isoformat(),
+            "hash": content_hash,
+            "size": len(json.dumps(current, indent=2, ensure_ascii=False, sort_keys=True).encode('utf-8')),
+            "base": "snapshot" in record,
+            "offset": offset
+        })
+        self._save_backup_index(index)
+        
+        state_store = StateStore.open_if_enabled(self.install_dir)
+        if state_store:
+            entry = entries[-1]
+            state_store.record_backup(name, "settings", self.backup_history_file,
+                                      entry["created"], entry["size"], {"hash": content_hash})
+        
+        return name
+    
+    def _load_backup_index(self) -> Dict[str, Any]:
+        """
+        Load backup history index, importing legacy full-copy backups once
+        
+        Returns:
+            Index dict with an ordered "entries" list (oldest first)
+        """
+        if self.backup_index_file.exists():
+            try:
+                with open(self.backup_index_file, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+                if isinstance(index.get("entries"), list):
+                    if index.get("format") != self.BACKUP_FORMAT_VERSION:
+                        self._upgrade_backup_index(index)
+                    return index
+            except (json.JSONDecodeError, IOError):
+                pass  # Rebuild below from whatever history survives
+        
+        index = {"format": self.BACKUP_FORMAT_VERSION, "entries": []}
+        if self.backup_history_file.exists():
+            return self._rebuild_backup_index()
+        
+        if self.backup_dir.exists():
+            self._import_legacy_backups(index)
+        return index
+    
+    def _upgrade_backup_index(self, index: Dict[str, Any]) -> None:
+        """
+        Add the log offsets missing from an index written by an older version
+        
+        Args:
+            index: Loaded index dict, updated and saved in place
+        """
+        offsets = {record.get("name"): offset for offset, record in self._read_backup_records()}
+        for entry in index["entries"]:
+            entry["offset"] = offsets.get(entry["name"])
+        index["format"] = self.BACKUP_FORMAT_VERSION
+        self._save_backup_index(index)
+    
+    def _save_backup_index(self, index: Dict[str, Any]) -> None:
+        """
+        Save backup history index
+        
+        Args:
+            index: Index dict to save
+        """
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        temp_file = self.backup_index_file.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, ensure_ascii=False)
+        temp_file.replace(self.backup_index_file)
+    
+    def _append_backup_record(self, record: Dict[str, Any]) -> int:
+        """
+        Append a snapshot or patch record to the history log
+        
+        Args:
+            record: Record dict with "name" and either "snapshot" or "patch"
+            
+        Returns:
+            Byte offset of the record in the log
+        """
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.backup_history_file, 'ab') as f:
+            offset = f.seek(0, os.SEEK_END)
+            f.write((json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n").encode('utf-8'))
+        return offset
+    
+    def _read_backup_records(self, offset: int = 0) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Read records from the history log
+        
+        Args:
+            offset: Byte offset of the first record to read
+            
+        Yields:
+            (offset, record) tuples in append order
+        """
+        if not self.backup_history_file.exists():
+            return
         
-        shutil.copy2(self.settings_file, backup_file)
+        with open(self.backup_history_file, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                start = offset
+                offset += len(line)
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line.decode('utf-8'))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    continue  # Skip a torn write
+                if isinstance(record, dict):
+                    yield start, record
+    
+    def _reconstruct_backup(self, backup_name: str,
+                            entries: Optional[List[Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Rebuild the settings content recorded under a backup name
+        
+        Only the chain holding the entry is read: from the offset of its base
+        snapshot up to the entry itself.
         
-        # Keep only last 10 backups
-        self._cleanup_old_backups()
+        Args:
+            backup_name: Name of the history entry
+            entries: Index entries (loaded if None)
+            
+        Returns:
+            Settings dict or None if the entry is unknown
+        """
+        if entries is None:
+            entries = self._load_backup_index()["entries"]
+        position = next((i for i, entry in enumerate(entries) if entry["name"] == backup_name), None)
+        if position is None:
+            return None
+        
+        base = position
+        while base > 0 and not entries[base].get("base"):
+            base -= 1
+        offset = entries[base].get("offset")
+        if offset is not None:
+            state = self._replay_backup_records(backup_name, offset, entries[base]["name"])
+            if state is not None:
+                return state
+        
+        # The log was rewritten behind the index's back; replay all of it
+        return self._replay_backup_records(backup_name)
+    
+    def _replay_backup_records(self, backup_name: str, offset: int = 0,
+                               base_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Apply history records up to a backup name
         
-        return backup_file
+        Args:
+            backup_name: Name of the history entry
+            offset: Byte offset to start reading at
+            base_name: Name of the snapshot expected at offset (not checked if None)
+            
+        Returns:
+            Settings dict or None if the entry wasn't reached
+        """
+        state = None
+        for _, record in self._read_backup_records(offset):
+            if base_name is not None:
+                if record.get("name") != base_name or "snapshot" not in record:
+                    return None
+                base_name = None
+            if "snapshot" in record:
+                state = copy.deepcopy(record["snapshot"])
+            elif state is not None:
+                state = _json_apply(state, record.get("patch", []))
+            if record.get("name") == backup_name:
+                return state
+        return None
     
-    def _cleanup_old_backups(self, keep_count: int = 10) -> None:
+    def _compact_backup_history(self, index: Dict[str, Any]) -> None:
         """
-        Remove old backup files, keeping only the most recent
+        Drop the chains older than the latest base snapshot
+        
+        The log is rewritten to start at the latest snapshot and the index
+        entries and offsets are updated to match (the caller saves the index).
         
         Args:
-            keep_count: Number of backups to keep
+            index: Index dict
         """
-        if not self.backup_dir.exists():
+        entries = index["entries"]
+        base = next((i for i in range(len(entries) - 1, -1, -1) if entries[i].get("base")), None)
+        if not base:
             return
         
-        # Get all backup files sorted by modification time
-        backup_files = []
-        for file in self.backup_dir.glob("settings_*.json"):
-            backup_files.append((file.stat().st_mtime, file))
+        offset = entries[base].get("offset")
+        if offset is None or not self.backup_history_file.exists():
+            return
+        
+        with open(self.backup_history_file, 'rb') as f:
+            f.seek(offset)
+            chain = f.read()
+        try:
+            first = json.loads(chain.split(b"\n", 1)[0].decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return
+        if not isinstance(first, dict) or first.get("name") != entries[base]["name"] or "snapshot" not in first:
+            return  # Offsets are stale; leave the log alone
+        
+        temp_file = self.backup_history_file.with_suffix('.tmp')
+        temp_file.write_bytes(chain)
+        temp_file.replace(self.backup_history_file)
+        
+        index["entries"] = entries[base:]
+        for entry in index["entries"]:
+            if entry.get("offset") is not None:
+                entry["offset"] -= offset
+    
+    def _rebuild_backup_index(self) -> Dict[str, Any]:
+        """
+        Rebuild the index from the history log after index loss or corruption
+        
+        Returns:
+            Rebuilt index dict
+        """
+        index = {"format": self.BACKUP_FORMAT_VERSION, "entries": []}
+        state = None
+        for offset, record in self._read_backup_records():
+            if "snapshot" in record:
+                state = copy.deepcopy(record["snapshot"])
+            elif state is not None:
+                state = _json_apply(state, record.get("patch", []))
+            else:
+                continue
+            
+            name = record.get("name", "")
+            try:
+                created = datetime.strptime(name, "settings_%Y%m%d_%H%M%S_%f").isoformat()
+            except ValueError:
+                created = datetime.fromtimestamp(self.backup_history_file.stat().st_mtime).isoformat()
+            
+            index["entries"].append({
+                "name": name,
+                "created": created,
+                "hash": _settings_hash(state),
+                "size": len(json.dumps(state, indent=2, ensure_ascii=False, sort_keys=True).encode('utf-8')),
+                "base": "snapshot" in record,
+                "offset": offset
+            })
+        
+        self._save_backup_index(index)
+        return index
+    
+    def _import_legacy_backups(self, index: Dict[str, Any]) -> None:
+        """
+        Import full-copy settings_*.json backups into the history
         
-        backup_files.sort(reverse=True)  # Most recent first
+        Legacy files are left in place; they are simply no longer scanned.
         
-        # Remove old backups
-        for _, file in backup_files[keep_count:]:
+        Args:
+            index: Empty index dict to populate
+        """
+        legacy_files = []
+        for file in self.backup_dir.glob("settings_*.json"):
             try:
-                file.unlink()
+                legacy_files.append((file.stat().st_mtime, file))
             except OSError:
-                pass  # Ignore errors when cleaning up
+                continue
+        
+        if not legacy_files:
+            return
+        
+        legacy_files.sort()  # Oldest first
+        
+        previous = None
+        for mtime, file in legacy_files:
+            try:
+                with open(file, 'r', encoding='utf-8') as f:
+                    content = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                continue
+            
+            content_hash = _settings_hash(content)
+            if index["entries"] and index["entries"][-1]["hash"] == content_hash:
+                continue
+            
+            if previous is None:
+                record = {"name": file.stem, "snapshot": content}
+            else:
+                record = {"name": file.stem, "patch": _json_diff(previous, content)}
+            offset = self._append_backup_record(record)
+            
+            index["entries"].append({
+                "name": file.stem,
+                "created": datetime.fromtimestamp(mtime).isoformat(),
+                "hash": content_hash,
+                "size": file.stat().st_size,
+                "base": "snapshot" in record,
+                "offset": offset
+            })
+            previous = content
+        
+        if index["entries"]:
+            self._save_backup_index(index)
     
     def list_backups(self) -> List[Dict[str, Any]]:
         """
@@ -462,25 +876,18 @@ class SettingsService:
         Returns:
             List of backup info dicts with name, path, and timestamp
         """
-        if not self.backup_dir.exists():
-            return []
+        entries = self._load_backup_index()["entries"]
         
         backups = []
-        for file in self.backup_dir.glob("settings_*.json"):
-            try:
-                stat = file.stat()
-                backups.append({
-                    "name": file.name,
-                    "path": str(file),
-                    "size": stat.st_size,
-                    "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                    "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
-                })
-            except OSError:
-                continue
-        
-        # Sort by creation time, most recent first
-        backups.sort(key=lambda x: x["created"], reverse=True)
+        for entry in reversed(entries):  # Most recent first
+            backups.append({
+                "name": entry["name"],
+                "path": str(self.backup_history_file),
+                "size": entry.get("size", 0),
+                "created": entry["created"],
+                "modified": entry["created"],
+                "hash": entry["hash"]
+            })
         return backups
     
     def restore_backup(self, backup_name: str) -> bool:
@@ -488,28 +895,115 @@ class SettingsService:
         Restore settings from backup
         
         Args:
-            backup_name: Name of backup file to restore
+            backup_name: Name of backup entry to restore (a trailing .json is accepted)
             
         Returns:
             True if successful, False otherwise
         """
-        backup_file = self.backup_dir / backup_name
-        
-        if not backup_file.exists():
-            return False
+        if backup_name.endswith(".json"):
+            backup_name = backup_name[:-len(".json")]
         
         try:
-            # Validate backup file first
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                json.load(f)  # Will raise exception if invalid
-            
-            # Create backup of current settings
-            if self.settings_file.exists():
-                self._create_settings_backup()
+            entries = self._load_backup_index()["entries"]
+            content = self._reconstruct_backup(backup_name, entries)
+            if content is None:
+                return False
             
-            # Restore backup
-            shutil.copy2(backup_file, self.settings_file)
+            # save_settings records the current settings before overwriting
+            self.save_settings(content, create_backup=True)
             return True
             
-        except (json.JSONDecodeError, IOError):
+        except (json.JSONDecodeError, IOError, ValueError):
             return False
+
+
+def _write_json_atomic(path: Path, content: Dict[str, Any]) -> None:
+    """
+    Write a JSON file via a temporary file and rename
+    
+    Readers that don't take the installation lock never see a partial file.
+    """
+    temp_file = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(content, f, indent=2, ensure_ascii=False, sort_keys=True)
+        os.replace(temp_file, path)
+    finally:
+        if temp_file.exists():
+            temp_file.unlink()
+
+
+def _settings_hash(content: Dict[str, Any]) -> str:
+    """Content hash of a settings dict, independent of key order and formatting"""
+    canonical = json.dumps(content, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _escape_pointer(key: str) -> str:
+    """Escape a key for use as a JSON pointer segment"""
+    return key.replace('~', '~0').replace('/', '~1')
+
+
+def _unescape_pointer(segment: str) -> str:
+    """Unescape a JSON pointer segment"""
+    return segment.replace('~1', '/').replace('~0', '~')
+
+
+def _json_diff(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    Compute a JSON patch (RFC 6902 add/remove/replace subset) from old to new
+    
+    Objects are diffed key by key; lists and scalars are replaced whole.
+    
+    Args:
+        old: Source document
+        new: Target document
+        path: JSON pointer of the current node
+        
+    Returns:
+        List of patch operations
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape_pointer(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape_pointer(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(_json_diff(old[key], value, child))
+        return ops
+    
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def _json_apply(document: Any, patch: List[Dict[str, Any]]) -> Any:
+    """
+    Apply a patch produced by _json_diff
+    
+    Args:
+        document: Document to patch (modified in place when it is an object)
+        patch: List of patch operations
+        
+    Returns:
+        Patched document
+    """
+    for op in patch:
+        segments = [_unescape_pointer(s) for s in op["path"].split('/')[1:]]
+        if not segments:
+            document = copy.deepcopy(op.get("value"))
+            continue
+        
+        parent = document
+        for segment in segments[:-1]:
+            parent = parent[segment]
+        
+        if op["op"] == "remove":
+            parent.pop(segments[-1], None)
+        else:
+            parent[segments[-1]] = copy.deepcopy(op["value"])
+    return document
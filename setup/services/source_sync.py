@@ -0,0 +1,292 @@
+"""
+Incremental source sync for SuperClaude installations
+Records the source commit and the source files every component was installed
+from, so the next install or update with --changed-only touches only the
+components and files that changed since: a local `git diff` against the
+recorded commit when the source is a git checkout, a stat-and-hash scan of the
+recorded files otherwise
+"""
+
+import os
+import json
+import hashlib
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set
+
+from ..utils.logger import get_logger
+
+
+GIT_TIMEOUT = 10
+
+
+def git_head(repo: Path) -> Optional[str]:
+    """
+    Commit checked out in a git working tree
+
+    Args:
+        repo: Top directory of the checkout
+
+    Returns:
+        Commit hash, or None if repo is not a git checkout or git is unavailable
+    """
+    output = _git(repo, "rev-parse", "HEAD")
+    return output.strip() if output else None
+
+
+def git_changed_paths(repo: Path, commit: str) -> Optional[Dict[str, Set[str]]]:
+    """
+    Files changed in a working tree since a commit, without network access
+
+    Args:
+        repo: Top directory of the checkout
+        commit: Recorded commit
+
+    Returns:
+        Dict with changed (paths relative to repo that differ between the commit and the
+        working tree, committed or not) and untracked paths, or None if the commit is
+        unknown locally or git is unavailable
+    """
+    if _git(repo, "cat-file", "-e", f"{commit}^{{commit}}") is None:
+        return None
+    changed = _git(repo, "diff", "--name-only", "--no-renames", commit, "--")
+    untracked = _git(repo, "ls-files", "--others", "--exclude-standard")
+    if changed is None or untracked is None:
+        return None
+    return {"changed": set(changed.splitlines()), "untracked": set(untracked.splitlines())}
+
+
+def _git(repo: Path, *args: str) -> Optional[str]:
+    """Output of a git command in repo (None on any failure)"""
+    if not (repo / ".git").exists():
+        return None
+    try:
+        result = subprocess.run(["git", "-C", str(repo), *args], capture_output=True, text=True,
+                                timeout=GIT_TIMEOUT)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+class SourceSync:
+    """Changes of the installed components' sources since they were last installed"""
+
+    FORMAT_VERSION = 1
+    MANIFEST_FILE = "source_manifest.json"
+
+    def __init__(self, source_root: Path, manifest_file: Path, version: str):
+        """
+        Initialize sync
+
+        Args:
+            source_root: Project root the components install from
+            manifest_file: Where the installed sources are recorded
+            version: Installer version (a different version, or changed installer code, reinstalls every component)
+        """
+        self.source_root = source_root
+        self.manifest_file = manifest_file
+        self.version = version
+        self.logger = get_logger()
+        self.manifest: Dict[str, Any] = {"format_version": self.FORMAT_VERSION, "files": {}, "components": {}}
+        self.method = "full"
+        self._git_changes: Dict[str, Optional[Dict[str, Set[str]]]] = {}
+
+    @classmethod
+    def for_install_dir(cls, install_dir: Path) -> "SourceSync":
+        """Sync of an installation from the package sources"""
+        from .. import PROJECT_ROOT, CACHE_DIR_NAME, __version__
+        return cls(PROJECT_ROOT, install_dir / CACHE_DIR_NAME / cls.MANIFEST_FILE, __version__)
+
+    def load(self) -> bool:
+        """
+        Load the recorded sources
+
+        Returns:
+            True if a compatible manifest was loaded
+        """
+        try:
+            data = json.loads(self.manifest_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if not isinstance(data, dict) or data.get("format_version") != self.FORMAT_VERSION:
+            return False
+        self.manifest = data
+        return True
+
+    def plan(self, components: Dict[str, Any],
+             settings: Optional[Dict[str, Any]] = None) -> Dict[str, Optional[List[str]]]:
+        """
+        Decide what each component has to install
+
+        Args:
+            components: Component name -> component instance (locale, items and packs already set)
+            settings: Installation settings that change installed content (minify, shared includes,
+                      import profile); a component recorded with other settings is installed whole
+
+        Returns:
+            Component name -> installed file paths (relative to the install directory) to copy,
+            or None to install the whole component; unchanged components are left out
+        """
+        self.load()
+        installer = self._installer_digest()
+        plan: Dict[str, Optional[List[str]]] = {}
+        for name, component in components.items():
+            recorded = self.manifest["components"].get(name)
+            if not recorded or recorded.get("version") != self.version:
+                plan[name] = None
+                continue
+            if recorded.get("installer") != installer or recorded.get("settings") != settings:
+                plan[name] = None
+                continue
+
+            targets = self._targets(component)
+            if not targets:
+                # Components that don't copy files (MCP configuration) follow their source directory
+                if any(self._source_changed(source, recorded.get("commit")) for source in self._tree(component)) \
+                        or set(recorded.get("tree", [])) != set(self._tree(component)):
+                    plan[name] = None
+                continue
+
+            previous = recorded.get("targets", {})
+            changed = [target for target, source in targets.items()
+                       if previous.get(target) != source or self._source_changed(source, recorded.get("commit"))]
+            removed = [target for target in previous if target not in targets]
+            if changed or removed:
+                plan[name] = changed
+        return plan
+
+    def removed_targets(self, name: str, component: Any) -> List[str]:
+        """Installed files of a component whose source no longer exists or is no longer selected"""
+        previous = self.manifest["components"].get(name, {}).get("targets", {})
+        targets = self._targets(component)
+        return sorted(target for target in previous if target not in targets)
+
+    def record(self, components: Dict[str, Any], settings: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Record the sources of freshly installed components
+
+        Args:
+            components: Component name -> installed component instance
+            settings: Installation settings the components were installed with (see plan)
+
+        Returns:
+            The source commit, or None if the source is not a git checkout
+        """
+        self.load()
+        commit = git_head(self.source_root)
+        changes = git_changed_paths(self.source_root, commit) if commit else None
+        dirty = changes["changed"] | changes["untracked"] if changes else set()
+        installer = self._installer_digest()
+        files = self.manifest["files"]
+        for name, component in components.items():
+            targets = self._targets(component)
+            sources = list(targets.values()) if targets else self._tree(component)
+            for source in sources:
+                signature = self._signature(source, files.get(source))
+                if signature:
+                    files[source] = dict(signature, dirty=self._relative(source) in dirty)
+            entry: Dict[str, Any] = {"version": self.version, "installer": installer, "commit": commit,
+                                     "settings": settings,
+                                     "synced_at": datetime.now().isoformat(timespec="seconds")}
+            if targets:
+                entry["targets"] = targets
+            else:
+                entry["tree"] = sources
+            self.manifest["components"][name] = entry
+
+        in_use = {source for entry in self.manifest["components"].values()
+                  for source in list(entry.get("targets", {}).values()) + entry.get("tree", [])}
+        self.manifest["files"] = {source: signature for source, signature in files.items() if source in in_use}
+        self._save()
+        return commit
+
+    def _targets(self, component: Any) -> Dict[str, str]:
+        """Installed file (relative to the install directory) -> absolute source file"""
+        targets = {}
+        for source, target in component.get_files_to_install():
+            try:
+                relative = target.relative_to(component.install_dir).as_posix()
+            except ValueError:
+                relative = str(target)
+            targets[relative] = str(source)
+        return targets
+
+    def _tree(self, component: Any) -> List[str]:
+        source_dir = component._get_source_dir()
+        if not source_dir or not source_dir.is_dir():
+            return []
+        return sorted(str(path) for path in source_dir.rglob("*")
+                      if path.is_file() and "__pycache__" not in path.parts)
+
+    def _relative(self, source: str) -> Optional[str]:
+        """Path of a source file relative to the source root (None outside it)"""
+        try:
+            return Path(source).relative_to(self.source_root).as_posix()
+        except ValueError:
+            return None
+
+    def _installer_digest(self) -> str:
+        """
+        Digest of the installer's code (setup/**/*.py); files are hashed only when
+        their size or modification time changed since the last install
+        """
+        recorded = self.manifest.setdefault("installer", {})
+        current = {}
+        for path in sorted((self.source_root / "setup").rglob("*.py")):
+            signature = self._signature(str(path), recorded.get(str(path)))
+            if signature:
+                current[str(path)] = signature
+        self.manifest["installer"] = current
+        return hashlib.sha256(json.dumps([[path, signature["hash"]] for path, signature in current.items()])
+                              .encode("utf-8")).hexdigest()[:16]
+
+    def _source_changed(self, source: str, commit: Optional[str]) -> bool:
+        """
+        Whether a source file changed since it was recorded
+
+        Tracked files of the git checkout that the diff against the recorded commit
+        doesn't list, and that had no uncommitted changes when recorded, are unchanged
+        without being opened; other files (listed by the diff, untracked, outside the
+        checkout such as content packs, or without git) are compared by size,
+        modification time and hash.
+        """
+        recorded = self.manifest["files"].get(source)
+        changes = self._changes_since(commit)
+        if changes is not None and not (recorded and recorded.get("dirty")):
+            relative = self._relative(source)
+            if relative is not None and relative not in changes["untracked"] and relative not in changes["changed"]:
+                return False
+        current = self._signature(source, recorded)
+        return current is None or recorded is None or current["hash"] != recorded["hash"]
+
+    def _changes_since(self, commit: Optional[str]) -> Optional[Dict[str, Set[str]]]:
+        if not commit:
+            self.method = "hash"
+            return None
+        if commit not in self._git_changes:
+            self._git_changes[commit] = git_changed_paths(self.source_root, commit)
+        self.method = "git" if self._git_changes[commit] is not None else "hash"
+        return self._git_changes[commit]
+
+    def _signature(self, source: str, recorded: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Size, modification time and hash of a file (the hash is reused while size and mtime match)"""
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return None
+        if recorded and recorded["size"] == stat.st_size and recorded["mtime_ns"] == stat.st_mtime_ns:
+            return recorded
+        with open(source, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": digest}
+
+    def _save(self) -> None:
+        """Write the manifest atomically (errors are ignored; the next install is then a full one)"""
+        try:
+            self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.manifest_file.with_name(f".{self.manifest_file.name}.{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(self.manifest, separators=(",", ":")), encoding="utf-8")
+            os.replace(temp_file, self.manifest_file)
+        except OSError as e:
+            self.logger.debug(f"Could not write source manifest {self.manifest_file}: {e}")
@@ -0,0 +1,678 @@
+"""
+SQLite state store for SuperClaude installation system
+Optional single-file replacement for the scattered JSON state files
+(.superclaude-metadata.json components, superclaude_env_vars.json, .update_check,
+settings backups, .claude.json.backup and the translation log)
+"""
+
+import json
+import atexit
+import sqlite3
+import threading
+from typing import Dict, Any, Optional, List, Iterable, Tuple
+from pathlib import Path
+from datetime import datetime
+
+from .translation_log import TranslationLog, read_log_entries
+
+
+STATE_DB_NAME = ".superclaude-state.db"
+
+SCHEMA_VERSION = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS schema_info (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS components (
+    name TEXT PRIMARY KEY,
+    version TEXT,
+    category TEXT,
+    installed_at TEXT,
+    info TEXT NOT NULL DEFAULT '{}'
+);
+
+CREATE TABLE IF NOT EXISTS installed_files (
+    path TEXT PRIMARY KEY,
+    component TEXT NOT NULL,
+    sha256 TEXT,
+    size INTEGER,
+    installed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_installed_files_component ON installed_files (component);
+
+CREATE TABLE IF NOT EXISTS env_tracking (
+    name TEXT PRIMARY KEY,
+    set_by TEXT,
+    timestamp TEXT,
+    value_hash TEXT
+);
+
+CREATE TABLE IF NOT EXISTS update_checks (
+    channel TEXT PRIMARY KEY,
+    last_check REAL NOT NULL,
+    latest_version TEXT
+);
+
+CREATE TABLE IF NOT EXISTS backups (
+    name TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    path TEXT,
+    created TEXT,
+    size INTEGER,
+    info TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_backups_kind_created ON backups (kind, created);
+
+CREATE TABLE IF NOT EXISTS translation_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    file TEXT,
+    status TEXT,
+    timestamp TEXT,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_translation_log_file ON translation_log (file);
+CREATE INDEX IF NOT EXISTS idx_translation_log_status ON translation_log (status);
+CREATE INDEX IF NOT EXISTS idx_translation_log_timestamp ON translation_log (timestamp);
+"""
+
+
+class StateStore:
+    """Embedded SQLite (WAL mode) store for installer state"""
+
+    # One store, and so one connection, per installation directory
+    _stores: Dict[Path, "StateStore"] = {}
+    _stores_lock = threading.Lock()
+
+    def __init__(self, install_dir: Path):
+        """
+        Initialize state store
+
+        Use open() or open_if_enabled() to share the connection of an installation.
+
+        Args:
+            install_dir: Installation directory holding the state database
+        """
+        self.install_dir = install_dir
+        self.db_path = install_dir / STATE_DB_NAME
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def is_enabled(cls, install_dir: Path) -> bool:
+        """
+        Check whether the state store has been enabled for an installation
+
+        Args:
+            install_dir: Installation directory
+
+        Returns:
+            True if the state database exists
+        """
+        return (install_dir / STATE_DB_NAME).exists()
+
+    @classmethod
+    def open(cls, install_dir: Path) -> "StateStore":
+        """
+        Get the shared state store of an installation, creating the database on first use
+
+        Args:
+            install_dir: Installation directory
+
+        Returns:
+            StateStore instance
+        """
+        key = Path(install_dir).resolve()
+        with cls._stores_lock:
+            store = cls._stores.get(key)
+            if store is None:
+                store = cls._stores[key] = cls(Path(install_dir))
+        return store
+
+    @classmethod
+    def open_if_enabled(cls, install_dir: Path) -> Optional["StateStore"]:
+        """
+        Get the shared state store of an installation if it has been enabled
+
+        Args:
+            install_dir: Installation directory
+
+        Returns:
+            StateStore instance or None if not enabled
+        """
+        if not cls.is_enabled(install_dir):
+            return None
+        return cls.open(install_dir)
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close the connections of all shared stores"""
+        with cls._stores_lock:
+            stores = list(cls._stores.values())
+            cls._stores.clear()
+        for store in stores:
+            store.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get the store's connection, creating the schema on first use"""
+        if self._conn is not None:
+            return self._conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Shared between threads; every use holds self._lock
+        conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with conn:
+            conn.executescript(_SCHEMA)
+            row = conn.execute("SELECT value FROM schema_info WHERE key = 'schema_version'").fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO schema_info (key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),)
+            )
+        self._conn = conn
+
+        # Schema version 2 dropped the component, file, backup and translation log
+        # tables; fill them again from the files
+        if row is not None and row["value"] == "2":
+            with conn:
+                conn.execute("DELETE FROM schema_info WHERE key = 'translation_log_imported'")
+            self.migrate_from_files(translation_log=TranslationLog.for_package().log_file)
+        return conn
+
+    def close(self) -> None:
+        """Close the store's connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def initialize(self) -> None:
+        """Create the database and schema if needed"""
+        with self._lock:
+            self._connect()
+
+    def get_info(self, key: str) -> Optional[str]:
+        """
+        Get a schema_info value
+
+        Args:
+            key: Info key
+
+        Returns:
+            Value or None if not set
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value FROM schema_info WHERE key = ?", (key,)
+            ).fetchone()
+        return row["value"] if row else None
+
+    def set_info(self, key: str, value: str) -> None:
+        """
+        Set a schema_info value
+
+        Args:
+            key: Info key
+            value: Value to store
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO schema_info (key, value) VALUES (?, ?)", (key, value)
+                )
+
+    # Components
+
+    def upsert_component(self, name: str, info: Dict[str, Any]) -> None:
+        """
+        Record a component registration
+
+        Args:
+            name: Component name
+            info: Component metadata dict
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO components (name, version, category, installed_at, info) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (name, info.get("version"), info.get("category"),
+                     info.get("installed_at") or datetime.now().isoformat(),
+                     json.dumps(info, ensure_ascii=False, sort_keys=True))
+                )
+
+    def remove_component(self, name: str) -> None:
+        """
+        Remove a component and its installed files
+
+        Args:
+            name: Component name
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM components WHERE name = ?", (name,))
+                conn.execute("DELETE FROM installed_files WHERE component = ?", (name,))
+
+    def get_components(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get all recorded components
+
+        Returns:
+            Dict of component_name -> component_info
+        """
+        with self._lock:
+            rows = self._connect().execute("SELECT name, info FROM components ORDER BY name").fetchall()
+        return {row["name"]: json.loads(row["info"]) for row in rows}
+
+    # Installed files
+
+    def record_installed_files(self, component: str, files: Iterable[Tuple[Path, Optional[str], int]]) -> None:
+        """
+        Record files installed by a component, replacing its previous set
+
+        Args:
+            component: Component name
+            files: Iterable of (target_path, sha256, size)
+        """
+        now = datetime.now().isoformat()
+        rows = [(str(path), component, sha256, size, now) for path, sha256, size in files]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM installed_files WHERE component = ?", (component,))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO installed_files (path, component, sha256, size, installed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+
+    def get_installed_files(self, component: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get recorded installed files
+
+        Args:
+            component: Restrict to one component (all components if None)
+
+        Returns:
+            List of file info dicts
+        """
+        with self._lock:
+            conn = self._connect()
+            if component is None:
+                rows = conn.execute("SELECT * FROM installed_files ORDER BY path").fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM installed_files WHERE component = ? ORDER BY path", (component,)
+                ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_file_owner(self, path: Path) -> Optional[str]:
+        """
+        Get the component that installed a file
+
+        Args:
+            path: Installed file path
+
+        Returns:
+            Component name or None if the file is not tracked
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT component FROM installed_files WHERE path = ?", (str(path),)
+            ).fetchone()
+        return row["component"] if row else None
+
+    # Environment variable tracking
+
+    def get_env_tracking(self) -> Dict[str, Dict[str, str]]:
+        """
+        Get tracked environment variables
+
+        Returns:
+            Dict in the superclaude_env_vars.json layout
+        """
+        with self._lock:
+            rows = self._connect().execute("SELECT * FROM env_tracking ORDER BY name").fetchall()
+        return {
+            row["name"]: {
+                "set_by": row["set_by"],
+                "timestamp": row["timestamp"],
+                "value_hash": row["value_hash"]
+            }
+            for row in rows
+        }
+
+    def set_env_tracking(self, name: str, info: Dict[str, str]) -> None:
+        """
+        Track an environment variable
+
+        Args:
+            name: Environment variable name
+            info: Tracking info dict (set_by, timestamp, value_hash)
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO env_tracking (name, set_by, timestamp, value_hash) "
+                    "VALUES (?, ?, ?, ?)",
+                    (name, info.get("set_by"), info.get("timestamp"), info.get("value_hash"))
+                )
+
+    def remove_env_tracking(self, names: Iterable[str]) -> None:
+        """
+        Stop tracking environment variables
+
+        Args:
+            names: Environment variable names
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany("DELETE FROM env_tracking WHERE name = ?", [(n,) for n in names])
+
+    # Update checks
+
+    def get_last_update_check(self, channel: str = "pypi") -> Optional[float]:
+        """
+        Get the last update check time
+
+        Args:
+            channel: Update channel name
+
+        Returns:
+            Unix timestamp or None if never checked
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT last_check FROM update_checks WHERE channel = ?", (channel,)
+            ).fetchone()
+        return row["last_check"] if row else None
+
+    def record_update_check(self, channel: str = "pypi", timestamp: Optional[float] = None,
+                            latest_version: Optional[str] = None) -> None:
+        """
+        Record an update check
+
+        Args:
+            channel: Update channel name
+            timestamp: Unix timestamp of the check (defaults to now)
+            latest_version: Latest version seen, if known
+        """
+        timestamp = timestamp if timestamp is not None else datetime.now().timestamp()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT INTO update_checks (channel, last_check, latest_version) VALUES (?, ?, ?) "
+                    "ON CONFLICT(channel) DO UPDATE SET last_check = excluded.last_check, "
+                    "latest_version = COALESCE(excluded.latest_version, update_checks.latest_version)",
+                    (channel, timestamp, latest_version)
+                )
+
+    # Backups
+
+    def record_backup(self, name: str, kind: str, path: Optional[Path] = None,
+                      created: Optional[str] = None, size: Optional[int] = None,
+                      info: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record a backup
+
+        Args:
+            name: Unique backup name
+            kind: Backup kind (installation, settings, claude_json)
+            path: Backup file path
+            created: ISO timestamp (defaults to now)
+            size: Size in bytes
+            info: Extra backup metadata
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO backups (name, kind, path, created, size, info) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (name, kind, str(path) if path else None,
+                     created or datetime.now().isoformat(), size,
+                     json.dumps(info or {}, ensure_ascii=False, sort_keys=True))
+                )
+
+    def list_backups(self, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List recorded backups, most recent first
+
+        Args:
+            kind: Restrict to one backup kind (all kinds if None)
+
+        Returns:
+            List of backup info dicts
+        """
+        with self._lock:
+            conn = self._connect()
+            if kind is None:
+                rows = conn.execute("SELECT * FROM backups ORDER BY created DESC").fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM backups WHERE kind = ? ORDER BY created DESC", (kind,)
+                ).fetchall()
+        backups = []
+        for row in rows:
+            backup = dict(row)
+            backup["info"] = json.loads(backup["info"])
+            backups.append(backup)
+        return backups
+
+    # Translation log
+
+    def append_translation_log(self, entry: Dict[str, Any]) -> int:
+        """
+        Append a translation log entry
+
+        Args:
+            entry: Log entry dict (file, status and timestamp are indexed)
+
+        Returns:
+            Row id of the new entry
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                cursor = conn.execute(
+                    "INSERT INTO translation_log (file, status, timestamp, entry) VALUES (?, ?, ?, ?)",
+                    (entry.get("file") or entry.get("source"), entry.get("status"),
+                     entry.get("timestamp") or datetime.now().isoformat(),
+                     json.dumps(entry, ensure_ascii=False, sort_keys=True))
+                )
+        return cursor.lastrowid
+
+    def query_translation_log(self, file: Optional[str] = None, status: Optional[str] = None,
+                              since: Optional[str] = None, until: Optional[str] = None,
+                              limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Query the translation log, most recent first
+
+        Args:
+            file: Restrict to one source file (a trailing "/" matches every file under a directory)
+            status: Restrict to one status
+            since: Restrict to entries at or after this date (YYYY-MM-DD) or ISO timestamp
+            until: Restrict to entries on or before this date (YYYY-MM-DD)
+            limit: Maximum number of entries
+
+        Returns:
+            List of log entry dicts
+        """
+        clauses = []
+        params: List[Any] = []
+        if file is not None and file.endswith("/"):
+            clauses.append("substr(file, 1, ?) = ?")
+            params.extend([len(file), file])
+        elif file is not None:
+            clauses.append("file = ?")
+            params.append(file)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("substr(timestamp, 1, 10) <= ?")
+            params.append(until)
+
+        sql = "SELECT entry FROM translation_log"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY timestamp DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [json.loads(row["entry"]) for row in rows]
+
+    def summarize_translation_log(self) -> Dict[str, Any]:
+        """
+        Counts of the translation log
+
+        Returns:
+            Dict with entries, files, statuses (status -> count), first and last date,
+            and the files whose latest event failed
+        """
+        with self._lock:
+            conn = self._connect()
+            totals = conn.execute(
+                "SELECT COUNT(*) AS entries, COUNT(DISTINCT file) AS files, "
+                "MIN(substr(timestamp, 1, 10)) AS first, MAX(substr(timestamp, 1, 10)) AS last "
+                "FROM translation_log"
+            ).fetchone()
+            statuses = conn.execute(
+                "SELECT status, COUNT(*) AS count FROM translation_log GROUP BY status ORDER BY status"
+            ).fetchall()
+            failing = conn.execute(
+                "SELECT file FROM translation_log WHERE id IN "
+                "(SELECT MAX(id) FROM translation_log GROUP BY file) AND status = 'failure' ORDER BY file"
+            ).fetchall()
+        return {
+            "entries": totals["entries"],
+            "files": totals["files"],
+            "statuses": {row["status"]: row["count"] for row in statuses},
+            "first": totals["first"],
+            "last": totals["last"],
+            "failing": [row["file"] for row in failing]
+        }
+
+    def replace_translation_log(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """
+        Replace the whole translation log (after compaction)
+
+        Args:
+            entries: Log entry dicts in log order
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM translation_log")
+                conn.executemany(
+                    "INSERT INTO translation_log (file, status, timestamp, entry) VALUES (?, ?, ?, ?)",
+                    [(entry.get("file") or entry.get("source"), entry.get("status"),
+                      entry.get("timestamp") or datetime.now().isoformat(),
+                      json.dumps(entry, ensure_ascii=False, sort_keys=True)) for entry in entries]
+                )
+
+    # Migration
+
+    def migrate_from_files(self, translation_log: Optional[Path] = None) -> Dict[str, int]:
+        """
+        Import existing JSON state files into the store
+
+        Source files are left untouched. Safe to run repeatedly: rows are keyed
+        so re-importing replaces them, and the translation log is only
+        imported once.
+
+        Args:
+            translation_log: Path to translation_log.jsonl or a legacy JSON array log (skipped if None)
+
+        Returns:
+            Dict of table name -> number of imported rows
+        """
+        counts = {
+            "components": 0,
+            "env_tracking": 0,
+            "update_checks": 0,
+            "backups": 0,
+            "translation_log": 0
+        }
+
+        metadata = _read_json(self.install_dir / ".superclaude-metadata.json")
+        if isinstance(metadata, dict):
+            for name, info in metadata.get("components", {}).items():
+                if isinstance(info, dict):
+                    self.upsert_component(name, info)
+                    counts["components"] += 1
+
+        env_tracking = _read_json(self.install_dir / "superclaude_env_vars.json")
+        if isinstance(env_tracking, dict):
+            for name, info in env_tracking.items():
+                if isinstance(info, dict):
+                    self.set_env_tracking(name, info)
+                    counts["env_tracking"] += 1
+
+        update_check = _read_json(self.install_dir / ".update_check")
+        if isinstance(update_check, dict) and "last_check" in update_check:
+            self.record_update_check("pypi", float(update_check["last_check"]))
+            counts["update_checks"] += 1
+
+        settings_index = _read_json(self.install_dir / "backups" / "settings" / "index.json")
+        if isinstance(settings_index, dict):
+            history_file = self.install_dir / "backups" / "settings" / "history.jsonl"
+            for entry in settings_index.get("entries", []):
+                self.record_backup(entry["name"], "settings", history_file,
+                                   entry.get("created"), entry.get("size"),
+                                   {"hash": entry.get("hash")})
+                counts["backups"] += 1
+
+        backups_dir = self.install_dir / "backups"
+        if backups_dir.exists():
+            for backup_file in backups_dir.glob("*.tar*"):
+                stat = backup_file.stat()
+                self.record_backup(backup_file.name, "installation", backup_file,
+                                   datetime.fromtimestamp(stat.st_mtime).isoformat(), stat.st_size)
+                counts["backups"] += 1
+
+        claude_json_backup = Path.home() / ".claude.json.backup"
+        if claude_json_backup.exists():
+            stat = claude_json_backup.stat()
+            self.record_backup(claude_json_backup.name, "claude_json", claude_json_backup,
+                               datetime.fromtimestamp(stat.st_mtime).isoformat(), stat.st_size)
+            counts["backups"] += 1
+
+        if translation_log is not None and self.get_info("translation_log_imported") is None:
+            for entry in read_log_entries(translation_log):
+                self.append_translation_log(entry)
+                counts["translation_log"] += 1
+            self.set_info("translation_log_imported", datetime.now().isoformat())
+
+        self.set_info("migrated_from_files", datetime.now().isoformat())
+        return counts
+
+
+atexit.register(StateStore.close_all)
+
+
+def _read_json(path: Path) -> Any:
+    """Read a JSON file, returning None if it is missing or invalid"""
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return None
@@ -0,0 +1,318 @@
+"""
+Parallel translation jobs for SuperClaude documentation
+Splits a batch of Markdown files into the segments the translation memory
+cannot supply and translates them through a pluggable backend with bounded
+concurrency, rate limiting, retries and a checkpoint that lets an interrupted
+batch resume without redoing finished segments
+"""
+
+import json
+import time
+import random
+import fnmatch
+import threading
+import importlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Type, Callable
+
+from .translation_memory import TranslationMemory, TranslationPlan, Segment
+from ..utils.logger import get_logger
+
+
+class TranslationError(Exception):
+    """Transient backend failure; the segment is retried"""
+
+
+class TranslationBackend(ABC):
+    """Translates one segment of Markdown"""
+
+    name = "base"
+
+    @abstractmethod
+    def translate(self, segment: Segment, locale: str) -> str:
+        """
+        Translate a segment
+
+        Args:
+            segment: Source segment (kind and text)
+            locale: Target language code
+
+        Returns:
+            Translated text, keeping the segment's Markdown structure
+
+        Raises:
+            TranslationError: On failures worth retrying
+        """
+        pass
+
+
+class StubBackend(TranslationBackend):
+    """Local stand-in for tests and benchmarks: tags the text instead of translating it"""
+
+    name = "stub"
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0, seed: int = 0):
+        """
+        Initialize stub
+
+        Args:
+            latency: Seconds each call sleeps, to simulate a remote service
+            failure_rate: Share of calls raising TranslationError
+            seed: Seed of the failure draws
+        """
+        self.latency = float(latency)
+        self.failure_rate = float(failure_rate)
+        self._random = random.Random(int(seed))
+        self._lock = threading.Lock()
+
+    def translate(self, segment: Segment, locale: str) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            failed = self._random.random() < self.failure_rate
+        if failed:
+            raise TranslationError("Simulated failure")
+        return f"[{locale}] {segment.text}"
+
+
+BACKENDS: Dict[str, Type[TranslationBackend]] = {
+    StubBackend.name: StubBackend,
+}
+
+
+def register_backend(backend_class: Type[TranslationBackend]) -> Type[TranslationBackend]:
+    """Register a backend class under its name (usable as a decorator)"""
+    BACKENDS[backend_class.name] = backend_class
+    return backend_class
+
+
+def get_backend(name: str, options: Optional[Dict[str, str]] = None) -> TranslationBackend:
+    """
+    Create a backend by registered name or "module:ClassName"
+
+    Args:
+        name: Backend name
+        options: Keyword arguments for the backend's constructor
+
+    Returns:
+        Backend instance
+
+    Raises:
+        ValueError: If the backend is unknown, can't be loaded or rejects the options
+    """
+    if name in BACKENDS:
+        backend_class = BACKENDS[name]
+    elif ":" in name:
+        module_name, _, class_name = name.partition(":")
+        try:
+            backend_class = getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError) as e:
+            raise ValueError(f"Could not load translation backend {name}: {e}")
+    else:
+        raise ValueError(f"Unknown translation backend: {name} (available: {', '.join(sorted(BACKENDS))})")
+    try:
+        return backend_class(**(options or {}))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid options for translation backend {name}: {e}")
+
+
+def discover_batch_files(base_dir: Path, include: List[str], exclude: List[str]) -> List[Path]:
+    """
+    Files of a translation batch
+
+    Args:
+        base_dir: Directory the patterns are relative to
+        include: Glob patterns of files to translate ("**" matches any depth)
+        exclude: fnmatch patterns of relative paths to leave out
+
+    Returns:
+        Sorted file paths
+    """
+    files = set()
+    for pattern in include:
+        files.update(path for path in base_dir.glob(pattern) if path.is_file())
+    return sorted(path for path in files
+                  if not any(fnmatch.fnmatch(path.relative_to(base_dir).as_posix(), rule) for rule in exclude))
+
+
+class RateLimiter:
+    """Spaces calls evenly to at most `rate` per second across threads (0 disables it)"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class TranslationScheduler:
+    """Runs the segment jobs of a batch against a backend"""
+
+    def __init__(self, memory: TranslationMemory, backend: TranslationBackend, checkpoint_file: Path,
+                 concurrency: int = 4, rate: float = 0.0, retries: int = 3, retry_delay: float = 1.0):
+        """
+        Initialize scheduler
+
+        Args:
+            memory: Translation memory supplying known segments and receiving new ones
+            backend: Translation backend
+            checkpoint_file: JSONL file of finished segments (hash, translation) for resuming
+            concurrency: Maximum backend calls in flight
+            rate: Maximum backend calls per second (0: unlimited)
+            retries: Retries per segment after a TranslationError
+            retry_delay: Delay before the first retry; doubles with each attempt
+
+        Raises:
+            ValueError: If a limit is out of range
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        if rate < 0 or retries < 0 or retry_delay < 0:
+            raise ValueError("Rate, retries and retry delay must not be negative")
+        self.memory = memory
+        self.backend = backend
+        self.checkpoint_file = checkpoint_file
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(rate)
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.logger = get_logger()
+        self._checkpoint_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def plan(self, files: List[Path]) -> Dict[Path, TranslationPlan]:
+        """Translation plan of every file"""
+        return {path: self.memory.plan(path.read_text(encoding="utf-8")) for path in files}
+
+    def load_checkpoint(self) -> Dict[str, str]:
+        """
+        Translations finished by an earlier, interrupted run
+
+        Returns:
+            Segment hash -> translation (a truncated last line is ignored)
+        """
+        finished = {}
+        try:
+            with open(self.checkpoint_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        finished[entry["hash"]] = entry["target"]
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except OSError:
+            pass
+        return finished
+
+    def clear_checkpoint(self) -> None:
+        """Discard the checkpoint"""
+        try:
+            self.checkpoint_file.unlink()
+        except FileNotFoundError:
+            pass
+
+    def run(self, plans: Dict[Path, TranslationPlan],
+            progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """
+        Translate every pending segment of the plans
+
+        Each distinct segment is translated once, even if several files contain it.
+        Finished segments are appended to the checkpoint as they complete and stored
+        in the memory at the end; segments already in the checkpoint are not sent again.
+        Ctrl+C stops scheduling new segments and returns what finished. Save the memory,
+        then clear the checkpoint.
+
+        Args:
+            plans: Plans of the batch's files
+            progress: Called with (finished, total) after each segment
+
+        Returns:
+            Stats: files, segments, reused, jobs, resumed, translated, failed (hash -> error),
+            interrupted and seconds
+        """
+        segments = sum(len(plan.segments) for plan in plans.values())
+        reused = sum(plan.stats()["reused"] for plan in plans.values())
+        pending: Dict[str, Segment] = {}
+        for plan in plans.values():
+            for segment in plan.pending:
+                pending.setdefault(segment.hash, segment)
+
+        finished = {h: target for h, target in self.load_checkpoint().items() if h in pending}
+        resumed = len(finished)
+        jobs = [segment for segment_hash, segment in pending.items() if segment_hash not in finished]
+        failed: Dict[str, str] = {}
+        interrupted = False
+        start = time.perf_counter()
+
+        self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.checkpoint_file, "a", encoding="utf-8") as checkpoint:
+            executor = ThreadPoolExecutor(max_workers=self.concurrency)
+            futures: Dict[Any, Segment] = {}
+            try:
+                futures = {executor.submit(self._translate, segment): segment for segment in jobs}
+                for future in as_completed(futures):
+                    segment = futures[future]
+                    try:
+                        target = future.result()
+                    except Exception as e:
+                        failed[segment.hash] = str(e)
+                    else:
+                        if target is not None:
+                            finished[segment.hash] = target
+                            with self._checkpoint_lock:
+                                checkpoint.write(json.dumps({"hash": segment.hash, "target": target},
+                                                            ensure_ascii=False) + "\n")
+                                checkpoint.flush()
+                    if progress:
+                        progress(len(finished) - resumed + len(failed), len(jobs))
+            except KeyboardInterrupt:
+                interrupted = True
+                self._stop.set()
+            finally:
+                # Drop jobs that haven't started (shutdown(cancel_futures=True) needs Python 3.9)
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=True)
+
+        for plan in plans.values():
+            plan.record(finished)
+
+        return {
+            "files": len(plans),
+            "segments": segments,
+            "reused": reused,
+            "jobs": len(pending),
+            "resumed": resumed,
+            "translated": len(finished) - resumed,
+            "failed": failed,
+            "interrupted": interrupted,
+            "seconds": round(time.perf_counter() - start, 3)
+        }
+
+    def _translate(self, segment: Segment) -> Optional[str]:
+        """Translate one segment with rate limiting and retries (None once the batch is stopping)"""
+        attempt = 0
+        while True:
+            if self._stop.is_set():
+                return None
+            self.limiter.wait()
+            try:
+                return self.backend.translate(segment, self.memory.locale)
+            except TranslationError as e:
+                if attempt >= self.retries:
+                    raise
+                delay = self.retry_delay * (2 ** attempt)
+                attempt += 1
+                self.logger.debug(f"Retrying segment {segment.hash[:12]} in {delay:.1f}s ({attempt}/{self.retries}): {e}")
+                self._stop.wait(delay)
@@ -0,0 +1,367 @@
+"""
+Translation log for SuperClaude documentation
+An append-only JSON Lines history of translation events with a sidecar index
+of byte offsets by file, status and date: appending writes one line and never
+touches the index, which catches up on the next query by reading only the
+lines appended since it was saved
+"""
+
+import os
+import json
+import hashlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+
+from ..utils.logger import get_logger
+
+
+LOG_FILE = "translation_log.jsonl"
+LEGACY_LOG_FILE = "translation_log.json"
+
+# Bytes at the start of the log hashed to notice a rewritten (compacted or replaced) file
+HEAD_BYTES = 4096
+
+
+def read_log_entries(path: Path) -> List[Dict[str, Any]]:
+    """
+    Entries of a JSON Lines log or of a legacy JSON array log
+
+    Args:
+        path: Log file
+
+    Returns:
+        Entry dicts in file order (malformed lines are skipped, missing files give none)
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return []
+    if text.lstrip().startswith("["):
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return []
+        return [entry for entry in data if isinstance(entry, dict)] if isinstance(data, list) else []
+    entries = []
+    for line in text.splitlines():
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(entry, dict):
+            entries.append(entry)
+    return entries
+
+
+class TranslationLog:
+    """History of translation events"""
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, log_file: Path, index_file: Optional[Path] = None, state_store: Optional[Any] = None):
+        """
+        Initialize log
+
+        Args:
+            log_file: JSON Lines file, one event per line
+            index_file: Sidecar index (default: <log name>.index.json next to the log)
+            state_store: StateStore that also keeps the events and answers queries and summaries
+        """
+        self.log_file = log_file
+        self.index_file = index_file or log_file.with_name(f"{log_file.stem}.index.json")
+        self.state_store = state_store
+        self.logger = get_logger()
+        self.index: Dict[str, Any] = {}
+
+    @classmethod
+    def for_package(cls) -> "TranslationLog":
+        """Log kept next to the glossary in SuperClaude/Translations"""
+        from .. import PROJECT_ROOT
+        return cls(PROJECT_ROOT / "SuperClaude" / "Translations" / LOG_FILE)
+
+    @classmethod
+    def beside(cls, path: Path) -> "TranslationLog":
+        """Log in the directory of another translation file (the memory in use)"""
+        return cls(path.parent / LOG_FILE)
+
+    def append(self, file: str, status: str, **details: Any) -> Dict[str, Any]:
+        """
+        Record a translation event
+
+        Writes a single line to the end of the log (and a row to the state store, if any);
+        the index is not read or rewritten.
+
+        Args:
+            file: Source file the event concerns
+            status: Outcome, such as success or failure
+            **details: Further fields (target, locale, segments, backend, message, ...);
+                a timestamp overrides the current time
+
+        Returns:
+            The stored entry
+
+        Raises:
+            ValueError: If file or status is empty
+        """
+        if not file or not status:
+            raise ValueError("Translation log entries need a file and a status")
+        entry = {"timestamp": datetime.now().isoformat(timespec="seconds"), "file": file, "status": status}
+        entry.update({key: value for key, value in details.items() if value is not None})
+        line = (json.dumps(entry, ensure_ascii=False, sort_keys=True) + "\n").encode("utf-8")
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+        if self.state_store:
+            self.state_store.append_translation_log(entry)
+        return entry
+
+    def migrate_legacy(self, legacy_file: Optional[Path] = None) -> int:
+        """
+        Move the entries of a legacy translation_log.json array into the log
+
+        Args:
+            legacy_file: Legacy log (default: translation_log.json next to the log)
+
+        Returns:
+            Number of entries moved (the legacy file is removed afterwards)
+        """
+        legacy_file = legacy_file or self.log_file.with_name(LEGACY_LOG_FILE)
+        if not legacy_file.is_file():
+            return 0
+        entries = read_log_entries(legacy_file)
+        moved = 0
+        for entry in entries:
+            entry = dict(entry)
+            file = entry.pop("file", None) or entry.pop("source", None)
+            status = entry.pop("status", None)
+            if file and status:
+                self.append(file, status, **entry)
+                moved += 1
+        legacy_file.unlink()
+        return moved
+
+    def refresh(self) -> Dict[str, Any]:
+        """
+        Bring the index up to date with the log
+
+        Lines appended since the index was saved are indexed from the stored offset;
+        a log that shrank or whose beginning changed is indexed from scratch.
+
+        Returns:
+            The index
+        """
+        if not self.index:
+            self.index = self._read_index()
+        try:
+            size = self.log_file.stat().st_size
+        except OSError:
+            size = 0
+
+        index = self.index
+        if (index.get("format_version") != self.FORMAT_VERSION or size < index.get("size", 0)
+                or self._head_hash(index.get("size", 0)) != index.get("head")):
+            index = self._empty_index()
+        if size == index["size"]:
+            self.index = index
+            return index
+
+        with open(self.log_file, "rb") as f:
+            f.seek(index["size"])
+            offset = index["size"]
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # Line still being written; indexed once complete
+                self._index_line(index, offset, raw)
+                offset += len(raw)
+        index["size"] = offset
+        index["head"] = self._head_hash(offset)
+        self.index = index
+        self._write_index()
+        return index
+
+    def query(self, file: Optional[str] = None, status: Optional[str] = None, since: Optional[str] = None,
+              until: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Log entries matching every given filter, most recent first
+
+        Candidates come from the index; only the matching lines are read from the log.
+        With a state store the query runs against the store instead.
+
+        Args:
+            file: Source file (a trailing "/" matches every file under a directory)
+            status: Event status
+            since: First date (YYYY-MM-DD) or timestamp to include
+            until: Last date (YYYY-MM-DD) to include
+            limit: Maximum number of entries
+
+        Returns:
+            Entry dicts
+        """
+        if self.state_store:
+            return self.state_store.query_translation_log(file, status, since, until, limit)
+        index = self.refresh()
+        candidates: Optional[set] = None
+
+        def narrow(offsets: List[int]) -> None:
+            nonlocal candidates
+            candidates = set(offsets) if candidates is None else candidates & set(offsets)
+
+        if file is not None:
+            if file.endswith("/"):
+                narrow([offset for name, offsets in index["files"].items() if name.startswith(file)
+                        for offset in offsets])
+            else:
+                narrow(index["files"].get(file, []))
+        if status is not None:
+            narrow(index["statuses"].get(status, []))
+        if since is not None or until is not None:
+            first, last = (since or "")[:10], until or "9999-12-31"
+            narrow([offset for day, offsets in index["dates"].items() if first <= day <= last
+                    for offset in offsets])
+
+        if candidates is None:
+            candidates = {offset for offsets in index["files"].values() for offset in offsets}
+        entries: List[Dict[str, Any]] = []
+        if not candidates:
+            return entries
+        with open(self.log_file, "rb") as f:
+            for offset in sorted(candidates, reverse=True):
+                f.seek(offset)
+                entry = json.loads(f.readline())
+                if since and len(since) > 10 and entry.get("timestamp", "") < since:
+                    continue
+                entries.append(entry)
+                if limit is not None and len(entries) >= limit:
+                    break
+        return entries
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Counts from the index alone (or from the state store, if any)
+
+        Returns:
+            Dict with entries, files, statuses (status -> count), first and last date,
+            and the files whose latest event failed
+        """
+        if self.state_store:
+            return self.state_store.summarize_translation_log()
+        index = self.refresh()
+        latest_failed = []
+        failed = set(index["statuses"].get("failure", []))
+        for name, offsets in index["files"].items():
+            if offsets and offsets[-1] in failed:
+                latest_failed.append(name)
+        days = sorted(index["dates"])
+        return {
+            "entries": index["count"],
+            "files": len(index["files"]),
+            "statuses": {status: len(offsets) for status, offsets in sorted(index["statuses"].items())},
+            "first": days[0] if days else None,
+            "last": days[-1] if days else None,
+            "failing": sorted(latest_failed)
+        }
+
+    def compact(self, keep_days: int = 365, keep_per_file: int = 1) -> Dict[str, int]:
+        """
+        Rewrite the log without old, superseded events
+
+        Entries older than keep_days are dropped unless they are among the latest
+        keep_per_file events of their file; malformed lines are dropped too.
+        The log is replaced atomically and the index (and state store, if any) rebuilt.
+
+        Args:
+            keep_days: Age in days below which every entry is kept
+            keep_per_file: Latest events kept per file regardless of age
+
+        Returns:
+            Dict with kept and dropped entries and bytes before and after
+
+        Raises:
+            ValueError: If a limit is negative
+        """
+        if keep_days < 0 or keep_per_file < 0:
+            raise ValueError("Compaction limits must not be negative")
+        if not self.log_file.is_file():
+            return {"kept": 0, "dropped": 0, "bytes_before": 0, "bytes_after": 0}
+        cutoff = (datetime.now() - timedelta(days=keep_days)).isoformat(timespec="seconds")
+        lines = list(self._read_lines())
+        seen: Dict[str, int] = {}
+        keep = []
+        for raw, entry in reversed(lines):
+            if entry is None:
+                continue
+            name = str(entry.get("file") or entry.get("source") or "")
+            seen[name] = seen.get(name, 0) + 1
+            if str(entry.get("timestamp", "")) >= cutoff or seen[name] <= keep_per_file:
+                keep.append(raw)
+        keep.reverse()
+        if self.state_store:
+            self.state_store.replace_translation_log(json.loads(raw) for raw in keep)
+
+        before = self.log_file.stat().st_size
+        temp_file = self.log_file.with_name(f".{self.log_file.name}.{os.getpid()}.tmp")
+        temp_file.write_bytes(b"".join(keep))
+        os.replace(temp_file, self.log_file)
+        self.index = self._empty_index()
+        self.refresh()
+        return {"kept": len(keep), "dropped": len(lines) - len(keep),
+                "bytes_before": before, "bytes_after": self.log_file.stat().st_size}
+
+    def _read_lines(self) -> Iterator[Tuple[bytes, Optional[Dict[str, Any]]]]:
+        """Complete lines of the log with their entries (None for malformed lines)"""
+        with open(self.log_file, "rb") as f:
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(raw)
+                except ValueError:
+                    entry = None
+                yield raw, entry if isinstance(entry, dict) else None
+
+    def _index_line(self, index: Dict[str, Any], offset: int, raw: bytes) -> None:
+        try:
+            entry = json.loads(raw)
+        except ValueError:
+            return
+        if not isinstance(entry, dict):
+            return
+        index["count"] += 1
+        index["files"].setdefault(str(entry.get("file") or entry.get("source") or ""), []).append(offset)
+        index["statuses"].setdefault(str(entry.get("status") or ""), []).append(offset)
+        index["dates"].setdefault(str(entry.get("timestamp") or "")[:10], []).append(offset)
+
+    def _empty_index(self) -> Dict[str, Any]:
+        return {"format_version": self.FORMAT_VERSION, "size": 0, "head": self._head_hash(0), "count": 0,
+                "files": {}, "statuses": {}, "dates": {}}
+
+    def _head_hash(self, size: int) -> str:
+        """Hash of the log's first bytes, up to the indexed size"""
+        head = b""
+        if size:
+            try:
+                with open(self.log_file, "rb") as f:
+                    head = f.read(min(size, HEAD_BYTES))
+            except OSError:
+                pass
+        return hashlib.blake2b(head, digest_size=16).hexdigest()
+
+    def _read_index(self) -> Dict[str, Any]:
+        try:
+            data = json.loads(self.index_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write_index(self) -> None:
+        """Write the index atomically (errors are ignored; it is rebuilt from the log)"""
+        try:
+            temp_file = self.index_file.with_name(f".{self.index_file.name}.{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(self.index, separators=(",", ":")), encoding="utf-8")
+            os.replace(temp_file, self.index_file)
+        except OSError as e:
+            self.logger.debug(f"Could not write translation log index {self.index_file}: {e}")
@@ -0,0 +1,341 @@
+"""
+Segment-level translation memory for SuperClaude documentation
+Splits Markdown into translatable segments (headings, paragraphs, list items,
+table rows, code fences), remembers the translation of each segment by a
+normalized hash of its source, and reassembles translated files so that only
+new or changed segments need translating
+"""
+
+import os
+import re
+import json
+import difflib
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from .context import FENCE_LINE
+from ..utils.logger import get_logger
+
+
+HEADING_LINE = re.compile(r'^#{1,6}\s')
+LIST_ITEM = re.compile(r'^\s*(?:[-*+]|\d+[.)])\s+')
+TABLE_ROW = re.compile(r'^\s*\|')
+
+# Links, images, HTML tags and markup characters; a segment made only of these has no translatable text
+NON_TEXT = re.compile(r'!?\[[^\]]*\]\([^)]*\)|<[^>]*>|[\s|*_`#>\-:]+')
+
+# Kinds whose whitespace is significant when hashing
+VERBATIM_KINDS = {"code", "frontmatter"}
+
+# File name suffixes in SuperClaude/Translations per locale (glossary_jp.json)
+LOCALE_SUFFIXES = {"ja": "jp"}
+
+
+def translations_file(name: str, locale: str) -> Path:
+    """Path of a per-locale file in SuperClaude/Translations, e.g. glossary_jp.json for ja"""
+    from .. import PROJECT_ROOT
+    return PROJECT_ROOT / "SuperClaude" / "Translations" / f"{name}_{LOCALE_SUFFIXES.get(locale, locale)}.json"
+
+
+class Segment:
+    """One translatable unit of a Markdown file"""
+
+    def __init__(self, kind: str, text: str, trailing: str):
+        """
+        Initialize segment
+
+        Args:
+            kind: frontmatter, code, heading, list_item, table_row or paragraph
+            text: Segment source without its final line break
+            trailing: Line break and blank lines that follow it
+        """
+        self.kind = kind
+        self.text = text
+        self.trailing = trailing
+        if kind in VERBATIM_KINDS:
+            normalized = "\n".join(line.rstrip() for line in text.splitlines())
+        else:
+            normalized = " ".join(text.split())
+        self.hash = hashlib.blake2b(f"{kind}\n{normalized}".encode("utf-8"), digest_size=16).hexdigest()
+
+    @property
+    def has_text(self) -> bool:
+        """Whether the segment contains words to translate (not only links, tags or rules)"""
+        return bool(NON_TEXT.sub("", self.text))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"hash": self.hash, "kind": self.kind, "text": self.text}
+
+
+def segment_markdown(text: str) -> List[Segment]:
+    """
+    Split Markdown into segments
+
+    Joining each segment's text and trailing whitespace (after the leading
+    blank lines, see leading_whitespace) reproduces the input exactly.
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        Segments in document order
+    """
+    lines = text.splitlines(keepends=True)
+    segments: List[Segment] = []
+    index = _skip_blank(lines, 0)
+
+    def emit(kind: str, start: int, end: int) -> int:
+        body = "".join(lines[start:end])
+        trailing = ""
+        if body.endswith("\n"):
+            body, trailing = body[:-1], "\n"
+            if body.endswith("\r"):
+                body, trailing = body[:-1], "\r\n"
+        after = _skip_blank(lines, end)
+        segments.append(Segment(kind, body, trailing + "".join(lines[end:after])))
+        return after
+
+    while index < len(lines):
+        line = lines[index]
+        if index == 0 and line.strip() == "---":
+            end = next((i for i in range(1, len(lines)) if lines[i].strip() == "---"), None)
+            if end is not None:
+                index = emit("frontmatter", 0, end + 1)
+                continue
+
+        fence = FENCE_LINE.match(line)
+        if fence:
+            marker = fence.group(1)
+            end = next((i for i in range(index + 1, len(lines)) if lines[i].lstrip().startswith(marker)),
+                       len(lines) - 1)
+            index = emit("code", index, end + 1)
+        elif HEADING_LINE.match(line):
+            index = emit("heading", index, index + 1)
+        elif TABLE_ROW.match(line):
+            index = emit("table_row", index, index + 1)
+        elif LIST_ITEM.match(line):
+            end = index + 1
+            while end < len(lines) and lines[end].strip() and lines[end][0] in " \t" \
+                    and not _starts_block(lines[end]):
+                end += 1
+            index = emit("list_item", index, end)
+        else:
+            end = index + 1
+            while end < len(lines) and lines[end].strip() and not _starts_block(lines[end]):
+                end += 1
+            index = emit("paragraph", index, end)
+    return segments
+
+
+def leading_whitespace(text: str) -> str:
+    """Blank lines before the first segment"""
+    lines = text.splitlines(keepends=True)
+    return "".join(lines[:_skip_blank(lines, 0)])
+
+
+def _skip_blank(lines: List[str], index: int) -> int:
+    while index < len(lines) and not lines[index].strip():
+        index += 1
+    return index
+
+
+def _starts_block(line: str) -> bool:
+    return bool(FENCE_LINE.match(line) or HEADING_LINE.match(line) or TABLE_ROW.match(line)
+                or LIST_ITEM.match(line))
+
+
+def diff_segments(old: List[Segment], new: List[Segment]) -> List[Dict[str, Any]]:
+    """
+    Compare two versions of a file segment by segment
+
+    Args:
+        old: Segments of the previous source
+        new: Segments of the current source
+
+    Returns:
+        Changes as dicts with op (insert, delete or replace) and the old/new index ranges
+    """
+    matcher = difflib.SequenceMatcher(None, [s.hash for s in old], [s.hash for s in new], autojunk=False)
+    return [{"op": op, "old": [i1, i2], "new": [j1, j2]}
+            for op, i1, i2, j1, j2 in matcher.get_opcodes() if op != "equal"]
+
+
+class TranslationPlan:
+    """Segments of one source file split into remembered and pending translations"""
+
+    def __init__(self, memory: "TranslationMemory", text: str):
+        self.memory = memory
+        self.lead = leading_whitespace(text)
+        self.segments = segment_markdown(text)
+
+    @property
+    def pending(self) -> List[Segment]:
+        """Distinct segments with text that the memory has no translation for"""
+        seen = set()
+        pending = []
+        for segment in self.segments:
+            if segment.hash not in seen and segment.has_text and self.memory.get(segment.hash) is None:
+                seen.add(segment.hash)
+                pending.append(segment)
+        return pending
+
+    def stats(self) -> Dict[str, int]:
+        """Segment and character counts of the plan"""
+        pending = self.pending
+        return {
+            "segments": len(self.segments),
+            "reused": sum(1 for s in self.segments if s.has_text and self.memory.get(s.hash) is not None),
+            "pending": len(pending),
+            "pending_chars": sum(len(s.text) for s in pending),
+            "total_chars": sum(len(s.text) for s in self.segments if s.has_text)
+        }
+
+    def assemble(self, translations: Optional[Dict[str, str]] = None) -> str:
+        """
+        Build the translated file
+
+        Segments without text (link-only lines, rules) are copied from the source.
+
+        Args:
+            translations: Segment hash -> translation for pending segments
+
+        Returns:
+            Translated text
+
+        Raises:
+            ValueError: If a pending segment has no translation
+        """
+        translations = translations or {}
+        missing = [s.hash for s in self.pending if s.hash not in translations]
+        if missing:
+            raise ValueError(f"{len(missing)} segments have no translation (first: {missing[0]})")
+
+        parts = [self.lead]
+        for segment in self.segments:
+            if not segment.has_text:
+                target = segment.text
+            else:
+                target = translations.get(segment.hash)
+                if target is None:
+                    target = self.memory.get(segment.hash)
+            parts.append(target.rstrip("\r\n") + segment.trailing)
+        return "".join(parts)
+
+    def record(self, translations: Dict[str, str]) -> int:
+        """
+        Store the translations of pending segments in the memory
+
+        Args:
+            translations: Segment hash -> translation
+
+        Returns:
+            Number of segments stored
+        """
+        stored = 0
+        for segment in self.pending:
+            if segment.hash in translations:
+                self.memory.put(segment, translations[segment.hash])
+                stored += 1
+        return stored
+
+
+class TranslationMemory:
+    """Persistent map of source segment hashes to translations"""
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, memory_file: Path, locale: str = "ja"):
+        """
+        Initialize memory
+
+        Args:
+            memory_file: JSON file holding the memory
+            locale: Target language code
+        """
+        self.memory_file = memory_file
+        self.locale = locale
+        self.logger = get_logger()
+        self.segments: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+        self.load()
+
+    @classmethod
+    def for_locale(cls, locale: str = "ja") -> "TranslationMemory":
+        """Memory kept next to the glossary in SuperClaude/Translations"""
+        return cls(translations_file("memory", locale), locale)
+
+    def load(self) -> None:
+        """Load the memory file (missing or incompatible files give an empty memory)"""
+        try:
+            data = json.loads(self.memory_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("format_version") == self.FORMAT_VERSION and data.get("locale") == self.locale:
+            self.segments = data.get("segments", {})
+
+    def save(self) -> None:
+        """
+        Write the memory atomically if it changed
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        if not self.dirty:
+            return
+        self.memory_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.memory_file.with_name(f".{self.memory_file.name}.{os.getpid()}.tmp")
+        temp_file.write_text(json.dumps({"format_version": self.FORMAT_VERSION, "locale": self.locale,
+                                         "segments": self.segments}, ensure_ascii=False, indent=1, sort_keys=True)
+                             + "\n", encoding="utf-8")
+        os.replace(temp_file, self.memory_file)
+        self.dirty = False
+
+    def get(self, segment_hash: str) -> Optional[str]:
+        """Remembered translation of a segment"""
+        entry = self.segments.get(segment_hash)
+        return entry["target"] if entry else None
+
+    def put(self, segment: Segment, target: str) -> None:
+        """Remember the translation of a segment"""
+        self.segments[segment.hash] = {
+            "kind": segment.kind,
+            "source": segment.text,
+            "target": target.rstrip("\r\n"),
+            "updated": datetime.now().isoformat(timespec="seconds")
+        }
+        self.dirty = True
+
+    def plan(self, text: str) -> TranslationPlan:
+        """Segment a source file against the memory"""
+        return TranslationPlan(self, text)
+
+    def learn(self, source_text: str, target_text: str) -> int:
+        """
+        Seed the memory from an existing source/translation pair
+
+        Segments with text are aligned by kind; only runs where both files
+        have the same sequence of kinds are paired, so insertions on either
+        side do not shift the pairing.
+
+        Args:
+            source_text: Source file content
+            target_text: Its current translation
+
+        Returns:
+            Number of segments learned
+        """
+        source = [s for s in segment_markdown(source_text) if s.has_text]
+        target = [s for s in segment_markdown(target_text) if s.has_text]
+        matcher = difflib.SequenceMatcher(None, [s.kind for s in source], [s.kind for s in target], autojunk=False)
+        learned = 0
+        for op, i1, i2, j1, _j2 in matcher.get_opcodes():
+            if op != "equal":
+                continue
+            for offset in range(i2 - i1):
+                segment = source[i1 + offset]
+                if self.get(segment.hash) is None:
+                    self.put(segment, target[j1 + offset].text)
+                    learned += 1
+        return learned
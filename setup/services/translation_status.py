@@ -0,0 +1,267 @@
+"""
+Translation sync status for SuperClaude documentation
+Records which source content each translated file was made from and answers
+which translations are stale, missing or orphaned from file stats and hashes,
+without comparing file contents
+"""
+
+import os
+import json
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from .translation_memory import translations_file
+from ..utils.logger import get_logger
+
+
+STATUSES = ("current", "stale", "missing", "orphaned", "untracked")
+
+_pairs_cache: Optional[Dict[str, Any]] = None
+
+
+def load_translation_pairs() -> Dict[str, Any]:
+    """
+    Load the source/translation directory pairs from setup/data/translation_pairs.json
+
+    Returns:
+        Dict of locale -> {pairs, overrides}
+    """
+    global _pairs_cache
+    if _pairs_cache is None:
+        from .. import DATA_DIR
+        with open(DATA_DIR / "translation_pairs.json", 'r', encoding='utf-8') as f:
+            _pairs_cache = json.load(f)
+    return _pairs_cache
+
+
+def expected_target(config: Dict[str, Any], source: str) -> Optional[str]:
+    """
+    Translation path of a source file under a locale's pairs and overrides
+
+    Args:
+        config: Pairs and overrides of the locale (see translation_pairs.json)
+        source: Source path relative to the project root
+
+    Returns:
+        Translation path relative to the project root, None if the file is not a translation source
+    """
+    for target, override_source in config.get("overrides", {}).items():
+        if override_source == source:
+            return target
+    path = Path(source)
+    for pair in config["pairs"]:
+        if path.parent.as_posix() == pair["source"] and path.match(pair["pattern"]):
+            return f"{pair['target']}/{path.stem}{pair.get('target_suffix', '')}{path.suffix}"
+    return None
+
+
+class SyncStatusIndex:
+    """Sync state of every translated file of one locale"""
+
+    FORMAT_VERSION = 1
+    HASH_CACHE_FILE = "translation_hashes.json"
+
+    def __init__(self, base_dir: Path, locale: str, config: Dict[str, Any], records_file: Path,
+                 hash_cache_file: Path):
+        """
+        Initialize index
+
+        Args:
+            base_dir: Directory the configured paths are relative to
+            locale: Target language code
+            config: Pairs and overrides of the locale (see translation_pairs.json)
+            records_file: JSON file of "translated from" records (kept in version control)
+            hash_cache_file: Cache of file hashes by size and modification time
+        """
+        self.base_dir = base_dir
+        self.locale = locale
+        self.config = config
+        self.records_file = records_file
+        self.hash_cache_file = hash_cache_file
+        self.logger = get_logger()
+        self.records: Dict[str, Dict[str, Any]] = self._read_json(records_file).get("files", {})
+        self.hash_cache: Dict[str, List[Any]] = self._read_json(hash_cache_file).get("files", {})
+        self.hash_cache_dirty = False
+
+    @classmethod
+    def for_locale(cls, locale: str = "ja", install_dir: Optional[Path] = None) -> "SyncStatusIndex":
+        """
+        Index of the package's translations for a locale
+
+        Args:
+            locale: Target language code
+            install_dir: Installation directory whose cache directory holds the hash cache
+
+        Raises:
+            ValueError: If no translation pairs are configured for the locale
+        """
+        from .. import PROJECT_ROOT, package_cache_dir
+        config = load_translation_pairs().get(locale)
+        if config is None:
+            raise ValueError(f"No translation pairs configured for locale '{locale}'")
+        return cls(PROJECT_ROOT, locale, config, translations_file("sync", locale),
+                   package_cache_dir(install_dir) / cls.HASH_CACHE_FILE)
+
+    def pairs(self) -> List[Tuple[Optional[str], str]]:
+        """
+        Source and translation paths of every configured file
+
+        Returns:
+            (source, target) tuples relative to base_dir; target is the expected path even
+            if it does not exist, source is None for orphaned translations
+        """
+        overrides: Dict[str, str] = self.config.get("overrides", {})
+        by_source: Dict[str, str] = {source: target for target, source in overrides.items()}
+        result = []
+        seen_targets = set()
+        for pair in self.config["pairs"]:
+            source_dir = self.base_dir / pair["source"]
+            target_dir = pair["target"]
+            suffix = pair.get("target_suffix", "")
+            if source_dir.is_dir():
+                for path in sorted(source_dir.glob(pair["pattern"])):
+                    source = path.relative_to(self.base_dir).as_posix()
+                    target = by_source.get(source) or f"{target_dir}/{path.stem}{suffix}{path.suffix}"
+                    result.append((source, target))
+                    seen_targets.add(target)
+            target_path = self.base_dir / target_dir
+            if target_path.is_dir():
+                for path in sorted(target_path.glob(pair["pattern"])):
+                    target = path.relative_to(self.base_dir).as_posix()
+                    if target not in seen_targets:
+                        seen_targets.add(target)
+                        source = overrides.get(target)
+                        result.append((source if source and (self.base_dir / source).is_file() else None, target))
+        # Overrides outside every pair (translated commands)
+        for target, source in sorted(overrides.items()):
+            if target not in seen_targets:
+                seen_targets.add(target)
+                result.append((source if (self.base_dir / source).is_file() else None, target))
+        return result
+
+    def expected_target(self, source: str) -> Optional[str]:
+        """Translation path of a configured source file, None if the file is not a translation source"""
+        return expected_target(self.config, source)
+
+    def file_hash(self, relative: str) -> Optional[str]:
+        """
+        Content hash of a file, read only if its size or modification time changed
+
+        Returns:
+            SHA-256 hex digest, None if the file does not exist
+        """
+        path = self.base_dir / relative
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        cached = self.hash_cache.get(relative)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self.hash_cache[relative] = [stat.st_size, stat.st_mtime_ns, digest]
+        self.hash_cache_dirty = True
+        return digest
+
+    def status(self) -> List[Dict[str, Any]]:
+        """
+        Sync status of every configured translation
+
+        Returns:
+            Dicts with source, target, status (one of STATUSES) and, for tracked
+            files, whether the translation was edited after it was recorded
+        """
+        entries = []
+        for source, target in self.pairs():
+            entry: Dict[str, Any] = {"source": source, "target": target}
+            if source is not None and not (self.base_dir / target).is_file():
+                entry["status"] = "missing"
+            elif source is None:
+                entry["status"] = "orphaned"
+            else:
+                record = self.records.get(target)
+                if record is None or record.get("source") != source:
+                    entry["status"] = "untracked"
+                else:
+                    entry["status"] = "current" if self.file_hash(source) == record["source_hash"] else "stale"
+                    entry["target_modified"] = self.file_hash(target) != record.get("target_hash")
+                    entry["recorded"] = record.get("recorded")
+            entries.append(entry)
+        self.save_hash_cache()
+        return entries
+
+    def record(self, target: str, source: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Record that a translation is now in sync with its source
+
+        Args:
+            target: Translation path relative to base_dir
+            source: Source path (default: the configured source of target)
+
+        Returns:
+            The stored record
+
+        Raises:
+            ValueError: If the source is unknown or either file is missing
+        """
+        if source is None:
+            source = next((s for s, t in self.pairs() if t == target), None)
+            if source is None:
+                raise ValueError(f"No source file is configured for {target}")
+        source_hash, target_hash = self.file_hash(source), self.file_hash(target)
+        if source_hash is None or target_hash is None:
+            raise ValueError(f"Cannot record {target}: {source if source_hash is None else target} does not exist")
+        self.records[target] = {
+            "source": source,
+            "source_hash": source_hash,
+            "target_hash": target_hash,
+            "recorded": datetime.now().isoformat(timespec="seconds")
+        }
+        return self.records[target]
+
+    def relative(self, path: Path) -> Optional[str]:
+        """Path relative to base_dir, None if it lies outside"""
+        try:
+            return path.resolve().relative_to(self.base_dir.resolve()).as_posix()
+        except ValueError:
+            return None
+
+    def save(self) -> None:
+        """
+        Write the records (sorted, for readable diffs) and the hash cache
+
+        Raises:
+            OSError: If the records file cannot be written
+        """
+        self._write_json(self.records_file, {"format_version": self.FORMAT_VERSION, "locale": self.locale,
+                                             "files": dict(sorted(self.records.items()))}, indent=2)
+        self.save_hash_cache()
+
+    def save_hash_cache(self) -> None:
+        """Write the hash cache if it changed (errors are ignored)"""
+        if not self.hash_cache_dirty:
+            return
+        try:
+            self._write_json(self.hash_cache_file, {"files": self.hash_cache})
+            self.hash_cache_dirty = False
+        except OSError as e:
+            self.logger.debug(f"Could not write hash cache {self.hash_cache_file}: {e}")
+
+    @staticmethod
+    def _read_json(path: Path) -> Dict[str, Any]:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any], indent: Optional[int] = None) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        separators = None if indent else (",", ":")
+        temp_file.write_text(json.dumps(data, ensure_ascii=False, indent=indent, separators=separators)
+                             + ("\n" if indent else ""), encoding="utf-8")
+        os.replace(temp_file, path)
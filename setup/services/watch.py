@@ -0,0 +1,298 @@
+"""
+Source file watching for SuperClaude development
+Reports files created, modified, moved or deleted under a set of source
+directories: through inotify on Linux, by periodically comparing file sizes
+and modification times everywhere else (or when inotify is unavailable)
+"""
+
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import List, Dict, Tuple, Optional, Set
+
+from ..utils.logger import get_logger
+
+
+WATCH_BACKENDS = ("auto", "inotify", "poll")
+DEFAULT_POLL_INTERVAL = 0.5
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct("iIII")
+
+IGNORED_DIRS = {"__pycache__", ".git"}
+
+
+def _is_ignored(path: Path) -> bool:
+    """Editor swap and backup files, and files in ignored directories"""
+    name = path.name
+    return (name.startswith(".") or name.endswith(("~", ".swp", ".swx", ".tmp"))
+            or any(part in IGNORED_DIRS for part in path.parts))
+
+
+class FileWatcher(ABC):
+    """Base class of the watcher backends"""
+
+    name = "base"
+
+    def __init__(self, roots: List[Path]):
+        """
+        Initialize watcher
+
+        Args:
+            roots: Directories to watch (recursively); missing ones are ignored
+        """
+        self.roots = sorted({Path(root) for root in roots if Path(root).is_dir()})
+        self.logger = get_logger()
+
+    @abstractmethod
+    def poll(self, timeout: float) -> Set[Path]:
+        """
+        Wait for changes
+
+        Args:
+            timeout: Seconds to wait at most
+
+        Returns:
+            Changed files (empty if nothing changed within timeout)
+        """
+        pass
+
+    def wait_for_changes(self, debounce: float, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Wait for a burst of changes to settle
+
+        Editors and git checkouts touch several files, or the same file several times,
+        in quick succession; changes are collected until none arrived for debounce seconds.
+
+        Args:
+            debounce: Quiet period ending a burst
+            timeout: Seconds to wait for the first change (None: forever)
+
+        Returns:
+            Changed files (empty if timeout expired first)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changes: Set[Path] = set()
+        while not changes:
+            wait = 1.0 if deadline is None else max(0.0, min(1.0, deadline - time.monotonic()))
+            changes = self.poll(wait)
+            if not changes and deadline is not None and time.monotonic() >= deadline:
+                return changes
+        while True:
+            more = self.poll(debounce)
+            if not more:
+                return changes
+            changes |= more
+
+    def close(self) -> None:
+        """Release the watcher's resources"""
+
+    def __enter__(self) -> "FileWatcher":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class PollingWatcher(FileWatcher):
+    """Watcher comparing file sizes and modification times at an interval"""
+
+    name = "poll"
+
+    def __init__(self, roots: List[Path], interval: float = DEFAULT_POLL_INTERVAL):
+        """
+        Initialize watcher
+
+        Args:
+            roots: Directories to watch (recursively)
+            interval: Seconds between two scans
+        """
+        super().__init__(roots)
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def poll(self, timeout: float) -> Set[Path]:
+        deadline = time.monotonic() + timeout
+        while True:
+            time.sleep(max(0.0, min(self.interval, deadline - time.monotonic())))
+            current = self._scan()
+            changes = {path for path in set(current) | set(self.snapshot)
+                       if current.get(path) != self.snapshot.get(path)}
+            self.snapshot = current
+            if changes or time.monotonic() >= deadline:
+                return changes
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        files = {}
+        for root in self.roots:
+            for directory, dirnames, filenames in os.walk(root):
+                dirnames[:] = [name for name in dirnames if name not in IGNORED_DIRS]
+                for filename in filenames:
+                    path = Path(directory) / filename
+                    if _is_ignored(path):
+                        continue
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    files[path] = (stat.st_size, stat.st_mtime_ns)
+        return files
+
+
+class InotifyWatcher(FileWatcher):
+    """Watcher receiving file events from the Linux kernel (inotify)"""
+
+    name = "inotify"
+
+    def __init__(self, roots: List[Path]):
+        """
+        Initialize watcher
+
+        Args:
+            roots: Directories to watch (recursively)
+
+        Raises:
+            OSError: If inotify is unavailable or a directory can't be watched
+        """
+        super().__init__(roots)
+        self.libc = self._load_libc()
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, f"inotify_init1 failed: {os.strerror(error)}")
+        self.watches: Dict[int, Path] = {}
+        try:
+            for root in self.roots:
+                self._add_tree(root)
+        except OSError:
+            self.close()
+            raise
+
+    @staticmethod
+    def is_available() -> bool:
+        """Whether the platform provides inotify"""
+        if not sys.platform.startswith("linux"):
+            return False
+        try:
+            InotifyWatcher._load_libc()
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def _load_libc():
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+
+    def _add_tree(self, directory: Path) -> None:
+        for current, dirnames, _ in os.walk(directory):
+            dirnames[:] = [name for name in dirnames if name not in IGNORED_DIRS]
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(current), WATCH_MASK)
+            if wd < 0:
+                error = ctypes.get_errno()
+                raise OSError(error, f"Cannot watch {current}: {os.strerror(error)}")
+            self.watches[wd] = Path(current)
+
+    def poll(self, timeout: float) -> Set[Path]:
+        if self.fd < 0:
+            return set()
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changes: Set[Path] = set()
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were lost; report the roots so the caller re-checks everything
+                self.logger.debug("inotify event queue overflowed")
+                changes.update(self.roots)
+                continue
+            directory = self.watches.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                del self.watches[wd]
+                continue
+            if not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and path.name not in IGNORED_DIRS:
+                    # Watch new directories, and report files moved in with them
+                    try:
+                        self._add_tree(path)
+                    except OSError as e:
+                        self.logger.debug(str(e))
+                    changes.update(p for p in path.rglob("*") if p.is_file() and not _is_ignored(p))
+                continue
+            if not _is_ignored(path):
+                changes.add(path)
+        return changes
+
+    def close(self) -> None:
+        if getattr(self, "fd", -1) >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def create_watcher(roots: List[Path], backend: str = "auto",
+                   interval: float = DEFAULT_POLL_INTERVAL) -> FileWatcher:
+    """
+    Create a watcher for source directories
+
+    Args:
+        roots: Directories to watch (recursively)
+        backend: "inotify", "poll", or "auto" for inotify where available, polling otherwise
+        interval: Seconds between two scans of the polling watcher
+
+    Returns:
+        Watcher
+
+    Raises:
+        ValueError: If backend is unknown
+        OSError: If the inotify backend was requested and can't be used
+    """
+    if backend not in WATCH_BACKENDS:
+        raise ValueError(f"Unknown watch backend '{backend}' (available: {', '.join(WATCH_BACKENDS)})")
+    if backend == "inotify" or (backend == "auto" and InotifyWatcher.is_available()):
+        try:
+            return InotifyWatcher(roots)
+        except OSError as e:
+            if backend == "inotify":
+                raise
+            # e.g. the per-user watch limit (fs.inotify.max_user_watches) is exhausted
+            get_logger().debug(f"inotify unavailable, polling instead: {e}")
+    return PollingWatcher(roots, interval)
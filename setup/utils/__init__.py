@@ -3,6 +3,7 @@
 from .ui import ProgressBar, Menu, confirm, Colors
 from .logger import Logger
 from .security import SecurityValidator
+from .lock import InstallLock, LockTimeout
 
 __all__ = [
     'ProgressBar',
@@ -10,5 +11,7 @@ __all__ = [
     'confirm',
     'Colors',
     'Logger',
-    'SecurityValidator'
+    'SecurityValidator',
+    'InstallLock',
+    'LockTimeout'
 ]
\ No newline at end of file
@@ -22,8 +22,22 @@ def _get_env_tracking_file() -> Path:
     return install_dir / "superclaude_env_vars.json"
 
 
+def _get_state_store():
+    """Get the SQLite state store for ~/.claude, if enabled"""
+    from ..services.state import StateStore
+    return StateStore.open_if_enabled(Path.home() / ".claude")
+
+
 def _load_env_tracking() -> Dict[str, Dict[str, str]]:
     """Load environment variable tracking data"""
+    state_store = _get_state_store()
+    if state_store:
+        try:
+            return state_store.get_env_tracking()
+        except Exception as e:
+            get_logger().warning(f"Could not load environment tracking: {e}")
+            return {}
+    
     tracking_file = _get_env_tracking_file()
     
     try:
@@ -54,8 +68,9 @@ def _add_env_tracking(env_vars: Dict[str, str]) -> None:
     if not env_vars:
         return
     
-    tracking_data = _load_env_tracking()
     timestamp = datetime.now().isoformat()
+    state_store = _get_state_store()
+    tracking_data = {} if state_store else _load_env_tracking()
     
     for env_var, value in env_vars.items():
         tracking_data[env_var] = {
@@ -64,7 +79,11 @@ def _add_env_tracking(env_vars: Dict[str, str]) -> None:
             "value_hash": str(hash(value))  # Store hash, not actual value for security
         }
     
-    _save_env_tracking(tracking_data)
+    if state_store:
+        for env_var, info in tracking_data.items():
+            state_store.set_env_tracking(env_var, info)
+    else:
+        _save_env_tracking(tracking_data)
     get_logger().info(f"Added {len(env_vars)} environment variables to tracking")
 
 
@@ -73,6 +92,12 @@ def _remove_env_tracking(env_vars: list) -> None:
     if not env_vars:
         return
     
+    state_store = _get_state_store()
+    if state_store:
+        state_store.remove_env_tracking(env_vars)
+        get_logger().info(f"Removed {len(env_vars)} environment variables from tracking")
+        return
+    
     tracking_data = _load_env_tracking()
     
     for env_var in env_vars:
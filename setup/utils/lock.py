@@ -0,0 +1,337 @@
+"""
+Cross-process installation lock for SuperClaude
+Serializes mutating operations (install, update, uninstall, restore) on one
+installation directory while letting read-only operations run lock-free
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import socket
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Callable, TypeVar
+
+from .logger import get_logger
+
+
+LOCK_DIR_NAME = ".superclaude-lock"
+
+T = TypeVar("T")
+
+
+class LockTimeout(TimeoutError):
+    """Raised when the installation lock cannot be acquired in time"""
+
+
+class InstallLock:
+    """
+    Advisory lock on an installation directory with a FIFO wait queue
+
+    The holder writes an owner file with a lease that a heartbeat thread
+    renews; an owner whose lease expired or whose process is gone on this host
+    is considered stale and broken. Waiters enqueue a ticket and acquire in
+    ticket order. Every release bumps a generation counter that read-only
+    operations use to detect a concurrent write (see read_snapshot).
+    """
+
+    DEFAULT_LEASE = 30.0  # seconds; renewed every lease / 3 while held
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, install_dir: Path, operation: str = "install",
+                 timeout: Optional[float] = 300.0, lease: float = DEFAULT_LEASE):
+        """
+        Initialize installation lock
+
+        Args:
+            install_dir: Installation directory to lock
+            operation: Operation name recorded in the owner file
+            timeout: Seconds to wait for the lock (None waits forever)
+            lease: Lease duration in seconds
+        """
+        self.install_dir = install_dir
+        self.operation = operation
+        self.timeout = timeout
+        self.lease = lease
+        self.lock_dir = install_dir / LOCK_DIR_NAME
+        self.owner_file = self.lock_dir / "owner.json"
+        self.queue_dir = self.lock_dir / "queue"
+        self.generation_file = self.lock_dir / "generation"
+        self.token = uuid.uuid4().hex
+        self.hostname = socket.gethostname()
+        self.held = False
+        self._ticket: Optional[Path] = None
+        self._heartbeat: Optional[threading.Thread] = None
+        self._stop_heartbeat = threading.Event()
+        self.logger = get_logger()
+
+    def __enter__(self) -> "InstallLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+    def acquire(self) -> None:
+        """
+        Acquire the lock, waiting in FIFO order behind earlier waiters
+
+        Raises:
+            LockTimeout: If the lock is not acquired within the timeout
+        """
+        if self.held:
+            return
+
+        self.queue_dir.mkdir(parents=True, exist_ok=True)
+        self._ticket = self.queue_dir / f"{time.time_ns():020d}-{os.getpid()}-{self.token}"
+        self._ticket.write_text(json.dumps(self._owner_info()), encoding="utf-8")
+
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        announced = False
+
+        try:
+            while True:
+                if self._is_first_in_queue() and self._try_create_owner():
+                    break
+
+                if not announced:
+                    owner = self.read_owner()
+                    if owner:
+                        self.logger.info(
+                            f"Waiting for {owner.get('operation', 'another operation')} "
+                            f"(pid {owner.get('pid')}) to release {self.install_dir}"
+                        )
+                    announced = True
+
+                if deadline is not None and time.monotonic() >= deadline:
+                    owner = self.read_owner() or {}
+                    raise LockTimeout(
+                        f"Timed out after {self.timeout:.0f}s waiting for installation lock on "
+                        f"{self.install_dir} (held by pid {owner.get('pid', 'unknown')}, "
+                        f"operation {owner.get('operation', 'unknown')})"
+                    )
+
+                self._touch_ticket()
+                time.sleep(self.POLL_INTERVAL)
+        except BaseException:
+            self._remove_ticket()
+            raise
+
+        self._remove_ticket()
+        self.held = True
+        self._start_heartbeat()
+        self.logger.debug(f"Acquired installation lock on {self.install_dir}")
+
+    def release(self) -> None:
+        """Release the lock if held and bump the snapshot generation"""
+        if not self.held:
+            return
+
+        self._stop_heartbeat.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join(timeout=1)
+            self._heartbeat = None
+
+        owner = self.read_owner()
+        if owner and owner.get("token") == self.token:
+            self._bump_generation()
+            try:
+                self.owner_file.unlink()
+            except FileNotFoundError:
+                pass
+
+        self.held = False
+        self.logger.debug(f"Released installation lock on {self.install_dir}")
+
+    def read_owner(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the current owner file
+
+        Returns:
+            Owner info dict or None if the lock is free
+        """
+        try:
+            return json.loads(self.owner_file.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def read_generation(self) -> int:
+        """
+        Read the generation counter
+
+        Returns:
+            Number of completed lock holds
+        """
+        try:
+            return int(self.generation_file.read_text(encoding="utf-8").strip() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def read_snapshot(self, reader: Callable[[], T], retries: int = 20) -> T:
+        """
+        Run a read-only function against a consistent view without locking
+
+        The reader is retried if a writer was active or completed while it ran.
+        Writers replace files atomically, so after the retries are exhausted the
+        last result is still made of whole files, just possibly mid-operation.
+
+        Args:
+            reader: Function performing the reads
+            retries: Maximum number of attempts
+
+        Returns:
+            Reader result
+        """
+        for _ in range(retries):
+            before = (self.read_generation(), self._live_owner_token())
+            result = reader()
+            if before[1] is None and (self.read_generation(), self._live_owner_token()) == before:
+                return result
+            time.sleep(self.POLL_INTERVAL)
+        return result
+
+    def _owner_info(self) -> Dict[str, Any]:
+        """Owner / ticket payload for this process"""
+        now = time.time()
+        return {
+            "pid": os.getpid(),
+            "host": self.hostname,
+            "token": self.token,
+            "operation": self.operation,
+            "acquired": now,
+            "lease_expires": now + self.lease
+        }
+
+    def _try_create_owner(self) -> bool:
+        """Atomically create the owner file, breaking a stale owner first"""
+        owner = self.read_owner()
+        if owner is None and self.owner_file.exists():
+            # Unreadable owner file: a holder mid-write, or one that died mid-write
+            try:
+                if time.time() - self.owner_file.stat().st_mtime < self.lease:
+                    return False
+                owner = {}
+            except FileNotFoundError:
+                pass
+        if owner is not None:
+            if owner and not self._is_stale(owner):
+                return False
+            self.logger.warning(
+                f"Breaking stale installation lock held by pid {owner.get('pid')} "
+                f"({owner.get('operation', 'unknown')})"
+            )
+            try:
+                stale_file = self.owner_file.with_name(f"owner.stale.{self.token}")
+                os.replace(self.owner_file, stale_file)
+                stale_file.unlink()
+            except FileNotFoundError:
+                pass  # Another waiter broke it first
+
+        try:
+            fd = os.open(str(self.owner_file), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return False
+
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self._owner_info(), f)
+        return True
+
+    def _is_stale(self, info: Dict[str, Any]) -> bool:
+        """Whether an owner or ticket belongs to a dead or expired holder"""
+        if info.get("lease_expires", 0) < time.time():
+            return True
+        if info.get("host") == self.hostname and not _pid_alive(info.get("pid")):
+            return True
+        return False
+
+    def _live_owner_token(self) -> Optional[str]:
+        """Token of the current non-stale owner, if any"""
+        owner = self.read_owner()
+        if owner is None or self._is_stale(owner):
+            return None
+        return owner.get("token")
+
+    def _is_first_in_queue(self) -> bool:
+        """Whether our ticket is the oldest live ticket, pruning dead waiters"""
+        for ticket in sorted(self.queue_dir.iterdir()):
+            if ticket == self._ticket:
+                return True
+            try:
+                info = json.loads(ticket.read_text(encoding="utf-8"))
+            except (FileNotFoundError, json.JSONDecodeError):
+                continue
+            if self._is_stale(info):
+                try:
+                    ticket.unlink()
+                except FileNotFoundError:
+                    pass
+                continue
+            return False
+        return False
+
+    def _touch_ticket(self) -> None:
+        """Extend our ticket's lease so other waiters don't prune it"""
+        if self._ticket is None:
+            return
+        if time.time() + self.lease / 2 < self._ticket_lease_expires():
+            return
+        self._ticket.write_text(json.dumps(self._owner_info()), encoding="utf-8")
+
+    def _ticket_lease_expires(self) -> float:
+        """Lease expiry recorded in our ticket"""
+        try:
+            return json.loads(self._ticket.read_text(encoding="utf-8")).get("lease_expires", 0)
+        except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+            return 0
+
+    def _remove_ticket(self) -> None:
+        """Remove our queue ticket"""
+        if self._ticket is not None:
+            try:
+                self._ticket.unlink()
+            except FileNotFoundError:
+                pass
+            self._ticket = None
+
+    def _start_heartbeat(self) -> None:
+        """Renew the lease in the background while the lock is held"""
+        self._stop_heartbeat.clear()
+
+        def renew() -> None:
+            while not self._stop_heartbeat.wait(self.lease / 3):
+                owner = self.read_owner()
+                if not owner:
+                    return  # Lock directory removed, e.g. by a complete uninstall
+                if owner.get("token") != self.token:
+                    self.logger.warning("Installation lock was taken over by another process")
+                    return
+                owner["lease_expires"] = time.time() + self.lease
+                temp_file = self.owner_file.with_name(f"owner.{self.token}.tmp")
+                temp_file.write_text(json.dumps(owner), encoding="utf-8")
+                os.replace(temp_file, self.owner_file)
+
+        self._heartbeat = threading.Thread(target=renew, name="superclaude-lock-heartbeat", daemon=True)
+        self._heartbeat.start()
+
+    def _bump_generation(self) -> None:
+        """Increment the generation counter atomically"""
+        temp_file = self.generation_file.with_name(f"generation.{self.token}.tmp")
+        temp_file.write_text(str(self.read_generation() + 1), encoding="utf-8")
+        os.replace(temp_file, self.generation_file)
+
+
+def _pid_alive(pid: Any) -> bool:
+    """Check whether a process id is alive on this host"""
+    if not isinstance(pid, int) or pid <= 0:
+        return False
+    if sys.platform == "win32":
+        return True  # No cheap check; rely on the lease
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
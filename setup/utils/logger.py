@@ -6,7 +6,7 @@ import logging
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, TextIO
 from enum import Enum
 
 from .ui import Colors
@@ -24,7 +24,8 @@ class LogLevel(Enum):
 class Logger:
     """Enhanced logger with console and file output"""
     
-    def __init__(self, name: str = "superclaude", log_dir: Optional[Path] = None, console_level: LogLevel = LogLevel.INFO, file_level: LogLevel = LogLevel.DEBUG):
+    def __init__(self, name: str = "superclaude", log_dir: Optional[Path] = None, console_level: LogLevel = LogLevel.INFO, file_level: LogLevel = LogLevel.DEBUG,
+                 console_stream: Optional[TextIO] = None):
         """
         Initialize logger
         
@@ -33,11 +34,13 @@ class Logger:
             log_dir: Directory for log files (defaults to ~/.claude/logs)
             console_level: Minimum level for console output
             file_level: Minimum level for file output
+            console_stream: Stream of the console output (defaults to stdout)
         """
         self.name = name
         self.log_dir = log_dir or (Path.home() / ".claude" / "logs")
         self.console_level = console_level
         self.file_level = file_level
+        self.console_stream = console_stream or sys.stdout
         self.session_start = datetime.now()
         
         # Create logger
@@ -61,7 +64,7 @@ class Logger:
     
     def _setup_console_handler(self) -> None:
         """Setup colorized console handler"""
-        handler = logging.StreamHandler(sys.stdout)
+        handler = logging.StreamHandler(self.console_stream)
         handler.setLevel(self.console_level.value)
         
         # Custom formatter with colors
@@ -286,16 +289,17 @@ def get_logger(name: str = "superclaude") -> Logger:
     """Get or create global logger instance"""
     global _global_logger
     
-    if _global_logger is None or _global_logger.name != name:
+    if _global_logger is None:
         _global_logger = Logger(name)
     
     return _global_logger
 
 
-def setup_logging(name: str = "superclaude", log_dir: Optional[Path] = None, console_level: LogLevel = LogLevel.INFO, file_level: LogLevel = LogLevel.DEBUG) -> Logger:
+def setup_logging(name: str = "superclaude", log_dir: Optional[Path] = None, console_level: LogLevel = LogLevel.INFO, file_level: LogLevel = LogLevel.DEBUG,
+                  console_stream: Optional[TextIO] = None) -> Logger:
     """Setup logging with specified configuration"""
     global _global_logger
-    _global_logger = Logger(name, log_dir, console_level, file_level)
+    _global_logger = Logger(name, log_dir, console_level, file_level, console_stream)
     return _global_logger
 
 
@@ -0,0 +1,83 @@
+"""
+Text analysis for SuperClaude's offline indexes
+Deterministic tokenization shared by agent routing and document search:
+lower-cased Latin words with light suffix stemming, and character n-grams
+for Japanese and other CJK text, which has no spaces between words
+"""
+
+import re
+from typing import List
+
+
+TOKEN = re.compile(r"[a-z0-9]+(?:[+#][a-z0-9+#]*)?|[぀-ヿ㐀-鿿가-힯]+")
+CJK_START = "぀"
+
+STOPWORDS = frozenset("""
+a about all also an and any are as at be been being both but by can could do does for from had has have
+how i if in into is it its may me more most my no not of on or our should so such than that the their
+them then there these they this those through to too up use used using via was we were what when where
+which while who will with without would you your
+""".split())
+
+# Longest first, in British spelling (stem() folds -ize to -ise); a stem keeps at least MIN_STEM characters
+SUFFIXES = (
+    "isations", "isation", "ational", "ations", "ation", "nesses", "ments", "ities", "ness", "ment",
+    "ings", "ing", "ity", "ies", "ers", "ise", "ive", "ed", "er", "es", "ly", "al", "is", "s", "e"
+)
+MIN_STEM = 4
+MAX_STEM = 7
+MAX_STRIPS = 3
+
+
+def stem(word: str) -> str:
+    """
+    Light suffix-stripping stemmer
+
+    Folds -iz/-yz spellings to -is/-ys, strips up to MAX_STRIPS suffixes, undoubles a final consonant and caps
+    the stem length, so related forms such as "optimize", "optimizing" and
+    "optimization" share a stem.
+
+    Args:
+        word: Lower-case word
+
+    Returns:
+        Stem
+    """
+    word = word.replace("iz", "is").replace("yz", "ys")
+    for _ in range(MAX_STRIPS):
+        for suffix in SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM:
+                word = word[:-len(suffix)]
+                break
+        else:
+            break
+    if len(word) > MIN_STEM and word[-1] == word[-2] and word[-1] not in "aeiouls":
+        word = word[:-1]
+    return word[:MAX_STEM]
+
+
+def cjk_ngrams(run: str, size: int = 2) -> List[str]:
+    """Overlapping character n-grams of a CJK run (the run itself if shorter)"""
+    if len(run) <= size:
+        return [run]
+    return [run[i:i + size] for i in range(len(run) - size + 1)]
+
+
+def analyze(text: str, ngram_size: int = 2) -> List[str]:
+    """
+    Split text into index terms in document order
+
+    Args:
+        text: Text to analyze
+        ngram_size: Characters per CJK n-gram
+
+    Returns:
+        Terms (stemmed Latin words without stopwords, CJK n-grams)
+    """
+    terms = []
+    for token in TOKEN.findall(text.lower()):
+        if token[0] >= CJK_START:
+            terms.extend(cjk_ngrams(token, ngram_size))
+        elif token not in STOPWORDS:
+            terms.append(stem(token))
+    return terms
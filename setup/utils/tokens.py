@@ -0,0 +1,155 @@
+"""
+Offline token estimation for SuperClaude context content
+Tokenizers are pluggable: built-in estimators, an optional tiktoken backend,
+or any class given as "package.module:ClassName"
+"""
+
+import re
+import importlib
+from abc import ABC, abstractmethod
+from typing import Dict, Type, Optional
+
+
+class Tokenizer(ABC):
+    """Base tokenizer; subclasses implement count()"""
+
+    name = "base"
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """
+        Estimate the number of tokens in text
+
+        Args:
+            text: Text to measure
+
+        Returns:
+            Token count
+        """
+        pass
+
+
+class CharRatioTokenizer(Tokenizer):
+    """Rough estimate of one token per four characters"""
+
+    name = "chars"
+    CHARS_PER_TOKEN = 4
+
+    def count(self, text: str) -> int:
+        return (len(text) + self.CHARS_PER_TOKEN - 1) // self.CHARS_PER_TOKEN
+
+
+class HeuristicTokenizer(Tokenizer):
+    """
+    BPE-like estimate without a vocabulary
+
+    Latin words cost one token per 6 characters, digits one per 3, runs of
+    punctuation one per 2 characters, each CJK or other non-Latin character
+    about one token, and newlines one each.
+    """
+
+    name = "heuristic"
+
+    _PIECES = re.compile(
+        r"[A-Za-z]+"                                  # Latin words
+        r"|[0-9]+"                                    # Numbers
+        r"|[\u3040-\u30ff\u3400-\u9fff\uac00-\ud7af]"  # Kana, CJK ideographs, Hangul
+        r"|\n"                                        # Newlines
+        r"|[!-/:-@\[-`{-~]+"                          # ASCII punctuation runs
+        r"|[^\sA-Za-z0-9]"                            # Symbols, emoji, other scripts
+    )
+
+    def count(self, text: str) -> int:
+        tokens = 0
+        for match in self._PIECES.finditer(text):
+            piece = match.group(0)
+            first = piece[0]
+            if first.isascii() and first.isalpha():
+                tokens += 1 + (len(piece) - 1) // 6
+            elif first.isdigit():
+                tokens += (len(piece) + 2) // 3
+            elif first.isascii() and first != "\n":
+                tokens += (len(piece) + 1) // 2
+            else:
+                tokens += 1
+        return tokens
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Exact counts with tiktoken's cl100k_base encoding (optional dependency)"""
+
+    name = "tiktoken"
+
+    def __init__(self, encoding: str = "cl100k_base"):
+        try:
+            import tiktoken
+        except ImportError:
+            raise ValueError("The tiktoken tokenizer requires the 'tiktoken' package (pip install tiktoken)")
+        self._encoding = tiktoken.get_encoding(encoding)
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+TOKENIZERS: Dict[str, Type[Tokenizer]] = {
+    HeuristicTokenizer.name: HeuristicTokenizer,
+    CharRatioTokenizer.name: CharRatioTokenizer,
+    TiktokenTokenizer.name: TiktokenTokenizer,
+}
+
+DEFAULT_TOKENIZER = HeuristicTokenizer.name
+
+_instances: Dict[str, Tokenizer] = {}
+
+
+def register_tokenizer(tokenizer_class: Type[Tokenizer]) -> Type[Tokenizer]:
+    """Register a tokenizer class under its name (usable as a decorator)"""
+    TOKENIZERS[tokenizer_class.name] = tokenizer_class
+    return tokenizer_class
+
+
+def get_tokenizer(name: Optional[str] = None) -> Tokenizer:
+    """
+    Get a tokenizer by registered name or "module:ClassName"
+
+    Args:
+        name: Tokenizer name (default: heuristic)
+
+    Returns:
+        Tokenizer instance
+
+    Raises:
+        ValueError: If the tokenizer is unknown or can't be loaded
+    """
+    name = name or DEFAULT_TOKENIZER
+    if name in _instances:
+        return _instances[name]
+
+    if name in TOKENIZERS:
+        tokenizer = TOKENIZERS[name]()
+    elif ":" in name:
+        module_name, _, class_name = name.partition(":")
+        try:
+            tokenizer_class = getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError) as e:
+            raise ValueError(f"Could not load tokenizer {name}: {e}")
+        tokenizer = tokenizer_class()
+    else:
+        raise ValueError(f"Unknown tokenizer: {name} (available: {', '.join(sorted(TOKENIZERS))})")
+
+    _instances[name] = tokenizer
+    return tokenizer
+
+
+def count_tokens(text: str, tokenizer: Optional[str] = None) -> int:
+    """
+    Estimate tokens in text with the named tokenizer
+
+    Args:
+        text: Text to measure
+        tokenizer: Tokenizer name (default: heuristic)
+
+    Returns:
+        Token count
+    """
+    return get_tokenizer(tokenizer).count(text)
@@ -37,6 +37,11 @@ class UpdateChecker:
         self.current_version = current_version
         self.logger = get_logger()
         
+    def _get_state_store(self):
+        """Get the SQLite state store next to the cache file, if enabled"""
+        from ..services.state import StateStore
+        return StateStore.open_if_enabled(self.CACHE_FILE.parent)
+        
     def should_check_update(self, force: bool = False) -> bool:
         """
         Determine if we should check for updates based on last check time
@@ -49,6 +54,11 @@ class UpdateChecker:
         """
         if force:
             return True
+        
+        state_store = self._get_state_store()
+        if state_store:
+            last_check = state_store.get_last_update_check("pypi")
+            return last_check is None or time.time() - last_check > self.CHECK_INTERVAL
             
         if not self.CACHE_FILE.exists():
             return True
@@ -69,6 +79,11 @@ class UpdateChecker:
         
     def save_check_timestamp(self):
         """Save the current timestamp as last check time"""
+        state_store = self._get_state_store()
+        if state_store:
+            state_store.record_update_check("pypi", time.time())
+            return
+        
         self.CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
         
         data = {}
@@ -0,0 +1,177 @@
+"""
+Tests for the translation job scheduler, run against the stub backend
+"""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from setup.services.translation_jobs import StubBackend, TranslationError, TranslationScheduler
+from setup.services.translation_memory import TranslationMemory
+
+
+SOURCE = """# Guide
+
+First paragraph of the guide.
+
+Second paragraph of the guide.
+
+- A list item
+- Another list item
+
+## Details
+
+Closing paragraph.
+"""
+
+
+class RecordingStub(StubBackend):
+    """Stub backend that records the segments it is asked to translate"""
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.calls = []
+
+    def translate(self, segment, locale):
+        with self._lock:
+            self.calls.append(segment.hash)
+        return super().translate(segment, locale)
+
+
+class RecordingEvent(threading.Event):
+    """Stop event that records the retry delays it is asked to wait"""
+
+    def __init__(self):
+        super().__init__()
+        self.delays = []
+
+    def wait(self, timeout=None):
+        self.delays.append(timeout)
+        return self.is_set()
+
+
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path, monkeypatch):
+    """Keep the logger's files out of the real ~/.claude"""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+
+
+def make_scheduler(tmp_path: Path, backend, **options) -> TranslationScheduler:
+    memory = TranslationMemory(tmp_path / "memory.json", "ja")
+    return TranslationScheduler(memory, backend, tmp_path / "checkpoint.jsonl", **options)
+
+
+def make_plans(scheduler: TranslationScheduler, tmp_path: Path):
+    source = tmp_path / "guide.md"
+    source.write_text(SOURCE, encoding="utf-8")
+    return scheduler.plan([source])
+
+
+def pending_hashes(plans):
+    return {segment.hash for plan in plans.values() for segment in plan.pending}
+
+
+def test_translates_every_pending_segment_once(tmp_path):
+    backend = RecordingStub()
+    scheduler = make_scheduler(tmp_path, backend, concurrency=2)
+    plans = make_plans(scheduler, tmp_path)
+    hashes = pending_hashes(plans)
+
+    stats = scheduler.run(plans)
+
+    assert sorted(backend.calls) == sorted(hashes)
+    assert stats["translated"] == stats["jobs"] == len(backend.calls)
+    assert stats["failed"] == {}
+    assert not stats["interrupted"]
+    assert "[ja] First paragraph of the guide." in next(iter(plans.values())).assemble()
+
+
+def test_resume_skips_segments_in_checkpoint(tmp_path):
+    first = make_scheduler(tmp_path, RecordingStub(), concurrency=1)
+    plans = make_plans(first, tmp_path)
+    all_hashes = pending_hashes(plans)
+
+    def interrupt_after_two(finished, total):
+        if finished == 2:
+            raise KeyboardInterrupt
+
+    stats = first.run(plans, progress=interrupt_after_two)
+    assert stats["interrupted"]
+    checkpointed = {json.loads(line)["hash"] for line in first.checkpoint_file.read_text(encoding="utf-8").splitlines()}
+    assert len(checkpointed) == 2
+
+    # A new run (fresh memory, as after a crash) only sends what the checkpoint lacks
+    backend = RecordingStub()
+    second = make_scheduler(tmp_path, backend, concurrency=1)
+    plans = make_plans(second, tmp_path)
+    stats = second.run(plans)
+
+    assert set(backend.calls) == all_hashes - checkpointed
+    assert stats["resumed"] == 2
+    assert stats["translated"] == len(all_hashes) - 2
+    assert stats["failed"] == {}
+
+
+def test_retries_transient_failures_with_backoff(tmp_path):
+    backend = RecordingStub(failure_rate=0.5, seed=3)
+    scheduler = make_scheduler(tmp_path, backend, concurrency=1, retries=20, retry_delay=0.5)
+    scheduler._stop = RecordingEvent()
+    plans = make_plans(scheduler, tmp_path)
+    jobs = len(pending_hashes(plans))
+
+    stats = scheduler.run(plans)
+
+    assert stats["failed"] == {}
+    assert stats["translated"] == jobs
+    assert len(backend.calls) > stats["translated"]
+    assert len(scheduler._stop.delays) == len(backend.calls) - stats["translated"]
+    assert set(scheduler._stop.delays) <= {0.5 * 2 ** attempt for attempt in range(20)}
+
+
+def test_gives_up_after_retries(tmp_path):
+    backend = RecordingStub(failure_rate=1.0)
+    scheduler = make_scheduler(tmp_path, backend, concurrency=1, retries=2, retry_delay=0.25)
+    scheduler._stop = RecordingEvent()
+    plans = make_plans(scheduler, tmp_path)
+    jobs = len(pending_hashes(plans))
+
+    stats = scheduler.run(plans)
+
+    assert len(stats["failed"]) == jobs
+    assert stats["translated"] == 0
+    assert len(backend.calls) == jobs * 3
+    assert scheduler._stop.delays == [0.25, 0.5] * jobs
+    assert not scheduler.checkpoint_file.read_text(encoding="utf-8")
+
+
+def test_keyboard_interrupt_cancels_pending_jobs(tmp_path):
+    backend = RecordingStub(latency=0.05)
+    scheduler = make_scheduler(tmp_path, backend, concurrency=1)
+    plans = make_plans(scheduler, tmp_path)
+    jobs = len(pending_hashes(plans))
+
+    def interrupt(finished, total):
+        raise KeyboardInterrupt
+
+    stats = scheduler.run(plans, progress=interrupt)
+
+    assert stats["interrupted"]
+    assert stats["translated"] == 1
+    assert scheduler._stop.is_set()
+    # Queued jobs are cancelled; at most the one already running finishes
+    assert len(backend.calls) <= 2 < jobs
+
+
+def test_rejects_invalid_limits(tmp_path):
+    with pytest.raises(ValueError):
+        make_scheduler(tmp_path, StubBackend(), concurrency=0)
+    with pytest.raises(ValueError):
+        make_scheduler(tmp_path, StubBackend(), retries=-1)
+
+
+def test_stub_raises_translation_error(tmp_path):
+    plan = TranslationMemory(tmp_path / "memory.json").plan("Some text.\n")
+    with pytest.raises(TranslationError):
+        StubBackend(failure_rate=1.0).translate(plan.pending[0], "ja")